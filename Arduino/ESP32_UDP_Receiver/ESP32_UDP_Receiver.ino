@@ -47,6 +47,28 @@ unsigned long lastSignal = 0;
 String lastReceivedSignal = "";
 int signalCount = 0;
 
+// Sequenznummern der Host-Pakete (signal:value:seq): Wiederholungen und
+// verspätete ältere Signale werden bestätigt, aber nicht noch einmal ausgeführt
+const long SEQUENCE_MODULO = 65536;
+const long SEQUENCE_WINDOW = 64;              // so weit zurück gilt ein Paket als veraltet
+const unsigned long SEQUENCE_RESET_MS = 10000; // danach (z.B. Host-Neustart) wieder alles annehmen
+long lastUdpSequence = -1;
+unsigned long lastUdpSequenceTime = 0;
+
+// Binär-Protokoll (nach "BINARY:1" vom Host):
+// SOF | LEN | SEQ | TYPE | PAYLOAD (LEN Bytes) | CRC16 (big endian, über LEN..PAYLOAD)
+const uint8_t FRAME_SOF = 0xA5;
+const uint8_t FRAME_SIGNAL = 0x01;     // value:u16 | page:u8 | name (nur wenn page == 0)
+const uint8_t FRAME_PING = 0x03;
+const uint8_t FRAME_MAX_PAYLOAD = 58;
+const unsigned long FRAME_TIMEOUT = 50; // ms bis ein angefangener Frame verworfen wird
+
+bool binaryMode = false;
+uint8_t frameBuffer[FRAME_MAX_PAYLOAD + 6];
+uint8_t frameIndex = 0;
+unsigned long frameStart = 0;
+unsigned long frameErrors = 0;
+
 void setup() {
   Serial.begin(115200);
   delay(1000);
@@ -101,10 +123,14 @@ void loop() {
   }
   
   // Serielle Befehle verarbeiten
-  if (Serial.available()) {
-    String command = Serial.readStringUntil('\n');
-    command.trim();
-    processSerialCommand(command);
+  while (Serial.available()) {
+    if (frameInProgress() || (binaryMode && Serial.peek() == FRAME_SOF)) {
+      feedFrameByte(Serial.read());
+    } else {
+      String command = Serial.readStringUntil('\n');
+      command.trim();
+      processSerialCommand(command);
+    }
   }
   
   // Heartbeat-Timeout prüfen (30 Sekunden)
@@ -150,29 +176,64 @@ void processUDPPacket() {
                   udp.remoteIP().toString().c_str(), 
                   message.c_str());
     
+    // Pakete vom Host tragen eine Sequenznummer als drittes Feld (signal:value:seq).
+    // Sofort bestätigen - processSignal() blockiert für die Pin-Dauer
+    int firstColon = message.indexOf(':');
+    int lastColon = message.lastIndexOf(':');
+    if (firstColon > 0 && lastColon > firstColon) {
+      long sequence = message.substring(lastColon + 1).toInt();
+      udp.beginPacket(udp.remoteIP(), udp.remotePort());
+      udp.print("ack:");
+      udp.print(sequence);
+      udp.print(':');
+      udp.print(millis());
+      udp.endPacket();
+      
+      // Heartbeats zählen nicht - sonst wäre die Wiederholung eines
+      // verlorenen Signals nach dem nächsten Heartbeat schon "veraltet"
+      if (!message.startsWith("heartbeat:")) {
+        if (isStaleSequence(sequence)) {
+          Serial.printf("UDP Wiederholung ignoriert: %ld\n", sequence);
+          return;
+        }
+        lastUdpSequence = sequence;
+        lastUdpSequenceTime = millis();
+      }
+    }
+    
     processSignal(message);
   }
 }
 
+bool isStaleSequence(long sequence) {
+  if (lastUdpSequence < 0 || millis() - lastUdpSequenceTime > SEQUENCE_RESET_MS) {
+    return false;
+  }
+  long behind = (lastUdpSequence - sequence + SEQUENCE_MODULO) % SEQUENCE_MODULO;
+  return behind < SEQUENCE_WINDOW;   // 0 = Wiederholung des letzten Signals
+}
+
 void processSignal(String signal) {
-  digitalWrite(signalLED, HIGH);
-  
   // Signal-Teile extrahieren
   int colonIndex = signal.indexOf(':');
   String signalName = signal;
-  String signalValue = "1";
   
   if (colonIndex > 0) {
     signalName = signal.substring(0, colonIndex);
-    signalValue = signal.substring(colonIndex + 1);
   }
   
+  handleSignal(signalName.c_str());
+}
+
+void handleSignal(const char* signalName) {
+  digitalWrite(signalLED, HIGH);
+  
   lastReceivedSignal = signalName;
   lastSignal = millis();
   signalCount++;
   
   // Spezielle Signale behandeln
-  if (signalName == "heartbeat") {
+  if (strcmp(signalName, "heartbeat") == 0) {
     lastHeartbeat = millis();
     digitalWrite(signalLED, LOW);
     return;
@@ -189,7 +250,7 @@ void processSignal(String signal) {
   }
   
   if (!signalFound) {
-    Serial.printf("Unbekanntes Signal: %s\n", signalName.c_str());
+    Serial.printf("Unbekanntes Signal: %s\n", signalName);
   }
   
   // Bestätigungston
@@ -226,6 +287,18 @@ void processSerialCommand(String command) {
     String testSignal = command.substring(5);
     processSignal(testSignal);
   }
+  else if (command.startsWith("SIGNAL:")) {
+    // Format: SIGNAL:signal_id:value (wie vom Host gesendet)
+    processSignal(command.substring(7));
+  }
+  else if (command == "BINARY:1") {
+    binaryMode = true;
+    Serial.println("BINARY:OK");
+  }
+  else if (command == "BINARY:0") {
+    binaryMode = false;
+    Serial.println("BINARY:AUS");
+  }
   else if (command == "PING") {
     Serial.println("PONG");
   }
@@ -234,6 +307,82 @@ void processSerialCommand(String command) {
   }
 }
 
+uint16_t crc16(const uint8_t* data, size_t length) {
+  // CRC16-CCITT (Polynom 0x1021, Start 0xFFFF)
+  uint16_t crc = 0xFFFF;
+  for (size_t i = 0; i < length; i++) {
+    crc ^= (uint16_t)data[i] << 8;
+    for (uint8_t bit = 0; bit < 8; bit++) {
+      crc = (crc & 0x8000) ? (crc << 1) ^ 0x1021 : crc << 1;
+    }
+  }
+  return crc;
+}
+
+bool frameInProgress() {
+  if (frameIndex > 0 && millis() - frameStart > FRAME_TIMEOUT) {
+    frameIndex = 0; // Unvollständiger Frame - verwerfen
+    frameErrors++;
+  }
+  return frameIndex > 0;
+}
+
+void feedFrameByte(uint8_t b) {
+  if (frameIndex == 0) {
+    if (b != FRAME_SOF) return;
+    frameStart = millis();
+  }
+  frameBuffer[frameIndex++] = b;
+  
+  if (frameIndex == 2 && frameBuffer[1] > FRAME_MAX_PAYLOAD) {
+    frameIndex = 0; // Ungültige Länge - auf nächstes SOF warten
+    frameErrors++;
+    return;
+  }
+  if (frameIndex < 2 || frameIndex < frameBuffer[1] + 6) return;
+  
+  uint8_t length = frameBuffer[1];
+  uint8_t sequence = frameBuffer[2];
+  uint16_t received = ((uint16_t)frameBuffer[length + 4] << 8) | frameBuffer[length + 5];
+  frameIndex = 0;
+  
+  if (crc16(frameBuffer + 1, length + 3) != received) {
+    frameErrors++;
+    Serial.printf("FRAME_ERR:%u\n", sequence);
+    return;
+  }
+  handleFrame(sequence, frameBuffer[3], frameBuffer + 4, length);
+}
+
+bool decodeSignal(const uint8_t* payload, uint8_t length, char* name, size_t size) {
+  // value:u16 | page:u8 | name - Seiten werden ohne Heap zu "page_n"
+  if (length < 3) return false;
+  uint8_t page = payload[2];
+  if (page > 0) {
+    snprintf(name, size, "page_%u", page);
+  } else {
+    size_t nameLength = min((size_t)(length - 3), size - 1);
+    memcpy(name, payload + 3, nameLength);
+    name[nameLength] = 0;
+  }
+  return true;
+}
+
+void handleFrame(uint8_t sequence, uint8_t type, const uint8_t* payload, uint8_t length) {
+  char signalName[FRAME_MAX_PAYLOAD + 1];
+  
+  if (type == FRAME_SIGNAL && decodeSignal(payload, length, signalName, sizeof(signalName))) {
+    handleSignal(signalName);
+  }
+  else if (type == FRAME_PING) {
+    Serial.println("PONG");
+  }
+  else {
+    frameErrors++;
+    Serial.printf("FRAME_ERR:%u\n", sequence);
+  }
+}
+
 void printStatus() {
   Serial.println("=== ESP32 Status ===");
   Serial.printf("WiFi: %s\n", WiFi.status() == WL_CONNECTED ? "Verbunden" : "Getrennt");
@@ -247,6 +396,8 @@ void printStatus() {
   Serial.printf("Letzter Heartbeat: %lu ms ago\n", millis() - lastHeartbeat);
   Serial.printf("Uptime: %lu ms\n", millis());
   Serial.printf("Freier Heap: %d bytes\n", ESP.getFreeHeap());
+  Serial.printf("Binär-Modus: %s\n", binaryMode ? "An" : "Aus");
+  Serial.printf("Frame-Fehler: %lu\n", frameErrors);
   Serial.println("Signal-Mapping:");
   for (int i = 0; i < numSignals; i++) {
     Serial.printf("  %s -> Pin %d\n", signalMap[i].signal.c_str(), signalMap[i].pin);
@@ -22,6 +22,8 @@ const char* esp32_ips[] = {
   "192.168.1.102"   // ESP32-3
 };
 const int num_esp32s = 3;
+// Subnetz-Broadcast: ein Paket erreicht alle ESP32s gleichzeitig
+const char* broadcastIP = "192.168.1.255";
 
 // Status-LEDs
 const int statusLED = LED_BUILTIN;
@@ -32,6 +34,21 @@ const int udpLED = 3;
 unsigned long lastHeartbeat = 0;
 const unsigned long heartbeatInterval = 5000; // 5 Sekunden
 
+// Binär-Protokoll (nach "BINARY:1" vom Host):
+// SOF | LEN | SEQ | TYPE | PAYLOAD (LEN Bytes) | CRC16 (big endian, über LEN..PAYLOAD)
+const uint8_t FRAME_SOF = 0xA5;
+const uint8_t FRAME_SIGNAL = 0x01;     // value:u16 | page:u8 | name (nur wenn page == 0)
+const uint8_t FRAME_UDP_SEND = 0x02;   // ip:4 | value:u16 | page:u8 | name
+const uint8_t FRAME_PING = 0x03;
+const uint8_t FRAME_MAX_PAYLOAD = 58;
+const unsigned long FRAME_TIMEOUT = 50; // ms bis ein angefangener Frame verworfen wird
+
+bool binaryMode = false;
+uint8_t frameBuffer[FRAME_MAX_PAYLOAD + 6];
+uint8_t frameIndex = 0;
+unsigned long frameStart = 0;
+unsigned long frameErrors = 0;
+
 void setup() {
   Serial.begin(115200);
   while (!Serial) delay(10);
@@ -68,10 +85,14 @@ void loop() {
   }
   
   // Serielle Befehle verarbeiten
-  if (Serial.available()) {
-    String command = Serial.readStringUntil('\n');
-    command.trim();
-    processCommand(command);
+  while (Serial.available()) {
+    if (frameInProgress() || (binaryMode && Serial.peek() == FRAME_SOF)) {
+      feedFrameByte(Serial.read());
+    } else {
+      String command = Serial.readStringUntil('\n');
+      command.trim();
+      processCommand(command);
+    }
   }
   
   // Heartbeat senden
@@ -139,30 +160,129 @@ void processCommand(String command) {
   else if (command == "PING") {
     Serial.println("PONG");
   }
+  else if (command == "BINARY:1") {
+    binaryMode = true;
+    Serial.println("BINARY:OK");
+  }
+  else if (command == "BINARY:0") {
+    binaryMode = false;
+    Serial.println("BINARY:AUS");
+  }
   else {
     Serial.printf("Unbekannter Befehl: %s\n", command.c_str());
   }
 }
 
 void sendUDPSignal(String targetIP, String signal, String value) {
-  String message = signal + ":" + value;
-  
-  udp.beginPacket(targetIP.c_str(), targetPort);
-  udp.print(message);
+  sendUDPSignal(targetIP.c_str(), signal.c_str(), value.c_str());
+}
+
+void sendUDPSignal(const char* targetIP, const char* signal, const char* value) {
+  // Nachricht direkt in das Paket schreiben - keine String-Verkettung
+  udp.beginPacket(targetIP, targetPort);
+  udp.print(signal);
+  udp.print(':');
+  udp.print(value);
   udp.endPacket();
   
   digitalWrite(udpLED, HIGH);
-  Serial.printf("UDP gesendet an %s: %s\n", targetIP.c_str(), message.c_str());
+  Serial.printf("UDP gesendet an %s: %s:%s\n", targetIP, signal, value);
   delay(50);
   digitalWrite(udpLED, LOW);
 }
 
 void broadcastSignal(String signal, String value) {
-  Serial.printf("Broadcasting Signal: %s:%s\n", signal.c_str(), value.c_str());
+  broadcastSignal(signal.c_str(), value.c_str());
+}
+
+void broadcastSignal(const char* signal, const char* value) {
+  Serial.printf("Broadcasting Signal: %s:%s\n", signal, value);
   
-  for (int i = 0; i < num_esp32s; i++) {
-    sendUDPSignal(esp32_ips[i], signal, value);
-    delay(10); // Kurze Pause zwischen Sendungen
+  // Ein Paket statt einem pro ESP32 - die Dauer hängt nicht von der Anzahl der Empfänger ab
+  sendUDPSignal(broadcastIP, signal, value);
+}
+
+uint16_t crc16(const uint8_t* data, size_t length) {
+  // CRC16-CCITT (Polynom 0x1021, Start 0xFFFF)
+  uint16_t crc = 0xFFFF;
+  for (size_t i = 0; i < length; i++) {
+    crc ^= (uint16_t)data[i] << 8;
+    for (uint8_t bit = 0; bit < 8; bit++) {
+      crc = (crc & 0x8000) ? (crc << 1) ^ 0x1021 : crc << 1;
+    }
+  }
+  return crc;
+}
+
+bool frameInProgress() {
+  if (frameIndex > 0 && millis() - frameStart > FRAME_TIMEOUT) {
+    frameIndex = 0; // Unvollständiger Frame - verwerfen
+    frameErrors++;
+  }
+  return frameIndex > 0;
+}
+
+void feedFrameByte(uint8_t b) {
+  if (frameIndex == 0) {
+    if (b != FRAME_SOF) return;
+    frameStart = millis();
+  }
+  frameBuffer[frameIndex++] = b;
+  
+  if (frameIndex == 2 && frameBuffer[1] > FRAME_MAX_PAYLOAD) {
+    frameIndex = 0; // Ungültige Länge - auf nächstes SOF warten
+    frameErrors++;
+    return;
+  }
+  if (frameIndex < 2 || frameIndex < frameBuffer[1] + 6) return;
+  
+  uint8_t length = frameBuffer[1];
+  uint8_t sequence = frameBuffer[2];
+  uint16_t received = ((uint16_t)frameBuffer[length + 4] << 8) | frameBuffer[length + 5];
+  frameIndex = 0;
+  
+  if (crc16(frameBuffer + 1, length + 3) != received) {
+    frameErrors++;
+    Serial.printf("FRAME_ERR:%u\n", sequence);
+    return;
+  }
+  handleFrame(sequence, frameBuffer[3], frameBuffer + 4, length);
+}
+
+bool decodeSignal(const uint8_t* payload, uint8_t length, char* name, size_t size, char* value, size_t valueSize) {
+  // value:u16 | page:u8 | name - Seiten werden ohne Heap zu "page_n"
+  if (length < 3) return false;
+  snprintf(value, valueSize, "%u", (unsigned)(payload[0] | (payload[1] << 8)));
+  uint8_t page = payload[2];
+  if (page > 0) {
+    snprintf(name, size, "page_%u", page);
+  } else {
+    size_t nameLength = min((size_t)(length - 3), size - 1);
+    memcpy(name, payload + 3, nameLength);
+    name[nameLength] = 0;
+  }
+  return true;
+}
+
+void handleFrame(uint8_t sequence, uint8_t type, const uint8_t* payload, uint8_t length) {
+  char signal[FRAME_MAX_PAYLOAD + 1];
+  char value[6];
+  
+  if (type == FRAME_SIGNAL && decodeSignal(payload, length, signal, sizeof(signal), value, sizeof(value))) {
+    broadcastSignal(signal, value);
+  }
+  else if (type == FRAME_UDP_SEND && length >= 4 &&
+           decodeSignal(payload + 4, length - 4, signal, sizeof(signal), value, sizeof(value))) {
+    char targetIP[16];
+    snprintf(targetIP, sizeof(targetIP), "%u.%u.%u.%u", payload[0], payload[1], payload[2], payload[3]);
+    sendUDPSignal(targetIP, signal, value);
+  }
+  else if (type == FRAME_PING) {
+    Serial.println("PONG");
+  }
+  else {
+    frameErrors++;
+    Serial.printf("FRAME_ERR:%u\n", sequence);
   }
 }
 
@@ -179,6 +299,9 @@ void printStatus() {
   }
   Serial.printf("UDP Port: %d\n", localPort);
   Serial.printf("Uptime: %lu ms\n", millis());
+  Serial.printf("Binär-Modus: %s\n", binaryMode ? "An" : "Aus");
+  Serial.printf("Frame-Fehler: %lu\n", frameErrors);
+  Serial.printf("Broadcast: %s:%d\n", broadcastIP, targetPort);
   Serial.println("ESP32 Ziele:");
   for (int i = 0; i < num_esp32s; i++) {
     Serial.printf("  ESP32-%d: %s:%d\n", i+1, esp32_ips[i], targetPort);
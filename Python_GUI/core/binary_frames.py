@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Binär-Protokoll für Dynamic Messe Stand V4
+Kompakte, längenpräfixierte Frames mit Sequenznummer und CRC16 (Host -> ESP32/GIGA)
+
+Frame-Aufbau (alle Felder 1 Byte, außer Payload und CRC):
+
+    SOF(0xA5) | LEN | SEQ | TYPE | PAYLOAD (LEN Bytes) | CRC16 (big endian)
+
+Die CRC16 (CCITT, Polynom 0x1021, Start 0xFFFF) läuft über LEN..PAYLOAD.
+Das Text-Protokoll bleibt Fallback: der Host bietet den Binär-Modus mit
+BINARY_OFFER an, nur bei BINARY_ACK werden Frames gesendet.
+"""
+
+import binascii
+import socket
+import struct
+from dataclasses import dataclass
+
+FRAME_SOF = 0xA5
+FRAME_HEADER_SIZE = 4           # SOF, LEN, SEQ, TYPE
+FRAME_CRC_SIZE = 2
+MAX_PAYLOAD = 58                # passt in den 64-Byte-Puffer der Sketches
+
+FRAME_SIGNAL = 0x01             # value:u16 | page:u8 | name (nur wenn page == 0)
+FRAME_UDP_SEND = 0x02           # ip:4 | value:u16 | page:u8 | name (nur wenn page == 0)
+FRAME_PING = 0x03               # leer - Antwort ist die Textzeile PONG
+
+BINARY_OFFER = "BINARY:1"
+BINARY_ACK = "BINARY:OK"
+
+class FrameError(ValueError):
+    """Kommando lässt sich nicht als Binär-Frame darstellen"""
+
+@dataclass
+class Frame:
+    """Ein dekodierter Frame"""
+    sequence: int
+    frame_type: int
+    payload: bytes
+
+def crc16(data):
+    """CRC16-CCITT (0x1021, Start 0xFFFF) - identisch zur Implementierung in den Sketches"""
+    return binascii.crc_hqx(data, 0xFFFF)
+
+def encode_frame(sequence, frame_type, payload=b""):
+    """Baut einen kompletten Frame inklusive CRC"""
+    if len(payload) > MAX_PAYLOAD:
+        raise FrameError(f"Payload zu groß ({len(payload)} > {MAX_PAYLOAD} Bytes)")
+    body = bytes((len(payload), sequence & 0xFF, frame_type)) + payload
+    return bytes((FRAME_SOF,)) + body + struct.pack('>H', crc16(body))
+
+def encode_signal_payload(signal_id, value):
+    """'page_3', 1 -> 3 Bytes; andere Signalnamen werden als Text angehängt"""
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        raise FrameError(f"Signalwert nicht numerisch: {value!r}")
+    if not 0 <= value <= 0xFFFF:
+        raise FrameError(f"Signalwert außerhalb 0..65535: {value}")
+
+    signal_id = str(signal_id)
+    page = 0
+    if signal_id.startswith("page_") and signal_id[5:].isdigit():
+        page = int(signal_id[5:])
+        if not 1 <= page <= 0xFF:
+            page = 0
+    try:
+        name = b"" if page else signal_id.encode('ascii', errors='strict')
+    except UnicodeEncodeError:
+        raise FrameError(f"Signal-ID nicht ASCII: {signal_id!r}")
+    return struct.pack('<HB', value, page) + name
+
+def decode_signal_payload(payload):
+    """Umkehrung von encode_signal_payload -> (signal_id, value)"""
+    if len(payload) < 3:
+        raise FrameError("Signal-Payload zu kurz")
+    value, page = struct.unpack_from('<HB', payload)
+    signal_id = f"page_{page}" if page else payload[3:].decode('ascii', errors='replace')
+    return signal_id, value
+
+def encode_signal(sequence, signal_id, value=1):
+    """SIGNAL-Frame (entspricht SIGNAL:<signal_id>:<value>)"""
+    return encode_frame(sequence, FRAME_SIGNAL, encode_signal_payload(signal_id, value))
+
+def encode_udp_send(sequence, target_ip, signal_id, value):
+    """UDP_SEND-Frame (entspricht UDP_SEND:<ip>:<signal_id>:<value>)"""
+    try:
+        address = socket.inet_aton(target_ip)
+    except (OSError, TypeError):
+        raise FrameError(f"Keine IPv4-Adresse: {target_ip!r}")
+    return encode_frame(sequence, FRAME_UDP_SEND, address + encode_signal_payload(signal_id, value))
+
+def encode_ping(sequence):
+    """PING-Frame"""
+    return encode_frame(sequence, FRAME_PING)
+
+class FrameDecoder:
+    """Inkrementeller Decoder (Gegenstück zum Parser in den Sketches)
+
+    Bytes außerhalb eines Frames werden übersprungen, bis wieder ein SOF
+    kommt; Frames mit falscher CRC werden gezählt und verworfen.
+    """
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self.crc_errors = 0
+        self.skipped_bytes = 0
+
+    def feed(self, data):
+        """Hängt Bytes an und gibt alle vollständigen, gültigen Frames zurück"""
+        buffer = self.buffer
+        buffer += data
+        frames = []
+        size = len(buffer)
+        position = 0
+
+        # Über den Puffer laufen und erst am Ende einmal kürzen
+        while True:
+            start = buffer.find(FRAME_SOF, position)
+            if start < 0:
+                self.skipped_bytes += size - position
+                position = size
+                break
+            self.skipped_bytes += start - position
+            position = start
+            if size - position < 2:
+                break
+
+            length = buffer[position + 1]
+            if length > MAX_PAYLOAD:
+                # Kein gültiger Frame-Anfang - ab dem nächsten Byte neu synchronisieren
+                self.skipped_bytes += 1
+                position += 1
+                continue
+
+            end = position + FRAME_HEADER_SIZE + length + FRAME_CRC_SIZE
+            if end > size:
+                break
+
+            body = buffer[position + 1:end - FRAME_CRC_SIZE]
+            if crc16(body) != (buffer[end - 2] << 8) | buffer[end - 1]:
+                self.crc_errors += 1
+                self.skipped_bytes += 1
+                position += 1
+                continue
+
+            frames.append(Frame(body[1], body[2], bytes(body[3:])))
+            position = end
+
+        if position:
+            del buffer[:position]
+        return frames
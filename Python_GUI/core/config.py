@@ -16,12 +16,46 @@ class Config:
         
         # Hardware-Konfiguration
         self.hardware = {
-            'esp32_1_port': '/dev/ttyUSB0',  # Haupt-ESP32
-            'esp32_2_port': '/dev/ttyUSB1',  # ESP32.2 (Addon)
-            'esp32_3_port': '/dev/ttyUSB2',  # ESP32.3 (Addon)
-            'giga_port': '/dev/ttyACM0',     # Arduino GIGA
+            # Ports: None = automatisch über den Geräte-Index (VID/PID/USB-Buchse),
+            # ein fester Pfad wie '/dev/ttyUSB0' überschreibt die Erkennung
+            'esp32_1_port': None,            # Haupt-ESP32
+            'esp32_2_port': None,            # ESP32.2 (Addon)
+            'esp32_3_port': None,            # ESP32.3 (Addon)
+            'giga_port': None,               # Arduino GIGA
+            'device_serials': {},            # Feste Zuordnung Rolle -> USB-Seriennummer
+            'device_locations': {},          # Feste Zuordnung Rolle -> USB-Buchse (z.B. '1-1.2', siehe device_index.py)
             'baud_rate': 115200,
-            'timeout': 1
+            'timeout': 1,
+            'binary_protocol': True,         # Binär-Frames anbieten (Fallback: Text)
+            'hotplug': True,                 # Ausgefallene Geräte einzeln neu verbinden
+            'record_path': None,             # Rohe Seriell-Bytes aufzeichnen (main.py --record)
+            'queue_size': 256,               # Empfangs-Queue pro Gerät (Zeilen)
+            'queue_policy': 'latest_signal', # Bei vollem Puffer: drop_oldest, latest_signal, block
+            'queue_block_timeout': 1.0,      # block: höchstens so lange auf Platz warten
+            'command_queue_size': 64,        # Wartende Befehle pro Gerät (Schreib-Thread)
+            'write_timeout': 1.0,            # Sekunden bis ein hängender Schreibvorgang abbricht
+            'udp_direct': False,             # Seitensignale direkt per UDP an die ESP32s (Fallback: GIGA)
+            'udp_port': 8889,                # localPort im ESP32-Sketch
+            'udp_link': True,                # Sequenznummern + Acks: RTT, Verlust, Uhrversatz (UdpLink)
+            'udp_heartbeat_interval': 2.0,   # Sekunden zwischen Heartbeats des Hosts an jeden ESP32
+            'udp_ack_timeout': 0.5,          # Wiederholungs-Timeout, bis die Umlaufzeit gemessen ist
+            'udp_max_retries': 4,            # Wiederholungen eines unbestätigten Signals (Backoff x2)
+            'liveness_timeout': 5.0,         # Sekunden ohne Zeile, bis ein Gerät per PING geprüft wird
+            'liveness_probe_timeout': 1.0,   # Wartezeit auf die Antwort, danach gilt es als stale
+            'udp_targets': {                 # Rolle -> IP bzw. 'host:port' (esp32_ips im GIGA-Sketch)
+                'esp32_1': '192.168.1.100',
+                'esp32_2': '192.168.1.101',
+                'esp32_3': '192.168.1.102'
+            }
+        }
+        
+        # Simulation (main.py --simulate N, services/device_farm.py)
+        self.simulation = {
+            'signal_rate': 0.2,              # Signale pro Sekunde und ESP32
+            'jitter': 0.5,                   # Streuung der Signal-Abstände
+            'noise': 0.0,                    # Anteil gestörter Zeilen
+            'disconnect_interval': None,     # Mittlere Sekunden zwischen Abbrüchen pro Gerät
+            'downtime': 2.0                  # Sekunden bis ein Gerät wieder auftaucht
         }
         
         # GUI-Konfiguration
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Geräte-Index für Dynamic Messe Stand V4
+Ordnet logische Rollen (esp32_1, giga) über VID/PID/Seriennummer dem aktuellen Geräteknoten zu
+"""
+
+import os
+import re
+import sys
+import glob
+import argparse
+import threading
+from dataclasses import dataclass
+
+SYSFS_TTY = "/sys/class/tty"
+TTY_PATTERNS = ("ttyUSB*", "ttyACM*")
+
+# USB-Seriell-Chips der ESP32-Boards: CP210x, CH34x, FTDI, Espressif (nativ USB)
+ESP32_VIDS = {"10c4", "1a86", "0403", "303a"}
+# Arduino (GIGA R1: 2341:0266) und Arduino.org
+ARDUINO_VIDS = {"2341", "2a03"}
+
+ESP32_ROLES = ("esp32_1", "esp32_2", "esp32_3")
+GIGA_ROLE = "giga"
+
+@dataclass
+class UsbSerialDevice:
+    """Ein USB-Seriell-Gerät mit seiner Identität"""
+    node: str                 # /dev/ttyUSB0
+    vid: str                  # "10c4" (hex, klein)
+    pid: str                  # "ea60"
+    serial_number: str = ""
+    location: str = ""        # physische USB-Buchse, z.B. "1-1.2:1.0" - stabil über Reboots
+    manufacturer: str = ""
+    product: str = ""
+
+    @property
+    def usb_id(self):
+        return f"{self.vid}:{self.pid}"
+
+def _read_attribute(path):
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except OSError:
+        return ""
+
+def _identity(device):
+    """Feste Identität eines Geräts: USB-Buchse, ersatzweise Seriennummer bzw. Knoten"""
+    return device.location or device.serial_number or device.node
+
+def _location_key(location):
+    """'1-1.10:1.0' -> (1, 1, 10, 1, 0) - natürliche Sortierung nach Buchse"""
+    return tuple(int(part) for part in re.findall(r'\d+', location))
+
+def scan_sysfs(sysfs_root=SYSFS_TTY, dev_root="/dev"):
+    """Liest alle ttyUSB*/ttyACM* samt USB-Identität direkt aus sysfs"""
+    devices = []
+    for pattern in TTY_PATTERNS:
+        for entry in glob.glob(os.path.join(sysfs_root, pattern)):
+            device_link = os.path.join(entry, "device")
+            if not os.path.exists(device_link):
+                continue
+
+            # Vom Interface aufwärts bis zum USB-Gerät (dort liegen idVendor/idProduct)
+            path = os.path.realpath(device_link)
+            interface = ""
+            while path not in ("/", "") and not os.path.exists(os.path.join(path, "idVendor")):
+                if ":" in os.path.basename(path):
+                    interface = os.path.basename(path)
+                path = os.path.dirname(path)
+            if path in ("/", ""):
+                continue
+
+            devices.append(UsbSerialDevice(
+                node=os.path.join(dev_root, os.path.basename(entry)),
+                vid=_read_attribute(os.path.join(path, "idVendor")).lower(),
+                pid=_read_attribute(os.path.join(path, "idProduct")).lower(),
+                serial_number=_read_attribute(os.path.join(path, "serial")),
+                location=interface or os.path.basename(path),
+                manufacturer=_read_attribute(os.path.join(path, "manufacturer")),
+                product=_read_attribute(os.path.join(path, "product"))
+            ))
+    return devices
+
+def scan_pyserial():
+    """Fallback ohne sysfs (macOS/Windows): Identität über pyserial"""
+    try:
+        from serial.tools import list_ports
+    except ImportError:
+        return []
+
+    return [
+        UsbSerialDevice(
+            node=port.device,
+            vid=f"{port.vid:04x}",
+            pid=f"{port.pid:04x}",
+            serial_number=port.serial_number or "",
+            location=port.location or "",
+            manufacturer=port.manufacturer or "",
+            product=port.product or ""
+        )
+        for port in list_ports.comports()
+        if port.vid is not None
+    ]
+
+class DeviceIndex:
+    """Zwischengespeicherter Index Rolle -> Geräteknoten
+
+    Eine Rolle hängt an einer festen Identität, nicht an der Reihenfolge der
+    gerade vorhandenen Geräte: zuerst feste Seriennummern aus role_serials
+    und feste USB-Buchsen aus role_locations. Jede andere Rolle bekommt beim
+    ersten Einlesen das nächste freie passende Gerät (GIGA über die
+    Arduino-VID, ESP32s über ihre USB-Seriell-Chips in der Reihenfolge der
+    physischen USB-Buchsen) und bleibt an dessen Buchse gebunden. Fehlt das
+    Gerät einer Rolle, löst sie zu None auf - nie zu einem anderen Board.
+    Nach Hotplug-Ereignissen invalidate() aufrufen - der nächste Zugriff
+    liest sysfs neu ein.
+    """
+
+    def __init__(self, role_serials=None, sysfs_root=SYSFS_TTY, role_locations=None):
+        self.role_serials = dict(role_serials or {})
+        self.role_locations = dict(role_locations or {})
+        self.sysfs_root = sysfs_root
+        self._lock = threading.Lock()
+        self._devices = None
+        self._roles = {}
+        self._bound = {}          # Rolle -> Identität (_identity) seit dem ersten Einlesen
+
+    def refresh(self):
+        """Liest die Geräte neu ein und berechnet die Rollen"""
+        return self._refresh()[0]
+
+    def invalidate(self):
+        """Verwirft den Cache (z.B. nach Hotplug) - Rollen-Bindungen bleiben"""
+        with self._lock:
+            self._devices = None
+
+    def devices(self):
+        """Alle bekannten USB-Seriell-Geräte"""
+        return list(self._snapshot()[0])
+
+    def resolve(self, role):
+        """Aktueller Geräteknoten einer Rolle oder None"""
+        return self._snapshot()[1].get(role)
+
+    def roles(self):
+        """Alle aufgelösten Rollen {rolle: knoten}"""
+        return dict(self._snapshot()[1])
+
+    def role_of(self, node):
+        """Rolle eines Geräteknotens oder None"""
+        for role, role_node in self.roles().items():
+            if role_node == node:
+                return role
+        return None
+
+    def find(self, node):
+        """Identität eines Geräteknotens oder None"""
+        for device in self.devices():
+            if device.node == node:
+                return device
+        return None
+
+    def _snapshot(self):
+        """(geräte, rollen) aus einem Einlesevorgang - auch bei gleichzeitigem invalidate()"""
+        with self._lock:
+            if self._devices is not None:
+                return self._devices, self._roles
+        return self._refresh()
+
+    def _refresh(self):
+        if os.path.isdir(self.sysfs_root):
+            devices = scan_sysfs(self.sysfs_root)
+        else:
+            devices = scan_pyserial()
+        devices.sort(key=lambda device: _location_key(device.location))
+
+        with self._lock:
+            roles = self._assign_roles(devices)
+            self._devices = devices
+            self._roles = roles
+        return devices, roles
+
+    def _assign_roles(self, devices):
+        """Rollen zuordnen (unter _lock, bindet neue Rollen an ihre Buchse)"""
+        roles = {}
+        taken = set()
+
+        def claim(role, device):
+            if device is not None and device.node not in taken:
+                roles[role] = device.node
+                taken.add(device.node)
+
+        # Feste Zuordnungen - fehlt das Gerät, bleibt die Rolle leer
+        fixed = set()
+        for role, serial_number in self.role_serials.items():
+            if serial_number:
+                fixed.add(role)
+                claim(role, next((device for device in devices
+                                  if device.serial_number == serial_number), None))
+        for role, location in self.role_locations.items():
+            if location and role not in fixed:
+                fixed.add(role)
+                claim(role, next((device for device in devices
+                                  if location in (device.location, device.location.split(":")[0])), None))
+
+        # Gebundene Rollen nur mit ihrem eigenen Gerät
+        by_identity = {_identity(device): device for device in devices}
+        for role, identity in self._bound.items():
+            if role not in fixed:
+                claim(role, by_identity.get(identity))
+        bound = set(self._bound.values())
+
+        # Neue Rollen an das nächste freie, noch ungebundene Gerät binden
+        free = [device for device in devices
+                if device.node not in taken and _identity(device) not in bound]
+        for role, vids in ((GIGA_ROLE, ARDUINO_VIDS),) + tuple((role, ESP32_VIDS) for role in ESP32_ROLES):
+            if role in fixed or role in self._bound:
+                continue
+            device = next((device for device in free
+                           if device.vid in vids and device.node not in taken), None)
+            if device is None:
+                continue
+            claim(role, device)
+            self._bound[role] = _identity(device)
+
+        return roles
+
+# Globale Geräte-Index Instanz
+device_index = DeviceIndex()
+
+def main():
+    parser = argparse.ArgumentParser(description='USB-Geräte-Index (Rolle -> Port)')
+    parser.add_argument('--shell', action='store_true',
+                        help='Ausgabe als ESP32_1_PORT=... für eval in Shell-Skripten')
+    args = parser.parse_args()
+
+    roles = device_index.roles()
+    if args.shell:
+        for role, node in sorted(roles.items()):
+            print(f"{role.upper()}_PORT={node}")
+        return 0
+
+    for device in device_index.devices():
+        role = device_index.role_of(device.node) or "-"
+        print(f"{device.node:<16}{role:<10}{device.usb_id:<11}{device.serial_number:<22}"
+              f"{device.location:<14}{device.product}")
+    if not roles:
+        print("Keine bekannten USB-Seriell-Geräte gefunden")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Device Supervisor für Dynamic Messe Stand V4
+Überwacht /dev auf USB-Hotplug und verbindet ausgefallene Geräte einzeln mit Backoff neu
+"""
+
+import os
+import glob
+import time
+import fnmatch
+import threading
+from core.logger import logger
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
+DEVICE_PATTERNS = ("ttyUSB*", "ttyACM*")
+
+class DeviceWatcher:
+    """Meldet hinzugekommene/entfernte Geräte-Dateien (inotify über watchdog, sonst Polling)"""
+
+    def __init__(self, callback, directory="/dev", patterns=DEVICE_PATTERNS, poll_interval=1.0):
+        self.callback = callback
+        self.directory = directory
+        self.patterns = patterns
+        self.poll_interval = poll_interval
+        self.mode = None
+        self.known = set()
+        self.running = False
+        self._observer = None
+        self._thread = None
+        self._changed = threading.Event()
+
+    def start(self):
+        """Startet die Überwachung"""
+        if self.running:
+            return
+
+        self.running = True
+        self.known = self.scan()
+
+        if WATCHDOG_AVAILABLE:
+            try:
+                handler = FileSystemEventHandler()
+                handler.on_any_event = self._on_fs_event
+                self._observer = Observer()
+                self._observer.schedule(handler, self.directory, recursive=False)
+                self._observer.start()
+                self.mode = "inotify"
+            except Exception as e:
+                logger.warning(f"Dateisystem-Überwachung von {self.directory} nicht möglich ({e}) - Polling")
+                self._observer = None
+
+        if self._observer is None:
+            self.mode = "polling"
+
+        self._thread = threading.Thread(target=self._run, name="DeviceWatcher", daemon=True)
+        self._thread.start()
+        logger.debug(f"Geräte-Überwachung gestartet ({self.mode}, {self.directory})")
+
+    def stop(self):
+        """Stoppt die Überwachung"""
+        if not self.running:
+            return
+
+        self.running = False
+        self._changed.set()
+        if self._observer:
+            self._observer.stop()
+            self._observer.join(timeout=2)
+            self._observer = None
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2)
+
+    def scan(self):
+        """Aktuell vorhandene Geräte-Dateien"""
+        found = set()
+        for pattern in self.patterns:
+            found.update(glob.glob(os.path.join(self.directory, pattern)))
+        return found
+
+    def _on_fs_event(self, event):
+        """watchdog-Thread: nur passende Namen wecken den Scan"""
+        for path in (getattr(event, 'src_path', ''), getattr(event, 'dest_path', '')):
+            name = os.path.basename(os.fsdecode(path)) if path else ''
+            if any(fnmatch.fnmatch(name, pattern) for pattern in self.patterns):
+                self._changed.set()
+                return
+
+    def _run(self):
+        """Vergleicht den Bestand nach jedem Ereignis (bzw. zyklisch beim Polling)"""
+        while self.running:
+            # Auch mit inotify gelegentlich nachsehen, falls ein Ereignis verloren ging
+            timeout = self.poll_interval if self.mode == "polling" else self.poll_interval * 10
+            self._changed.wait(timeout)
+            self._changed.clear()
+            if not self.running:
+                break
+
+            current = self.scan()
+            added = current - self.known
+            removed = self.known - current
+            self.known = current
+            if added or removed:
+                try:
+                    self.callback(added, removed)
+                except Exception as e:
+                    logger.error(f"Fehler in der Hotplug-Verarbeitung: {e}")
+
+class DeviceSupervisor:
+    """Verbindet ausgefallene Geräte einzeln neu - die übrigen laufen unverändert weiter
+
+    Ein Gerät gilt als ausgefallen, wenn sein Lesepfad einen Fehler meldet
+    oder die Geräte-Datei verschwindet. Neue Versuche folgen mit
+    exponentiellem Backoff; taucht die Geräte-Datei wieder auf, wird
+    sofort ein Versuch gestartet.
+    """
+
+    def __init__(self, manager, base_delay=0.5, max_delay=30.0, directory="/dev",
+                 patterns=DEVICE_PATTERNS, poll_interval=1.0):
+        self.manager = manager
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.watcher = DeviceWatcher(self._on_devices_changed, directory, patterns, poll_interval)
+        self.running = False
+        self.thread = None
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._retry = {}        # connection -> (fällig_ab, nächste_verzögerung)
+
+    def start(self):
+        """Startet Überwachung und Reconnect-Thread"""
+        if self.running:
+            return
+
+        self.running = True
+        self.watcher.start()
+        self.thread = threading.Thread(target=self._run, name="DeviceSupervisor", daemon=True)
+        self.thread.start()
+
+        # Beim Start nicht erreichbare Geräte sofort in die Überwachung aufnehmen
+        for connection in self.manager.connections.values():
+            if connection.status != "connected":
+                self.connection_lost(connection)
+
+    def stop(self):
+        """Stoppt Überwachung und Reconnects"""
+        if not self.running:
+            return
+
+        self.running = False
+        self._wakeup.set()
+        self.watcher.stop()
+        if self.thread and self.thread is not threading.current_thread():
+            self.thread.join(timeout=2)
+        with self._lock:
+            self._retry.clear()
+
+    def connection_lost(self, connection):
+        """Meldet ein ausgefallenes Gerät (thread-sicher, mehrfacher Aufruf unschädlich)"""
+        if not self.running:
+            return
+
+        with self._lock:
+            if connection.down_since is None:
+                connection.down_since = time.monotonic()
+            connection.status = "reconnecting"
+            if connection in self._retry:
+                return
+            self._retry[connection] = (time.monotonic() + self.base_delay,
+                                       min(self.base_delay * 2, self.max_delay))
+        logger.warning(f"🔌 {connection.name} ausgefallen - Neuverbindung in {self.base_delay:.1f} s")
+        self._wakeup.set()
+
+    def _on_devices_changed(self, added, removed):
+        """Watcher: Geräte-Datei entfernt -> ausgefallen; wieder da -> sofort versuchen"""
+        self.manager.device_index.invalidate()
+        for connection in list(self.manager.connections.values()):
+            if connection.port in removed and connection.status == "connected":
+                logger.info(f"🔌 {connection.port} entfernt")
+                connection.close_port()
+                self.connection_lost(connection)
+                continue
+            
+            with self._lock:
+                waiting = connection in self._retry
+            if not waiting:
+                continue
+            
+            # Nach einem Replug kann das Gerät unter einem anderen Knoten auftauchen
+            if self.manager.resolve_port(connection) in added:
+                with self._lock:
+                    if connection in self._retry:
+                        # Backoff zurücksetzen - das Gerät ist gerade erst aufgetaucht
+                        self._retry[connection] = (time.monotonic(), self.base_delay)
+                logger.info(f"🔌 {connection.port} wieder verfügbar")
+                self._wakeup.set()
+
+    def _run(self):
+        """Reconnect-Schleife: schläft bis zum nächsten fälligen Versuch"""
+        while self.running:
+            with self._lock:
+                now = time.monotonic()
+                due = [c for c, (at, _) in self._retry.items() if at <= now]
+                next_at = min((at for at, _ in self._retry.values()), default=None)
+
+            for connection in due:
+                self._attempt(connection)
+
+            if not due:
+                timeout = None if next_at is None else max(0.0, next_at - time.monotonic())
+                self._wakeup.wait(timeout)
+                self._wakeup.clear()
+
+    def _attempt(self, connection):
+        """Ein Verbindungsversuch für genau ein Gerät"""
+        port = self.manager.resolve_port(connection)
+        if port and os.path.exists(port) and self.manager.start_connection(connection):
+            with self._lock:
+                self._retry.pop(connection, None)
+                if connection.down_since is not None:
+                    connection.downtime += time.monotonic() - connection.down_since
+                    connection.down_since = None
+                connection.reconnect_count += 1
+            logger.info(f"✅ {connection.name} wieder verbunden (Reconnect #{connection.reconnect_count})")
+            return
+
+        with self._lock:
+            if connection not in self._retry:
+                return
+            _, delay = self._retry[connection]
+            self._retry[connection] = (time.monotonic() + delay, min(delay * 2, self.max_delay))
+        connection.status = "reconnecting"
+        logger.debug(f"{connection.name}: nächster Versuch in {delay:.1f} s")
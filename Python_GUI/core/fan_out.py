@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Fan-Out für Dynamic Messe Stand V4
+Verfolgt die Zustellung eines Signals an mehrere Ziele gleichzeitig
+"""
+
+import time
+import threading
+
+class FanOut:
+    """Ein Signal, mehrere Ziele - jedes Ziel ist ein Future
+
+    Ziele werden mit add() registriert (z.B. Futures der CommandWriter
+    aller Geräte), seal() schließt die Liste. Jedes Ziel meldet beim
+    Abschluss seine Zeit seit dem Start; callback(fan_out, target) läuft
+    im Thread, der das Future erfüllt (Schreib- bzw. Lese-Thread).
+    Status pro Ziel:
+      sent        geschrieben bzw. Empfang bestätigt
+      failed      Schreibfehler, Timeout, Queue voll, Verbindung weg
+      superseded  durch ein neueres Signal ersetzt
+      pending     noch nicht abgeschlossen
+    """
+
+    def __init__(self, signal_id, value=1, callback=None):
+        self.signal_id = signal_id
+        self.value = value
+        self.callback = callback
+        self.started = time.perf_counter()
+        self.futures = {}           # Ziel -> Future
+        self.finished = {}          # Ziel -> Sekunden seit started
+        self._open = 0
+        self._sealed = False
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+
+    def add(self, target, future):
+        """Ziel registrieren (future False/None = nicht verbunden -> ignoriert)"""
+        if not future:
+            return False
+        with self._lock:
+            self.futures[target] = future
+            self._open += 1
+        future.add_done_callback(lambda _, target=target: self._target_done(target))
+        return True
+
+    def seal(self):
+        """Keine weiteren Ziele - ab jetzt kann der Fan-Out als abgeschlossen gelten"""
+        with self._lock:
+            self._sealed = True
+            if not self._open:
+                self._done.set()
+        return self
+
+    def _target_done(self, target):
+        elapsed = time.perf_counter() - self.started
+        with self._lock:
+            self.finished[target] = elapsed
+            self._open -= 1
+            if self._sealed and not self._open:
+                self._done.set()
+        if self.callback:
+            self.callback(self, target)
+
+    def done(self):
+        return self._done.is_set()
+
+    def wait(self, timeout=None):
+        """Wartet bis alle Ziele abgeschlossen sind -> True, bei Timeout False"""
+        return self._done.wait(timeout)
+
+    def status(self, target):
+        future = self.futures[target]
+        if not future.done():
+            return "pending"
+        if future.cancelled():
+            return "superseded"
+        return "failed" if future.exception() else "sent"
+
+    def results(self):
+        """{ziel: {'status', 'ms'}} - ms seit dem Start, None solange offen"""
+        with self._lock:
+            targets = list(self.futures)
+            finished = dict(self.finished)
+        return {
+            target: {
+                'status': self.status(target),
+                'ms': finished[target] * 1000 if target in finished else None,
+            }
+            for target in targets
+        }
+
+    def counts(self):
+        """Anzahl Ziele pro Status"""
+        counts = {'sent': 0, 'failed': 0, 'superseded': 0, 'pending': 0}
+        for target in list(self.futures):
+            counts[self.status(target)] += 1
+        return counts
+
+    def elapsed_ms(self):
+        """Zeit bis zum letzten abgeschlossenen Ziel (Wanduhr des gesamten Fan-Outs)"""
+        with self._lock:
+            return max(self.finished.values()) * 1000 if self.finished else 0.0
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Liveness für Dynamic Messe Stand V4
+Zuletzt-gesehen pro Gerät und Timer-Wheel: meldet stale/alive genau beim Fristablauf statt per Polling
+"""
+
+import time
+import threading
+from core.logger import logger
+
+DEVICE_STALE = "hardware:device_stale"
+DEVICE_ALIVE = "hardware:device_alive"
+
+class TimerWheel:
+    """Hashed Timing Wheel: schedule()/cancel() in O(1), advance() liefert fällige Schlüssel
+
+    Die Zeit ist in Ticks à tick Sekunden geteilt, jeder Tick hat ein Fach
+    (modulo slots). Fristen jenseits einer Umdrehung liegen schon im
+    richtigen Fach und werden erst in ihrer Runde fällig. Auflösung: eine
+    Frist läuft frühestens zu ihrem Zeitpunkt und höchstens einen Tick
+    später ab.
+    """
+
+    def __init__(self, tick=0.05, slots=256, now=None):
+        self.tick = tick
+        self.slots = [{} for _ in range(slots)]   # Fach -> {schlüssel: tick}
+        self.ticks = {}                            # schlüssel -> tick
+        self.current = int((time.monotonic() if now is None else now) / tick)
+
+    def __len__(self):
+        return len(self.ticks)
+
+    def __contains__(self, key):
+        return key in self.ticks
+
+    def schedule(self, key, deadline):
+        """Frist (monotonic) für key setzen bzw. verschieben"""
+        self.cancel(key)
+        # Aufrunden: nie vor der Frist, und immer mindestens ein Tick in der Zukunft
+        tick = max(-int(-deadline // self.tick), self.current + 1)
+        self.slots[tick % len(self.slots)][key] = tick
+        self.ticks[key] = tick
+
+    def cancel(self, key):
+        tick = self.ticks.pop(key, None)
+        if tick is not None:
+            del self.slots[tick % len(self.slots)][key]
+
+    def advance(self, now):
+        """Uhr bis now vorstellen -> Liste der abgelaufenen Schlüssel"""
+        target = int(now / self.tick)
+        if target <= self.current:
+            return []
+        expired = []
+        # Nach langer Pause reicht eine Umdrehung - jedes Fach wird einmal besucht
+        for tick in range(self.current + 1, min(target, self.current + len(self.slots)) + 1):
+            slot = self.slots[tick % len(self.slots)]
+            for key in [key for key, due in slot.items() if due <= target]:
+                del slot[key]
+                del self.ticks[key]
+                expired.append(key)
+        self.current = target
+        return expired
+
+    def next_due(self):
+        """Zeitpunkt (monotonic) des nächsten belegten Ticks oder None"""
+        slots = len(self.slots)
+        for tick in range(self.current + 1, self.current + slots + 1):
+            slot = self.slots[tick % slots]
+            if any(due == tick for due in slot.values()):
+                return tick * self.tick
+        # Nur Fristen jenseits einer Umdrehung
+        return min(self.ticks.values()) * self.tick if self.ticks else None
+
+class LivenessTracker:
+    """Zuletzt-gesehen pro Gerät; meldet Übergänge alive <-> stale
+
+    seen(gerät) wird für jede empfangene Zeile aufgerufen (beliebiger
+    Thread) und setzt im Normalfall nur einen Zeitstempel. Die Frist im
+    TimerWheel wird dabei nicht verschoben: läuft sie ab, obwohl das Gerät
+    inzwischen etwas gesendet hat, wird sie einfach neu gesetzt. Ist ein
+    Gerät timeout Sekunden still, ruft der Tracker probe(gerät) auf (z.B.
+    PING - auch ein ruhiges Gerät antwortet dann) und wartet weitere
+    probe_timeout Sekunden. Erst danach gilt es als stale. Spätestens
+    timeout + probe_timeout + ein Tick nach der letzten Zeile ist das
+    gemeldet, und die nächste Zeile meldet es sofort wieder als alive.
+    Ein stale Gerät wird alle timeout Sekunden erneut geprüft, damit auch
+    ein ruhiges Gerät nach dem Hänger wieder als alive erkannt wird.
+
+    on_change(topic, gerät, last_seen) mit topic DEVICE_STALE/DEVICE_ALIVE
+    läuft im Thread des Trackers, der nur bis zur nächsten Frist schläft.
+    """
+
+    def __init__(self, timeout=5.0, on_change=None, probe=None, probe_timeout=1.0, tick=0.05):
+        self.timeout = timeout
+        self.probe_timeout = probe_timeout if probe else 0.0
+        self.on_change = on_change
+        self.probe = probe
+        self.wheel = TimerWheel(tick)
+        self.last_seen = {}     # gerät -> monotonic() der letzten Zeile
+        self.state = {}         # gerät -> "alive", "probing" oder "stale"
+        self.transitions = 0
+        self.running = False
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._thread = None
+
+    def start(self):
+        if self.running:
+            return
+        self.running = True
+        self._thread = threading.Thread(target=self._run, name="Liveness", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        with self._lock:
+            self.running = False
+            self._wakeup.notify()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(2.0)
+        self._thread = None
+
+    def watch(self, device):
+        """Gerät überwachen (z.B. nach erfolgreichem Verbinden) - gilt ab jetzt als alive"""
+        now = time.monotonic()
+        with self._lock:
+            previous = self.state.get(device)
+            self.last_seen[device] = now
+            self.state[device] = "alive"
+            self.wheel.schedule(device, now + self.timeout)
+            self._wakeup.notify()
+        if previous == "stale":
+            self._notify(DEVICE_ALIVE, device, now)  # z.B. nach einem Reconnect
+
+    def forget(self, device):
+        """Gerät nicht mehr überwachen (gewolltes Trennen) - ohne Meldung"""
+        with self._lock:
+            self.wheel.cancel(device)
+            self.last_seen.pop(device, None)
+            self.state.pop(device, None)
+
+    def seen(self, device):
+        """Empfangene Zeile (beliebiger Thread)"""
+        now = time.monotonic()
+        self.last_seen[device] = now
+        if self.state.get(device) == "alive":
+            return  # Schneller Weg: die Frist prüft beim Ablauf selbst nach
+        with self._lock:
+            previous = self.state.get(device)
+            if previous is None or previous == "alive":
+                return  # Nicht überwacht bzw. inzwischen schon erledigt
+            self.state[device] = "alive"
+            self.wheel.schedule(device, now + self.timeout)
+            self._wakeup.notify()
+        if previous == "stale":
+            self._notify(DEVICE_ALIVE, device, now)
+
+    def is_alive(self, device):
+        return self.state.get(device) in ("alive", "probing")
+
+    def get_status(self, device):
+        """{'state', 'age'} (age: Sekunden seit der letzten Zeile) oder None"""
+        last_seen = self.last_seen.get(device)
+        if last_seen is None:
+            return None
+        return {'state': self.state.get(device), 'age': time.monotonic() - last_seen}
+
+    def _run(self):
+        with self._lock:
+            while self.running:
+                now = time.monotonic()
+                events, probes = [], []
+                for device in self.wheel.advance(now):
+                    self._expire(device, now, events, probes)
+                if events or probes:
+                    # Callbacks ohne Lock - sie dürfen seen()/watch() aufrufen
+                    self._lock.release()
+                    try:
+                        for device in probes:
+                            self._probe(device)
+                        for topic, device, last_seen in events:
+                            self._notify(topic, device, last_seen)
+                    finally:
+                        self._lock.acquire()
+                    continue
+                due = self.wheel.next_due()
+                # +1 ms: Gleitkomma-Rundung darf den Tick nicht knapp verfehlen
+                self._wakeup.wait(None if due is None else max(0.0, due - time.monotonic()) + 0.001)
+
+    def _expire(self, device, now, events, probes):
+        """Frist abgelaufen (unter Lock)"""
+        state = self.state.get(device)
+        last_seen = self.last_seen.get(device, 0.0)
+        if state is None:
+            return
+        if state == "stale":
+            # Weiter nachfragen - antwortet das Gerät, macht seen() es wieder alive
+            self.wheel.schedule(device, now + self.timeout)
+            probes.append(device)
+            return
+        if state == "alive" and last_seen + self.timeout > now:
+            # Zwischendurch etwas empfangen - Frist nachziehen
+            self.wheel.schedule(device, last_seen + self.timeout)
+        elif state == "alive" and self.probe:
+            self.state[device] = "probing"
+            self.wheel.schedule(device, now + self.probe_timeout)
+            probes.append(device)
+        elif state == "probing" and last_seen + self.timeout > now:
+            # Antwort auf die Probe kam (seen() hat den Zustand schon gesetzt)
+            self.state[device] = "alive"
+            self.wheel.schedule(device, last_seen + self.timeout)
+        else:
+            self.state[device] = "stale"
+            if self.probe:
+                self.wheel.schedule(device, now + self.timeout)
+            events.append((DEVICE_STALE, device, last_seen))
+
+    def _probe(self, device):
+        try:
+            self.probe(device)
+        except Exception as e:
+            logger.debug(f"Liveness-Probe an {device} fehlgeschlagen: {e}")
+
+    def _notify(self, topic, device, last_seen):
+        self.transitions += 1
+        if topic == DEVICE_STALE:
+            logger.warning(f"⚠️ {device}: seit {time.monotonic() - last_seen:.1f} s keine Daten")
+        else:
+            logger.info(f"✅ {device}: sendet wieder")
+        if self.on_change:
+            try:
+                self.on_change(topic, device, last_seen)
+            except Exception as e:
+                logger.error(f"Fehler in Liveness-Callback: {e}")
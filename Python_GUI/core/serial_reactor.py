@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Serial Reactor für Dynamic Messe Stand V4
+Ein einziger selector-basierter Lese-Thread für alle seriellen Verbindungen
+"""
+
+import os
+import selectors
+import threading
+from core.logger import logger
+
+class SerialReactor:
+    """Überwacht alle seriellen File-Deskriptoren und weckt nur bei eingehenden Bytes auf"""
+
+    def __init__(self):
+        self.selector = None
+        self.thread = None
+        self.running = False
+        self._lock = threading.Lock()
+        self._pending = []
+        self._wakeup_read = None
+        self._wakeup_write = None
+
+    def start(self):
+        """Startet den Reactor-Thread"""
+        if self.running:
+            return
+
+        self.selector = selectors.DefaultSelector()
+        self._wakeup_read, self._wakeup_write = os.pipe()
+        os.set_blocking(self._wakeup_read, False)
+        os.set_blocking(self._wakeup_write, False)
+        self.selector.register(self._wakeup_read, selectors.EVENT_READ, None)
+
+        self.running = True
+        self.thread = threading.Thread(target=self._run, name="SerialReactor", daemon=True)
+        self.thread.start()
+        logger.debug(f"Serial-Reactor gestartet ({type(self.selector).__name__})")
+
+    def stop(self):
+        """Stoppt den Reactor-Thread und gibt alle Ressourcen frei"""
+        if not self.running:
+            return
+
+        self.running = False
+        self._wakeup()
+        if self.thread and self.thread.is_alive() and self.thread is not threading.current_thread():
+            self.thread.join(timeout=2)
+
+        self.selector.close()
+        os.close(self._wakeup_read)
+        os.close(self._wakeup_write)
+        self.selector = None
+        logger.debug("Serial-Reactor gestoppt")
+
+    def register(self, connection, timeout=2):
+        """Meldet eine Verbindung beim Reactor an -> True, sobald der Selector sie überwacht
+
+        False, wenn die Registrierung scheitert (der Aufrufer liest dann
+        selbst, z.B. mit eigenem Thread) oder der Reactor nicht antwortet.
+        """
+        if not self.running:
+            return False
+
+        if threading.current_thread() is self.thread:
+            return self._register_now(connection)
+
+        done = self._submit('register', connection)
+        if not done.wait(timeout):
+            with self._lock:
+                for index, item in enumerate(self._pending):
+                    if item[2] is done:
+                        del self._pending[index]
+                        logger.error(f"Reactor antwortet nicht - {connection.name} nicht registriert")
+                        return False
+            done.wait()   # Wird gerade angewendet
+        return done.registered
+
+    def unregister(self, connection, timeout=2):
+        """Meldet eine Verbindung ab (wartet bis der Reactor den Deskriptor freigegeben hat)"""
+        if not self.running:
+            return
+
+        if threading.current_thread() is self.thread:
+            self._unregister_now(connection)
+            return
+
+        done = self._submit('unregister', connection)
+        done.wait(timeout)
+
+    def _submit(self, action, connection):
+        """Übergibt eine Änderung an den Reactor-Thread"""
+        done = threading.Event()
+        with self._lock:
+            self._pending.append((action, connection, done))
+        self._wakeup()
+        return done
+
+    def _wakeup(self):
+        """Weckt den Reactor-Thread über die Self-Pipe"""
+        try:
+            os.write(self._wakeup_write, b'\0')
+        except (BlockingIOError, OSError):
+            pass  # Pipe voll oder geschlossen - Reactor ist ohnehin wach
+
+    def _apply_pending(self):
+        """Wendet angemeldete Registrierungen im Reactor-Thread an"""
+        with self._lock:
+            pending, self._pending = self._pending, []
+
+        for action, connection, done in pending:
+            if action == 'register':
+                done.registered = self.running and self._register_now(connection)
+            else:
+                self._unregister_now(connection)
+            done.set()
+
+    def _register_now(self, connection):
+        try:
+            self.selector.register(connection.connection.fileno(), selectors.EVENT_READ, connection)
+            return True
+        except (ValueError, KeyError, OSError, AttributeError) as e:
+            logger.error(f"Reactor-Registrierung für {connection.name} fehlgeschlagen: {e}")
+            return False
+
+    def _unregister_now(self, connection):
+        """Entfernt eine Verbindung direkt aus dem Selector"""
+        for key in list(self.selector.get_map().values()):
+            if key.data is connection:
+                self.selector.unregister(key.fileobj)
+
+    def _run(self):
+        """Reactor-Schleife: blockiert bis Bytes anliegen"""
+        while self.running:
+            try:
+                events = self.selector.select()
+            except OSError as e:
+                logger.error(f"Reactor select() Fehler: {e}")
+                continue
+
+            for key, _ in events:
+                connection = key.data
+                if connection is None:
+                    try:
+                        while os.read(self._wakeup_read, 512):
+                            pass
+                    except BlockingIOError:
+                        pass
+                    self._apply_pending()
+                    continue
+
+                try:
+                    port = connection.connection
+                    data = port.read(port.in_waiting or 1)
+                except Exception as e:
+                    self._unregister_now(connection)
+                    connection._handle_read_error(e)
+                    continue
+
+                if data:
+                    connection._handle_bytes(data)
+
+        # Beim Beenden noch ausstehende Abmeldungen freigeben
+        self._apply_pending()
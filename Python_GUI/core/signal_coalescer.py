@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Signal Coalescer für Dynamic Messe Stand V4
+Fasst kurz aufeinanderfolgende Seitenwechsel zusammen - nur die letzte Seite wird aufgebaut
+"""
+
+import time
+
+class SignalCoalescer:
+    """Zwischenstufe zwischen Daten-Queue und Seitenaufbau
+
+    add() nimmt die Signale eines Abhol-Durchlaufs entgegen, end_cycle()
+    schließt den Durchlauf ab. Nur das jeweils letzte Signal wird über
+    render(signal, trace) angezeigt; alle davor gehen über skip(signal) nur
+    in die Historie. Ohne settle_ms wird am Ende jedes Durchlaufs angezeigt.
+    Mit settle_ms wartet die Anzeige, bis so lange kein neues Signal kam
+    (höchstens max_wait_ms ab dem ersten wartenden Signal) - dafür werden
+    after/after_cancel des UI-Frameworks benötigt (Tk: root.after).
+    """
+
+    def __init__(self, render, skip=None, settle_ms=0, after=None, after_cancel=None, max_wait_ms=250):
+        if settle_ms and after is None:
+            raise ValueError("settle_ms benötigt eine after()-Funktion")
+        self.render = render
+        self.skip = skip
+        self.settle_ms = settle_ms
+        self.max_wait_ms = max(max_wait_ms, settle_ms)
+        self.after = after
+        self.after_cancel = after_cancel
+        self.rendered = 0          # tatsächlich aufgebaute Seiten
+        self.coalesced = 0         # übersprungene Zwischenseiten
+        self._pending = None       # (signal, trace) des neuesten noch nicht angezeigten Signals
+        self._timer = None
+        self._first_at = None      # monotonic() des ersten wartenden Signals
+
+    def add(self, signal, trace=None):
+        """Neues Signal - ein noch wartendes wird zum Historien-Eintrag"""
+        if self._pending is not None:
+            self.coalesced += 1
+            if self.skip:
+                self.skip(self._pending[0])
+        else:
+            self._first_at = time.monotonic()
+        self._pending = (signal, trace)
+
+    def end_cycle(self):
+        """Abhol-Durchlauf beendet: sofort anzeigen bzw. Ruhefenster (neu) starten"""
+        if self._pending is None:
+            return
+        if not self.settle_ms:
+            self.flush()
+            return
+
+        if self._timer is not None and self.after_cancel:
+            self.after_cancel(self._timer)
+        self._timer = None
+        remaining_ms = self.max_wait_ms - (time.monotonic() - self._first_at) * 1000
+        if remaining_ms <= 0:
+            self.flush()
+        else:
+            self._timer = self.after(int(min(self.settle_ms, remaining_ms)) or 1, self.flush)
+
+    def flush(self):
+        """Wartendes Signal jetzt anzeigen"""
+        if self._timer is not None and self.after_cancel:
+            self.after_cancel(self._timer)
+        self._timer = None
+        self._first_at = None
+        pending, self._pending = self._pending, None
+        if pending is not None:
+            self.rendered += 1
+            self.render(*pending)
+
+    def cancel(self):
+        """Wartendes Signal verwerfen (z.B. beim Beenden)"""
+        if self._timer is not None and self.after_cancel:
+            self.after_cancel(self._timer)
+        self._timer = None
+        self._first_at = None
+        self._pending = None
+
+    def get_stats(self):
+        return {'rendered': self.rendered, 'coalesced': self.coalesced}
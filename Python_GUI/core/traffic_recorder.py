@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Traffic Recorder für Dynamic Messe Stand V4
+Zeichnet rohe Seriell-Bytes pro Gerät mit Zeitstempel auf und spielt sie über Pseudo-Terminals wieder ab
+"""
+
+import os
+import tty
+import time
+import errno
+import select
+import struct
+import threading
+from core.logger import logger
+
+# Dateiformat (append-only, little endian):
+#   Kopf:      MAGIC, einmalig am Dateianfang
+#   Datensatz: <B kanal> <I delta_us> <H länge> <nutzdaten>
+#     kanal 0..DEVICE_MAX  rohe Bytes eines Geräts, delta_us seit dem vorigen Datensatz
+#     kanal CHANNEL_DEVICE Geräte-Deklaration "name\tport" für den nächsten freien Kanal
+#     kanal CHANNEL_SESSION neue Aufnahme-Sitzung, Nutzdaten <d startzeit (time.time())>
+# Lücken über ~71 Minuten werden mit leeren Datensätzen überbrückt.
+MAGIC = b"DMSREC\x01\n"
+RECORD_HEADER = struct.Struct("<BIH")
+SESSION_PAYLOAD = struct.Struct("<d")
+CHANNEL_SESSION = 0xFE
+CHANNEL_DEVICE = 0xFF
+DEVICE_MAX = 0xFD
+MAX_DELTA_US = 0xFFFFFFFF
+MAX_CHUNK = 0xFFFF
+
+class RecordingError(ValueError):
+    """Datei ist keine (gültige) Aufnahme"""
+
+class TrafficRecorder:
+    """Schreibt empfangene Bytes aller Geräte in eine kompakte Aufnahme-Datei
+
+    record() ist thread-sicher und wird direkt aus dem Lesepfad aufgerufen
+    (Reactor-Thread bzw. Lese-Threads). Gepuffert wird im Dateiobjekt;
+    spätestens nach flush_interval Sekunden landen die Daten auf der Platte.
+    Eine bestehende Datei wird mit einer neuen Sitzung fortgesetzt.
+    """
+
+    def __init__(self, path, flush_interval=1.0):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.bytes_recorded = 0
+        self.chunks_recorded = 0
+        self._lock = threading.Lock()
+        self._channels = {}
+        self._last = None
+        self._last_flush = 0.0
+
+        new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+        self._file = open(path, "ab")
+        if new_file:
+            self._file.write(MAGIC)
+        self._write(CHANNEL_SESSION, 0, SESSION_PAYLOAD.pack(time.time()))
+        self._last = time.monotonic()
+        logger.info(f"📼 Aufnahme gestartet: {path}")
+
+    def channel(self, device, port=""):
+        """Aufnahme-Funktion für ein Gerät: channel('esp32_1')(data)"""
+        return lambda data: self.record(device, data, port)
+
+    def record(self, device, data, port="", at=None):
+        """Hängt empfangene Bytes eines Geräts an (at: Empfangszeit als monotonic(), Standard jetzt)"""
+        now = time.monotonic() if at is None else at
+        with self._lock:
+            if self._file is None:
+                return
+            channel = self._channels.get(device)
+            if channel is None:
+                channel = self._declare(device, port)
+
+            delta = max(0, int((now - self._last) * 1_000_000))
+            self._last = now
+            while delta > MAX_DELTA_US:
+                self._write(channel, MAX_DELTA_US, b"")
+                delta -= MAX_DELTA_US
+
+            view = memoryview(data)
+            for start in range(0, len(view), MAX_CHUNK):
+                self._write(channel, delta, view[start:start + MAX_CHUNK])
+                delta = 0
+            self.bytes_recorded += len(data)
+            self.chunks_recorded += 1
+
+            if now - self._last_flush >= self.flush_interval:
+                self._file.flush()
+                self._last_flush = now
+
+    def close(self):
+        """Schreibt den Puffer und schließt die Datei"""
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.close()
+            self._file = None
+        logger.info(f"📼 Aufnahme beendet: {self.bytes_recorded} Bytes in {self.chunks_recorded} Blöcken")
+
+    def _declare(self, device, port):
+        if len(self._channels) > DEVICE_MAX:
+            raise RecordingError("Zu viele Geräte in einer Aufnahme")
+        channel = len(self._channels)
+        self._channels[device] = channel
+        self._write(CHANNEL_DEVICE, 0, f"{device}\t{port or ''}".encode("utf-8"))
+        return channel
+
+    def _write(self, channel, delta, payload):
+        self._file.write(RECORD_HEADER.pack(channel, delta, len(payload)))
+        self._file.write(payload)
+
+def read_recording(path):
+    """Liest eine Aufnahme -> Liste von (zeit_s, gerät, bytes)
+
+    zeit_s ist fortlaufend ab Beginn der Datei; mehrere Sitzungen werden
+    ohne Pause aneinandergehängt.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    if not data.startswith(MAGIC):
+        raise RecordingError(f"{path} ist keine Aufnahme")
+
+    chunks = []
+    names = []
+    elapsed = 0
+    position = len(MAGIC)
+    header_size = RECORD_HEADER.size
+    while position + header_size <= len(data):
+        channel, delta, length = RECORD_HEADER.unpack_from(data, position)
+        position += header_size
+        payload = data[position:position + length]
+        position += length
+        if len(payload) < length:
+            break  # Abgeschnittener letzter Datensatz (Absturz während der Aufnahme)
+
+        if channel == CHANNEL_SESSION:
+            names = []
+        elif channel == CHANNEL_DEVICE:
+            names.append(payload.decode("utf-8", "replace").split("\t")[0])
+        else:
+            elapsed += delta
+            if payload:
+                if channel >= len(names):
+                    raise RecordingError(f"Kanal {channel} ohne Geräte-Deklaration")
+                chunks.append((elapsed / 1_000_000, names[channel], payload))
+    return chunks
+
+class TrafficReplayer:
+    """Spielt eine Aufnahme über ein Pseudo-Terminal pro Gerät ab
+
+    open() legt die PTYs an und liefert {gerät: pfad}; diese Pfade
+    werden wie echte Ports geöffnet (GUI, cli_monitor.py, HardwareManager).
+    speed 1.0 = Echtzeit, N = N-fach, None = so schnell wie die Leser
+    abnehmen (Schreiben blockiert bei vollem PTY-Puffer). Was die Leser
+    an die "Geräte" senden, wird verworfen.
+    """
+
+    def __init__(self, chunks, link_dir=None):
+        self.chunks = chunks
+        self.link_dir = link_dir
+        self.devices = sorted({device for _, device, _ in chunks})
+        self.paths = {}
+        self.bytes_sent = 0
+        self.duration = 0.0
+        self.finished = threading.Event()
+        self._masters = {}
+        self._links = []
+        self._running = False
+        self._thread = None
+        self._drain_thread = None
+
+    def open(self):
+        """Legt die PTYs an -> {gerät: pfad}"""
+        for device in self.devices:
+            master, slave = os.openpty()
+            tty.setraw(slave)   # Keine Zeilenend-Umwandlung, kein Echo
+            path = os.ttyname(slave)
+            os.close(slave)     # Ohne offenen Leser meldet der Master POLLHUP
+            self._masters[device] = master
+
+            if self.link_dir:
+                link = os.path.join(self.link_dir, device)
+                if os.path.lexists(link):
+                    os.unlink(link)
+                os.symlink(path, link)
+                self._links.append(link)
+                path = link
+            self.paths[device] = path
+
+        self._running = True
+        self._drain_thread = threading.Thread(target=self._drain, name="ReplayDrain", daemon=True)
+        self._drain_thread.start()
+        return dict(self.paths)
+
+    def wait_for_readers(self, timeout=None):
+        """Wartet, bis jedes PTY von einem Leser geöffnet wurde"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        poller = select.poll()
+        for master in self._masters.values():
+            poller.register(master, select.POLLIN)
+        while self._running:
+            if not any(mask & select.POLLHUP for _, mask in poller.poll(0)):
+                return True
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.05)
+        return False
+
+    def start(self, speed=1.0):
+        """Startet die Wiedergabe im Hintergrund"""
+        self.finished.clear()
+        self._thread = threading.Thread(target=self._replay, args=(speed,),
+                                        name="TrafficReplayer", daemon=True)
+        self._thread.start()
+
+    def run(self, speed=1.0):
+        """Wiedergabe im aufrufenden Thread"""
+        self.finished.clear()
+        self._replay(speed)
+
+    def close(self):
+        """Beendet die Wiedergabe und entfernt PTYs und Symlinks"""
+        self._running = False
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2)
+        if self._drain_thread:
+            self._drain_thread.join(timeout=2)
+        for master in self._masters.values():
+            os.close(master)
+        self._masters.clear()
+        for link in self._links:
+            if os.path.lexists(link):
+                os.unlink(link)
+        self._links.clear()
+
+    def _replay(self, speed):
+        start = time.monotonic()
+        masters = self._masters
+        try:
+            for timestamp, device, payload in self.chunks:
+                if not self._running:
+                    break
+                if speed:
+                    delay = start + timestamp / speed - time.monotonic()
+                    if delay > 0:
+                        time.sleep(delay)
+                os.write(masters[device], payload)
+                self.bytes_sent += len(payload)
+        except OSError as e:
+            logger.error(f"Wiedergabe abgebrochen: {e}")
+        finally:
+            self.duration = time.monotonic() - start
+            self.finished.set()
+
+    def _drain(self):
+        """Verwirft Befehle der Leser (PING, BINARY:1 ...), damit deren write() nie blockiert"""
+        while self._running:
+            masters = list(self._masters.values())
+            try:
+                readable, _, _ = select.select(masters, [], [], 0.2)
+            except (OSError, ValueError):
+                break
+            for master in readable:
+                try:
+                    os.read(master, 4096)
+                except OSError as e:
+                    if e.errno == errno.EIO:
+                        time.sleep(0.05)  # Kein Leser geöffnet
@@ -14,17 +14,20 @@ sys.path.insert(0, os.path.dirname(__file__))
 from core.logger import logger
 from core.config import config
 from models.hardware import hardware_manager
+from core.traffic_recorder import TrafficReplayer, read_recording
+from core.device_supervisor import DeviceSupervisor
+from core.latency_trace import latency_tracer
+from services.device_farm import FarmProcess
 from ui.main_window import MainWindow
 
-def setup_hardware():
+def setup_hardware(esp32_count=3):
     """Initialisiert Hardware-Verbindungen"""
     logger.info("🔌 Hardware-Setup wird gestartet...")
     
     try:
         # ESP32-Verbindungen hinzufügen
-        esp32_1 = hardware_manager.add_esp32(config.hardware['esp32_1_port'], 1)
-        esp32_2 = hardware_manager.add_esp32(config.hardware['esp32_2_port'], 2)
-        esp32_3 = hardware_manager.add_esp32(config.hardware['esp32_3_port'], 3)
+        for number in range(1, esp32_count + 1):
+            hardware_manager.add_esp32(config.hardware.get(f'esp32_{number}_port'), number)
         
         # Arduino GIGA hinzufügen
         giga = hardware_manager.add_giga(config.hardware['giga_port'])
@@ -43,16 +46,66 @@ def setup_hardware():
         logger.error(f"Fehler beim Hardware-Setup: {e}")
         return False
 
+def setup_replay(path):
+    """Ersetzt die Geräte-Ports durch PTYs, über die eine Aufnahme abgespielt wird"""
+    replayer = TrafficReplayer(read_recording(path))
+    paths = replayer.open()
+    for device in ("esp32_1", "esp32_2", "esp32_3", "giga"):
+        # "" statt None: nicht aufgezeichnete Geräte bleiben getrennt statt echte Hardware zu suchen
+        config.hardware[f'{device}_port'] = paths.get(device, "")
+    config.hardware['hotplug'] = False
+    logger.info(f"📼 Wiedergabe von {path}: {', '.join(f'{d} -> {p}' for d, p in paths.items())}")
+    return replayer
+
+def setup_simulation(esp32_count):
+    """Startet die Device Farm und verbindet den HardwareManager mit ihren PTYs"""
+    settings = dict(config.simulation, udp_loopback=config.hardware['udp_direct'])
+    farm = FarmProcess(esp32_count, settings)
+    for device, path in farm.start().items():
+        config.hardware[f'{device}_port'] = path
+    if config.hardware['udp_direct']:
+        # Direkte UDP-Pakete an die Loopback-Empfänger der virtuellen ESP32s
+        config.hardware['udp_targets'] = farm.udp_addresses()
+    # Hotplug im Farm-Verzeichnis statt in /dev überwachen
+    hardware_manager.supervisor = DeviceSupervisor(hardware_manager, directory=farm.directory)
+    return farm
+
 def main():
     """Hauptfunktion"""
     # Argument-Parser
     parser = argparse.ArgumentParser(description='Dynamic Messe Stand V4')
-    parser.add_argument('--esp32-port', help='ESP32 Port (Standard: /dev/ttyUSB0)')
+    parser.add_argument('--esp32-port', help='ESP32 Port (Standard: automatisch über USB-Identität)')
     parser.add_argument('--no-hardware', action='store_true', help='Ohne Hardware-Verbindungen starten')
     parser.add_argument('--debug', action='store_true', help='Debug-Modus aktivieren')
+    parser.add_argument('--record', metavar='DATEI', help='Rohe Seriell-Daten aller Geräte aufzeichnen')
+    parser.add_argument('--replay', metavar='DATEI', help='Aufnahme statt echter Hardware abspielen')
+    parser.add_argument('--replay-speed', type=float, default=1.0,
+                        help='Wiedergabe-Geschwindigkeit (1 = Echtzeit, 0 = maximal)')
+    parser.add_argument('--simulate', type=int, metavar='N',
+                        help='N virtuelle ESP32 + GIGA statt echter Hardware (Device Farm)')
+    parser.add_argument('--sim-rate', type=float, help='Simulation: Signale pro Sekunde und ESP32')
+    parser.add_argument('--sim-noise', type=float, help='Simulation: Anteil gestörter Zeilen (0..1)')
+    parser.add_argument('--sim-disconnect', type=float, metavar='SEK',
+                        help='Simulation: mittlerer Abstand zwischen Verbindungsabbrüchen')
+    parser.add_argument('--udp-direct', action='store_true',
+                        help='Seitensignale direkt per UDP an die ESP32s senden (Fallback: GIGA)')
+    parser.add_argument('--latency-report', nargs='?', const='-', metavar='DATEI',
+                        help='Signal-Latenz pro Station beim Beenden ausgeben (ohne DATEI: Konsole)')
     
     args = parser.parse_args()
     
+    # Fester Port überschreibt die automatische Erkennung für den Haupt-ESP32
+    if args.esp32_port:
+        config.hardware['esp32_1_port'] = args.esp32_port
+    if args.record:
+        config.hardware['record_path'] = args.record
+    if args.udp_direct:
+        config.hardware['udp_direct'] = True
+    for option, key in (('sim_rate', 'signal_rate'), ('sim_noise', 'noise'),
+                        ('sim_disconnect', 'disconnect_interval')):
+        if getattr(args, option) is not None:
+            config.simulation[key] = getattr(args, option)
+    
     # Logging-Level setzen
     if args.debug:
         import logging
@@ -62,10 +115,21 @@ def main():
     logger.info(f"Python Version: {sys.version}")
     logger.info(f"Arbeitsverzeichnis: {os.getcwd()}")
     
+    replayer = None
+    farm = None
+    esp32_count = 3
     try:
+        if args.replay:
+            replayer = setup_replay(args.replay)
+        elif args.simulate:
+            farm = setup_simulation(args.simulate)
+            esp32_count = args.simulate
+        
         # Hardware-Setup (falls gewünscht)
         if not args.no_hardware:
-            hardware_success = setup_hardware()
+            hardware_success = setup_hardware(esp32_count)
+            if replayer:
+                replayer.start(args.replay_speed or None)
             if not hardware_success:
                 logger.warning("⚠️ Keine Hardware-Verbindungen erfolgreich - GUI startet trotzdem")
         else:
@@ -91,6 +155,12 @@ def main():
         # Cleanup
         logger.info("🧹 Cleanup wird durchgeführt...")
         hardware_manager.disconnect_all()
+        if replayer:
+            replayer.close()
+        if farm:
+            farm.stop()
+        if args.latency_report:
+            latency_tracer.write_report(args.latency_report)
         logger.info("👋 Dynamic Messe Stand V4 beendet")
 
 if __name__ == "__main__":
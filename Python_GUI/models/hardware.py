@@ -7,9 +7,35 @@ ESP32 und Arduino GIGA Verbindungsmanagement
 import serial
 import threading
 import time
-import queue
+import functools
+from concurrent.futures import Future, InvalidStateError
 from core.logger import logger
 from core.config import config
+from core.serial_reactor import SerialReactor
+from core.device_supervisor import DeviceSupervisor
+from core.device_index import device_index
+from core.line_framer import LineFramer
+from core.traffic_recorder import TrafficRecorder
+from core.latency_trace import latency_tracer
+from core.ring_queue import RingQueue
+from core.command_writer import CommandWriter, command_merge_key
+from core.fan_out import FanOut
+from core.udp_transport import UdpTransport, parse_address
+from core.udp_link import UdpLink
+from core.liveness import LivenessTracker
+from core.binary_frames import (
+    BINARY_ACK, BINARY_OFFER, FrameError, encode_ping, encode_signal, encode_udp_send
+)
+
+# Startmeldungen der Sketches - danach wird das Binär-Angebot wiederholt,
+# falls es während des Resets beim Öffnen des Ports verloren ging
+READY_LINES = ("ESP32 bereit für UDP-Empfang!", "GIGA bereit für UDP-Übertragung!")
+# Meldung des ESP32-Sketches zu jedem empfangenen UDP-Paket
+UDP_RECEIVED_PREFIX = "UDP empfangen von "
+
+def _line_signal_key(item):
+    """Schlüssel für RingQueue(latest_signal): alle SIGNAL-Zeilen eines Geräts ersetzen einander"""
+    return "signal" if item['data'].startswith("SIGNAL:") else None
 
 class HardwareConnection:
     """Basis-Klasse für Hardware-Verbindungen"""
@@ -20,18 +46,45 @@ class HardwareConnection:
         self.baud_rate = baud_rate
         self.connection = None
         self.thread = None
+        self.reactor = None
+        self.writer = None               # Schreib-Thread mit Befehls-Queue (CommandWriter)
         self.running = False
-        self.data_queue = queue.Queue()
+        self.data_queue = RingQueue(config.hardware.get('queue_size', 256),
+                                    config.hardware.get('queue_policy', 'latest_signal'),
+                                    signal_key=_line_signal_key,
+                                    block_timeout=config.hardware.get('queue_block_timeout', 1.0))
         self.status = "disconnected"
+        self.framer = LineFramer()
+        self.binary_mode = False
+        self.binary_state = "off"   # off, offered, on, unsupported
+        self._tx_sequence = 0
+        self.on_connection_lost = None   # Callback bei Lesefehlern (Supervisor)
+        self.role = None                 # Rolle im Geräte-Index, falls der Port automatisch ermittelt wird
+        self.recorder = None             # Aufnahme-Funktion für rohe Bytes (TrafficRecorder.channel)
+        self.on_data = None              # Wird nach neuen Zeilen aufgerufen (z.B. TkWakeup.notify)
+        self.on_seen = None              # Wird bei jeder empfangenen Zeile aufgerufen (LivenessTracker.seen)
+        self.receipt = None              # (präfix, suffix, Future) einer erwarteten Zeile - expect_line()
+        self.reconnect_count = 0
+        self.downtime = 0.0              # Summe abgeschlossener Ausfälle in Sekunden
+        self.down_since = None           # monotonic() seit Beginn des laufenden Ausfalls
     
     def connect(self):
         """Verbindung zur Hardware herstellen"""
+        if not self.port:
+            self.status = "disconnected"
+            logger.warning(f"{self.name}: kein passendes USB-Gerät gefunden")
+            return False
+        
         try:
             self.connection = serial.Serial(
                 self.port, 
                 self.baud_rate, 
-                timeout=config.hardware['timeout']
+                timeout=config.hardware['timeout'],
+                write_timeout=config.hardware.get('write_timeout', 1.0)
             )
+            self.writer = CommandWriter(self.name, self.connection.write,
+                                        config.hardware.get('command_queue_size', 64))
+            self.writer.start()
             self.status = "connected"
             logger.info(f"{self.name} verbunden auf {self.port}")
             return True
@@ -43,53 +96,233 @@ class HardwareConnection:
     def disconnect(self):
         """Verbindung trennen"""
         self.running = False
+        if self.reactor:
+            self.reactor.unregister(self)
+            self.reactor = None
         if self.thread and self.thread.is_alive():
             self.thread.join(timeout=2)
+        self._stop_writer()
+        self._drop_receipt()
         
         if self.connection and self.connection.is_open:
             self.connection.close()
             self.status = "disconnected"
             logger.info(f"{self.name} getrennt")
     
-    def start_reading(self):
-        """Startet das Lesen von Daten in einem separaten Thread"""
+    def close_port(self):
+        """Schließt nur den Port nach einem Ausfall - Statistiken bleiben erhalten"""
+        self.running = False
+        if self.reactor:
+            self.reactor.unregister(self)
+            self.reactor = None
+        self._stop_writer()
+        self._drop_receipt()
+        if self.connection and self.connection.is_open:
+            try:
+                self.connection.close()
+            except Exception:
+                pass
+    
+    def _stop_writer(self):
+        """Beendet den Schreib-Thread - noch wartende Befehle scheitern mit WriterStopped"""
+        if self.writer:
+            self.writer.stop()
+            self.writer = None
+    
+    def current_downtime(self):
+        """Gesamte Ausfallzeit in Sekunden inklusive eines laufenden Ausfalls"""
+        if self.down_since is None:
+            return self.downtime
+        return self.downtime + time.monotonic() - self.down_since
+    
+    def get_status_info(self):
+        """Status, Port, Reconnect- und Queue-Statistik als Dictionary"""
+        return {
+            'status': self.status,
+            'port': self.port,
+            'reconnects': self.reconnect_count,
+            'downtime': self.current_downtime(),
+            'queue': self.data_queue.get_stats(),
+            'writer': self.writer.get_stats() if self.writer else None
+        }
+    
+    def start_reading(self, reactor=None):
+        """Startet das Lesen von Daten über den Reactor (Fallback: eigener Thread)"""
         if not self.connection or not self.connection.is_open:
             return False
         
         self.running = True
+        self.framer.reset()
+        self.binary_mode = False
+        self.binary_state = "off"
+        
+        if reactor and self._has_fileno():
+            # Erst nach erfolgreicher Registrierung zuordnen - sonst liest niemand
+            if reactor.register(self):
+                self.reactor = reactor
+                return True
+            logger.warning(f"{self.name}: Reactor nicht verfügbar - eigener Lese-Thread")
+        
         self.thread = threading.Thread(target=self._read_loop, daemon=True)
         self.thread.start()
         return True
     
+    def _has_fileno(self):
+        """Prüft ob die Verbindung einen pollbaren File-Deskriptor hat"""
+        try:
+            return self.connection.fileno() >= 0
+        except (AttributeError, ValueError, OSError):
+            return False
+    
+    def _handle_bytes(self, data):
+        """Verarbeitet rohe Bytes und legt vollständige Zeilen in die Queue"""
+        read_at = time.perf_counter()
+        if self.recorder:
+            self.recorder(data)
+        self._enqueue_lines(self.framer.feed(data), read_at)
+    
+    def _enqueue_lines(self, lines, read_at=None):
+        """Legt empfangene Zeilen in die data_queue (SIGNAL-Zeilen mit Latenz-Trace)"""
+        if not lines:
+            return
+        if self.on_seen:
+            self.on_seen()
+        if self.binary_state == "offered":
+            self._check_binary_reply(lines)
+        if self.receipt is not None:
+            self._check_receipt(lines)
+        timestamp = time.time()
+        for line in lines:
+            item = {
+                'timestamp': timestamp,
+                'source': self.name,
+                'data': line
+            }
+            if line.startswith("SIGNAL:"):
+                trace = latency_tracer.begin(self.name, line[7:], read_at)
+                if trace:
+                    # Vor put() markieren - danach kann der UI-Thread das Signal schon holen
+                    latency_tracer.mark(trace, "queued")
+                    item['trace'] = trace
+            self.data_queue.put(item)
+        if self.on_data:
+            self.on_data()
+    
+    def _check_binary_reply(self, lines):
+        """Wertet die Antwort auf das Binär-Angebot aus"""
+        for line in lines:
+            if line == BINARY_ACK:
+                self.binary_state = "on"
+                self.binary_mode = True
+                logger.info(f"{self.name}: Binär-Protokoll aktiv")
+            elif line.startswith("Unbekannter Befehl") and BINARY_OFFER in line:
+                self.binary_state = "unsupported"
+                logger.info(f"{self.name}: Firmware ohne Binär-Protokoll - Text-Protokoll bleibt aktiv")
+            elif line in READY_LINES:
+                self.send_data(BINARY_OFFER)
+    
+    def expect_line(self, prefix, suffix=""):
+        """Future, das sich erfüllt, sobald eine Zeile mit prefix...suffix ankommt
+        
+        Pro Verbindung wird nur eine Zeile erwartet - eine neue Erwartung
+        ersetzt die alte (deren Future wird abgebrochen).
+        """
+        future = Future()
+        previous, self.receipt = self.receipt, (prefix, suffix, future)
+        if previous is not None:
+            previous[2].cancel()
+        return future
+    
+    def _check_receipt(self, lines):
+        receipt = self.receipt
+        if receipt is None:
+            return
+        prefix, suffix, future = receipt
+        for line in lines:
+            if line.startswith(prefix) and line.endswith(suffix):
+                self.receipt = None
+                try:
+                    future.set_result(True)
+                except InvalidStateError:
+                    pass  # Inzwischen durch eine neuere Erwartung ersetzt
+                return
+    
+    def _drop_receipt(self):
+        """Erwartete Zeile kommt nicht mehr - Verbindung ist weg"""
+        receipt, self.receipt = self.receipt, None
+        if receipt is not None:
+            try:
+                receipt[2].set_exception(ConnectionError(f"{self.name}: Verbindung geschlossen"))
+            except InvalidStateError:
+                pass
+    
+    def _handle_read_error(self, error):
+        """Wird vom Reactor bei Lesefehlern aufgerufen"""
+        self.reactor = None
+        self._connection_lost(error)
+    
+    def _connection_lost(self, error):
+        """Lesepfad ist ausgefallen (z.B. USB-Kabel gezogen) - Port schließen und melden"""
+        self.status = "error"
+        logger.error(f"Fehler beim Lesen von {self.name}: {error}")
+        self.close_port()
+        if self.on_connection_lost:
+            self.on_connection_lost(self)
+    
     def _read_loop(self):
-        """Lese-Schleife für eingehende Daten"""
+        """Lese-Schleife für eingehende Daten (Fallback ohne Reactor)"""
         while self.running and self.connection and self.connection.is_open:
             try:
-                if self.connection.in_waiting > 0:
-                    data = self.connection.readline().decode('utf-8').strip()
-                    if data:
-                        self.data_queue.put({
-                            'timestamp': time.time(),
-                            'source': self.name,
-                            'data': data
-                        })
-                time.sleep(0.01)  # Kurze Pause
+                # Wie LineFramer.read_from, aber mit Zugriff auf die rohen Bytes (Aufnahme)
+                data = self.connection.read(self.connection.in_waiting or 1)
+                if data:
+                    self._handle_bytes(data)
             except Exception as e:
-                logger.error(f"Fehler beim Lesen von {self.name}: {e}")
+                if self.running:  # Nicht beim gewollten Trennen melden
+                    self._connection_lost(e)
                 break
     
-    def send_data(self, data):
-        """Daten an Hardware senden"""
-        if not self.connection or not self.connection.is_open:
+    def send_data(self, data, merge_key=None, callback=None):
+        """Textbefehl an die Hardware senden (blockiert nie)
+        
+        Der Befehl wird im Schreib-Thread geschrieben; zurück kommt ein Future
+        (siehe CommandWriter) oder False ohne Verbindung. Ein noch wartender
+        Befehl mit gleichem merge_key (Standard: command_merge_key) wird ersetzt.
+        """
+        writer = self.writer
+        if not writer or not self.connection or not self.connection.is_open:
             return False
         
-        try:
-            self.connection.write(f"{data}\n".encode('utf-8'))
-            logger.debug(f"Gesendet an {self.name}: {data}")
-            return True
-        except Exception as e:
-            logger.error(f"Fehler beim Senden an {self.name}: {e}")
+        if merge_key is None:
+            merge_key = command_merge_key(data)
+        logger.debug(f"Senden an {self.name}: {data}")
+        return writer.submit(f"{data}\n".encode('utf-8'), merge_key, callback)
+    
+    def request_binary_mode(self):
+        """Bietet dem Gerät das Binär-Protokoll an (Antwort wird asynchron ausgewertet)"""
+        if self.binary_state in ("on", "unsupported"):
+            return self.binary_mode
+        self.binary_state = "offered"
+        return self.send_data(BINARY_OFFER)
+    
+    def ping(self):
+        """Sendet PING (Text oder Binär-Frame) - das Gerät antwortet mit einer PONG-Zeile"""
+        if self.binary_mode:
+            return self.send_frame(encode_ping(self.next_sequence()), "PING")
+        return self.send_data("PING", "PING")
+    
+    def next_sequence(self):
+        """Nächste Frame-Sequenznummer (0-255, umlaufend)"""
+        self._tx_sequence = (self._tx_sequence + 1) & 0xFF
+        return self._tx_sequence
+    
+    def send_frame(self, frame, merge_key=None, callback=None):
+        """Sendet einen fertig kodierten Binär-Frame über den Schreib-Thread (Future oder False)"""
+        writer = self.writer
+        if not writer or not self.connection or not self.connection.is_open:
             return False
+        
+        return writer.submit(frame, merge_key, callback)
 
 class ESP32Connection(HardwareConnection):
     """ESP32-spezifische Verbindungsklasse"""
@@ -99,10 +332,16 @@ class ESP32Connection(HardwareConnection):
         self.instance_number = instance_number
         self.signals = {}
     
-    def send_signal(self, signal_id, value=1):
-        """Sendet ein Signal an den ESP32"""
+    def send_signal(self, signal_id, value=1, callback=None):
+        """Sendet ein Signal an den ESP32 (ein noch wartendes Signal wird ersetzt)"""
+        if self.binary_mode:
+            try:
+                return self.send_frame(encode_signal(self.next_sequence(), signal_id, value),
+                                       "SIGNAL", callback)
+            except FrameError:
+                pass  # Nicht binär darstellbar - Text-Protokoll verwenden
         command = f"SIGNAL:{signal_id}:{value}"
-        return self.send_data(command)
+        return self.send_data(command, "SIGNAL", callback)
     
     def flash_firmware(self, firmware_path):
         """Flash neue Firmware auf ESP32"""
@@ -115,7 +354,6 @@ class GIGAConnection(HardwareConnection):
     """Arduino GIGA-spezifische Verbindungsklasse"""
     
     def __init__(self, port=None):
-        port = port or config.hardware['giga_port']
         super().__init__(port, "Arduino GIGA")
         self.udp_enabled = False
     
@@ -127,69 +365,315 @@ class GIGAConnection(HardwareConnection):
         """Deaktiviert UDP-Sender Modus"""
         return self.send_data("UDP_DISABLE")
     
-    def send_udp_signal(self, target_ip, signal_id, value):
-        """Sendet UDP-Signal über GIGA"""
+    def send_udp_signal(self, target_ip, signal_id, value, callback=None):
+        """Sendet UDP-Signal über GIGA (ein noch wartendes Signal an dieselbe IP wird ersetzt)"""
+        merge_key = f"UDP_SEND:{target_ip}"
+        if self.binary_mode:
+            try:
+                return self.send_frame(encode_udp_send(self.next_sequence(), target_ip, signal_id, value),
+                                       merge_key, callback)
+            except FrameError:
+                pass  # Nicht binär darstellbar - Text-Protokoll verwenden
         command = f"UDP_SEND:{target_ip}:{signal_id}:{value}"
-        return self.send_data(command)
+        return self.send_data(command, merge_key, callback)
+    
+    def broadcast_signal(self, signal_id, value=1, callback=None):
+        """Ein Broadcast-Paket über GIGA an alle ESP32s (ein noch wartendes Signal wird ersetzt)"""
+        if self.binary_mode:
+            try:
+                return self.send_frame(encode_signal(self.next_sequence(), signal_id, value),
+                                       "SIGNAL", callback)
+            except FrameError:
+                pass  # Nicht binär darstellbar - Text-Protokoll verwenden
+        return self.send_data(f"SIGNAL:{signal_id}:{value}", "SIGNAL", callback)
 
 class HardwareManager:
     """Verwaltet alle Hardware-Verbindungen"""
     
     def __init__(self):
         self.connections = {}
-        self.data_queue = queue.Queue()
         self.running = False
         self.monitor_thread = None
+        self.reactor = SerialReactor()
+        self.supervisor = DeviceSupervisor(self)
+        self.device_index = device_index
+        self.device_index.role_serials.update(config.hardware.get('device_serials') or {})
+        self.device_index.role_locations.update(config.hardware.get('device_locations') or {})
+        self.recorder = None
+        self.data_notifier = None
+        self.transport = None            # Direkter Signalweg zu den ESP32s (z.B. UdpTransport), sonst GIGA
+        self.status_listeners = []       # callback(topic, gerät) bei Statuswechseln (z.B. Status-Panel)
+        self.liveness = LivenessTracker(config.hardware.get('liveness_timeout', 5.0),
+                                        self._liveness_changed, probe=self._probe,
+                                        probe_timeout=config.hardware.get('liveness_probe_timeout', 1.0))
+    
+    def set_transport(self, transport):
+        """Direkten Signalweg einsetzen bzw. mit None entfernen (dann wieder nur über GIGA)
+        
+        Ein Transport braucht open(), close(), is_open(), send_signal(signal_id,
+        value) -> {rolle: Future}, link_quality() und get_stats(); confirms
+        gibt an, ob seine Futures erst mit der Bestätigung des Empfängers
+        fertig werden (UdpLink) oder schon beim Absenden (UdpTransport).
+        """
+        if self.transport is not None and self.transport is not transport:
+            self.transport.close()
+        self.transport = transport
+        if transport is not None:
+            transport.open()
+        return transport
+    
+    def set_data_notifier(self, callback):
+        """Callback nach neuen Daten eines Geräts (aus dem Lese-Thread, z.B. TkWakeup.notify)"""
+        self.data_notifier = callback
+        for connection in self.connections.values():
+            connection.on_data = callback
+    
+    def add_status_listener(self, callback):
+        """callback(topic, gerät) bei Statuswechseln - aus Lese-, Reconnect- oder Liveness-Thread
+        
+        Topics: hardware:connection_changed (verbunden/ausgefallen),
+        hardware:device_stale / hardware:device_alive (LivenessTracker) und
+        hardware:link_updated (neue Messwerte des UdpLink).
+        """
+        if callback not in self.status_listeners:
+            self.status_listeners.append(callback)
+    
+    def remove_status_listener(self, callback):
+        if callback in self.status_listeners:
+            self.status_listeners.remove(callback)
     
-    def add_esp32(self, port, instance_number=1):
-        """Fügt eine ESP32-Verbindung hinzu"""
+    def _notify_status(self, topic, name):
+        for callback in list(self.status_listeners):
+            try:
+                callback(topic, name)
+            except Exception as e:
+                logger.error(f"Fehler in Status-Listener: {e}")
+    
+    def _liveness_changed(self, topic, name, last_seen):
+        self._notify_status(topic, name)
+    
+    def _link_updated(self, role, quality):
+        self._notify_status("hardware:link_updated", role)
+    
+    def _probe(self, name):
+        """Liveness-Probe: ein stilles Gerät per PING zu einer Antwort bewegen"""
+        connection = self.connections.get(name)
+        if connection is not None and connection.status == "connected":
+            connection.ping()
+    
+    def _name_of(self, connection):
+        """Schlüssel einer Verbindung in self.connections (esp32_1, giga, ...)"""
+        for name, candidate in self.connections.items():
+            if candidate is connection:
+                return name
+        return connection.name
+    
+    def add_esp32(self, port=None, instance_number=1):
+        """Fügt eine ESP32-Verbindung hinzu (ohne Port: über den Geräte-Index)"""
+        role = f"esp32_{instance_number}"
         esp32 = ESP32Connection(port, instance_number)
-        self.connections[f"esp32_{instance_number}"] = esp32
+        self._assign_role(esp32, role, port)
+        self.connections[role] = esp32
         return esp32
     
     def add_giga(self, port=None):
-        """Fügt eine GIGA-Verbindung hinzu"""
+        """Fügt eine GIGA-Verbindung hinzu (ohne Port: über den Geräte-Index)"""
         giga = GIGAConnection(port)
+        self._assign_role(giga, "giga", port)
         self.connections["giga"] = giga
         return giga
     
+    def _assign_role(self, connection, role, port):
+        """Fester Port gewinnt, sonst bestimmt der Geräte-Index den Port"""
+        if port is None:
+            connection.role = role
+            self.resolve_port(connection)
+    
+    def resolve_port(self, connection):
+        """Aktualisiert den Port einer Verbindung aus dem Geräte-Index
+        
+        None, wenn das Gerät der Rolle fehlt oder eine andere Verbindung den Knoten geöffnet hat.
+        """
+        if not connection.role:
+            return connection.port
+        node = self.device_index.resolve(connection.role)
+        if node is None:
+            return None
+        holder = self._holder_of(node, connection)
+        if holder is not None:
+            logger.warning(f"{connection.name}: {node} ist bereits von {holder.name} geöffnet")
+            return None
+        if node != connection.port:
+            if connection.port:
+                logger.info(f"{connection.name}: Port {connection.port} -> {node}")
+            connection.port = node
+        return node
+    
+    def _holder_of(self, node, connection):
+        """Andere Verbindung, die node gerade geöffnet hat, oder None"""
+        for other in self.connections.values():
+            if other is not connection and other.port == node \
+                    and other.connection is not None and other.connection.is_open:
+                return other
+        return None
+    
     def connect_all(self):
         """Verbindet alle Hardware-Geräte"""
         results = {}
+        self.reactor.start()
+        self.liveness.start()
+        if config.hardware.get('record_path') and not self.recorder:
+            self.start_recording(config.hardware['record_path'])
+        if config.hardware.get('udp_direct') and self.transport is None:
+            targets = config.hardware.get('udp_targets') or {}
+            port = config.hardware.get('udp_port', 8889)
+            if config.hardware.get('udp_link'):
+                self.set_transport(UdpLink(targets, port,
+                                           config.hardware.get('udp_heartbeat_interval', 2.0),
+                                           config.hardware.get('udp_ack_timeout', 0.5),
+                                           on_update=self._link_updated,
+                                           max_retries=config.hardware.get('udp_max_retries', 4)))
+            else:
+                self.set_transport(UdpTransport(targets, port))
         for name, connection in self.connections.items():
-            results[name] = connection.connect()
-            if results[name]:
-                connection.start_reading()
+            self._attach_recorder(name, connection)
+            results[name] = self.start_connection(connection)
+        if config.hardware.get('hotplug'):
+            self.supervisor.start()
         return results
     
+    def start_recording(self, path):
+        """Zeichnet ab sofort alle empfangenen Bytes in path auf (wird fortgesetzt, falls vorhanden)"""
+        self.stop_recording()
+        self.recorder = TrafficRecorder(path)
+        for name, connection in self.connections.items():
+            self._attach_recorder(name, connection)
+        return self.recorder
+    
+    def stop_recording(self):
+        """Beendet eine laufende Aufnahme"""
+        if not self.recorder:
+            return
+        for connection in self.connections.values():
+            connection.recorder = None
+        self.recorder.close()
+        self.recorder = None
+    
+    def _attach_recorder(self, name, connection):
+        if self.recorder and connection.recorder is None:
+            connection.recorder = self.recorder.channel(name, connection.port)
+    
+    def start_connection(self, connection):
+        """Verbindet ein einzelnes Gerät und startet das Lesen (auch für Reconnects)"""
+        name = self._name_of(connection)
+        connection.on_connection_lost = self._connection_lost
+        connection.on_data = self.data_notifier
+        connection.on_seen = functools.partial(self.liveness.seen, name)
+        if connection.role and not self.resolve_port(connection):
+            connection.status = "disconnected"
+            logger.warning(f"{connection.name}: kein freies passendes USB-Gerät gefunden")
+            return False
+        if not connection.connect():
+            return False
+        # Vor dem Lesen - die erste Zeile kann sofort kommen
+        self.liveness.watch(name)
+        connection.start_reading(self.reactor)
+        if config.hardware.get('binary_protocol'):
+            connection.request_binary_mode()
+        self._notify_status("hardware:connection_changed", name)
+        return True
+    
+    def _connection_lost(self, connection):
+        """Lesepfad ausgefallen: Reconnect anstoßen und Status melden"""
+        self.supervisor.connection_lost(connection)
+        self._notify_status("hardware:connection_changed", self._name_of(connection))
+    
     def disconnect_all(self):
         """Trennt alle Hardware-Verbindungen"""
         self.running = False
+        self.supervisor.stop()
+        self.liveness.stop()
         for connection in self.connections.values():
             connection.disconnect()
+        if self.transport is not None:
+            self.transport.close()
+        self.reactor.stop()
+        self.stop_recording()
     
     def get_connection(self, name):
         """Gibt eine spezifische Verbindung zurück"""
         return self.connections.get(name)
     
+    def broadcast_signal(self, signal_id, value=1, callback=None, confirm=False, serial=True):
+        """Sendet ein Signal an jeden ESP32 genau einmal (seriell oder per UDP) -> FanOut"""
+        fan_out = FanOut(signal_id, value, callback)
+        giga = self.connections.get('giga')
+        giga_connected = giga is not None and giga.status == "connected"
+        transport = self.transport if self.transport is not None and self.transport.is_open() else None
+        
+        # Befehle werden nur eingereiht, geschrieben wird in den Schreib-Threads der Geräte.
+        # FanOut-Ziele: <rolle> (seriell), "direct:<rolle>", "giga:<rolle>", "giga",
+        # mit confirm "<rolle>:udp"; callback(fan_out, ziel) läuft im Schreib-/Lese-/Loop-Thread
+        serial_roles = set()
+        for name, connection in self.connections.items():
+            if not name.startswith('esp32_') or connection.status != "connected":
+                continue
+            if serial:
+                # Per USB verbundene ESP32s lösen bei SIGNAL: wie bei einem UDP-Paket aus
+                serial_roles.add(name)
+                fan_out.add(name, connection.send_signal(signal_id, value))
+            elif confirm and (giga_connected or transport) and not (transport and transport.confirms):
+                # serial=False: nur per UDP, der ESP32 meldet den Empfang seriell.
+                # Vor dem Senden erwarten - die Antwort kann schneller sein als add()
+                fan_out.add(f"{name}:udp",
+                            connection.expect_line(UDP_RECEIVED_PREFIX, f": {signal_id}:{value}"))
+        
+        if transport:
+            # UDP direkt vom Host; bei einem bestätigenden Transport gilt erst dessen Ack
+            roles = [role for role in transport.targets if role not in serial_roles]
+            direct = transport.send_signal(signal_id, value, roles=roles) if roles else {}
+            # Über den GIGA nur noch, was der direkte Weg nicht erreicht hat
+            giga_targets = {}
+            for role, future in direct.items():
+                fan_out.add(f"direct:{role}", future)
+                if future.done() and future.exception():
+                    giga_targets[role] = transport.targets[role][0]
+        else:
+            giga_targets = {role: parse_address(address)[0]
+                            for role, address in (config.hardware.get('udp_targets') or {}).items()
+                            if role not in serial_roles}
+        if giga_connected:
+            # Ein SIGNAL-Broadcast reicht nur, wenn kein ESP32 anders bedient wurde
+            if not transport and not serial_roles:
+                fan_out.add('giga', giga.broadcast_signal(signal_id, value))
+            else:
+                for role, ip in giga_targets.items():
+                    fan_out.add(f"giga:{role}", giga.send_udp_signal(ip, signal_id, value))
+        return fan_out.seal()
+    
     def get_all_data(self):
         """Sammelt Daten von allen Verbindungen"""
         all_data = []
         for connection in self.connections.values():
-            while not connection.data_queue.empty():
-                try:
-                    data = connection.data_queue.get_nowait()
-                    all_data.append(data)
-                except queue.Empty:
-                    break
+            all_data.extend(connection.data_queue.drain())
         return all_data
     
     def get_status_summary(self):
-        """Gibt eine Übersicht aller Verbindungsstatus zurück"""
-        return {
-            name: connection.status 
-            for name, connection in self.connections.items()
-        }
+        """Gibt eine Übersicht aller Verbindungen zurück
+        
+        Pro Gerät: {'status', 'port', 'reconnects', 'downtime', 'queue', 'writer', 'link',
+        'liveness'} (downtime in Sekunden, queue: RingQueue.get_stats(), writer:
+        CommandWriter.get_stats() oder None, link: Verbindungsqualität des
+        UDP-Wegs aus UdpLink oder None, liveness: {'state', 'age'} aus dem
+        LivenessTracker oder None)
+        """
+        link = self.transport.link_quality() if self.transport is not None else {}
+        summary = {}
+        for name, connection in self.connections.items():
+            summary[name] = connection.get_status_info()
+            summary[name]['link'] = link.get(name)
+            summary[name]['liveness'] = self.liveness.get_status(name)
+        return summary
 
 # Globale Hardware-Manager Instanz
 hardware_manager = HardwareManager()
\ No newline at end of file
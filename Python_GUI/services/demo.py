@@ -147,15 +147,8 @@ class DemoService:
     def _send_slide_signal(self, slide_id):
         """Sendet Signal an Hardware für Slide-Wechsel"""
         try:
-            # Signal an alle ESP32s senden
-            for name, connection in hardware_manager.connections.items():
-                if name.startswith('esp32_'):
-                    connection.send_signal(f"page_{slide_id}")
-            
-            # UDP-Signal über GIGA senden (falls verfügbar)
-            giga = hardware_manager.get_connection('giga')
-            if giga and giga.status == "connected":
-                giga.send_udp_signal("192.168.1.100", f"page_{slide_id}", 1)
+            # Jeder ESP32 genau einmal: seriell, falls per USB verbunden, sonst per UDP
+            hardware_manager.broadcast_signal(f"page_{slide_id}")
             
             logger.debug(f"Slide-Signal gesendet: page_{slide_id}")
             
@@ -0,0 +1,792 @@
+#!/usr/bin/env python3
+"""
+Device Farm Service für Dynamic Messe Stand V4
+Virtuelle ESP32s und ein GIGA hinter Pseudo-Terminals für Last- und Dauertests ohne Hardware
+"""
+
+import os
+import tty
+import time
+import random
+import select
+import shutil
+import socket
+import tempfile
+import threading
+import multiprocessing
+from collections import deque
+from core.logger import logger
+from core.binary_frames import (
+    FRAME_SOF, FRAME_HEADER_SIZE, FRAME_CRC_SIZE, MAX_PAYLOAD, FRAME_SIGNAL, FRAME_UDP_SEND,
+    FRAME_PING, FrameError, crc16, decode_signal_payload
+)
+
+GIGA_IP = "192.168.1.50"
+BROADCAST_IP = "192.168.1.255"
+ESP32_UDP_PORT = 8889
+GIGA_UDP_PORT = 8888
+# Pins aus signalMap[] in ESP32_UDP_Receiver.ino (page_1 .. page_10)
+SIGNAL_PINS = (12, 13, 14, 15, 16, 17, 19, 21, 22, 23)
+PIN_DURATION_MS = 1000
+# sendUDPSignal() im GIGA-Sketch blockiert nach jedem Paket 50 ms (UDP-LED)
+UDP_SEND_MS = 50
+# delay(10) am Ende von loop(): ein Befehl wartet im Mittel 5 ms auf den nächsten Durchlauf
+LOOP_DELAY_MS = 10
+# isStaleSequence() im ESP32-Sketch: Fenster für veraltete Host-Pakete und Rücksetzzeit
+SEQUENCE_MODULO = 65536
+SEQUENCE_WINDOW = 64
+SEQUENCE_RESET_MS = 10000
+# blinkError() im Sketch blockiert 5 x 400 ms - so oft wiederholt sich die Timeout-Meldung
+TIMEOUT_REPEAT = 2.0
+MAX_COMMAND_LENGTH = 256
+
+DEFAULT_SETTINGS = {
+    'signal_rate': 0.2,             # Signale pro Sekunde und ESP32
+    'jitter': 0.5,                  # Streuung der Abstände (0 = exakt periodisch, 1 = 0..2x)
+    'noise': 0.0,                   # Anteil gestörter Zeilen (Bitfehler, fehlende/zusätzliche Bytes)
+    'disconnect_interval': None,    # Mittlere Sekunden zwischen Verbindungsabbrüchen pro Gerät
+    'downtime': 2.0,                # Sekunden bis ein abgezogenes Gerät wieder auftaucht
+    'heartbeat_interval': 5.0,      # GIGA -> ESP32 (heartbeatInterval im Sketch)
+    'heartbeat_timeout': 30.0,      # ESP32 meldet Heartbeat-Timeout nach ... Sekunden
+    'giga_offline_after': None,     # GIGA sendet ab ... Sekunden keine Heartbeats mehr
+    'clients_interval': 10.0,       # GIGA meldet "Clients: n"
+    'track_latency': False,         # Sendezeitpunkte der SIGNAL-Zeilen für Latenzmessungen
+    'muted': (),                    # Namen hängender Geräte: Port bleibt offen, aber es kommt nichts
+    'udp_loopback': False           # ESP32s empfangen echte UDP-Pakete auf 127.0.0.1 (UdpTransport)
+}
+
+class VirtualDevice:
+    """Gemeinsamer Teil: PTY, Befehls-Eingang, Störungen und Abbrüche"""
+
+    kind = "device"
+    link_name = "tty"
+    echo_prefix = ""
+
+    def __init__(self, name, farm):
+        self.name = name
+        self.farm = farm
+        self.settings = farm.settings
+        self.master = None
+        self.path = os.path.join(farm.directory, self.link_name)
+        self.reader = False
+        self.binary_mode = False
+        self.frame_errors = 0
+        self.booted_at = time.monotonic()
+        self.down_until = None
+        self.next_disconnect = None
+        self.input = bytearray()
+        self.signal_times = deque(maxlen=100000)
+        self.stats = {'lines': 0, 'bytes': 0, 'dropped_bytes': 0, 'commands': 0,
+                      'signals': 0, 'disconnects': 0, 'udp_packets': 0, 'udp_duplicates': 0}
+
+    # --- PTY -------------------------------------------------------------
+
+    def plug(self):
+        """Legt PTY und Geräte-Datei an (wie USB einstecken)"""
+        master, slave = os.openpty()
+        tty.setraw(slave)
+        target = os.ttyname(slave)
+        os.close(slave)
+        os.set_blocking(master, False)
+        if os.path.lexists(self.path):
+            os.unlink(self.path)
+        os.symlink(target, self.path)
+        self.master = master
+        self.reader = False
+        self.down_until = None
+        self._schedule_disconnect(time.monotonic())
+
+    def unplug(self, downtime=None):
+        """Entfernt Geräte-Datei und PTY (wie USB abziehen)"""
+        if self.master is None:
+            return
+        if os.path.lexists(self.path):
+            os.unlink(self.path)
+        os.close(self.master)
+        self.master = None
+        self.reader = False
+        self.input.clear()
+        if downtime is not None:
+            self.down_until = time.monotonic() + downtime
+            self.stats['disconnects'] += 1
+            logger.debug(f"Farm: {self.name} abgezogen für {downtime:.1f} s")
+
+    def _schedule_disconnect(self, now):
+        interval = self.settings['disconnect_interval']
+        self.next_disconnect = now + random.expovariate(1.0 / interval) if interval else None
+
+    def check_reader(self, hangup):
+        """Leser hat geöffnet -> Reset wie per DTR beim Öffnen des Ports (True = neu gebootet)"""
+        if hangup:
+            self.reader = False
+        elif not self.reader:
+            self.reader = True
+            self.boot()
+            return True
+        return False
+
+    def boot(self):
+        self.booted_at = time.monotonic()
+        self.binary_mode = False
+        self.input.clear()
+        self.emit(self.boot_lines())
+
+    def millis(self):
+        return int((time.monotonic() - self.booted_at) * 1000)
+
+    # --- Ausgabe ---------------------------------------------------------
+
+    def emit(self, lines):
+        """Schreibt Zeilen wie Serial.println; ohne Leser gehen sie verloren"""
+        if self.master is None or not self.reader or self.name in self.settings['muted']:
+            return
+        noise = self.settings['noise']
+        data = b"".join(self._disturb(f"{line}\r\n".encode()) if noise and random.random() < noise
+                        else f"{line}\r\n".encode() for line in lines)
+        self.stats['lines'] += len(lines)
+        try:
+            written = os.write(self.master, data)
+        except BlockingIOError:
+            written = 0  # Host liest nicht schnell genug - wie ein UART-Überlauf
+        except OSError:
+            return
+        self.stats['bytes'] += written
+        self.stats['dropped_bytes'] += len(data) - written
+
+    @staticmethod
+    def _disturb(data):
+        """Bitfehler, verlorenes Byte, Müll-Bytes oder verschlucktes Zeilenende"""
+        kind = random.randrange(4)
+        position = random.randrange(len(data))
+        if kind == 0:
+            return data[:position] + bytes([data[position] ^ (1 << random.randrange(8))]) + data[position + 1:]
+        if kind == 1:
+            return data[:position] + data[position + 1:]
+        if kind == 2:
+            return data[:position] + bytes(random.randrange(256) for _ in range(3)) + data[position:]
+        return data.rstrip(b"\r\n")
+
+    # --- Eingang ---------------------------------------------------------
+
+    def read_input(self):
+        try:
+            data = os.read(self.master, 4096)
+        except (BlockingIOError, OSError):
+            return
+        self.input += data
+        self._consume_input()
+
+    def _consume_input(self):
+        """Text-Befehle zeilenweise, im Binär-Modus Frames ab SOF (wie loop() im Sketch)"""
+        buffer = self.input
+        while buffer:
+            if self.binary_mode and buffer[0] == FRAME_SOF:
+                if len(buffer) < 2:
+                    return
+                length = buffer[1]
+                if length > MAX_PAYLOAD:
+                    del buffer[:1]
+                    self.frame_errors += 1
+                    continue
+                end = FRAME_HEADER_SIZE + length + FRAME_CRC_SIZE
+                if len(buffer) < end:
+                    return
+                body = bytes(buffer[1:end - FRAME_CRC_SIZE])
+                received = (buffer[end - 2] << 8) | buffer[end - 1]
+                del buffer[:end]
+                self.stats['commands'] += 1
+                if crc16(body) != received:
+                    self.frame_errors += 1
+                    self.emit([f"FRAME_ERR:{body[1]}"])
+                else:
+                    self.handle_frame(body[1], body[2], body[3:])
+                continue
+
+            newline = buffer.find(b"\n")
+            if newline < 0:
+                if len(buffer) > MAX_COMMAND_LENGTH:
+                    buffer.clear()
+                return
+            command = buffer[:newline].decode("utf-8", "replace").strip()
+            del buffer[:newline + 1]
+            self.stats['commands'] += 1
+            self.emit([f"{self.echo_prefix}{command}"] + self.handle_command(command))
+
+    def handle_command(self, command):
+        """Gemeinsame Befehle beider Sketches -> Antwortzeilen"""
+        if command == "STATUS":
+            return self.status_lines()
+        if command == "PING":
+            return ["PONG"]
+        if command == "BINARY:1":
+            self.binary_mode = True
+            return ["BINARY:OK"]
+        if command == "BINARY:0":
+            self.binary_mode = False
+            return ["BINARY:AUS"]
+        return [f"Unbekannter Befehl: {command}"]
+
+    def handle_frame(self, sequence, frame_type, payload):
+        if frame_type == FRAME_PING:
+            self.emit(["PONG"])
+            return
+        lines = self.frame_lines(frame_type, payload)
+        if lines is None:
+            self.frame_errors += 1
+            lines = [f"FRAME_ERR:{sequence}"]
+        self.emit(lines)
+
+    # --- Zeitgesteuertes Verhalten ----------------------------------------
+
+    def tick(self, now):
+        """Fällige Ereignisse ausführen -> Zeitpunkt des nächsten Ereignisses"""
+        if self.down_until is not None:
+            if now < self.down_until:
+                return self.down_until
+            self.plug()
+            logger.debug(f"Farm: {self.name} wieder angesteckt")
+        if self.next_disconnect is not None and now >= self.next_disconnect:
+            self.unplug(self.settings['downtime'])
+            return self.down_until
+        due = self.next_event(now)
+        if self.next_disconnect is not None:
+            due = min(due, self.next_disconnect)
+        return due
+
+    def next_interval(self, rate):
+        """Abstand bis zum nächsten Ereignis mit Jitter"""
+        jitter = min(max(self.settings['jitter'], 0.0), 1.0)
+        return (1.0 / rate) * random.uniform(1.0 - jitter, 1.0 + jitter)
+
+    def boot_lines(self):
+        return []
+
+    def status_lines(self):
+        return []
+
+    def frame_lines(self, frame_type, payload):
+        return None
+
+    def next_event(self, now):
+        return now + 1.0
+
+class VirtualESP32(VirtualDevice):
+    """ESP32_UDP_Receiver.ino: empfängt Seitensignale und Heartbeats vom GIGA"""
+
+    kind = "esp32"
+    echo_prefix = "Serieller Befehl: "
+
+    def __init__(self, name, farm, instance_number):
+        self.instance_number = instance_number
+        self.link_name = f"ttyUSB{instance_number - 1}"
+        super().__init__(name, farm)
+        self.ip = f"192.168.1.{99 + instance_number}"
+        self.signal_count = 0
+        self.last_signal = ""
+        self.last_heartbeat = None
+        self.next_signal = None
+        self.next_timeout_line = 0.0
+        self.udp_socket = None
+        self.udp_sequence = None        # lastUdpSequence: letztes ausgeführtes Host-Signal
+        self.udp_sequence_time = 0
+        self.udp_signal = ""            # zuletzt per UDP ausgeführte Seite (auch ohne Leser)
+        if self.settings['udp_loopback']:
+            # Stellvertreter für localPort 8889: eigener Port pro ESP32 auf Loopback
+            self.udp_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            self.udp_socket.bind(("127.0.0.1", 0))
+            self.udp_socket.setblocking(False)
+
+    def udp_address(self):
+        """(host, port) des Loopback-Empfängers oder None"""
+        return self.udp_socket.getsockname() if self.udp_socket else None
+
+    def close_udp(self):
+        if self.udp_socket:
+            self.udp_socket.close()
+            self.udp_socket = None
+
+    def boot_lines(self):
+        self.last_heartbeat = None
+        return [
+            "=== ESP32 UDP Receiver V4 ===",
+            "Starte ESP32 Initialisierung...",
+            "Teste Signal-Pins...",
+            "Initialisierung abgeschlossen!",
+            "Verbinde mit WiFi: Bertrandt_Messe",
+            f"WiFi verbunden! IP: {self.ip}",
+            f"UDP Receiver gestartet auf Port {ESP32_UDP_PORT}",
+            "ESP32 bereit für UDP-Empfang!",
+        ]
+
+    def status_lines(self):
+        heartbeat_age = self.millis() - (self.last_heartbeat or 0)
+        return [
+            "=== ESP32 Status ===",
+            "WiFi: Verbunden",
+            f"IP: {self.ip}",
+            f"RSSI: {random.randint(-75, -45)} dBm",
+            f"UDP Port: {ESP32_UDP_PORT}",
+            f"Letztes Signal: {self.last_signal}",
+            f"Signal-Anzahl: {self.signal_count}",
+            f"Letzter Heartbeat: {heartbeat_age} ms ago",
+            f"Uptime: {self.millis()} ms",
+            f"Freier Heap: {random.randint(200000, 230000)} bytes",
+            f"Binär-Modus: {'An' if self.binary_mode else 'Aus'}",
+            f"Frame-Fehler: {self.frame_errors}",
+            "Signal-Mapping:",
+        ] + [f"  page_{page} -> Pin {pin}" for page, pin in enumerate(SIGNAL_PINS, start=1)] + [
+            "===================",
+        ]
+
+    def handle_command(self, command):
+        if command.startswith("TEST:"):
+            return self.signal_lines(command[5:])
+        if command.startswith("SIGNAL:"):
+            return self.signal_lines(command[7:])
+        return super().handle_command(command)
+
+    def frame_lines(self, frame_type, payload):
+        if frame_type != FRAME_SIGNAL:
+            return None
+        try:
+            signal, value = decode_signal_payload(payload)
+        except FrameError:
+            return None
+        return self.signal_lines(f"{signal}:{value}")
+
+    def signal_lines(self, message):
+        """processSignal(): Name vor dem ersten ':' auswerten"""
+        name = message.split(":", 1)[0]
+        self.signal_count += 1
+        self.last_signal = name
+        if name == "heartbeat":
+            self.last_heartbeat = self.millis()
+            return []
+        if name.startswith("page_") and name[5:].isdigit() and 1 <= int(name[5:]) <= len(SIGNAL_PINS):
+            pin = SIGNAL_PINS[int(name[5:]) - 1]
+            return [f"Aktiviere Pin {pin} für {PIN_DURATION_MS} ms", f"Pin {pin} deaktiviert"]
+        return [f"Unbekanntes Signal: {name}"]
+
+    def receive_udp(self, message, sender=GIGA_IP):
+        """Paket vom virtuellen GIGA oder über den Loopback-Socket"""
+        if not self.reader:
+            return
+        self.emit([f"UDP empfangen von {sender}: {message}"] + self.signal_lines(message))
+
+    def read_udp(self):
+        """processUDPPacket(): wartende Pakete lesen (höchstens 254 Bytes wie packetBuffer)"""
+        while self.udp_socket:
+            try:
+                data, sender = self.udp_socket.recvfrom(2048)
+            except (BlockingIOError, OSError):
+                return
+            self.stats['udp_packets'] += 1
+            if not data:
+                continue
+            message = data[:254].decode("utf-8", "replace")
+            parts = message.split(":")
+            if len(parts) >= 3 and parts[0]:
+                # Host-Paket mit Sequenznummer: sofort an den Absender bestätigen
+                sequence = int(parts[-1]) if parts[-1].isdigit() else 0
+                try:
+                    self.udp_socket.sendto(f"ack:{sequence}:{self.millis()}".encode(), sender)
+                except OSError:
+                    pass
+                if parts[0] != "heartbeat":
+                    if self.is_stale_sequence(sequence):
+                        self.stats['udp_duplicates'] += 1
+                        if self.reader:
+                            self.emit([f"UDP empfangen von {sender[0]}: {message}",
+                                       f"UDP Wiederholung ignoriert: {sequence}"])
+                        continue
+                    self.udp_sequence, self.udp_sequence_time = sequence, self.millis()
+            if parts[0] != "heartbeat":
+                self.udp_signal = parts[0]
+            self.receive_udp(message, sender[0])
+
+    def is_stale_sequence(self, sequence):
+        """isStaleSequence(): Wiederholung oder bis zu 63 Pakete älter als das letzte Signal"""
+        if self.udp_sequence is None or self.millis() - self.udp_sequence_time > SEQUENCE_RESET_MS:
+            return False
+        return (self.udp_sequence - sequence) % SEQUENCE_MODULO < SEQUENCE_WINDOW
+
+    def next_event(self, now):
+        rate = self.settings['signal_rate']
+        if self.next_signal is None or not rate:
+            self.next_signal = now + self.next_interval(rate) if rate else now + 1.0
+        elif now >= self.next_signal:
+            # Vom geplanten Zeitpunkt aus weiterzählen, damit sich Verspätungen nicht aufsummieren
+            self.next_signal = max(self.next_signal + self.next_interval(rate), now - 1.0)
+            if self.reader:
+                page = random.randint(1, len(SIGNAL_PINS))
+                self.stats['signals'] += 1
+                if self.settings['track_latency']:
+                    self.signal_times.append(time.perf_counter())
+                # Seitenwechsel für den Host, dann die Ausgaben des Sketches
+                self.emit([f"UDP empfangen von {GIGA_IP}: page_{page}:1", f"SIGNAL:{page}"]
+                          + self.signal_lines(f"page_{page}:1"))
+
+        due = self.next_signal
+        if self.reader and self.last_heartbeat is not None:
+            silent = (self.millis() - self.last_heartbeat) / 1000.0
+            if silent > self.settings['heartbeat_timeout']:
+                if now >= self.next_timeout_line:
+                    self.emit(["Heartbeat-Timeout - GIGA möglicherweise offline"])
+                    self.next_timeout_line = now + TIMEOUT_REPEAT
+                due = min(due, self.next_timeout_line)
+            else:
+                due = min(due, now + self.settings['heartbeat_timeout'] - silent + 0.01)
+        return due
+
+class VirtualGIGA(VirtualDevice):
+    """GIGA_UDP_Sender.ino: verteilt Signale und Heartbeats an die ESP32s"""
+
+    kind = "giga"
+    link_name = "ttyACM0"
+    echo_prefix = "Befehl empfangen: "
+
+    def __init__(self, name, farm):
+        self.outbox = deque()   # (zeitpunkt, empfänger, nachricht, zeilen) geplanter UDP-Pakete
+        self.busy_until = 0.0
+        super().__init__(name, farm)
+        self.started = time.monotonic()
+        self.next_heartbeat = None
+        self.next_clients = None
+
+    def boot_lines(self):
+        self.outbox.clear()
+        self.busy_until = 0.0
+        return [
+            "=== Arduino GIGA UDP Sender V4 ===",
+            "Verbinde mit WiFi: Bertrandt_Messe",
+            f"WiFi verbunden! IP: {GIGA_IP}",
+            f"UDP Server gestartet auf Port {GIGA_UDP_PORT}",
+            "GIGA bereit für UDP-Übertragung!",
+        ]
+
+    def status_lines(self):
+        return [
+            "=== GIGA Status ===",
+            "WiFi: Verbunden",
+            f"IP: {GIGA_IP}",
+            f"RSSI: {random.randint(-70, -40)} dBm",
+            f"UDP Port: {GIGA_UDP_PORT}",
+            f"Uptime: {self.millis()} ms",
+            f"Binär-Modus: {'An' if self.binary_mode else 'Aus'}",
+            f"Frame-Fehler: {self.frame_errors}",
+            f"Broadcast: {BROADCAST_IP}:{ESP32_UDP_PORT}",
+            "ESP32 Ziele:",
+        ] + [f"  ESP32-{esp32.instance_number}: {esp32.ip}:{ESP32_UDP_PORT}" for esp32 in self.farm.esp32s] + [
+            "==================",
+        ]
+
+    def handle_command(self, command):
+        if command.startswith("UDP_SEND:"):
+            parts = command[9:].split(":", 2)
+            if len(parts) == 3:
+                return self.send_udp(parts[0], parts[1], parts[2])
+            return []
+        if command.startswith("SIGNAL:"):
+            parts = command[7:].split(":", 1)
+            if len(parts) == 2:
+                return self.broadcast(parts[0], parts[1])
+            return []
+        return super().handle_command(command)
+
+    def frame_lines(self, frame_type, payload):
+        try:
+            if frame_type == FRAME_SIGNAL:
+                signal, value = decode_signal_payload(payload)
+                target = None
+            elif frame_type == FRAME_UDP_SEND and len(payload) >= 4:
+                target = ".".join(str(byte) for byte in payload[:4])
+                signal, value = decode_signal_payload(payload[4:])
+            else:
+                return None
+        except FrameError:
+            return None
+        if target:
+            return self.send_udp(target, signal, str(value))
+        return self.broadcast(signal, str(value))
+
+    def send_udp(self, target, signal, value):
+        """Plant ein Paket ein: Pakete gehen nacheinander raus, jedes belegt den Sketch UDP_SEND_MS"""
+        message = f"{signal}:{value}"
+        if target == BROADCAST_IP:
+            receivers = list(self.farm.esp32s)
+        else:
+            receivers = [esp32 for esp32 in self.farm.esp32s if esp32.ip == target]
+        send_at = max(time.monotonic() + random.uniform(0, LOOP_DELAY_MS) / 1000.0, self.busy_until)
+        self.busy_until = send_at + UDP_SEND_MS / 1000.0
+        self.outbox.append((send_at, receivers, message, [f"UDP gesendet an {target}: {message}"]))
+        return []
+
+    def broadcast(self, signal, value):
+        """Ein Broadcast-Paket an alle ESP32s (broadcastSignal im Sketch)"""
+        return [f"Broadcasting Signal: {signal}:{value}"] + self.send_udp(BROADCAST_IP, signal, value)
+
+    def next_event(self, now):
+        while self.outbox and self.outbox[0][0] <= now:
+            _, receivers, message, lines = self.outbox.popleft()
+            self.emit(lines)
+            for esp32 in receivers:
+                esp32.receive_udp(message)
+
+        offline_after = self.settings['giga_offline_after']
+        online = offline_after is None or now - self.started < offline_after
+
+        if self.next_heartbeat is None:
+            self.next_heartbeat = now
+        if now >= self.next_heartbeat:
+            self.next_heartbeat = now + self.settings['heartbeat_interval']
+            if online:
+                lines = self.broadcast("heartbeat", str(self.millis()))
+                self.emit(lines)
+
+        if self.next_clients is None:
+            self.next_clients = now + self.settings['clients_interval']
+        elif now >= self.next_clients:
+            self.next_clients = now + self.settings['clients_interval']
+            self.emit([f"Clients: {sum(1 for esp32 in self.farm.esp32s if esp32.reader)}"])
+
+        due = min(self.next_heartbeat, self.next_clients)
+        if self.outbox:
+            due = min(due, self.outbox[0][0])
+        return due
+
+class DeviceFarm:
+    """N virtuelle ESP32s und ein GIGA, jeweils hinter einem PTY
+
+    Die Geräte-Dateien heißen wie echte Geräte (ttyUSB0.., ttyACM0) und
+    liegen in einem eigenen Verzeichnis, das der DeviceSupervisor statt
+    /dev überwachen kann. Ein Gerät "bootet", sobald ein Leser seinen Port
+    öffnet (wie der DTR-Reset der echten Boards). Kann der Host nicht
+    schnell genug lesen, werden Bytes verworfen und in dropped_bytes
+    gezählt - wie ein überlaufender UART-Puffer.
+
+    Vereinfachung: Pin-Meldungen folgen sofort aufeinander; der Sketch
+    blockiert dafür PIN_DURATION_MS lang. Signalraten über ~1/s sind mit
+    echter Firmware daher nicht erreichbar, für Lasttests aber gewollt.
+    UDP-Pakete des GIGA dagegen kosten wie im Sketch je UDP_SEND_MS und
+    gehen nacheinander raus - UDP_SEND pro ESP32 dauert so N-mal länger
+    als ein Broadcast. Mit udp_loopback lauscht jeder ESP32 zusätzlich auf
+    einem eigenen UDP-Port auf 127.0.0.1 (udp_addresses()) - Gegenstelle
+    für den direkten UdpTransport des Hosts.
+    """
+
+    def __init__(self, esp32_count=3, settings=None, directory=None):
+        self.settings = dict(DEFAULT_SETTINGS)
+        self.settings.update(settings or {})
+        self._own_directory = directory is None
+        self.directory = directory or tempfile.mkdtemp(prefix="device_farm_")
+        self.esp32s = [VirtualESP32(f"esp32_{number}", self, number)
+                       for number in range(1, esp32_count + 1)]
+        self.giga = VirtualGIGA("giga", self)
+        self.devices = self.esp32s + [self.giga]
+        self.running = False
+        self.thread = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Steckt alle Geräte an und startet die Simulation -> {name: pfad}"""
+        if self.running:
+            return self.ports()
+        for device in self.devices:
+            device.plug()
+        self.running = True
+        self.thread = threading.Thread(target=self._run, name="DeviceFarm", daemon=True)
+        self.thread.start()
+        logger.info(f"🧪 Device Farm: {len(self.esp32s)} ESP32 + GIGA in {self.directory}")
+        return self.ports()
+
+    def stop(self):
+        """Beendet die Simulation und entfernt alle Geräte"""
+        if not self.running:
+            return
+        self.running = False
+        if self.thread and self.thread is not threading.current_thread():
+            self.thread.join(timeout=2)
+        for device in self.devices:
+            device.unplug()
+        for device in self.esp32s:
+            device.close_udp()
+        if self._own_directory:
+            shutil.rmtree(self.directory, ignore_errors=True)
+
+    def ports(self):
+        """Geräte-Dateien {name: pfad}"""
+        return {device.name: device.path for device in self.devices}
+
+    def udp_addresses(self):
+        """Loopback-Empfänger der ESP32s {name: (host, port)} (Einstellung udp_loopback)"""
+        return {device.name: device.udp_address() for device in self.esp32s if device.udp_socket}
+
+    def udp_state(self):
+        """Zuletzt per UDP ausgeführtes Signal der ESP32s {name: signal}"""
+        return {device.name: device.udp_signal for device in self.esp32s if device.udp_socket}
+
+    def configure(self, **settings):
+        """Ändert Einstellungen zur Laufzeit (z.B. signal_rate für Lastrampen)"""
+        with self._lock:
+            self.settings.update(settings)
+            for device in self.devices:
+                if hasattr(device, 'next_signal'):
+                    device.next_signal = None
+                if 'disconnect_interval' in settings and device.master is not None:
+                    device._schedule_disconnect(time.monotonic())
+
+    def get_stats(self):
+        """Zähler pro Gerät"""
+        return {device.name: dict(device.stats, frame_errors=device.frame_errors)
+                for device in self.devices}
+
+    def _run(self):
+        next_due = {device: 0.0 for device in self.devices}
+        while self.running:
+            with self._lock:
+                now = time.monotonic()
+                for device in self.devices:
+                    if now >= next_due[device]:
+                        next_due[device] = device.tick(now)
+
+                # Ohne Leser meldet ein PTY dauerhaft POLLHUP - diese nur kurz abfragen,
+                # sonst kehrt poll() sofort zurück
+                waiting = [device for device in self.devices if device.master is not None and not device.reader]
+                for device in waiting:
+                    probe = select.poll()
+                    probe.register(device.master, select.POLLIN)
+                    if device.check_reader(any(mask & select.POLLHUP for _, mask in probe.poll(0))):
+                        next_due[device] = 0.0
+
+                readers = {device.master: device for device in self.devices if device.reader}
+                udp_sockets = {device.udp_socket.fileno(): device for device in self.esp32s
+                               if device.udp_socket}
+                poller = select.poll()
+                for fd in list(readers) + list(udp_sockets):
+                    poller.register(fd, select.POLLIN)
+
+            timeout = max(0.0, min(next_due.values()) - time.monotonic())
+            if waiting or not readers:
+                timeout = min(timeout, 0.05)   # Öffnende Leser zeitnah bemerken
+            if not readers and not udp_sockets:
+                time.sleep(timeout)
+                continue
+            events = poller.poll(timeout * 1000)
+
+            with self._lock:
+                for fd, mask in events:
+                    if fd in udp_sockets:
+                        udp_sockets[fd].read_udp()
+                        continue
+                    device = readers[fd]
+                    if device.master != fd:
+                        continue
+                    if mask & select.POLLIN:
+                        device.read_input()
+                        next_due[device] = 0.0   # Befehle können neue Ereignisse eingeplant haben
+                    if mask & select.POLLHUP:
+                        device.check_reader(True)
+
+def _farm_process_main(connection, esp32_count, settings, directory):
+    """Kindprozess: betreibt die Farm und beantwortet Befehle über die Pipe"""
+    farm = DeviceFarm(esp32_count, settings, directory)
+    connection.send(farm.start())
+    try:
+        while True:
+            command, argument = connection.recv()
+            if command == 'configure':
+                farm.configure(**argument)
+                connection.send(None)
+            elif command == 'stats':
+                connection.send(farm.get_stats())
+            elif command == 'udp_addresses':
+                connection.send(farm.udp_addresses())
+            elif command == 'udp_state':
+                connection.send(farm.udp_state())
+            elif command == 'signal_times':
+                times = {}
+                for device in farm.esp32s:
+                    times[device.name] = list(device.signal_times)
+                    device.signal_times.clear()
+                connection.send(times)
+            elif command == 'stop':
+                break
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        farm.stop()
+
+class FarmProcess:
+    """DeviceFarm in einem eigenen Prozess
+
+    Echte Geräte rechnen unabhängig vom Host. Im selben Prozess würde die
+    Farm mit der GUI um den GIL konkurrieren und unter Last selbst
+    langsamer senden - der Engpass der UI bliebe unsichtbar. Gleiche
+    Schnittstelle wie DeviceFarm (start/stop/configure/get_stats);
+    Sendezeitpunkte (perf_counter, systemweit monoton) holt
+    pop_signal_times() ab.
+    """
+
+    def __init__(self, esp32_count=3, settings=None):
+        self.esp32_count = esp32_count
+        self.settings = dict(DEFAULT_SETTINGS)
+        self.settings.update(settings or {})
+        self.directory = tempfile.mkdtemp(prefix="device_farm_")
+        self.process = None
+        self._connection = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Startet den Farm-Prozess -> {name: pfad}"""
+        parent, child = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(
+            target=_farm_process_main, name="DeviceFarm",
+            args=(child, self.esp32_count, self.settings, self.directory), daemon=True
+        )
+        self.process.start()
+        child.close()
+        self._connection = parent
+        ports = parent.recv()
+        logger.info(f"🧪 Device Farm (Prozess {self.process.pid}): {self.esp32_count} ESP32 + GIGA "
+                    f"in {self.directory}")
+        return ports
+
+    def stop(self):
+        """Beendet den Farm-Prozess und entfernt das Geräte-Verzeichnis"""
+        if self.process is None:
+            return
+        try:
+            self._request('stop', expect_reply=False)
+        except (OSError, EOFError):
+            pass
+        self.process.join(timeout=3)
+        if self.process.is_alive():
+            self.process.terminate()
+        self.process = None
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def configure(self, **settings):
+        """Ändert Einstellungen zur Laufzeit"""
+        self.settings.update(settings)
+        self._request('configure', settings)
+
+    def get_stats(self):
+        """Zähler pro Gerät"""
+        return self._request('stats')
+
+    def udp_addresses(self):
+        """Loopback-Empfänger der ESP32s {name: (host, port)}"""
+        return self._request('udp_addresses')
+
+    def udp_state(self):
+        """Zuletzt per UDP ausgeführtes Signal der ESP32s {name: signal}"""
+        return self._request('udp_state')
+
+    def pop_signal_times(self):
+        """Sendezeitpunkte der SIGNAL-Zeilen seit dem letzten Aufruf {name: [perf_counter]}"""
+        return self._request('signal_times')
+
+    def _request(self, command, argument=None, expect_reply=True):
+        with self._lock:
+            self._connection.send((command, argument))
+            return self._connection.recv() if expect_reply else None
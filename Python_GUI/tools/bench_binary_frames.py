@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Loopback-Benchmark: Text-Kommandos vs. Binär-Frames (Host -> ESP32/GIGA)
+Vergleicht Bytes pro Kommando, Durchsatz über ein Pseudo-Terminal und die
+Zerlege-Kosten auf Geräteseite (Text: indexOf/substring wie in den Sketches,
+Binär: FrameDecoder). Zusätzlich wird die Aushandlung BINARY:1 -> BINARY:OK
+mit einer echten ESP32Connection gegen ein simuliertes Gerät geprüft.
+
+Hinweis: in CPython ist str.split() schneller als ein Frame-Decoder in Python.
+Der Gewinn liegt auf dem MCU (keine String-Allokationen) und auf der Leitung:
+die Zeile "UART @115200" zeigt die reine Übertragungszeit pro Kommando.
+
+Aufruf (aus Python_GUI/):
+    python tools/bench_binary_frames.py --commands 20000
+"""
+
+import os
+import sys
+import time
+import argparse
+import threading
+
+import serial
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.binary_frames import (
+    BINARY_ACK, BINARY_OFFER, FRAME_SIGNAL, FRAME_UDP_SEND, FrameDecoder,
+    decode_signal_payload, encode_signal, encode_udp_send
+)
+
+TARGET_IP = "192.168.1.100"
+UART_BAUD = 115200              # 8N1 -> 10 Bit pro Byte
+
+def make_commands(count):
+    """Mischung aus SIGNAL (ESP32) und UDP_SEND (GIGA) wie im Messe-Betrieb"""
+    commands = []
+    for i in range(count):
+        page = f"page_{i % 10 + 1}"
+        if i % 2:
+            commands.append(("udp", TARGET_IP, page, 1))
+        else:
+            commands.append(("signal", None, page, 1))
+    return commands
+
+def encode_text(commands):
+    """Text-Protokoll wie bisher in send_signal/send_udp_signal"""
+    lines = []
+    for kind, ip, signal_id, value in commands:
+        if kind == "signal":
+            lines.append(f"SIGNAL:{signal_id}:{value}\n".encode('utf-8'))
+        else:
+            lines.append(f"UDP_SEND:{ip}:{signal_id}:{value}\n".encode('utf-8'))
+    return lines
+
+def encode_binary(commands):
+    """Binär-Protokoll aus core.binary_frames"""
+    frames = []
+    for sequence, (kind, ip, signal_id, value) in enumerate(commands):
+        if kind == "signal":
+            frames.append(encode_signal(sequence, signal_id, value))
+        else:
+            frames.append(encode_udp_send(sequence, ip, signal_id, value))
+    return frames
+
+def parse_text(data):
+    """Nachbildung des Sketch-Parsers: Zeile suchen, indexOf(':') + substring()"""
+    parsed = 0
+    for command in data.decode('utf-8').split('\n'):
+        command = command.strip()
+        if command.startswith("UDP_SEND:"):
+            first = command.find(':', 9)
+            second = command.find(':', first + 1)
+            if first > 0 and second > 0:
+                command[9:first], command[first + 1:second], command[second + 1:]
+                parsed += 1
+        elif command.startswith("SIGNAL:"):
+            first = command.find(':', 7)
+            if first > 0:
+                command[7:first], command[first + 1:]
+                parsed += 1
+    return parsed
+
+def parse_binary(data):
+    """Geräteseite im Binär-Modus: Frames + Signal-Payload dekodieren"""
+    parsed = 0
+    for frame in FrameDecoder().feed(data):
+        if frame.frame_type == FRAME_SIGNAL:
+            decode_signal_payload(frame.payload)
+        elif frame.frame_type == FRAME_UDP_SEND:
+            frame.payload[:4], decode_signal_payload(frame.payload[4:])
+        parsed += 1
+    return parsed
+
+def bench_pty(data, parse, count):
+    """Schickt alle Kommandos durch ein PTY; Gerät liest und zerlegt sie"""
+    master, slave = os.openpty()
+    device = serial.Serial(os.ttyname(slave), 115200, timeout=1)
+
+    writer = threading.Thread(target=os.write, args=(master, data))
+    start = time.perf_counter()
+    writer.start()
+    received = bytearray()
+    while len(received) < len(data):
+        received += device.read(device.in_waiting or 1)
+    parsed = parse(bytes(received))
+    elapsed = time.perf_counter() - start
+    writer.join()
+
+    device.close()
+    os.close(master)
+    os.close(slave)
+    if parsed != count:
+        raise RuntimeError(f"{parse.__name__}: {parsed} von {count} Kommandos erkannt")
+    return count / elapsed
+
+def bench_parse(data, parse, count, repeat=5):
+    """Reine Zerlege-Kosten in µs pro Kommando (bestes von repeat Läufen)"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse(data)
+        best = min(best, time.perf_counter() - start)
+    return best / count * 1e6
+
+def check_negotiation(timeout=2.0):
+    """ESP32Connection gegen ein simuliertes Gerät: Angebot, Bestätigung, Binär-Signal"""
+    from models.hardware import ESP32Connection
+
+    master, slave = os.openpty()
+    connection = ESP32Connection(os.ttyname(slave))
+    if not connection.connect() or not connection.start_reading():
+        return "Verbindung fehlgeschlagen"
+
+    received = bytearray()
+    deadline = time.monotonic() + timeout
+    try:
+        connection.request_binary_mode()
+        while BINARY_OFFER.encode() not in received and time.monotonic() < deadline:
+            received += os.read(master, 256)
+        os.write(master, f"{BINARY_ACK}\r\n".encode())
+        while not connection.binary_mode and time.monotonic() < deadline:
+            time.sleep(0.01)
+        if not connection.binary_mode:
+            return "keine Umschaltung auf Binär-Modus"
+
+        connection.send_signal("page_3", 1)
+        decoder = FrameDecoder()
+        frames = []
+        while not frames and time.monotonic() < deadline:
+            frames = decoder.feed(os.read(master, 256))
+        if not frames or decode_signal_payload(frames[0].payload) != ("page_3", 1):
+            return "Binär-Signal nicht empfangen"
+        return "OK"
+    finally:
+        connection.disconnect()
+        os.close(master)
+
+def main():
+    parser = argparse.ArgumentParser(description='Binär-Frames Loopback-Benchmark')
+    parser.add_argument('--commands', type=int, default=20000, help='Anzahl Kommandos')
+    args = parser.parse_args()
+
+    commands = make_commands(args.commands)
+    text = encode_text(commands)
+    binary = encode_binary(commands)
+    text_data = b"".join(text)
+    binary_data = b"".join(binary)
+
+    text_signal = len(text[0])
+    text_udp = len(text[1]) if len(text) > 1 else 0
+    binary_signal = len(binary[0])
+    binary_udp = len(binary[1]) if len(binary) > 1 else 0
+
+    text_pty = bench_pty(text_data, parse_text, args.commands)
+    binary_pty = bench_pty(binary_data, parse_binary, args.commands)
+    text_cost = bench_parse(text_data, parse_text, args.commands)
+    binary_cost = bench_parse(binary_data, parse_binary, args.commands)
+
+    print(f"Binär-Frames Benchmark: {args.commands} Kommandos (SIGNAL/UDP_SEND gemischt)")
+    print(f"{'Messung':<26}{'Text':>14}{'Binär':>14}{'Faktor':>9}")
+    print(f"{'Bytes SIGNAL':<26}{text_signal:>14}{binary_signal:>14}{text_signal / binary_signal:>9.1f}")
+    if text_udp:
+        print(f"{'Bytes UDP_SEND':<26}{text_udp:>14}{binary_udp:>14}{text_udp / binary_udp:>9.1f}")
+    print(f"{'Bytes gesamt':<26}{len(text_data):>14,}{len(binary_data):>14,}{len(text_data) / len(binary_data):>9.1f}")
+    text_uart = len(text_data) * 10 / UART_BAUD / args.commands * 1e6
+    binary_uart = len(binary_data) * 10 / UART_BAUD / args.commands * 1e6
+    print(f"{'UART @115200 µs/Kommando':<26}{text_uart:>14.0f}{binary_uart:>14.0f}{text_uart / binary_uart:>9.1f}")
+    print(f"{'PTY Kommandos/s':<26}{text_pty:>14,.0f}{binary_pty:>14,.0f}{binary_pty / text_pty:>9.1f}")
+    print(f"{'Zerlegen µs/Kommando':<26}{text_cost:>14.2f}{binary_cost:>14.2f}{text_cost / binary_cost:>9.1f}")
+    print(f"Aushandlung ESP32Connection: {check_negotiation()}")
+
+if __name__ == "__main__":
+    main()
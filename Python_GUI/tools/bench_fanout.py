@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Fan-Out-Benchmark: ein Seitenwechsel an alle Empfänger
+Vergleicht mit der Device Farm (services/device_farm.py, eigener Prozess)
+drei Wege, ein Signal an N ESP32s zu verteilen:
+
+  pro Gerät   wie bisher: UDP_SEND über den GIGA an jede ESP32-IP einzeln
+              und nacheinander (jedes Paket blockiert den Sketch 50 ms)
+  Fan-Out     HardwareManager.broadcast_signal(serial=False): ein einziger
+              SIGNAL-Broadcast über den GIGA
+  UDP direkt  wie Fan-Out, die UDP-Pakete schickt aber der Host selbst
+              (UdpTransport) an die Loopback-Empfänger der virtuellen
+              ESP32s - kein serieller Umweg über den GIGA
+
+Die seriellen Verbindungen der ESP32s melden nur den Empfang ("UDP
+empfangen"); ein Seitensignal geht nur per UDP an sie, damit jeder ESP32
+es genau einmal ausführt.
+
+Gemessen wird die Wanduhr-Zeit ab dem Absenden bis alle Befehle geschrieben
+sind und bis jeder ESP32 "UDP empfangen" für das Signal gemeldet hat.
+
+Aufruf (aus Python_GUI/):
+    python tools/bench_fanout.py
+    python tools/bench_fanout.py --receivers 3,10,20 --rounds 50
+    python tools/bench_fanout.py --gap-ms 20     # schnelles Durchblättern
+"""
+
+import os
+import sys
+import time
+import argparse
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.config import config
+from core.fan_out import FanOut
+from core.udp_transport import UdpTransport
+from models.hardware import HardwareManager, UDP_RECEIVED_PREFIX
+from services.device_farm import FarmProcess
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+def esp32_ip(number):
+    """IP des virtuellen ESP32 (VirtualESP32: 192.168.1.100 ff.)"""
+    return f"192.168.1.{99 + number}"
+
+def send_per_device(manager, signal_id):
+    """Bisheriger Weg: jedes Ziel einzeln und nacheinander"""
+    fan_out = FanOut(signal_id)
+    esp32s = [(name, connection) for name, connection in manager.connections.items()
+              if name.startswith('esp32_')]
+    for name, connection in esp32s:
+        fan_out.add(f"{name}:udp", connection.expect_line(UDP_RECEIVED_PREFIX, f": {signal_id}:1"))
+    giga = manager.get_connection('giga')
+    for name, connection in esp32s:
+        future = giga.send_udp_signal(esp32_ip(connection.instance_number), signal_id, 1)
+        fan_out.add(f"giga:{name}", future)
+        future.result()
+    return fan_out.seal()
+
+def send_fan_out(manager, signal_id):
+    return manager.broadcast_signal(signal_id, confirm=True, serial=False)
+
+def measure(manager, send, rounds, timeout, gap):
+    """-> (geschrieben ms, empfangen ms, Runden ohne vollständigen Empfang)"""
+    written, received, incomplete = [], [], 0
+    for round_number in range(rounds):
+        # Wechselnde Seiten, damit keine verspätete Meldung der Vorrunde zählt
+        signal_id = f"page_{round_number % 10 + 1}"
+        fan_out = send(manager, signal_id)
+        if not fan_out.wait(timeout):
+            incomplete += 1
+            continue
+        results = fan_out.results()
+        if any(result['status'] != "sent" for result in results.values()):
+            incomplete += 1
+            continue
+        written.append(max(result['ms'] for target, result in results.items()
+                           if not target.endswith(":udp")))
+        received.append(fan_out.elapsed_ms())
+        for connection in manager.connections.values():
+            connection.data_queue.drain()
+        time.sleep(gap)  # Abstand der Seitenwechsel (klein: GIGA ist noch mit dem letzten Paket beschäftigt)
+    return written, received, incomplete
+
+def run(receivers, rounds, timeout, gap):
+    farm = FarmProcess(receivers, {'signal_rate': 0, 'heartbeat_interval': 3600.0,
+                                   'clients_interval': 3600.0, 'udp_loopback': True})
+    ports = farm.start()
+    manager = HardwareManager()
+    for number in range(1, receivers + 1):
+        manager.add_esp32(ports[f'esp32_{number}'], number)
+    manager.add_giga(ports['giga'])
+    try:
+        manager.connect_all()
+        time.sleep(1.0)  # Boot-Meldungen abwarten
+        results = {}
+        for mode, send in (("pro Gerät", send_per_device), ("Fan-Out", send_fan_out)):
+            results[mode] = measure(manager, send, rounds, timeout, gap)
+        manager.set_transport(UdpTransport(farm.udp_addresses()))
+        results["UDP direkt"] = measure(manager, send_fan_out, rounds, timeout, gap)
+        return results
+    finally:
+        manager.disconnect_all()
+        farm.stop()
+
+def main():
+    parser = argparse.ArgumentParser(description='Fan-Out eines Signals an N Empfänger messen')
+    parser.add_argument('--receivers', default='3,10', help='Anzahl ESP32s, kommagetrennt')
+    parser.add_argument('--rounds', type=int, default=20, help='Signale pro Messung')
+    parser.add_argument('--timeout', type=float, default=5.0, help='Sekunden bis eine Runde als verloren gilt')
+    parser.add_argument('--gap-ms', type=float, default=100.0, help='Pause zwischen zwei Signalen')
+    parser.add_argument('--binary', action='store_true', help='Binär-Protokoll aushandeln')
+    args = parser.parse_args()
+
+    config.hardware['binary_protocol'] = args.binary
+    config.hardware['hotplug'] = False
+    config.hardware['record_path'] = None
+
+    print(f"{args.rounds} Signale pro Messung im Abstand von {args.gap_ms:.0f} ms, Zeiten ab dem Absenden (ms)")
+    print(f"{'Empfänger':>9}  {'Weg':<10}{'geschr. p50':>12}{'geschr. p95':>12}"
+          f"{'empf. p50':>11}{'empf. p95':>11}{'Fehlend':>9}")
+    for receivers in [int(count) for count in args.receivers.split(',')]:
+        results = run(receivers, args.rounds, args.timeout, args.gap_ms / 1000.0)
+        for mode, (written, received, incomplete) in results.items():
+            if not received:
+                print(f"{receivers:>9}  {mode:<10}{'-':>12}{'-':>12}{'-':>11}{'-':>11}{incomplete:>9}")
+                continue
+            print(f"{receivers:>9}  {mode:<10}{statistics.median(written):>12.1f}"
+                  f"{percentile(written, 0.95):>12.1f}{statistics.median(received):>11.1f}"
+                  f"{percentile(received, 0.95):>11.1f}{incomplete:>9}")
+        per_device = statistics.median(results["pro Gerät"][1] or [0.0])
+        fan_out = statistics.median(results["Fan-Out"][1] or [0.0])
+        direct = statistics.median(results["UDP direkt"][1] or [0.0])
+        if per_device and fan_out:
+            print(f"{'':>9}  -> Fan-Out {per_device / fan_out:.1f}x schneller bis zum Empfang")
+        if fan_out and direct:
+            print(f"{'':>9}  -> UDP direkt spart {fan_out - direct:.1f} ms gegenüber GIGA-Broadcast "
+                  f"({fan_out / direct:.1f}x schneller)")
+
+if __name__ == '__main__':
+    main()
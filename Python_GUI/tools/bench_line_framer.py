@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Micro-Benchmark: LineFramer vs. readline().decode().strip() pro Zeile
+Misst Zeilen/s für einen Burst (Status-Dump, Heartbeat-Sturm) über ein Pseudo-Terminal
+und zusätzlich die reine Zerlege-Arbeit im Speicher.
+
+Aufruf (aus Python_GUI/):
+    python tools/bench_line_framer.py --lines 50000
+"""
+
+import io
+import os
+import sys
+import time
+import argparse
+import threading
+
+import serial
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.line_framer import LineFramer
+
+BURST_LINES = [
+    b"SIGNAL:3\r\n",
+    b"Clients: 2\r\n",
+    b"UDP empfangen von 192.168.1.50: heartbeat:123456\r\n",
+    b"Letzter Heartbeat: 4711 ms ago\r\n",
+    b"Freier Heap: 214332 bytes\r\n",
+]
+
+def make_burst(count):
+    """Erzeugt einen Burst aus count Zeilen"""
+    return b"".join(BURST_LINES[i % len(BURST_LINES)] for i in range(count))
+
+def read_legacy(connection, count):
+    """Bisheriges Muster: ein readline()-Aufruf pro Zeile"""
+    received = 0
+    while received < count:
+        if connection.in_waiting > 0:
+            line = connection.readline().decode('utf-8').strip()
+            if line:
+                received += 1
+    return received
+
+def read_framer(connection, count):
+    """Neues Muster: alles aus in_waiting auf einmal, Zeilen aus dem Puffer"""
+    framer = LineFramer()
+    received = 0
+    while received < count:
+        received += len(framer.read_from(connection))
+    return received
+
+def bench_pty(reader, burst, count):
+    """Schickt den Burst durch ein PTY und misst die Lesezeit"""
+    master, slave = os.openpty()
+    connection = serial.Serial(os.ttyname(slave), 115200, timeout=1)
+
+    writer = threading.Thread(target=os.write, args=(master, burst))
+    start = time.perf_counter()
+    writer.start()
+    reader(connection, count)
+    elapsed = time.perf_counter() - start
+    writer.join()
+
+    connection.close()
+    os.close(master)
+    os.close(slave)
+    return count / elapsed
+
+def bench_memory(burst, count, repeat=5):
+    """Reine Zerlege-Kosten ohne Systemaufrufe (bestes von repeat Läufen)"""
+    legacy_best = framer_best = float('inf')
+    for _ in range(repeat):
+        stream = io.BytesIO(burst)
+        start = time.perf_counter()
+        for raw in iter(stream.readline, b""):
+            raw.decode('utf-8').strip()
+        legacy_best = min(legacy_best, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        framer = LineFramer()
+        for offset in range(0, len(burst), 4096):
+            framer.feed(burst[offset:offset + 4096])
+        framer_best = min(framer_best, time.perf_counter() - start)
+    return count / legacy_best, count / framer_best
+
+def main():
+    parser = argparse.ArgumentParser(description='LineFramer Micro-Benchmark')
+    parser.add_argument('--lines', type=int, default=50000, help='Zeilen pro Burst')
+    args = parser.parse_args()
+
+    burst = make_burst(args.lines)
+    print(f"LineFramer Benchmark: {args.lines} Zeilen, {len(burst)} Bytes")
+
+    legacy_pty = bench_pty(read_legacy, burst, args.lines)
+    framer_pty = bench_pty(read_framer, burst, args.lines)
+    legacy_mem, framer_mem = bench_memory(burst, args.lines)
+
+    print(f"{'Messung':<22}{'readline Zeilen/s':>20}{'Framer Zeilen/s':>18}{'Faktor':>9}")
+    print(f"{'PTY (mit Syscalls)':<22}{legacy_pty:>20,.0f}{framer_pty:>18,.0f}{framer_pty / legacy_pty:>9.1f}")
+    print(f"{'Speicher (nur Parsen)':<22}{legacy_mem:>20,.0f}{framer_mem:>18,.0f}{framer_mem / legacy_mem:>9.1f}")
+
+if __name__ == "__main__":
+    main()
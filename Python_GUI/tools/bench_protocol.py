@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Durchsatz-Benchmark: ProtocolParser (Dispatch-Tabelle) vs. startswith/split-Kette
+Beide Varianten erkennen dieselben Zeilentypen; gemessen werden Zeilen/s
+für einen realistischen Mix aus Signalen, Statusmeldungen und Rauschen.
+Jeder Lauf bekommt frisch dekodierte Zeilen (wie aus dem LineFramer, ohne
+zwischengespeicherten String-Hash), damit Wiederholungen nichts beschönigen.
+
+Aufruf (aus Python_GUI/):
+    python tools/bench_protocol.py --lines 200000
+"""
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.protocol import ProtocolParser
+
+STATUS_BLOCK = [
+    "=== ESP32 Status ===", "WiFi: Verbunden", "IP: 192.168.1.100", "RSSI: -61 dBm",
+    "UDP Port: 8889", "Letztes Signal: page_3", "Signal-Anzahl: 12",
+    "Letzter Heartbeat: 2300 ms ago", "Uptime: 123456 ms", "Freier Heap: 214332 bytes",
+    "===================",
+]
+
+MIX = [
+    "SIGNAL:3", "SIGNAL:7", "Clients: 2", "PONG",
+    "UDP empfangen von 192.168.1.50: heartbeat:123456",
+    "UDP empfangen von 192.168.1.50: page_3:1",
+    "Aktiviere Pin 14 für 1000 ms", "Pin 14 deaktiviert",
+    "Heartbeat-Timeout - GIGA möglicherweise offline",
+    "Serieller Befehl: PING", "Rauschen ohne bekanntes Präfix",
+] + STATUS_BLOCK
+
+LEGACY_PREFIXES = [
+    "SIGNAL:", "Clients:", "PONG", "UDP empfangen von ", "UDP gesendet an ",
+    "Broadcasting Signal: ", "Heartbeat-Timeout", "Aktiviere Pin ", "Pin ",
+    "WiFi verbunden! IP: ", "WiFi-Verbindung fehlgeschlagen", "WiFi-Verbindung verloren",
+    "Serieller Befehl: ", "Befehl empfangen: ", "Unbekannter Befehl: ", "Unbekanntes Signal: ",
+]
+
+def legacy_parse(lines):
+    """Bisheriger Stil: startswith-Kette und split(':') pro Zeile"""
+    results = []
+    for line in lines:
+        if line.startswith("SIGNAL:"):
+            try:
+                results.append(('signal', int(line.split(":")[1])))
+            except ValueError:
+                results.append(('malformed', line))
+        elif line.startswith("Clients:"):
+            try:
+                results.append(('clients', int(line.split(":")[1].strip())))
+            except ValueError:
+                results.append(('malformed', line))
+        elif line.startswith("=== ESP32 Status ===") or line.startswith("RSSI:") \
+                or line.startswith("Uptime:") or line.startswith("Freier Heap:"):
+            results.append(('status', line.split(":")[-1].strip()))
+        else:
+            for prefix in LEGACY_PREFIXES[2:]:
+                if line.startswith(prefix):
+                    results.append((prefix, line[len(prefix):]))
+                    break
+            else:
+                results.append(('unknown', line))
+    return results
+
+def bench(function, lines, repeat):
+    """Bester Durchsatz aus repeat Läufen (Zeilen/s)"""
+    raw = "\n".join(lines).encode()
+    best = float('inf')
+    for _ in range(repeat):
+        fresh = raw.decode().split("\n")
+        start = time.perf_counter()
+        function(fresh)
+        best = min(best, time.perf_counter() - start)
+    return len(lines) / best
+
+def main():
+    parser = argparse.ArgumentParser(description='Protokoll-Parser Durchsatz')
+    parser.add_argument('--lines', type=int, default=200000, help='Zeilen pro Lauf')
+    parser.add_argument('--repeat', type=int, default=5, help='Wiederholungen')
+    args = parser.parse_args()
+
+    lines = (MIX * (args.lines // len(MIX) + 1))[:args.lines]
+    signals_only = [f"SIGNAL:{number % 10 + 1}" for number in range(args.lines)]
+
+    print(f"Protokoll-Benchmark: {args.lines} Zeilen, bestes von {args.repeat} Läufen")
+    print(f"{'Eingabe':<16}{'startswith Zeilen/s':>22}{'Dispatch Zeilen/s':>20}")
+    for name, data in (("Gemischt", lines), ("Nur SIGNAL", signals_only)):
+        legacy = bench(legacy_parse, data, args.repeat)
+        dispatch = bench(lambda l: ProtocolParser().feed(l), data, args.repeat)
+        print(f"{name:<16}{legacy:>22,.0f}{dispatch:>20,.0f}")
+
+if __name__ == "__main__":
+    main()
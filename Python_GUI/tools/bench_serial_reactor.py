@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Serial-Reactor vs. ein Lese-Thread pro Gerät
+Misst Idle-CPU und Byte-zu-Queue-Latenz über Pseudo-Terminals (keine Hardware nötig)
+
+Aufruf (aus Python_GUI/):
+    python tools/bench_serial_reactor.py --devices 4 --samples 300
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+import statistics
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.hardware import HardwareConnection
+from core.serial_reactor import SerialReactor
+
+def open_pty_connections(count):
+    """Erstellt Pseudo-Terminal-Paare und verbindet je eine HardwareConnection"""
+    devices = []
+    for i in range(count):
+        master, slave = os.openpty()
+        connection = HardwareConnection(os.ttyname(slave), f"PTY-{i + 1}")
+        if not connection.connect():
+            raise RuntimeError(f"PTY {connection.port} konnte nicht geöffnet werden")
+        devices.append((master, slave, connection))
+    return devices
+
+def close_pty_connections(devices):
+    """Trennt alle Verbindungen und schließt die Pseudo-Terminals"""
+    for master, slave, connection in devices:
+        connection.disconnect()
+        os.close(master)
+        os.close(slave)
+
+def measure_idle_cpu(duration):
+    """CPU-Zeit des Prozesses während einer Ruhephase (in % eines Kerns)"""
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    time.sleep(duration)
+    return 100.0 * (time.process_time() - cpu_start) / (time.perf_counter() - wall_start)
+
+def measure_latency(devices, samples):
+    """Zeit vom Schreiben einer Zeile bis zum Eintrag in der data_queue (ms)"""
+    latencies = []
+    for _ in range(samples):
+        master, _, connection = random.choice(devices)
+        time.sleep(random.uniform(0, 0.01))  # Nicht im Takt der 10-ms-Pollschleife messen
+        start = time.perf_counter()
+        os.write(master, b"SIGNAL:3\n")
+        connection.data_queue.get(timeout=2)
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+def run_mode(mode, args):
+    """Führt eine Messreihe für 'thread' oder 'reactor' durch"""
+    devices = open_pty_connections(args.devices)
+    reactor = SerialReactor() if mode == 'reactor' else None
+    if reactor:
+        reactor.start()
+
+    for _, _, connection in devices:
+        connection.start_reading(reactor)
+
+    time.sleep(0.2)
+    threads = threading.active_count()
+    idle_cpu = measure_idle_cpu(args.idle)
+    latencies = sorted(measure_latency(devices, args.samples))
+
+    close_pty_connections(devices)
+    if reactor:
+        reactor.stop()
+
+    return {
+        'threads': threads,
+        'idle_cpu': idle_cpu,
+        'median': statistics.median(latencies),
+        'p99': latencies[int(len(latencies) * 0.99) - 1],
+        'max': latencies[-1],
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description='Serial-Reactor Benchmark')
+    parser.add_argument('--devices', type=int, default=4, help='Anzahl simulierter Geräte')
+    parser.add_argument('--samples', type=int, default=300, help='Latenz-Messungen pro Modus')
+    parser.add_argument('--idle', type=float, default=3.0, help='Dauer der Idle-CPU-Messung (s)')
+    args = parser.parse_args()
+
+    print(f"Serial-Reactor Benchmark: {args.devices} Geräte, {args.samples} Samples")
+    print(f"{'Modus':<10}{'Threads':>9}{'Idle-CPU %':>12}{'Median ms':>11}{'p99 ms':>9}{'Max ms':>9}")
+    for mode in ('thread', 'reactor'):
+        r = run_mode(mode, args)
+        print(f"{mode:<10}{r['threads']:>9}{r['idle_cpu']:>12.2f}"
+              f"{r['median']:>11.3f}{r['p99']:>9.3f}{r['max']:>9.3f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Latenz-Benchmark: Signal -> Repaint mit after(50)-Polling vs. TkWakeup
+Ein Producer-Thread legt Signale in eine Queue (wie read_serial_data), der
+Tk-Thread aktualisiert ein Label und erzwingt das Neuzeichnen. Gemessen wird
+die Zeit vom put() bis nach update_idletasks() sowie die Anzahl der
+Aufrufe des Verarbeiters im Leerlauf.
+
+Ohne Display (oder mit --headless) läuft die Messung auf einem reinen
+Tcl-Interpreter: gleiche Event-Schleife, aber ohne Label/Repaint.
+
+Aufruf (aus Python_GUI/):
+    python tools/bench_tk_wakeup.py --signals 200
+"""
+
+import os
+import sys
+import time
+import queue
+import random
+import argparse
+import statistics
+import threading
+import tkinter as tk
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.tk_wakeup import TkWakeup
+
+POLL_INTERVAL_MS = 50
+
+def run(mode, signals, idle_seconds, headless):
+    """Führt einen Durchlauf aus -> (latenzen_ms, leerlauf_aufrufe_pro_s, bezeichnung)"""
+    if headless:
+        root = tk.Tcl()
+        label = None
+    else:
+        root = tk.Tk()
+        label = tk.Label(root, text="-", font=("Arial", 32))
+        label.pack()
+        root.update()
+
+    data_queue = queue.Queue()
+    latencies = []
+    calls = [0]
+    finished = threading.Event()
+    wakeup = None
+
+    def process():
+        calls[0] += 1
+        try:
+            while not data_queue.empty():
+                signal_id, sent = data_queue.get_nowait()
+                if label:
+                    label.config(text=f"Seite {signal_id}")
+                    root.update_idletasks()
+                latencies.append((time.perf_counter() - sent) * 1000)
+        except queue.Empty:
+            pass
+        if mode == "poll":
+            root.after(POLL_INTERVAL_MS, process)
+
+    if mode == "bridge":
+        wakeup = TkWakeup(root, process)
+    process()
+
+    def producer():
+        # Leerlauf-Phase: keine Daten, nur Aufrufe zählen
+        time.sleep(idle_seconds)
+        idle_calls.append(calls[0])
+        for i in range(signals):
+            time.sleep(random.uniform(0.005, 0.08))
+            data_queue.put((i % 10 + 1, time.perf_counter()))
+            if wakeup:
+                wakeup.notify()
+        time.sleep(0.2)
+        finished.set()
+        if wakeup:
+            wakeup.notify()
+
+    idle_calls = []
+    thread = threading.Thread(target=producer, daemon=True)
+    thread.start()
+    # Entspricht root.mainloop(), endet aber sobald der Producer fertig ist
+    while not finished.is_set():
+        root.dooneevent()
+    thread.join()
+
+    name = f"TkWakeup ({wakeup.mode})" if wakeup else f"after({POLL_INTERVAL_MS})"
+    if wakeup:
+        wakeup.close()
+    if not headless:
+        root.destroy()
+    return latencies, (idle_calls[0] - 1) / idle_seconds, name
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+def main():
+    parser = argparse.ArgumentParser(description='TkWakeup Latenz-Benchmark')
+    parser.add_argument('--signals', type=int, default=200, help='Anzahl Signale pro Durchlauf')
+    parser.add_argument('--idle', type=float, default=2.0, help='Leerlauf-Messung in Sekunden')
+    parser.add_argument('--headless', action='store_true', help='Ohne Fenster messen (nur Tcl)')
+    args = parser.parse_args()
+
+    headless = args.headless
+    if not headless:
+        try:
+            tk.Tk().destroy()
+        except tk.TclError as e:
+            print(f"⚠️ Kein Display verfügbar ({e}) - messe ohne Repaint")
+            headless = True
+
+    target = "Verarbeitung" if headless else "Repaint"
+    print(f"Signal -> {target} Latenz: {args.signals} Signale, Leerlauf {args.idle:.1f} s")
+    print(f"{'Modus':<24}{'Median ms':>11}{'p95 ms':>9}{'Max ms':>9}{'Leerlauf-Aufrufe/s':>21}")
+    for mode in ("poll", "bridge"):
+        latencies, idle_rate, label = run(mode, args.signals, args.idle, headless)
+        print(f"{label:<24}{statistics.median(latencies):>11.2f}{percentile(latencies, 0.95):>9.2f}"
+              f"{max(latencies):>9.2f}{idle_rate:>21.1f}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
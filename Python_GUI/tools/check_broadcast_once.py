@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Prüfung: ein Seitenwechsel löst auf jedem ESP32 genau eine Aktivierung aus
+Mit der Device Farm (virtuelle ESP32s + GIGA, eigener Prozess) sendet
+HardwareManager.broadcast_signal() ein Signal; gezählt werden die Zeilen
+"Aktiviere Pin ..." jedes ESP32. Der Sketch schaltet die Relais sowohl bei
+seriellem SIGNAL: als auch bei einem UDP-Paket - jedes Ziel darf nur über
+einen Weg erreicht werden. Geprüfte Fälle:
+
+  seriell          alle ESP32s per USB verbunden, GIGA verbunden
+  gemischt         nur ein Teil per USB, der Rest per UDP_SEND über den GIGA
+  nur UDP          kein ESP32 per USB: ein SIGNAL-Broadcast über den GIGA
+  direkt gemischt  wie gemischt, der Rest direkt per UdpTransport
+
+ESP32s, die der sendende HardwareManager nicht verbunden hat, liest ein
+zweiter HardwareManager nur mit (ihre Ausgaben zählen mit).
+
+Aufruf (aus Python_GUI/):
+    python tools/check_broadcast_once.py
+    python tools/check_broadcast_once.py --rounds 10
+"""
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.config import config
+from core.udp_transport import UdpTransport
+from models.hardware import HardwareManager
+from services.device_farm import FarmProcess
+
+ESP32_COUNT = 3
+CASES = (
+    # Name, per USB am sendenden Manager, direkter UDP-Weg
+    ("seriell", (1, 2, 3), False),
+    ("gemischt", (1,), False),
+    ("nur UDP", (), False),
+    ("direkt gemischt", (1, 2), True),
+)
+
+def count_activations(managers, settle):
+    """Aktivierungen pro ESP32 aus den Empfangs-Queues aller Manager"""
+    time.sleep(settle)
+    counts = {f"esp32_{number}": 0 for number in range(1, ESP32_COUNT + 1)}
+    for manager in managers:
+        for role, connection in manager.connections.items():
+            for item in connection.data_queue.drain():
+                if role in counts and item['data'].startswith("Aktiviere Pin"):
+                    counts[role] += 1
+    return counts
+
+def run_case(ports, farm, serial_numbers, direct, rounds, settle):
+    """-> Liste der Runden mit {esp32: Aktivierungen}"""
+    sender, listener = HardwareManager(), HardwareManager()
+    for number in range(1, ESP32_COUNT + 1):
+        manager = sender if number in serial_numbers else listener
+        manager.add_esp32(ports[f'esp32_{number}'], number)
+    sender.add_giga(ports['giga'])
+    managers = (sender, listener)
+    try:
+        for manager in managers:
+            manager.connect_all()
+        if direct:
+            sender.set_transport(UdpTransport(farm.udp_addresses()))
+        count_activations(managers, 1.0)    # Boot-Meldungen verwerfen
+        results = []
+        for round_number in range(rounds):
+            fan_out = sender.broadcast_signal(f"page_{round_number % 10 + 1}")
+            fan_out.wait(2.0)
+            results.append(count_activations(managers, settle))
+        return results
+    finally:
+        for manager in managers:
+            manager.disconnect_all()
+
+def main():
+    parser = argparse.ArgumentParser(description='broadcast_signal: genau eine Aktivierung pro ESP32')
+    parser.add_argument('--rounds', type=int, default=3, help='Signale pro Fall')
+    parser.add_argument('--settle', type=float, default=0.5, help='Sekunden Wartezeit auf die Ausgaben')
+    args = parser.parse_args()
+
+    config.hardware['hotplug'] = False
+    config.hardware['udp_direct'] = False
+    config.hardware['record_path'] = None
+
+    farm = FarmProcess(ESP32_COUNT, {'signal_rate': 0, 'heartbeat_interval': 3600.0,
+                                     'heartbeat_timeout': 3600.0, 'clients_interval': 3600.0,
+                                     'udp_loopback': True})
+    ports = farm.start()
+    failures = []
+    try:
+        print(f"{'Fall':<17}{'per USB':<18}" + "".join(f"{f'esp32_{n}':>9}" for n in range(1, ESP32_COUNT + 1)))
+        for name, serial_numbers, direct in CASES:
+            results = run_case(ports, farm, serial_numbers, direct, args.rounds, args.settle)
+            totals = {esp32: sum(result[esp32] for result in results) for esp32 in results[0]}
+            usb = ", ".join(f"esp32_{number}" for number in serial_numbers) or "-"
+            print(f"{name:<17}{usb:<18}" + "".join(f"{totals[esp32]:>9}" for esp32 in sorted(totals)))
+            for round_number, result in enumerate(results, start=1):
+                for esp32, count in result.items():
+                    if count != 1:
+                        failures.append(f"{name}, Signal {round_number}: {esp32} {count}x aktiviert")
+    finally:
+        farm.stop()
+
+    if failures:
+        for failure in failures:
+            print(f"❌ {failure}")
+        return 1
+    print(f"✅ Jeder ESP32 genau einmal aktiviert ({args.rounds} Signale pro Fall)")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Prüfung: Geräte-Index mit nachgebautem sysfs-Baum (Hotplug ohne Hardware)
+Legt unter einem temporären Verzeichnis ttyUSB*/ttyACM*-Einträge samt
+USB-Geräten (idVendor, idProduct, serial) an und prüft, dass
+  - jede Rolle an ihrer Buchse bleibt: wird ein Board abgezogen, löst seine
+    Rolle zu None auf, die übrigen Rollen rücken nicht nach,
+  - ein wieder eingestecktes Board seine alte Rolle zurückbekommt,
+  - feste Seriennummern/Buchsen (role_serials, role_locations) gelten und
+    ohne ihr Gerät leer bleiben statt auf ein anderes Board auszuweichen,
+  - HardwareManager.resolve_port() keinen Knoten liefert, den eine andere
+    Verbindung schon geöffnet hat,
+  - devices()/resolve() bei gleichzeitigem invalidate() nicht scheitern.
+
+Aufruf (aus Python_GUI/):
+    python tools/check_device_index.py
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.device_index import DeviceIndex
+
+class FakeSysfs:
+    """sysfs-Ausschnitt: class/tty/<knoten>/device -> devices/usb1/<buchse>/<buchse>:1.0"""
+
+    def __init__(self):
+        self.root = tempfile.mkdtemp(prefix="sysfs_")
+        self.tty_root = os.path.join(self.root, "class", "tty")
+        os.makedirs(self.tty_root)
+
+    def plug(self, node, location, vid="10c4", pid="ea60", serial=""):
+        usb = os.path.join(self.root, "devices", "usb1", location)
+        interface = os.path.join(usb, f"{location}:1.0")
+        os.makedirs(interface, exist_ok=True)
+        for name, value in (("idVendor", vid), ("idProduct", pid), ("serial", serial)):
+            with open(os.path.join(usb, name), "w") as f:
+                f.write(value + "\n")
+        entry = os.path.join(self.tty_root, node)
+        os.makedirs(entry)
+        os.symlink(interface, os.path.join(entry, "device"))
+
+    def unplug(self, node):
+        shutil.rmtree(os.path.join(self.tty_root, node))
+
+    def remove(self):
+        shutil.rmtree(self.root)
+
+def boards(sysfs):
+    """Vier ESP32-Boards an den Buchsen 1-1.1 bis 1-1.4 und ein GIGA"""
+    for number in range(4):
+        sysfs.plug(f"ttyUSB{number}", f"1-1.{number + 1}", serial=f"ESP{number}")
+    sysfs.plug("ttyACM0", "1-1.5", vid="2341", pid="0266", serial="GIGA0")
+
+def check_sticky(failures):
+    sysfs = FakeSysfs()
+    try:
+        boards(sysfs)
+        index = DeviceIndex(sysfs_root=sysfs.tty_root)
+        before = index.roles()
+        expected = {"esp32_1": "/dev/ttyUSB0", "esp32_2": "/dev/ttyUSB1",
+                    "esp32_3": "/dev/ttyUSB2", "giga": "/dev/ttyACM0"}
+        if before != expected:
+            failures.append(f"Start: {before}, erwartet {expected}")
+
+        sysfs.unplug("ttyUSB0")
+        index.invalidate()
+        after = index.roles()
+        print(f"ttyUSB0 abgezogen: {after}")
+        if index.resolve("esp32_1") is not None:
+            failures.append(f"esp32_1 ohne Board -> {index.resolve('esp32_1')}, erwartet None")
+        for role in ("esp32_2", "esp32_3", "giga"):
+            if after.get(role) != before[role]:
+                failures.append(f"{role} nach Abziehen von ttyUSB0: {after.get(role)}, erwartet {before[role]}")
+
+        # Replug an derselben Buchse, vom Kernel unter einem neuen Knoten angelegt
+        sysfs.plug("ttyUSB4", "1-1.1", serial="ESP0")
+        index.invalidate()
+        if index.resolve("esp32_1") != "/dev/ttyUSB4":
+            failures.append(f"esp32_1 nach Replug: {index.resolve('esp32_1')}, erwartet /dev/ttyUSB4")
+    finally:
+        sysfs.remove()
+
+def check_fixed(failures):
+    sysfs = FakeSysfs()
+    try:
+        boards(sysfs)
+        index = DeviceIndex({"esp32_1": "ESP3"}, sysfs_root=sysfs.tty_root,
+                            role_locations={"esp32_2": "1-1.3"})
+        roles = index.roles()
+        if roles.get("esp32_1") != "/dev/ttyUSB3" or roles.get("esp32_2") != "/dev/ttyUSB2":
+            failures.append(f"Feste Zuordnung: {roles}")
+        if roles.get("esp32_3") != "/dev/ttyUSB0":
+            failures.append(f"esp32_3 sollte das erste freie Board bekommen: {roles}")
+
+        sysfs.unplug("ttyUSB3")
+        sysfs.unplug("ttyUSB2")
+        index.invalidate()
+        roles = index.roles()
+        print(f"Feste Boards abgezogen: {roles}")
+        if "esp32_1" in roles or "esp32_2" in roles:
+            failures.append(f"Feste Rollen ohne Gerät müssen leer bleiben: {roles}")
+    finally:
+        sysfs.remove()
+
+def check_held_node(failures):
+    from models.hardware import HardwareManager
+
+    class OpenPort:
+        is_open = True
+
+    sysfs = FakeSysfs()
+    try:
+        boards(sysfs)
+        manager = HardwareManager()
+        manager.device_index = DeviceIndex(sysfs_root=sysfs.tty_root)
+        # Fester Port auf dem Knoten, den der Index esp32_1 zuordnet - schon geöffnet
+        fixed = manager.add_esp32("/dev/ttyUSB0", 3)
+        fixed.connection = OpenPort()
+        automatic = manager.add_esp32(None, 1)
+        port = manager.resolve_port(automatic)
+        if port is not None:
+            failures.append(f"resolve_port lieferte den schon geöffneten Knoten {port}")
+        fixed.connection = None
+        if manager.resolve_port(automatic) != "/dev/ttyUSB0":
+            failures.append("resolve_port nach dem Schließen: Knoten nicht wieder frei")
+    finally:
+        sysfs.remove()
+
+def check_concurrent_invalidate(failures):
+    sysfs = FakeSysfs()
+    errors = []
+    stop = threading.Event()
+    try:
+        boards(sysfs)
+        index = DeviceIndex(sysfs_root=sysfs.tty_root)
+
+        def invalidate():
+            while not stop.is_set():
+                index.invalidate()
+
+        thread = threading.Thread(target=invalidate, daemon=True)
+        thread.start()
+        for _ in range(2000):
+            try:
+                index.devices()
+                index.resolve("esp32_1")
+            except Exception as e:
+                errors.append(e)
+                break
+        stop.set()
+        thread.join()
+    finally:
+        sysfs.remove()
+    if errors:
+        failures.append(f"Gleichzeitiges invalidate(): {errors[0]!r}")
+
+def main():
+    failures = []
+    check_sticky(failures)
+    check_fixed(failures)
+    check_held_node(failures)
+    check_concurrent_invalidate(failures)
+
+    if failures:
+        for failure in failures:
+            print(f"❌ {failure}")
+        return 1
+    print("✅ Rollen bleiben an ihrem Board, fehlende Geräte lösen zu None auf")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
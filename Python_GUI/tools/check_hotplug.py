@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Hotplug-Prüfung: Gerät entfernen und wieder anstecken (Pseudo-Terminals)
+Vier simulierte Geräte senden laufend SIGNAL-Zeilen. Eines wird "abgezogen"
+(PTY geschlossen, Geräte-Datei entfernt) und später unter gleichem Namen neu
+angelegt. Geprüft wird, dass die anderen drei ohne Unterbrechung weiterlaufen,
+nur das betroffene Gerät neu verbunden wird und get_status_summary()
+Reconnects und Ausfallzeit meldet.
+
+Die Geräte-Dateien liegen als Symlinks in einem temporären Verzeichnis,
+das der Supervisor statt /dev überwacht.
+
+Aufruf (aus Python_GUI/):
+    python tools/check_hotplug.py
+"""
+
+import os
+import sys
+import time
+import tempfile
+import argparse
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.config import config
+from core.device_supervisor import DeviceSupervisor
+from models.hardware import HardwareManager
+
+class FakeDevice:
+    """PTY-Paar mit Symlink als Geräte-Datei; sendet SIGNAL-Zeilen"""
+
+    def __init__(self, path):
+        self.path = path
+        self.master = None
+        self.running = False
+        self.thread = None
+
+    def plug(self):
+        self.master, slave = os.openpty()
+        os.symlink(os.ttyname(slave), self.path)
+        os.close(slave)
+        self.running = True
+        self.thread = threading.Thread(target=self._send, daemon=True)
+        self.thread.start()
+
+    def unplug(self):
+        self.running = False
+        self.thread.join()
+        os.unlink(self.path)
+        os.close(self.master)
+
+    def _send(self):
+        counter = 0
+        while self.running:
+            counter += 1
+            try:
+                os.write(self.master, f"SIGNAL:{counter % 10 + 1}\r\n".encode())
+            except OSError:
+                pass  # Noch niemand verbunden
+            time.sleep(0.02)
+
+def drain(manager):
+    """Anzahl empfangener Zeilen pro Gerät seit dem letzten Aufruf"""
+    counts = {name: 0 for name in manager.connections}
+    for connection_name, connection in manager.connections.items():
+        while not connection.data_queue.empty():
+            connection.data_queue.get_nowait()
+            counts[connection_name] += 1
+    return counts
+
+def wait_for(condition, timeout):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.05)
+    return False
+
+def main():
+    parser = argparse.ArgumentParser(description='Hotplug-Prüfung mit PTY-Geräten')
+    parser.add_argument('--downtime', type=float, default=1.5, help='Sekunden ohne Gerät')
+    args = parser.parse_args()
+
+    config.hardware['binary_protocol'] = False
+    config.hardware['hotplug'] = True
+    failures = []
+
+    with tempfile.TemporaryDirectory() as directory:
+        names = ["ttyUSB0", "ttyUSB1", "ttyUSB2", "ttyACM0"]
+        devices = [FakeDevice(os.path.join(directory, name)) for name in names]
+        for device in devices:
+            device.plug()
+
+        manager = HardwareManager()
+        manager.supervisor = DeviceSupervisor(manager, base_delay=0.2, max_delay=2.0,
+                                              directory=directory, poll_interval=0.2)
+        for number, device in enumerate(devices[:3], start=1):
+            manager.add_esp32(device.path, number)
+        manager.add_giga(devices[3].path)
+
+        results = manager.connect_all()
+        print(f"Verbunden: {results} (Überwachung: {manager.supervisor.watcher.mode})")
+
+        time.sleep(0.5)
+        drain(manager)
+
+        # ESP32-2 abziehen
+        devices[1].unplug()
+        if not wait_for(lambda: manager.connections['esp32_2'].status != "connected", 3):
+            failures.append("Ausfall von esp32_2 nicht erkannt")
+        time.sleep(args.downtime)
+        during = drain(manager)
+        print(f"Zeilen während des Ausfalls: {during}")
+        for name in ("esp32_1", "esp32_3", "giga"):
+            if during[name] == 0:
+                failures.append(f"{name} hat während des Ausfalls nicht weitergesendet")
+
+        # Wieder anstecken
+        devices[1].plug()
+        if not wait_for(lambda: manager.connections['esp32_2'].status == "connected", 5):
+            failures.append("esp32_2 wurde nicht neu verbunden")
+        time.sleep(0.5)
+        after = drain(manager)
+        print(f"Zeilen nach dem Reconnect: {after}")
+        if after['esp32_2'] == 0:
+            failures.append("esp32_2 liefert nach dem Reconnect keine Daten")
+
+        summary = manager.get_status_summary()
+        for name, info in summary.items():
+            print(f"  {name:<8} {info['status']:<13} Reconnects: {info['reconnects']}  "
+                  f"Ausfall: {info['downtime']:.2f} s")
+        if summary['esp32_2']['reconnects'] != 1:
+            failures.append(f"esp32_2 Reconnects = {summary['esp32_2']['reconnects']} (erwartet 1)")
+        if summary['esp32_2']['downtime'] < args.downtime * 0.8:
+            failures.append("Ausfallzeit von esp32_2 zu klein")
+        for name in ("esp32_1", "esp32_3", "giga"):
+            if summary[name]['reconnects'] or summary[name]['status'] != "connected":
+                failures.append(f"{name} wurde unnötig neu verbunden")
+
+        manager.disconnect_all()
+        for device in devices:
+            device.unplug()
+
+    if failures:
+        for failure in failures:
+            print(f"❌ {failure}")
+        return 1
+    print("✅ Hotplug: nur das betroffene Gerät wurde neu verbunden")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Liveness-Prüfung mit der Device Farm (virtuelle ESP32s + GIGA, eigener Prozess)
+Alle Geräte sind still (keine Signale, keine Heartbeats). Geprüft wird, dass
+  - ein stilles, aber ansprechbares Gerät per PING als alive erkannt und nie
+    als stale gemeldet wird,
+  - ein hängendes Gerät (Farm-Einstellung muted: Port offen, keine Antwort)
+    spätestens timeout + probe_timeout + ein Tick nach dem Hänger als stale
+    gemeldet wird, die anderen nicht, und
+  - es nach dem Hänger wieder als alive gemeldet wird.
+Zusätzlich wird gezählt, wie oft der Liveness-Thread aufwacht - ohne
+Fristablauf schläft er, statt den Status zu pollen.
+
+Aufruf (aus Python_GUI/):
+    python tools/check_liveness.py
+    python tools/check_liveness.py --timeout 1.0 --probe-timeout 0.5 --quiet 5
+"""
+
+import os
+import sys
+import time
+import argparse
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.config import config
+from core.liveness import DEVICE_ALIVE, DEVICE_STALE
+from models.hardware import HardwareManager
+from services.device_farm import FarmProcess
+
+class EventLog:
+    """Sammelt Status-Meldungen des HardwareManagers mit Zeitstempel"""
+
+    def __init__(self):
+        self.events = []
+        self.changed = threading.Condition()
+
+    def __call__(self, topic, name):
+        with self.changed:
+            self.events.append((time.monotonic(), topic, name))
+            self.changed.notify_all()
+
+    def of(self, topic, since=0.0):
+        with self.changed:
+            return [(at, name) for at, event, name in self.events if event == topic and at >= since]
+
+    def wait_for(self, topic, name, since, timeout):
+        """Zeitpunkt der ersten Meldung topic für name ab since oder None"""
+        deadline = time.monotonic() + timeout
+        with self.changed:
+            while True:
+                for at, event, device in self.events:
+                    if event == topic and device == name and at >= since:
+                        return at
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                self.changed.wait(remaining)
+
+def main():
+    parser = argparse.ArgumentParser(description='LivenessTracker mit der Device Farm prüfen')
+    parser.add_argument('--esp32', type=int, default=3, help='Anzahl virtueller ESP32s')
+    parser.add_argument('--timeout', type=float, default=0.5, help='liveness_timeout in Sekunden')
+    parser.add_argument('--probe-timeout', type=float, default=0.3, help='liveness_probe_timeout in Sekunden')
+    parser.add_argument('--quiet', type=float, default=3.0, help='Sekunden Stille vor dem Hänger')
+    parser.add_argument('--muted', default='esp32_2', help='Gerät, das hängen bleibt')
+    args = parser.parse_args()
+
+    config.hardware['hotplug'] = False
+    config.hardware['udp_direct'] = False
+    config.hardware['record_path'] = None
+    config.hardware['liveness_timeout'] = args.timeout
+    config.hardware['liveness_probe_timeout'] = args.probe_timeout
+
+    farm = FarmProcess(args.esp32, {'signal_rate': 0, 'heartbeat_interval': 3600.0,
+                                    'heartbeat_timeout': 3600.0, 'clients_interval': 3600.0})
+    ports = farm.start()
+    manager = HardwareManager()
+    for number in range(1, args.esp32 + 1):
+        manager.add_esp32(ports[f'esp32_{number}'], number)
+    manager.add_giga(ports['giga'])
+    log = EventLog()
+    manager.add_status_listener(log)
+    tracker = manager.liveness
+    bound = args.timeout + args.probe_timeout + tracker.wheel.tick
+    failures = []
+
+    # Aufwachen des Liveness-Threads zählen (Condition.wait kehrt pro Durchlauf einmal zurück)
+    wakeups = [0]
+    wait = tracker._wakeup.wait
+    def counting_wait(timeout=None):
+        wakeups[0] += 1
+        return wait(timeout)
+    tracker._wakeup.wait = counting_wait
+
+    try:
+        connected = manager.connect_all()
+        missing = sorted(name for name, ok in connected.items() if not ok)
+        if missing:
+            print(f"❌ Nicht verbunden: {', '.join(missing)}")
+            return 1
+
+        # 1. Stille: PING hält alle Geräte am Leben
+        start = time.monotonic()
+        commands = sum(stats['commands'] for stats in farm.get_stats().values())
+        time.sleep(args.quiet)
+        probes = sum(stats['commands'] for stats in farm.get_stats().values()) - commands
+        quiet_wakeups = wakeups[0]
+        stale = log.of(DEVICE_STALE, start)
+        if stale:
+            failures.append(f"Stilles Gerät als stale gemeldet: {', '.join(name for _, name in stale)}")
+        if not probes:
+            failures.append("Keine PING-Probe in der Stille")
+        print(f"Stille {args.quiet:.1f} s: {probes} PING-Proben, {quiet_wakeups} Aufwachvorgänge, "
+              f"{len(stale)} stale")
+
+        # 2. Hänger: muted antwortet nicht mehr
+        farm.configure(muted=[args.muted])
+        muted_at = time.monotonic()
+        stale_at = log.wait_for(DEVICE_STALE, args.muted, muted_at, bound + 2.0)
+        others = [name for _, name in log.of(DEVICE_STALE, muted_at) if name != args.muted]
+        if stale_at is None:
+            failures.append(f"{args.muted} nie als stale gemeldet")
+        else:
+            delay = stale_at - muted_at
+            print(f"Hänger {args.muted}: stale nach {delay:.2f} s (Schranke {bound:.2f} s)")
+            if delay > bound + 0.1:  # Toleranz: Thread-Wechsel, Farm-Prozess
+                failures.append(f"stale erst nach {delay:.2f} s, Schranke {bound:.2f} s")
+        if others:
+            failures.append(f"Fälschlich stale: {', '.join(sorted(set(others)))}")
+        if manager.get_status_summary()[args.muted]['liveness']['state'] != "stale":
+            failures.append("get_status_summary meldet den Hänger nicht als stale")
+
+        # 3. Erholung: das stille Gerät antwortet wieder auf die erneute Probe
+        farm.configure(muted=[])
+        recovered_at = time.monotonic()
+        alive_at = log.wait_for(DEVICE_ALIVE, args.muted, recovered_at, args.timeout + bound + 2.0)
+        if alive_at is None:
+            failures.append(f"{args.muted} nach dem Hänger nie wieder alive")
+        else:
+            print(f"Erholung {args.muted}: alive nach {alive_at - recovered_at:.2f} s "
+                  f"(erneute Probe alle {args.timeout:.2f} s)")
+    finally:
+        manager.disconnect_all()
+        farm.stop()
+
+    print(f"Übergänge: {tracker.transitions}")
+    if failures:
+        for failure in failures:
+            print(f"❌ {failure}")
+        return 1
+    print("✅ Liveness: stille Geräte bleiben alive, Hänger innerhalb der Schranke erkannt")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
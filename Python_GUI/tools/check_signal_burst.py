@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Prüfung: Signal-Burst durch Empfangs-Queue und SignalCoalescer
+Wie in Bertrandt_GUI.py legt der Lese-Thread N Signale in die Daten-Queue
+(Standard-Einstellungen: queue_size und queue_policy aus core/config.py),
+process_serial_data holt sie ab und gibt sie an den SignalCoalescer.
+Erwartet werden N-1 Historien-Einträge für die Zwischenseiten und genau
+ein Seitenaufbau mit der letzten Seite - geprüft für
+  ein Durchlauf     alle Signale vor dem Abholen in der Queue
+  zwei Durchläufe   der Burst verteilt sich auf zwei Abhol-Durchläufe,
+                    mit settle_ms (Ruhefenster über after())
+
+Aufruf (aus Python_GUI/):
+    python tools/check_signal_burst.py
+    python tools/check_signal_burst.py --burst 10
+"""
+
+import os
+import sys
+import queue
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.config import config
+from core.ring_queue import RingQueue
+from core.signal_coalescer import SignalCoalescer
+
+class Page:
+    """Zählt Seitenaufbauten und Historien-Einträge"""
+
+    def __init__(self):
+        self.rendered = []
+        self.history = []
+
+    def render(self, signal_id, trace=None):
+        self.rendered.append(signal_id)
+
+    def skip(self, signal_id):
+        self.history.append(signal_id)
+
+class FakeAfter:
+    """Stellvertreter für root.after/after_cancel: Timer laufen erst bei fire()"""
+
+    def __init__(self):
+        self.timers = {}
+        self.next_id = 0
+
+    def after(self, ms, callback):
+        self.next_id += 1
+        self.timers[self.next_id] = callback
+        return self.next_id
+
+    def after_cancel(self, timer_id):
+        self.timers.pop(timer_id, None)
+
+    def fire(self):
+        timers, self.timers = self.timers, {}
+        for callback in timers.values():
+            callback()
+
+def new_queue():
+    """Daten-Queue wie in Bertrandt_GUI.py mit den Standard-Einstellungen"""
+    return RingQueue(config.hardware['queue_size'], config.hardware['queue_policy'],
+                     signal_key=lambda item: "signal" if item[0] == 'signal' else None)
+
+def process(data_queue, coalescer):
+    """Ein Abhol-Durchlauf wie process_serial_data"""
+    try:
+        while not data_queue.empty():
+            data_type, value, trace = data_queue.get_nowait()
+            if data_type == 'signal':
+                coalescer.add(value, trace)
+    except queue.Empty:
+        pass
+    coalescer.end_cycle()
+
+def run(burst, cycles, settle_ms):
+    data_queue = new_queue()
+    page = Page()
+    timer = FakeAfter()
+    coalescer = SignalCoalescer(page.render, page.skip, settle_ms, timer.after, timer.after_cancel)
+    signals = [number % 10 + 1 for number in range(burst)]
+    per_cycle = -(-burst // cycles)
+    for start in range(0, burst, per_cycle):
+        for signal_id in signals[start:start + per_cycle]:
+            data_queue.put(('signal', signal_id, None))
+        data_queue.put(('clients', 1, None))
+        process(data_queue, coalescer)
+    timer.fire()
+    return page, signals, data_queue.get_stats()
+
+def main():
+    parser = argparse.ArgumentParser(description='Signal-Burst: Historie und Seitenaufbau prüfen')
+    parser.add_argument('--burst', type=int, default=5, help='Signale im Burst (N)')
+    args = parser.parse_args()
+
+    print(f"Queue: {config.hardware['queue_size']} Einträge, Strategie {config.hardware['queue_policy']}, "
+          f"Burst von {args.burst} Signalen")
+    failures = []
+    for name, cycles, settle_ms in (("ein Durchlauf", 1, 0), ("zwei Durchläufe", 2, 50)):
+        page, signals, stats = run(args.burst, cycles, settle_ms)
+        print(f"{name:<16} Historie {len(page.history):>3}  Aufbau {len(page.rendered)}  "
+              f"ersetzt {stats['superseded']}  verworfen {stats['dropped']}")
+        if page.history != signals[:-1]:
+            failures.append(f"{name}: Historie {page.history}, erwartet {signals[:-1]}")
+        if page.rendered != signals[-1:]:
+            failures.append(f"{name}: aufgebaut {page.rendered}, erwartet {signals[-1:]}")
+
+    if failures:
+        for failure in failures:
+            print(f"❌ {failure}")
+        return 1
+    print(f"✅ {args.burst - 1} Zwischenseiten in der Historie, nur die letzte Seite aufgebaut")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+UDP-Link-Prüfung: Heartbeats, Acks und Umlaufzeit gegen Loopback-Empfänger
+Die virtuellen ESP32s der Device Farm (udp_loopback, eigener Prozess)
+lauschen auf 127.0.0.1 und bestätigen Pakete mit Sequenznummer wie der
+Sketch (ack:seq:millis). Dazu kommt ein Ziel ohne Empfänger. Geprüft wird,
+dass UdpLink für die lebenden Empfänger Umlaufzeit und einen stabilen
+Uhrversatz misst, Seitensignale bestätigt werden und das tote Ziel mit
+100 % Verlust auffällt.
+
+Aufruf (aus Python_GUI/):
+    python tools/check_udp_link.py
+    python tools/check_udp_link.py --esp32 10 --duration 5
+"""
+
+import os
+import sys
+import time
+import socket
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.udp_link import UdpLink, link_quality_text
+from services.device_farm import FarmProcess
+
+def unused_address():
+    """Loopback-Port, auf dem niemand lauscht"""
+    probe = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    probe.bind(("127.0.0.1", 0))
+    address = probe.getsockname()
+    probe.close()
+    return address
+
+def main():
+    parser = argparse.ArgumentParser(description='UdpLink gegen Loopback-Empfänger prüfen')
+    parser.add_argument('--esp32', type=int, default=3, help='Anzahl virtueller ESP32s')
+    parser.add_argument('--duration', type=float, default=3.0, help='Sekunden Messdauer')
+    parser.add_argument('--heartbeat', type=float, default=0.2, help='Sekunden zwischen Heartbeats')
+    args = parser.parse_args()
+    failures = []
+
+    farm = FarmProcess(args.esp32, {'signal_rate': 0, 'heartbeat_interval': 3600.0,
+                                    'clients_interval': 3600.0, 'udp_loopback': True})
+    farm.start()
+    targets = dict(farm.udp_addresses())
+    targets['esp32_tot'] = unused_address()
+    updates = []
+    link = UdpLink(targets, heartbeat_interval=args.heartbeat, ack_timeout=0.3,
+                   on_update=lambda role, quality: updates.append(role), max_retries=1)
+    try:
+        if not link.open():
+            print("❌ UdpLink konnte nicht geöffnet werden")
+            return 1
+
+        time.sleep(args.duration / 2)
+        offsets = {role: quality['clock_offset_ms'] for role, quality in link.link_quality().items()}
+
+        # Seitensignale: bestätigt von allen lebenden Empfängern, Timeout beim toten Ziel
+        futures = link.send_signal("page_3", 1)
+        for role, future in futures.items():
+            error = future.exception(timeout=5.0)
+            if role == 'esp32_tot':
+                if not isinstance(error, TimeoutError):
+                    failures.append(f"Signal an esp32_tot: erwartet Timeout, erhalten {error!r}")
+            elif error is not None:
+                failures.append(f"Signal an {role} nicht bestätigt: {error}")
+
+        time.sleep(args.duration / 2)
+        quality = link.link_quality()
+    finally:
+        link.close()
+        farm.stop()
+
+    print(f"{'Ziel':<10}{'gesendet':>9}{'Acks':>6}{'RTT ms':>8}{'min ms':>8}{'Verlust':>9}"
+          f"{'Versatz ms':>12}  Anzeige")
+    for role, info in quality.items():
+        rtt = f"{info['srtt_ms']:.2f}" if info['srtt_ms'] is not None else "-"
+        min_rtt = f"{info['min_rtt_ms']:.2f}" if info['min_rtt_ms'] is not None else "-"
+        offset = f"{info['clock_offset_ms']:.1f}" if info['clock_offset_ms'] is not None else "-"
+        loss = f"{info['loss_rate']:.0%}" if info['loss_rate'] is not None else "-"
+        print(f"{role:<10}{info['sent']:>9}{info['acked']:>6}{rtt:>8}{min_rtt:>8}{loss:>9}"
+              f"{offset:>12}  {link_quality_text(info)}")
+
+        if role == 'esp32_tot':
+            if info['acked'] or info['loss_rate'] != 1.0:
+                failures.append("Ziel ohne Empfänger wird nicht als 100 % Verlust erkannt")
+            continue
+        if info['loss_rate']:
+            failures.append(f"{role}: {info['loss_rate']:.0%} Verlust auf Loopback")
+        if info['srtt_ms'] is None or info['srtt_ms'] > 50:
+            failures.append(f"{role}: Umlaufzeit fehlt oder unplausibel ({rtt} ms)")
+        if offsets.get(role) is None or info['clock_offset_ms'] is None:
+            failures.append(f"{role}: kein Uhrversatz gemessen")
+        elif abs(info['clock_offset_ms'] - offsets[role]) > 5:
+            failures.append(f"{role}: Uhrversatz springt um "
+                            f"{info['clock_offset_ms'] - offsets[role]:.1f} ms")
+    if not updates:
+        failures.append("on_update wurde nie aufgerufen")
+
+    if failures:
+        for failure in failures:
+            print(f"❌ {failure}")
+        return 1
+    print("✅ UDP-Link: Acks, Umlaufzeit und Verlust pro Empfänger gemessen")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+UDP-Wiederholungsprüfung: Seitensignale über einen verlustbehafteten Proxy
+Zwischen UdpLink und den Loopback-Empfängern der Device Farm (virtuelle
+ESP32s, eigener Prozess) sitzt pro ESP32 ein UDP-Proxy, der in beide
+Richtungen zufällig Pakete verwirft und verzögert. Gesendet wird eine
+Folge schneller Seitenwechsel, einmal ohne und einmal mit Wiederholungen.
+
+Geprüft wird (mit Wiederholungen), dass
+  - jeder ESP32 am Ende die zuletzt gesendete Seite zeigt,
+  - das letzte Signal von allen bestätigt wurde,
+  - nie ein abgelöstes Signal erneut gesendet wurde (der Proxy sieht
+    jedes Paket, bevor er es verwirft) und
+  - der ESP32 Wiederholungen nicht doppelt ausführt.
+
+Aufruf (aus Python_GUI/):
+    python tools/check_udp_retransmit.py
+    python tools/check_udp_retransmit.py --loss 0.3 --delay-ms 20 --signals 300
+"""
+
+import os
+import sys
+import time
+import heapq
+import random
+import socket
+import argparse
+import selectors
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.udp_link import UdpLink, HEARTBEAT_SIGNAL
+from services.device_farm import FarmProcess
+
+class LossProxy:
+    """UDP-Proxy pro Ziel: verwirft loss der Pakete je Richtung, verzögert um 0..delay_ms"""
+
+    def __init__(self, targets, loss, delay_ms=0.0, seed=1):
+        self.loss = loss
+        self.delay = delay_ms / 1000.0
+        self.random = random.Random(seed)
+        self.selector = selectors.DefaultSelector()
+        self.proxies = {}       # rolle -> (socket, ziel)
+        self.clients = {}       # rolle -> Adresse des UdpLink-Sockets
+        self.signals = {role: [] for role in targets}  # gesehene Signal-Pakete (seq, signal)
+        self.dropped = 0
+        self.forwarded = 0
+        self._queue = []        # (fällig, nr, socket, daten, adresse)
+        self._count = 0
+        self._running = False
+        self._thread = None
+        for role, target in targets.items():
+            proxy = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            proxy.bind(("127.0.0.1", 0))
+            proxy.setblocking(False)
+            self.proxies[role] = (proxy, tuple(target))
+            self.selector.register(proxy, selectors.EVENT_READ, role)
+
+    def addresses(self):
+        """Adressen, an die UdpLink statt an die Empfänger senden soll"""
+        return {role: proxy.getsockname() for role, (proxy, _) in self.proxies.items()}
+
+    def start(self):
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="LossProxy", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._running = False
+        if self._thread:
+            self._thread.join(2.0)
+        for proxy, _ in self.proxies.values():
+            proxy.close()
+        self.selector.close()
+
+    def _run(self):
+        while self._running:
+            timeout = 0.05
+            if self._queue:
+                timeout = max(0.0, min(timeout, self._queue[0][0] - time.monotonic()))
+            for key, _ in self.selector.select(timeout):
+                self._receive(key.data, key.fileobj)
+            now = time.monotonic()
+            while self._queue and self._queue[0][0] <= now:
+                _, _, proxy, data, address = heapq.heappop(self._queue)
+                try:
+                    proxy.sendto(data, address)
+                except OSError:
+                    pass
+
+    def _receive(self, role, proxy):
+        target = self.proxies[role][1]
+        while True:
+            try:
+                data, sender = proxy.recvfrom(2048)
+            except (BlockingIOError, OSError):
+                return
+            if sender == target:
+                address = self.clients.get(role)
+            else:
+                self.clients[role] = address = sender
+                parts = data.decode("utf-8", "replace").split(":")
+                if len(parts) == 3 and parts[0] != HEARTBEAT_SIGNAL:
+                    self.signals[role].append((int(parts[2]), parts[0]))
+                address = target
+            if address is None or self.random.random() < self.loss:
+                self.dropped += 1
+                continue
+            self.forwarded += 1
+            self._count += 1
+            due = time.monotonic() + self.random.uniform(0, self.delay)
+            heapq.heappush(self._queue, (due, self._count, proxy, data, address))
+
+def stale_resends(sequences):
+    """Pakete eines Ziels, deren Signal beim Senden schon durch ein neueres abgelöst war"""
+    newest, stale = None, 0
+    for sequence, _ in sequences:
+        # Sequenznummern steigen (modulo 65536) - kleiner Abstand rückwärts = älter
+        if newest is not None and 0 < (newest - sequence) % 65536 < 32768:
+            stale += 1
+        elif newest is None or (sequence - newest) % 65536 < 32768:
+            newest = sequence
+    return stale
+
+def run(args, max_retries, seed):
+    """-> (Auswertung, Fehlerliste) für einen Durchlauf mit frischer Farm"""
+    farm = FarmProcess(args.esp32, {'signal_rate': 0, 'heartbeat_interval': 3600.0,
+                                    'clients_interval': 3600.0, 'udp_loopback': True})
+    farm.start()
+    proxy = LossProxy(farm.udp_addresses(), args.loss, args.delay_ms, seed)
+    proxy.start()
+    link = UdpLink(proxy.addresses(), heartbeat_interval=0.1, ack_timeout=0.2,
+                   max_retries=max_retries)
+    failures = []
+    try:
+        if not link.open():
+            return None, ["UdpLink konnte nicht geöffnet werden"]
+        time.sleep(1.0)  # Heartbeats: Umlaufzeit messen, bevor die Seitenwechsel kommen
+
+        sent_futures = []
+        for number in range(args.signals):
+            page = f"page_{number % 10 + 1}"
+            sent_futures.append((page, link.send_signal(page, 1)))
+            time.sleep(args.gap_ms / 1000.0)
+        last_page, last_futures = sent_futures[-1]
+        for future in last_futures.values():
+            try:
+                future.exception(timeout=10.0)
+            except Exception:
+                pass
+        time.sleep(0.5)  # verspätete Pakete im Proxy abwarten
+        state = farm.udp_state()
+        duplicates = sum(stats['udp_duplicates'] for stats in farm.get_stats().values())
+    finally:
+        link.close()
+        proxy.stop()
+        farm.stop()
+
+    outcome = {'acked': 0, 'superseded': 0, 'failed': 0}
+    for _, futures in sent_futures:
+        for future in futures.values():
+            if future.cancelled():
+                outcome['superseded'] += 1
+            elif future.done() and future.exception() is None:
+                outcome['acked'] += 1
+            else:
+                outcome['failed'] += 1
+    wrong = sorted(role for role, signal in state.items() if signal != last_page)
+    last_failed = sorted(role for role, future in last_futures.items()
+                         if not future.done() or future.cancelled() or future.exception())
+    stale = sum(stale_resends(sequences) for sequences in proxy.signals.values())
+    stats = link.get_stats()
+    result = dict(outcome, wrong=wrong, last_failed=last_failed, stale=stale,
+                  retransmits=stats['retransmits'], dropped=proxy.dropped,
+                  forwarded=proxy.forwarded, duplicates=duplicates)
+
+    if max_retries:
+        if wrong:
+            failures.append(f"Falsche Seite am Ende bei {', '.join(wrong)} (erwartet {last_page})")
+        if last_failed:
+            failures.append(f"Letztes Signal nicht bestätigt von {', '.join(last_failed)}")
+        if stale:
+            failures.append(f"{stale} Pakete abgelöster Signale erneut gesendet")
+        if not stats['retransmits'] and args.loss:
+            failures.append("Trotz Verlust keine Wiederholungen")
+    return result, failures
+
+def main():
+    parser = argparse.ArgumentParser(description='UdpLink-Wiederholungen über verlustbehafteten Proxy prüfen')
+    parser.add_argument('--esp32', type=int, default=3, help='Anzahl virtueller ESP32s')
+    parser.add_argument('--signals', type=int, default=200, help='Seitenwechsel pro Durchlauf')
+    parser.add_argument('--gap-ms', type=float, default=50.0, help='Pause zwischen zwei Seitenwechseln')
+    parser.add_argument('--loss', type=float, default=0.2, help='Verlustrate je Richtung (0..1)')
+    parser.add_argument('--delay-ms', type=float, default=5.0, help='Zufällige Verzögerung bis ... ms')
+    parser.add_argument('--retries', type=int, default=4, help='max_retries im zweiten Durchlauf')
+    parser.add_argument('--seed', type=int, default=1, help='Zufallsstart des Proxys')
+    args = parser.parse_args()
+
+    print(f"{args.signals} Seitenwechsel an {args.esp32} ESP32s, {args.loss:.0%} Verlust je Richtung, "
+          f"bis {args.delay_ms:.0f} ms Verzögerung")
+    print(f"{'Wdh. max':>9}{'bestätigt':>11}{'abgelöst':>10}{'gescheit.':>11}{'Wdh.':>10}"
+          f"{'Duplikate':>11}{'veraltet':>10}  Falsche Seite am Ende")
+    failures = []
+    for retries in (0, args.retries):
+        result, run_failures = run(args, retries, args.seed)
+        failures.extend(run_failures)
+        if result is None:
+            continue
+        print(f"{retries:>9}{result['acked']:>11}{result['superseded']:>10}{result['failed']:>11}"
+              f"{result['retransmits']:>10}{result['duplicates']:>11}{result['stale']:>10}"
+              f"  {', '.join(result['wrong']) or '-'}")
+
+    if failures:
+        for failure in failures:
+            print(f"❌ {failure}")
+        return 1
+    print("✅ UDP-Wiederholungen: letzte Seite überall angekommen, nichts Veraltetes wiederholt")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
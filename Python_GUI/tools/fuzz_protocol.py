@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Fuzzing des Geräte-Protokolls
+Schickt den Korpus fehlerhafter Zeilen (tools/corpus/protocol_malformed.txt) sowie
+zufällige Mutationen gültiger Zeilen durch LineFramer + ProtocolParser und prüft,
+dass keine Ausnahme auftritt und jede Zeile in genau einem Event landet.
+
+Aufruf (aus Python_GUI/):
+    python tools/fuzz_protocol.py --iterations 20000 --seed 1
+"""
+
+import os
+import sys
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.line_framer import LineFramer
+from core.protocol import ProtocolParser, StatusEvent, UnknownLineEvent, MalformedLineEvent
+
+CORPUS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpus", "protocol_malformed.txt")
+
+VALID_LINES = [
+    b"SIGNAL:3", b"Clients: 2", b"PONG", b"UDP empfangen von 192.168.1.50: page_3:1",
+    b"Heartbeat-Timeout - GIGA m\xc3\xb6glicherweise offline", b"Aktiviere Pin 14 f\xc3\xbcr 1000 ms",
+    b"Pin 14 deaktiviert", b"=== ESP32 Status ===", b"RSSI: -61 dBm", b"Uptime: 123456 ms",
+    b"Freier Heap: 214332 bytes", b"===================",
+]
+
+def mutate(line, rng):
+    """Erzeugt eine zufällig beschädigte Variante einer gültigen Zeile"""
+    data = bytearray(line)
+    for _ in range(rng.randint(1, 4)):
+        choice = rng.randrange(5)
+        position = rng.randrange(len(data) + 1)
+        if choice == 0 and data:
+            data[min(position, len(data) - 1)] ^= 1 << rng.randrange(8)
+        elif choice == 1:
+            data[position:position] = bytes([rng.randrange(256)])
+        elif choice == 2:
+            del data[position:]
+        elif choice == 3:
+            data[position:position] = rng.choice([b":", b": ", b" ", b"\r", b"\x00", b"==="])
+        else:
+            data[position:position] = rng.choice(VALID_LINES)
+    return bytes(data)
+
+def consumed_lines(event):
+    """Anzahl der Eingabezeilen, die ein Event abdeckt"""
+    return event.line_count if isinstance(event, StatusEvent) else 1
+
+def run(stream, chunk_size, rng):
+    """Füttert den Byte-Strom in zufälligen Stücken ein; gibt (zeilen, events) zurück"""
+    framer = LineFramer()
+    parser = ProtocolParser()
+    lines = 0
+    events = []
+    offset = 0
+    while offset < len(stream):
+        size = rng.randint(1, chunk_size)
+        framed = framer.feed(stream[offset:offset + size])
+        lines += len(framed)
+        events.extend(parser.feed(framed))
+        offset += size
+    framed = framer.feed(b"\n")
+    lines += len(framed)
+    events.extend(parser.feed(framed))
+    events.extend(parser.flush())
+    return lines, events
+
+def main():
+    parser = argparse.ArgumentParser(description='Fuzzing des Geräte-Protokolls')
+    parser.add_argument('--iterations', type=int, default=20000, help='Anzahl mutierter Zeilen')
+    parser.add_argument('--seed', type=int, default=1, help='Zufalls-Seed (reproduzierbar)')
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    with open(CORPUS_PATH, 'rb') as corpus_file:
+        corpus = corpus_file.read()
+
+    mutated = b"\n".join(mutate(rng.choice(VALID_LINES), rng) for _ in range(args.iterations))
+
+    failures = 0
+    for name, stream in (("Korpus", corpus), ("Mutationen", mutated)):
+        try:
+            lines, events = run(stream, 64, rng)
+        except Exception as e:
+            print(f"❌ {name}: Ausnahme {type(e).__name__}: {e}")
+            failures += 1
+            continue
+
+        covered = sum(consumed_lines(event) for event in events)
+        unknown = sum(isinstance(event, (UnknownLineEvent, MalformedLineEvent)) for event in events)
+        status = "✅" if covered == lines else "❌"
+        if covered != lines:
+            failures += 1
+        print(f"{status} {name}: {lines} Zeilen -> {len(events)} Events "
+              f"({unknown} unbekannt/ungültig, {covered} Zeilen abgedeckt)")
+
+    sys.exit(1 if failures else 0)
+
+if __name__ == "__main__":
+    main()
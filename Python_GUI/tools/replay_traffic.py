@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Wiedergabe von Seriell-Aufnahmen (main.py --record) über Pseudo-Terminals
+Jedes aufgezeichnete Gerät bekommt ein PTY; GUI oder cli_monitor.py öffnen
+diese Pfade wie echte Ports. Die Wiedergabe startet, sobald alle PTYs
+geöffnet sind.
+
+--bench spielt die Aufnahme mit maximaler Geschwindigkeit in einen
+HardwareManager im selben Prozess und misst den Durchsatz vom PTY bis zur
+data_queue (Bytes/s, Zeilen/s). --synthetic erzeugt vorher eine Aufnahme
+mit typischem Messe-Verkehr, falls keine echte vorliegt.
+
+Aufruf (aus Python_GUI/):
+    python tools/replay_traffic.py messe.dmsrec                 # Echtzeit
+    python tools/replay_traffic.py messe.dmsrec --speed 10      # 10-fach
+    python tools/replay_traffic.py messe.dmsrec --link-dir /tmp/replay
+    python tools/replay_traffic.py /tmp/syn.dmsrec --synthetic 600 --bench
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.config import config
+from core.line_framer import LineFramer
+from core.traffic_recorder import TrafficRecorder, TrafficReplayer, read_recording
+from models.hardware import HardwareManager
+
+ESP32_LINES = [
+    "UDP empfangen von 192.168.1.50: heartbeat:{uptime}",
+    "UDP empfangen von 192.168.1.50: page_{page}:1",
+    "SIGNAL:{page}",
+    "Aktiviere Pin 14 für 1000 ms",
+    "Pin 14 deaktiviert",
+]
+GIGA_LINES = [
+    "Broadcasting Signal: page_{page}:1",
+    "UDP gesendet an 192.168.1.100: page_{page}:1",
+    "Clients: {clients}",
+]
+
+def generate_synthetic(path, seconds, rate):
+    """Schreibt eine Aufnahme mit simuliertem Verkehr: rate Zeilen/s pro Gerät"""
+    if os.path.exists(path):
+        os.unlink(path)
+    recorder = TrafficRecorder(path)
+    base = time.monotonic()
+    random.seed(1)
+
+    events = []
+    for device in ("esp32_1", "esp32_2", "esp32_3", "giga"):
+        templates = GIGA_LINES if device == "giga" else ESP32_LINES
+        t = 0.0
+        while t < seconds:
+            t += random.expovariate(rate)
+            line = random.choice(templates).format(uptime=int(t * 1000), page=random.randint(1, 10),
+                                                   clients=random.randint(1, 3))
+            data = f"{line}\r\n".encode()
+            # Wie am echten UART: Zeilen kommen teils in mehreren Stücken an
+            if len(data) > 8 and random.random() < 0.3:
+                cut = random.randint(1, len(data) - 1)
+                events.append((t, device, data[:cut]))
+                events.append((t + 0.0005, device, data[cut:]))
+            else:
+                events.append((t, device, data))
+
+    for t, device, data in sorted(events, key=lambda event: event[0]):
+        recorder.record(device, data, at=base + t)
+    recorder.close()
+
+def expected_lines(chunks):
+    """Anzahl vollständiger Zeilen pro Gerät, wie sie der LineFramer liefert"""
+    framers = {}
+    counts = {}
+    for _, device, payload in chunks:
+        framer = framers.setdefault(device, LineFramer())
+        counts[device] = counts.get(device, 0) + len(framer.feed(payload))
+    return counts
+
+def replay(chunks, speed, link_dir, wait):
+    """Stellt PTYs bereit und spielt ab, sobald alle geöffnet sind"""
+    replayer = TrafficReplayer(chunks, link_dir)
+    paths = replayer.open()
+    print("PTYs:")
+    for device, path in paths.items():
+        print(f"  {device:<10}{path}")
+    if "esp32_1" in paths:
+        print(f"\nBeispiele:\n  python ../active_project/cli_monitor.py --esp32-port {paths['esp32_1']}")
+        print(f"  python Bertrandt_GUI.py --esp32-port {paths['esp32_1']}")
+    print("\nWarte auf Leser (Strg+C zum Abbrechen)...")
+
+    try:
+        if not replayer.wait_for_readers(wait):
+            print("❌ Nicht alle PTYs wurden geöffnet")
+            return 1
+        label = "maximal" if not speed else f"{speed:g}x"
+        print(f"▶ Wiedergabe ({label}) von {len(chunks)} Blöcken")
+        replayer.run(speed)
+        print(f"✅ {replayer.bytes_sent} Bytes in {replayer.duration:.2f} s")
+        # Leser noch kurz bedienen, bevor die PTYs verschwinden
+        time.sleep(1.0)
+    except KeyboardInterrupt:
+        print("Abgebrochen")
+    finally:
+        replayer.close()
+    return 0
+
+def bench(chunks, timeout):
+    """Maximale Wiedergabe in einen HardwareManager -> Durchsatz bis zur data_queue"""
+    config.hardware['binary_protocol'] = False
+    config.hardware['hotplug'] = False
+    config.hardware['record_path'] = None
+    config.hardware['queue_policy'] = 'block'   # Gegendruck statt Verwerfen - es zählt jede Zeile
+    expected = expected_lines(chunks)
+    total_lines = sum(expected.values())
+    total_bytes = sum(len(payload) for _, _, payload in chunks)
+
+    replayer = TrafficReplayer(chunks)
+    paths = replayer.open()
+    manager = HardwareManager()
+    for device, path in paths.items():
+        if device == "giga":
+            manager.add_giga(path)
+        elif device.startswith("esp32_"):
+            manager.add_esp32(path, int(device.split("_")[1]))
+    manager.connect_all()
+    replayer.wait_for_readers(5)
+
+    received = {name: 0 for name in manager.connections}
+    start = time.perf_counter()
+    replayer.start(None)
+    deadline = time.monotonic() + timeout
+    while sum(received.values()) < total_lines and time.monotonic() < deadline:
+        for name, connection in manager.connections.items():
+            while not connection.data_queue.empty():
+                connection.data_queue.get_nowait()
+                received[name] += 1
+        time.sleep(0.001)
+    elapsed = time.perf_counter() - start
+
+    manager.disconnect_all()
+    replayer.close()
+
+    lines = sum(received.values())
+    print(f"{'Gerät':<10}{'Erwartet':>10}{'Empfangen':>11}")
+    for device in sorted(received):
+        print(f"{device:<10}{expected.get(device, 0):>10}{received[device]:>11}")
+    print(f"\n{total_bytes} Bytes, {lines} Zeilen in {elapsed:.2f} s")
+    print(f"Durchsatz: {total_bytes / elapsed / 1e6:.2f} MB/s, {lines / elapsed:,.0f} Zeilen/s")
+    if lines < total_lines:
+        print(f"❌ {total_lines - lines} Zeilen fehlen")
+        return 1
+    return 0
+
+def main():
+    parser = argparse.ArgumentParser(description='Seriell-Aufnahmen über PTYs abspielen')
+    parser.add_argument('recording', help='Aufnahme-Datei (main.py --record)')
+    parser.add_argument('--speed', type=float, default=1.0,
+                        help='Geschwindigkeit: 1 = Echtzeit, N = N-fach, 0 = maximal')
+    parser.add_argument('--link-dir', help='Symlinks <gerät> -> PTY in diesem Verzeichnis anlegen')
+    parser.add_argument('--wait', type=float, default=None,
+                        help='Höchstens so viele Sekunden auf Leser warten (Standard: unbegrenzt)')
+    parser.add_argument('--bench', action='store_true',
+                        help='Durchsatz-Messung: maximale Wiedergabe in einen HardwareManager')
+    parser.add_argument('--timeout', type=float, default=120.0, help='Abbruch der Messung nach Sekunden')
+    parser.add_argument('--synthetic', type=float, metavar='SEKUNDEN',
+                        help='Vorher eine synthetische Aufnahme dieser Länge erzeugen')
+    parser.add_argument('--rate', type=float, default=20.0,
+                        help='Zeilen/s pro Gerät für --synthetic')
+    args = parser.parse_args()
+
+    if args.synthetic:
+        generate_synthetic(args.recording, args.synthetic, args.rate)
+
+    chunks = read_recording(args.recording)
+    if not chunks:
+        print("Aufnahme enthält keine Daten")
+        return 1
+    devices = sorted({device for _, device, _ in chunks})
+    print(f"Aufnahme: {args.recording} - {len(chunks)} Blöcke, {chunks[-1][0]:.1f} s, "
+          f"Geräte: {', '.join(devices)}")
+
+    if args.bench:
+        return bench(chunks, args.timeout)
+    return replay(chunks, args.speed, args.link_dir, args.wait)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Lasttest mit der Device Farm: ab welcher Signalrate fällt die UI zurück?
+N virtuelle ESP32s + GIGA (services/device_farm.py, eigener Prozess) senden
+in Stufen immer mehr Signale. Der Weg ist derselbe wie in der GUI: PTY -> HardwareManager
+(Reactor, LineFramer) -> data_queue -> TkWakeup -> Tk-Thread, der die Zeilen
+parst und pro Seitenwechsel ein Label neu zeichnet (--work-ms simuliert
+zusätzlich den Aufbau einer Seite).
+
+Gemessen wird pro Stufe die Latenz vom Senden der SIGNAL-Zeile bis zur
+Verarbeitung im Tk-Thread, der Rückstau (gesendet, aber noch nicht
+verarbeitet) und Verluste (PTY-Puffer voll bzw. Empfangs-Queue übergelaufen,
+siehe --queue-policy). Eine Stufe gilt als
+"zurückgefallen", wenn p95 über --threshold-ms liegt, Bytes verloren gehen
+oder der Rückstau wächst.
+
+Ohne Display (oder mit --headless) läuft die Schleife auf einem reinen
+Tcl-Interpreter, ohne Label/Repaint.
+
+Aufruf (aus Python_GUI/):
+    python tools/soak_device_farm.py --esp32 3 --rates 1,10,50,100,200,500
+    python tools/soak_device_farm.py --duration 3600 --rates 2 --noise 0.01 --disconnect 300
+"""
+
+import os
+import sys
+import time
+import argparse
+import statistics
+import tkinter as tk
+from collections import deque
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.config import config
+from core.protocol import ProtocolParser, SignalEvent
+from core.tk_wakeup import TkWakeup
+from core.device_supervisor import DeviceSupervisor
+from models.hardware import HardwareManager
+from services.device_farm import FarmProcess
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+class UiConsumer:
+    """Tk-seitiger Verbraucher wie process_serial_data in der GUI"""
+
+    def __init__(self, root, label, manager, farm, work_ms):
+        self.root = root
+        self.label = label
+        self.manager = manager
+        self.farm = farm
+        self.work = work_ms / 1000.0
+        self.parsers = {name: ProtocolParser() for name in manager.connections}
+        self.sent_times = {name: deque() for name in manager.connections}
+        self.latencies = []
+        self.lines = 0
+        self.signals = 0
+        self.unmatched = 0
+
+    def process(self):
+        for name, connection in self.manager.connections.items():
+            lines = [item['data'] for item in connection.data_queue.drain()]
+            if not lines:
+                continue
+            self.lines += len(lines)
+            for event in self.parsers[name].feed(lines):
+                if isinstance(event, SignalEvent):
+                    self._show_page(name, event.value)
+
+    def collect_sent_times(self):
+        """Holt neue Sendezeitpunkte aus dem Farm-Prozess"""
+        for name, times in self.farm.pop_signal_times().items():
+            self.sent_times[name].extend(times)
+
+    def _show_page(self, name, page):
+        sent_times = self.sent_times[name]
+        if not sent_times:
+            self.collect_sent_times()
+        if self.label:
+            self.label.config(text=f"{name}: Seite {page}")
+            self.root.update_idletasks()
+        if self.work:
+            deadline = time.perf_counter() + self.work
+            while time.perf_counter() < deadline:
+                pass
+        self.signals += 1
+        if sent_times:
+            self.latencies.append((time.perf_counter() - sent_times.popleft()) * 1000)
+        else:
+            self.unmatched += 1  # z.B. durch Störungen verfälschte Zuordnung
+
+def run_for(root, seconds):
+    """Entspricht root.mainloop() für eine feste Zeit"""
+    done = []
+    root.after(int(seconds * 1000), lambda: done.append(True))
+    while not done:
+        root.dooneevent()
+
+def main():
+    parser = argparse.ArgumentParser(description='Device-Farm-Lasttest für die UI-Pipeline')
+    parser.add_argument('--esp32', type=int, default=3, help='Anzahl virtueller ESP32s')
+    parser.add_argument('--rates', default='1,2,5,10,20,50,100,200,500',
+                        help='Signale/s pro ESP32, kommagetrennt (eine Stufe pro Wert)')
+    parser.add_argument('--duration', type=float, default=3.0, help='Sekunden pro Stufe')
+    parser.add_argument('--threshold-ms', type=float, default=100.0, help='p95-Grenze für "hält mit"')
+    parser.add_argument('--work-ms', type=float, default=2.0, help='Simulierte Arbeit pro Seitenwechsel')
+    parser.add_argument('--jitter', type=float, default=0.5, help='Streuung der Signal-Abstände')
+    parser.add_argument('--noise', type=float, default=0.0, help='Anteil gestörter Zeilen')
+    parser.add_argument('--disconnect', type=float, help='Mittlere Sekunden zwischen Abbrüchen (Dauertest)')
+    parser.add_argument('--queue-policy', default='drop_oldest',
+                        help='Strategie der Empfangs-Queues (drop_oldest, latest_signal, block)')
+    parser.add_argument('--headless', action='store_true', help='Ohne Fenster messen (nur Tcl)')
+    args = parser.parse_args()
+
+    headless = args.headless
+    if not headless:
+        try:
+            tk.Tk().destroy()
+        except tk.TclError as e:
+            print(f"⚠️ Kein Display verfügbar ({e}) - messe ohne Repaint")
+            headless = True
+
+    config.hardware['binary_protocol'] = False
+    config.hardware['hotplug'] = bool(args.disconnect)
+    config.hardware['record_path'] = None
+    config.hardware['queue_policy'] = args.queue_policy
+
+    farm = FarmProcess(args.esp32, {'signal_rate': 0, 'jitter': args.jitter, 'noise': args.noise,
+                                    'disconnect_interval': args.disconnect})
+    ports = farm.start()
+    manager = HardwareManager()
+    if args.disconnect:
+        manager.supervisor = DeviceSupervisor(manager, base_delay=0.2, max_delay=2.0,
+                                              directory=farm.directory, poll_interval=0.2)
+    for number in range(1, args.esp32 + 1):
+        manager.add_esp32(ports[f'esp32_{number}'], number)
+    manager.add_giga(ports['giga'])
+
+    if headless:
+        root, label = tk.Tcl(), None
+    else:
+        root = tk.Tk()
+        label = tk.Label(root, text="-", font=("Arial", 32))
+        label.pack()
+        root.update()
+
+    consumer = UiConsumer(root, label, manager, farm, args.work_ms)
+    wakeup = TkWakeup(root, consumer.process)
+    manager.set_data_notifier(wakeup.notify)
+    manager.connect_all()
+    run_for(root, 1.0)  # Boot-Meldungen abarbeiten
+
+    rates = [float(rate) for rate in args.rates.split(',')]
+    target = "Verarbeitung" if headless else "Repaint"
+    print(f"{args.esp32} ESP32 + GIGA, {args.duration:.0f} s pro Stufe, Arbeit {args.work_ms:.1f} ms/Signal, "
+          f"Latenz Signal -> {target} ({wakeup.mode})")
+    print(f"{'Rate/ESP32':>10}{'Signale/s':>11}{'Zeilen/s':>10}{'p50 ms':>9}{'p95 ms':>9}"
+          f"{'Max ms':>10}{'Rückstau':>10}{'Verworfen':>11}  Ergebnis")
+
+    falling_behind = None
+    for rate in rates:
+        farm.pop_signal_times()
+        for times in consumer.sent_times.values():
+            times.clear()
+        farm.configure(signal_rate=rate, track_latency=True)
+        consumer.latencies, consumer.lines, consumer.signals = [], 0, 0
+        before = farm.get_stats()
+        queue_losses = sum(c.data_queue.dropped + c.data_queue.superseded for c in manager.connections.values())
+        start = time.perf_counter()
+        run_for(root, args.duration)
+        elapsed = time.perf_counter() - start   # länger als geplant, wenn die UI blockiert
+
+        after = farm.get_stats()
+        sent = sum(after[name]['signals'] - before[name]['signals'] for name in after)
+        dropped = sum(after[name]['dropped_bytes'] - before[name]['dropped_bytes'] for name in after)
+        dropped += sum(c.data_queue.dropped + c.data_queue.superseded
+                       for c in manager.connections.values()) - queue_losses
+        consumer.collect_sent_times()
+        backlog = sum(len(times) for times in consumer.sent_times.values())
+        latencies = consumer.latencies or [0.0]
+        p95 = percentile(latencies, 0.95)
+        behind = p95 > args.threshold_ms or dropped > 0 or backlog > max(2, sent * 0.05)
+        print(f"{rate:>10g}{sent / elapsed:>11.0f}{consumer.lines / elapsed:>10.0f}"
+              f"{statistics.median(latencies):>9.2f}{p95:>9.2f}{max(latencies):>10.2f}"
+              f"{backlog:>10}{dropped:>11}  {'❌ zurückgefallen' if behind else '✅'}")
+        if behind:
+            # Höhere Stufen würden nur den Rückstau vergrößern
+            falling_behind = rate
+            break
+
+        # Rückstau vor der nächsten Stufe abbauen
+        farm.configure(signal_rate=0, track_latency=False)
+        run_for(root, 0.5)
+
+    if args.disconnect:
+        for name, info in manager.get_status_summary().items():
+            print(f"  {name:<8} {info['status']:<13} Reconnects: {info['reconnects']}  "
+                  f"Ausfall: {info['downtime']:.1f} s")
+
+    manager.disconnect_all()
+    wakeup.close()
+    farm.stop()
+    if not headless:
+        root.destroy()
+
+    if falling_behind is None:
+        print(f"✅ UI hält bei allen Stufen mit (bis {rates[-1] * args.esp32:g} Signale/s gesamt)")
+    else:
+        print(f"⚠️ UI fällt ab {falling_behind:g} Signalen/s pro ESP32 "
+              f"({falling_behind * args.esp32:g} gesamt) zurück")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
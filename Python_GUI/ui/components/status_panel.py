@@ -8,6 +8,10 @@ import tkinter as tk
 from tkinter import ttk
 from core.theme import theme_manager
 from core.logger import logger
+from core.latency_trace import latency_tracer
+from core.ring_queue import queue_stats_text
+from core.udp_link import link_quality_text
+from core.tk_wakeup import TkWakeup
 from models.hardware import hardware_manager
 from services.demo import demo_service
 
@@ -19,6 +23,11 @@ class StatusPanelComponent(ttk.Frame):
         self.main_window = main_window
         
         self.setup_status_panel()
+        # Hardware-Status nur bei Übergängen neu zeichnen (Meldungen kommen aus Hintergrund-Threads)
+        self.hardware_wakeup = TkWakeup(self, self.update_hardware_status)
+        hardware_manager.add_status_listener(self.on_hardware_status)
+        self.bind('<Destroy>', self.on_destroy, add='+')
+        self.update_hardware_status()
         self.start_status_updates()
     
     def setup_status_panel(self):
@@ -203,34 +212,80 @@ class StatusPanelComponent(ttk.Frame):
             bg=colors['background_tertiary']
         )
         self.resolution_label.pack(fill='x')
+        
+        # Signal-Latenz
+        self.latency_label = tk.Label(
+            self.sys_frame,
+            text="Latenz: -",
+            font=fonts['caption'],
+            fg=colors['text_tertiary'],
+            bg=colors['background_tertiary'],
+            anchor='w',
+            justify='left',
+            wraplength=int(270 * self.main_window.scale_factor)
+        )
+        self.latency_label.pack(fill='x')
+        
+        # Empfangs-Queues (Höchststand und Verluste aller Geräte)
+        self.queue_label = tk.Label(
+            self.sys_frame,
+            text="Queue: -",
+            font=fonts['caption'],
+            fg=colors['text_tertiary'],
+            bg=colors['background_tertiary'],
+            anchor='w'
+        )
+        self.queue_label.pack(fill='x')
     
     def start_status_updates(self):
-        """Startet regelmäßige Status-Updates"""
+        """Startet regelmäßige Status-Updates (Demo und Uhrzeit - Hardware meldet sich selbst)"""
         self.update_status()
         # Update alle 2 Sekunden
         self.after(2000, self.start_status_updates)
     
     def update_status(self):
-        """Aktualisiert alle Status-Informationen"""
-        self.update_hardware_status()
+        """Aktualisiert Demo- und System-Informationen"""
         self.update_demo_status()
         self.update_system_info()
     
+    def on_hardware_status(self, topic, device_id):
+        """Status-Listener des HardwareManagers (beliebiger Thread)"""
+        self.hardware_wakeup.notify()
+    
+    def on_destroy(self, event):
+        if event.widget is self:
+            hardware_manager.remove_status_listener(self.on_hardware_status)
+            self.hardware_wakeup.close()
+    
     def update_hardware_status(self):
         """Aktualisiert Hardware-Status"""
         try:
             status_summary = hardware_manager.get_status_summary()
             
             for device_id, status_label in self.hw_status_labels.items():
-                status = status_summary.get(device_id, "disconnected")
+                info = status_summary.get(device_id, {})
+                status = info.get('status', "disconnected")
                 
-                if status == "connected":
+                liveness = info.get('liveness') or {}
+                if status == "connected" and liveness.get('state') == "stale":
+                    status_text = "⚪ Keine Daten"
+                elif status == "connected":
                     status_text = "🟢 Online"
+                elif status == "reconnecting":
+                    status_text = "🟡 Verbinde..."
                 elif status == "error":
                     status_text = "🟡 Fehler"
                 else:
                     status_text = "🔴 Offline"
                 
+                # Reconnects seit Programmstart anzeigen
+                if info.get('reconnects'):
+                    status_text += f" ↻{info['reconnects']}"
+                
+                # Funkstrecke (UdpLink): Umlaufzeit und Verlust
+                if info.get('link'):
+                    status_text += f" {link_quality_text(info['link'])}"
+                
                 status_label.configure(text=status_text)
                 
         except Exception as e:
@@ -269,5 +324,12 @@ class StatusPanelComponent(ttk.Frame):
             current_time = datetime.datetime.now().strftime("%H:%M:%S")
             self.time_label.configure(text=f"Zeit: {current_time}")
             
+            # Signal-Latenz (p50/p95 aus dem Latency-Tracer)
+            self.latency_label.configure(text=f"Latenz: {latency_tracer.status_text()}")
+            
+            # Empfangs-Queues
+            queue_stats = [info['queue'] for info in hardware_manager.get_status_summary().values()]
+            self.queue_label.configure(text=queue_stats_text(queue_stats))
+            
         except Exception as e:
             logger.error(f"Fehler beim System-Info Update: {e}")
\ No newline at end of file
@@ -1116,7 +1116,7 @@ class DemoTab:
         
         # Hardware-Status aktualisieren
         from models.hardware import hardware_manager
-        connected_devices = sum(1 for status in hardware_manager.get_status_summary().values() if status == "connected")
+        connected_devices = sum(1 for info in hardware_manager.get_status_summary().values() if info['status'] == "connected")
         self.hardware_status.configure(text=f"Hardware: {connected_devices} Geräte verbunden")
     
     def update_status_display(self):
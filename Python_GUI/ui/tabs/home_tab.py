@@ -266,9 +266,10 @@ class HomeTab:
         status = hardware_manager.get_status_summary()
         info_text = "Hardware Status:\n\n"
         
-        for device, status_val in status.items():
-            status_icon = "🟢" if status_val == "connected" else "🔴"
-            info_text += f"{status_icon} {device}: {status_val}\n"
+        for device, info in status.items():
+            status_icon = "🟢" if info['status'] == "connected" else "🔴"
+            info_text += (f"{status_icon} {device}: {info['status']} "
+                          f"(Reconnects: {info['reconnects']}, Ausfall: {info['downtime']:.0f} s)\n")
         
         messagebox.showinfo("Hardware Status", info_text)
     
@@ -299,9 +300,9 @@ Theme: {'Dark' if theme_manager.dark_mode else 'Light'} Mode
         # Hardware-Status sammeln
         status = hardware_manager.get_status_summary()
         hw_info = "Hardware Status:\n"
-        for device, status_val in status.items():
-            status_icon = "🟢" if status_val == "connected" else "🔴"
-            hw_info += f"{status_icon} {device}: {status_val}\n"
+        for device, info in status.items():
+            status_icon = "🟢" if info['status'] == "connected" else "🔴"
+            hw_info += f"{status_icon} {device}: {info['status']}\n"
         
         # System-Info sammeln
         sys_info = f"""
@@ -8,6 +8,7 @@ import tkinter as tk
 from tkinter import ttk
 from core.theme import theme_manager
 from core.logger import logger
+from core.tk_wakeup import TkWakeup
 from models.content import content_manager
 from models.hardware import hardware_manager
 
@@ -19,8 +20,11 @@ class PresentationTab:
         self.main_window = main_window
         self.visible = False
         self.current_slide = 1
+        self.pending_delivery = None     # FanOut des zuletzt gesendeten Signals
         
         self.create_presentation_content()
+        # Zustellung wird im Schreib-Thread gemeldet - Anzeige im Tk-Thread
+        self.delivery_wakeup = TkWakeup(self.container, self.show_delivery_status)
     
     def create_presentation_content(self):
         """Erstellt den Presentation-Tab Inhalt"""
@@ -286,29 +290,47 @@ class PresentationTab:
         try:
             signal_id = f"page_{self.current_slide}"
             
-            # Signal an alle ESP32s senden
-            sent_count = 0
-            for name, connection in hardware_manager.connections.items():
-                if name.startswith('esp32_') and connection.status == "connected":
-                    if connection.send_signal(signal_id):
-                        sent_count += 1
-            
-            # UDP-Signal über GIGA senden
-            giga = hardware_manager.get_connection('giga')
-            if giga and giga.status == "connected":
-                giga.send_udp_signal("192.168.1.100", signal_id, 1)
-                sent_count += 1
+            # Jeder ESP32 genau einmal (seriell oder per UDP) - nur einreihen,
+            # geschrieben wird parallel in den Schreib-Threads
+            fan_out = hardware_manager.broadcast_signal(
+                signal_id, callback=lambda fan_out, target: self.delivery_wakeup.notify()
+            )
             
-            if sent_count > 0:
-                self.hw_status_label.configure(text=f"Signal gesendet: {signal_id}")
-                logger.info(f"Hardware-Signal gesendet: {signal_id}")
+            if fan_out.futures:
+                self.pending_delivery = fan_out
+                self.hw_status_label.configure(text=f"Signal wird gesendet: {signal_id}")
+                logger.info(f"Hardware-Signal eingereiht: {signal_id}")
+                self.show_delivery_status()
             else:
+                self.pending_delivery = None
                 self.hw_status_label.configure(text="Keine Hardware verbunden")
                 
         except Exception as e:
             self.hw_status_label.configure(text="Fehler beim Senden")
             logger.error(f"Fehler beim Hardware-Signal: {e}")
     
+    def show_delivery_status(self):
+        """Zustellstatus des zuletzt gesendeten Signals anzeigen (Tk-Thread)"""
+        if not self.pending_delivery:
+            return
+        fan_out = self.pending_delivery
+        if not fan_out.done():
+            return
+        
+        counts = fan_out.counts()
+        if counts['superseded'] == len(fan_out.futures):
+            return  # Durch ein neueres Signal ersetzt - dessen Status wird angezeigt
+        
+        self.pending_delivery = None
+        signal_id = fan_out.signal_id
+        if counts['failed']:
+            self.hw_status_label.configure(
+                text=f"Signal {signal_id}: {counts['sent']} gesendet, {counts['failed']} Fehler")
+        else:
+            self.hw_status_label.configure(
+                text=f"Signal gesendet: {signal_id} ({counts['sent']} Geräte, "
+                     f"{fan_out.elapsed_ms():.0f} ms)")
+    
     def refresh_slide_buttons(self):
         """Aktualisiert die Slide-Button-Anzeige"""
         # Einfache Implementierung - in einer echten App würde man die Buttons direkt aktualisieren
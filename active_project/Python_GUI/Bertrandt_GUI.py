@@ -14,14 +14,22 @@ import sys
 import argparse
 import subprocess
 import os
-import glob
 from PIL import Image, ImageTk
 import json
+from core.line_framer import LineFramer
+from core.tk_wakeup import TkWakeup, bind_bus
+from core.bus import bus
+from core.device_index import device_index
+from core.latency_trace import latency_tracer
+from core.ring_queue import RingQueue, POLICIES, queue_stats_text
+from core.signal_coalescer import SignalCoalescer
 
 class BertrandtGUI:
-    def __init__(self, esp32_port=None):
+    def __init__(self, esp32_port=None, queue_size=256, queue_policy="latest_signal", settle_ms=0):
         self.root = tk.Tk()
         self.root.title("Dynamic Messe Stand V3 - Bertrandt ESP32 Monitor")
+        # Bus-Handler mit thread="ui" im Tk-Thread statt im publizierenden Thread
+        self.bus_wakeup = bind_bus(self.root, bus)
         
         # 16:9 Format für verschiedene Bildschirmgrößen
         screen_width = self.root.winfo_screenwidth()
@@ -88,17 +96,23 @@ class BertrandtGUI:
         self.root.configure(bg=self.colors['background_primary'])
         
         # Hardware-Verbindungen (Multi-ESP32 Setup)
-        self.esp32_1_port = esp32_port or '/dev/ttyUSB0'  # Haupt-ESP32
-        self.esp32_2_port = '/dev/ttyUSB1'  # ESP32.2 (Addon)
-        self.esp32_3_port = '/dev/ttyUSB2'  # ESP32.3 (Addon)
-        self.giga_port = '/dev/ttyACM0'     # Arduino GIGA
+        # Ports über die USB-Identität, alte Standard-Pfade nur als Rückfall
+        self.esp32_1_port = esp32_port or device_index.resolve('esp32_1') or '/dev/ttyUSB0'  # Haupt-ESP32
+        self.esp32_2_port = device_index.resolve('esp32_2') or '/dev/ttyUSB1'  # ESP32.2 (Addon)
+        self.esp32_3_port = device_index.resolve('esp32_3') or '/dev/ttyUSB2'  # ESP32.3 (Addon)
+        self.giga_port = device_index.resolve('giga') or '/dev/ttyACM0'        # Arduino GIGA
         
         self.serial_connections = {}  # Dictionary für alle Verbindungen
         self.serial_threads = {}      # Dictionary für alle Threads
         self.running = False
         
-        # Daten-Queue
-        self.data_queue = queue.Queue()
+        # Daten-Queue (begrenzt - ein hängender GUI-Thread darf den Speicher nicht füllen)
+        self.data_queue = RingQueue(queue_size, queue_policy,
+                                    signal_key=lambda item: "signal" if item[0] == 'signal' else None)
+        self.data_wakeup = None
+        # Signal-Bursts: nur die letzte Seite aufbauen, Zwischenseiten nur in die Historie
+        self.signal_coalescer = SignalCoalescer(self.render_signal, self.record_signal_history,
+                                                settle_ms, self.root.after, self.root.after_cancel)
         
         # Aktuelle Werte
         self.current_signal = 0
@@ -577,6 +591,28 @@ class BertrandtGUI:
                                           bg=self.colors['background_tertiary'])
         self.client_status_text.pack()
         
+        # Kompakte Latenz Card (Signal -> neue Seite, aktualisiert mit der Uhrzeit)
+        latency_card = tk.Frame(parent, bg=self.colors['background_tertiary'], relief='flat', borderwidth=1)
+        latency_card.pack(fill='x', padx=2, pady=3)
+        
+        latency_header = tk.Frame(latency_card, bg=self.colors['background_secondary'], height=20)
+        latency_header.pack(fill='x')
+        latency_header.pack_propagate(False)
+        
+        tk.Label(latency_header,
+                text="⏱",
+                font=('Helvetica Neue', 10),
+                fg=self.colors['text_primary'],
+                bg=self.colors['background_secondary']).pack(pady=2)
+        
+        self.latency_label = tk.Label(latency_card,
+                                     text=latency_tracer.status_text(),
+                                     font=('Helvetica Neue', 6),
+                                     fg=self.colors['text_primary'],
+                                     bg=self.colors['background_tertiary'],
+                                     wraplength=120)
+        self.latency_label.pack(padx=2, pady=1)
+        
         # Dark Theme Aktuelles Signal Card
         signal_card = tk.Frame(parent, bg=self.colors['background_tertiary'], relief='flat', borderwidth=1)
         signal_card.pack(fill='x', padx=20, pady=15)
@@ -1598,6 +1634,8 @@ class BertrandtGUI:
     
     def load_content_page(self, page_id):
         """Multimedia-Seite laden und anzeigen"""
+        trace = latency_tracer.current()
+        latency_tracer.mark(trace, "page_load")
         self.current_page = page_id
         
         # Alte Inhalte löschen
@@ -1624,6 +1662,9 @@ class BertrandtGUI:
         
         # Layout basierend auf Konfiguration erstellen
         self.create_content_layout(config, page_dir)
+        if trace:
+            # Erst im Idle sind Geometrie-Berechnung und Neuzeichnen der neuen Seite erledigt
+            self.root.after_idle(latency_tracer.mark, trace, "idle")
         
         # Navigation aktualisieren
         self.update_navigation(page_id)
@@ -2233,46 +2274,68 @@ für den normalen Betrieb mit Arduino-Steuerung.
             
     def start_serial_reading(self):
         """Serial-Daten lesen starten"""
+        # GUI-Thread wird nur noch geweckt, wenn der Lese-Thread Daten hat -
+        # vor dem Start anlegen, die ersten Zeilen können sofort kommen
+        if self.data_wakeup is None:
+            self.data_wakeup = TkWakeup(self.root, self.process_serial_data)
+        
         self.running = True
         self.serial_thread = threading.Thread(target=self.read_serial_data)
         self.serial_thread.daemon = True
         self.serial_thread.start()
-        
-        # GUI-Update-Loop starten
         self.process_serial_data()
         
     def read_serial_data(self):
         """Serial-Daten in separatem Thread lesen"""
+        framer = LineFramer()
         while self.running and self.serial_connection:
             try:
-                if self.serial_connection.in_waiting > 0:
-                    line = self.serial_connection.readline().decode('utf-8').strip()
+                lines = framer.read_from(self.serial_connection)
+            except Exception as e:
+                print(f"Serial read error: {e}")
+                time.sleep(0.1)
+                continue
+            read_at = time.perf_counter()
+            queued = False
+            for line in lines:
+                # Eine ungültige Zeile kostet nur sich selbst, nicht den Rest des Blocks
+                try:
                     if line.startswith("SIGNAL:"):
                         signal_value = int(line.split(":")[1])
-                        self.data_queue.put(('signal', signal_value))
+                        trace = latency_tracer.begin("esp32", signal_value, read_at)
+                        latency_tracer.mark(trace, "queued")
+                        self.data_queue.put(('signal', signal_value, trace))
+                        queued = True
                     elif line.startswith("Clients:"):
                         client_count = int(line.split(":")[1].strip())
-                        self.data_queue.put(('clients', client_count))
-            except Exception as e:
-                print(f"Serial read error: {e}")
-                time.sleep(0.1)
+                        self.data_queue.put(('clients', client_count, None))
+                        queued = True
+                except Exception as e:
+                    print(f"Serial parse error in '{line}': {e}")
+            if queued:
+                self.data_wakeup.notify()
                 
     def process_serial_data(self):
-        """Serial-Daten verarbeiten (GUI-Thread)"""
+        """Serial-Daten verarbeiten (GUI-Thread, ausgelöst durch data_wakeup)"""
         try:
             while not self.data_queue.empty():
-                data_type, value = self.data_queue.get_nowait()
+                data_type, value, trace = self.data_queue.get_nowait()
                 
                 if data_type == 'signal':
-                    self.update_signal(value)
+                    latency_tracer.mark(trace, "drained")
+                    self.signal_coalescer.add(value, trace)
                 elif data_type == 'clients':
                     self.update_client_count(value)
                     
         except queue.Empty:
             pass
+        self.signal_coalescer.end_cycle()
         
-        # Nächste Verarbeitung planen
-        self.root.after(50, self.process_serial_data)
+    def render_signal(self, signal_id, trace=None):
+        """Letztes Signal eines Bursts anzeigen (vom SignalCoalescer aufgerufen)"""
+        # load_content_page übernimmt den Trace als aktuellen Trace
+        with latency_tracer.active(trace):
+            self.update_signal(signal_id)
         
     def update_signal(self, signal_id):
         """Signal-Anzeige mit Bertrandt Design aktualisieren"""
@@ -2296,15 +2359,23 @@ für den normalen Betrieb mit Arduino-Steuerung.
             self.update_navigation(signal_id)
             
             # Historie aktualisieren
-            self.signal_history.append({
-                'signal': signal_id,
-                'name': signal_info['name'],
-                'timestamp': time.time()
-            })
-            
-            # Nur letzte 100 Einträge behalten
-            if len(self.signal_history) > 100:
-                self.signal_history.pop(0)
+            self.record_signal_history(signal_id)
+    
+    def record_signal_history(self, signal_id):
+        """Signal in die Historie übernehmen (auch übersprungene Zwischenseiten eines Bursts)"""
+        signal_info = self.signal_definitions.get(signal_id)
+        if not signal_info:
+            return
+        
+        self.signal_history.append({
+            'signal': signal_id,
+            'name': signal_info['name'],
+            'timestamp': time.time()
+        })
+        
+        # Nur letzte 100 Einträge behalten
+        if len(self.signal_history) > 100:
+            self.signal_history.pop(0)
                 
     def update_client_count(self, count):
         """Client-Anzahl mit einheitlichem Styling aktualisieren"""
@@ -2327,6 +2398,9 @@ für den normalen Betrieb mit Arduino-Steuerung.
         current_time = time.strftime("%H:%M:%S")
         current_date = time.strftime("%d.%m.%Y")
         self.time_label.config(text=f"{current_date} | {current_time}")
+        if hasattr(self, 'latency_label'):
+            self.latency_label.config(text=f"{latency_tracer.status_text()}\n"
+                                           f"{queue_stats_text(self.data_queue.get_stats())}")
         self.root.after(1000, self.update_time)
         
     def restart_connection(self):
@@ -2544,22 +2618,18 @@ für den normalen Betrieb mit Arduino-Steuerung.
                   
     def scan_ports(self):
         """Verfügbare Serial-Ports scannen"""
-        ports = []
-        
-        # Linux/Mac Ports
-        for pattern in ['/dev/ttyUSB*', '/dev/ttyACM*', '/dev/cu.usbserial*', '/dev/cu.usbmodem*']:
-            ports.extend(glob.glob(pattern))
+        # USB-Identität statt Namensmuster - Rollen bleiben nach Replug gleich
+        device_index.refresh()
+        ports = [device.node for device in device_index.devices()]
+        roles = device_index.roles()
         
-        # Windows Ports (falls auf Windows)
-        if sys.platform.startswith('win'):
-            import serial.tools.list_ports
-            ports.extend([port.device for port in serial.tools.list_ports.comports()])
-        
-        # Combobox aktualisieren
+        # Combobox aktualisieren, passendes Gerät zur Auswahl vorwählen
         self.flash_port_combo['values'] = ports
         if ports:
-            self.flash_port_combo.set(ports[0])
-            self.flash_status.config(text=f"Gefunden: {len(ports)} Port(s)")
+            preferred = roles.get('giga') if self.device_var.get() == "GIGA" else roles.get('esp32_1')
+            self.flash_port_combo.set(preferred or ports[0])
+            found = ", ".join(f"{role}: {node}" for role, node in sorted(roles.items()))
+            self.flash_status.config(text=f"Gefunden: {len(ports)} Port(s) - {found or 'unbekannte Geräte'}")
         else:
             self.flash_status.config(text="Keine Ports gefunden")
     
@@ -2807,32 +2877,18 @@ für den normalen Betrieb mit Arduino-Steuerung.
     def _flash_both_worker(self):
         """Beide Geräte nacheinander flashen"""
         try:
-            # Ports automatisch erkennen
-            ports = []
-            for pattern in ['/dev/ttyUSB*', '/dev/ttyACM*', '/dev/cu.usbserial*', '/dev/cu.usbmodem*']:
-                ports.extend(glob.glob(pattern))
+            # Ports über die USB-Identität (VID/PID) erkennen
+            device_index.refresh()
+            giga_port = device_index.resolve('giga')
+            esp32_port = device_index.resolve('esp32_1')
             
-            if len(ports) < 2:
+            if not giga_port or not esp32_port:
+                missing = [name for name, port in (("Arduino GIGA", giga_port), ("ESP32", esp32_port)) if not port]
                 self.root.after(0, lambda: messagebox.showerror("Fehler", 
-                    f"Nicht genügend Ports gefunden!\nGefunden: {len(ports)}, Benötigt: 2\n" +
+                    f"Nicht gefunden: {', '.join(missing)}\n" +
                     "Bitte beide Geräte anschließen."))
                 return
             
-            # Annahme: GIGA meist auf /dev/ttyACM*, ESP32 auf /dev/ttyUSB*
-            giga_port = None
-            esp32_port = None
-            
-            for port in ports:
-                if '/dev/ttyACM' in port or '/dev/cu.usbmodem' in port:
-                    giga_port = port
-                elif '/dev/ttyUSB' in port or '/dev/cu.usbserial' in port:
-                    esp32_port = port
-            
-            if not giga_port:
-                giga_port = ports[0]
-            if not esp32_port:
-                esp32_port = ports[1] if len(ports) > 1 else ports[0]
-            
             # 1. Arduino GIGA flashen
             self.root.after(0, lambda: self.flash_status.config(text="1/2: Flashe Arduino GIGA..."))
             
@@ -2949,6 +3005,8 @@ für den normalen Betrieb mit Arduino-Steuerung.
             self.root.mainloop()
         finally:
             self.running = False
+            bus.unbind_ui()
+            self.bus_wakeup.close()
             if self.dev_mode:
                 self.stop_auto_demo()
             if self.serial_connection:
@@ -2956,13 +3014,27 @@ für den normalen Betrieb mit Arduino-Steuerung.
 
 def main():
     parser = argparse.ArgumentParser(description='Bertrandt ESP32 Monitor')
-    parser.add_argument('--esp32-port', default='/dev/ttyUSB0',
-                       help='ESP32 Serial Port')
+    parser.add_argument('--esp32-port', default=None,
+                       help='ESP32 Serial Port (Standard: automatisch über USB-Identität)')
+    
+    parser.add_argument('--queue-size', type=int, default=256,
+                       help='Maximale Anzahl wartender Seriell-Ereignisse')
+    parser.add_argument('--queue-policy', choices=POLICIES, default='latest_signal',
+                       help='Verhalten bei voller Queue (Standard: nur das neueste Signal behalten)')
+    parser.add_argument('--settle-ms', type=int, default=0,
+                       help='Seitenwechsel erst nach so vielen ms ohne neues Signal anzeigen (0 = je Durchlauf)')
+    parser.add_argument('--latency-report', nargs='?', const='-', metavar='DATEI',
+                       help='Signal-Latenz pro Station beim Beenden ausgeben (ohne DATEI: Konsole)')
     
     args = parser.parse_args()
     
-    app = BertrandtGUI(esp32_port=args.esp32_port)
-    app.run()
+    app = BertrandtGUI(esp32_port=args.esp32_port, queue_size=args.queue_size,
+                       queue_policy=args.queue_policy, settle_ms=args.settle_ms)
+    try:
+        app.run()
+    finally:
+        if args.latency_report:
+            latency_tracer.write_report(args.latency_report)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
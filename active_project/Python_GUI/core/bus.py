@@ -2,31 +2,700 @@
 """
 Event-Bus für lose Kopplung zwischen Komponenten
 """
-from collections import defaultdict
-from typing import Callable, Dict, List, Any
+import time
+import inspect
+import functools
+import weakref
+import threading
+import itertools
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Deque, Dict, Any, List, Optional, Tuple
+from core.logger import logger
+from core.latency_trace import LatencyHistogram
+
+# Zustellung eines Handlers (subscribe(..., thread=...))
+SYNC = "sync"       # Sofort im publizierenden Thread
+UI = "ui"           # Im UI-Thread, gesammelt pro Wakeup
+WORKER = "worker"   # Im Thread-Pool des Busses
+THREADS = (SYNC, UI, WORKER)
+
+# Topics sind durch ":" gegliedert (hardware:signal_received). In Mustern steht
+# "*" für genau ein Segment, "**" am Ende für beliebig viele (auch keins).
+SEPARATOR = ":"
+ONE = "*"
+REST = "**"
+
+def is_pattern(topic: str) -> bool:
+    return ONE in topic
+
+def handler_name(fn: Callable[..., None]) -> str:
+    """Qualifizierter Name eines Handlers (Modul.Klasse.methode)"""
+    target = getattr(fn, '__func__', fn)
+    name = getattr(target, '__qualname__', None) or type(target).__qualname__
+    return f"{getattr(target, '__module__', None) or '?'}.{name}"
+
+# Ein Handler ist (target, func): stark (fn, None) oder schwach (weakref.ref(objekt), funktion),
+# aufgerufen als func(objekt, **payload) - ohne bei jedem publish eine gebundene Methode zu bauen
+
+def _handler(target, func) -> Optional[Callable[..., None]]:
+    """Aufrufbarer Handler oder None, wenn das Objekt weg ist"""
+    if func is None:
+        return target
+    owner = target()
+    return None if owner is None else functools.partial(func, owner)
+
+def _owner(target, func) -> Any:
+    return target() if func is not None else getattr(target, '__self__', None)
+
+def _matches(target, func, fn: Callable[..., None]) -> bool:
+    if func is None:
+        return target == fn
+    owner = target()
+    if inspect.ismethod(fn):
+        return fn.__self__ is owner and fn.__func__ is func
+    return fn is owner and func is type(fn).__call__
+
+class _Subscription:
+    """Ein Abonnement (target/func wie bei _handler)"""
+
+    __slots__ = ('order', 'target', 'func', 'thread', 'since', 'name')
+
+    def __init__(self, order: int, target, func, thread: str, name: str):
+        self.order = order
+        self.target = target
+        self.func = func
+        self.thread = thread
+        self.since = time.monotonic()
+        self.name = name
+
+    @property
+    def weak(self) -> bool:
+        return self.func is not None
+
+    @property
+    def dead(self) -> bool:
+        return self.func is not None and self.target() is None
+
+class _HandlerStats:
+    """Laufzeiten eines Abonnements für ein Topic"""
+
+    __slots__ = ('name', 'thread', 'histogram', 'slow')
+
+    def __init__(self, name: str, thread: str):
+        self.name = name
+        self.thread = thread
+        self.histogram = LatencyHistogram()     # Mikrosekunden
+        self.slow = 0                           # Aufrufe über der Schwelle
+
+class _TopicStats:
+    __slots__ = ('published', 'window_start', 'window_count', 'rate', 'handlers')
+
+    def __init__(self, now: float):
+        self.published = 0
+        self.window_start = now
+        self.window_count = 0
+        self.rate = 0.0                         # publish/s im letzten abgeschlossenen Fenster
+        self.handlers: Dict[int, _HandlerStats] = {}    # Abonnement (order) -> Laufzeiten
+
+class BusStats:
+    """publish-Aufrufe pro Topic und Laufzeit jedes Handlers (EventBus.enable_stats)"""
+
+    RATE_WINDOW = 1.0   # Sekunden pro Fenster der publish-Rate
+
+    def __init__(self, slow_ms: float):
+        self.slow_ms = slow_ms
+        self.since = time.monotonic()
+        self.topics: Dict[str, _TopicStats] = {}
+        self._lock = threading.Lock()
+
+    def _topic(self, topic: str, now: float) -> _TopicStats:
+        stats = self.topics.get(topic)
+        if stats is None:
+            stats = self.topics[topic] = _TopicStats(now)
+        return stats
+
+    def published(self, topic: str) -> None:
+        now = time.monotonic()
+        with self._lock:
+            stats = self._topic(topic, now)
+            stats.published += 1
+            stats.window_count += 1
+            if now - stats.window_start >= self.RATE_WINDOW:
+                stats.rate = stats.window_count / (now - stats.window_start)
+                stats.window_start, stats.window_count = now, 0
+
+    def handler(self, topic: str, subscription: _Subscription) -> _HandlerStats:
+        with self._lock:
+            stats = self._topic(topic, time.monotonic())
+            handler = stats.handlers.get(subscription.order)
+            if handler is None:
+                handler = stats.handlers[subscription.order] = _HandlerStats(subscription.name,
+                                                                             subscription.thread)
+            return handler
+
+    def record(self, handler: _HandlerStats, elapsed_us: float) -> bool:
+        """Laufzeit zählen -> True bei einem neuen Höchstwert über der Schwelle (melden)"""
+        with self._lock:
+            histogram = handler.histogram
+            previous = histogram.max_us
+            histogram.record(elapsed_us)
+            if elapsed_us < self.slow_ms * 1000:
+                return False
+            handler.slow += 1
+            return histogram.max_us > previous
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        now = time.monotonic()
+        result = {}
+        with self._lock:
+            for topic, stats in self.topics.items():
+                elapsed = now - stats.window_start
+                if elapsed >= self.RATE_WINDOW or (not stats.rate and elapsed > 0):
+                    rate = stats.window_count / elapsed     # Fenster abgelaufen bzw. noch keins voll
+                else:
+                    rate = stats.rate
+                subscribers = []
+                for handler in stats.handlers.values():
+                    histogram = handler.histogram
+                    subscribers.append({
+                        'handler': handler.name,
+                        'thread': handler.thread,
+                        'calls': histogram.count,
+                        'total_ms': histogram.total_us / 1000,
+                        'mean_ms': histogram.mean() / 1000,
+                        'p99_ms': histogram.percentile(0.99) / 1000,
+                        'max_ms': histogram.max_us / 1000,
+                        'slow': handler.slow,
+                    })
+                result[topic] = {'published': stats.published, 'rate': rate, 'subscribers': subscribers}
+        return result
+
+class _TimedHandler:
+    """Eintrag im Cache bei aktiver Statistik: ruft den Handler auf und misst die Laufzeit
+
+    Steht als starker Handler (self, None) im Cache bzw. in den wartenden
+    UI-Events; Vergleich und Besitzer wie beim Handler selbst, damit
+    unsubscribe()/unsubscribe_owner() auch eingereihte Events finden.
+    """
+
+    __slots__ = ('bus', 'stats', 'topic', 'target', 'func', 'handler')
+
+    def __init__(self, bus: 'EventBus', stats: BusStats, topic: str, subscription: _Subscription):
+        self.bus = bus
+        self.stats = stats
+        self.topic = topic
+        self.target = subscription.target
+        self.func = subscription.func
+        self.handler = stats.handler(topic, subscription)
+
+    def __call__(self, **payload: Any) -> None:
+        if self.func is None:
+            fn, args = self.target, ()
+        else:
+            owner = self.target()
+            if owner is None:
+                self.bus._on_dead(None)
+                return
+            fn, args = self.func, (owner,)
+        start = time.perf_counter()
+        try:
+            fn(*args, **payload)
+        finally:
+            elapsed_us = (time.perf_counter() - start) * 1e6
+            if self.stats.record(self.handler, elapsed_us):
+                logger.warning("🐢 Langsamer Event-Handler für '%s': %s %.1f ms (Schwelle %.0f ms)",
+                               self.topic, self.handler.name, elapsed_us / 1000, self.stats.slow_ms)
+
+    def __eq__(self, other: Any) -> bool:
+        return _matches(self.target, self.func, other)
+
+    __hash__ = object.__hash__
+
+    @property
+    def __self__(self) -> Any:
+        return _owner(self.target, self.func)
+
+class _TopicTrie:
+    """Präfixbaum der abonnierten Muster: match(topic) -> passende Muster
+
+    Pro Segment ein Knoten; Kinder nach Segment-Text und ein eigenes Kind
+    für "*". Ein Knoten merkt sich, welches Muster an ihm endet bzw. mit
+    "**" an ihm weitergeht.
+    """
+
+    __slots__ = ('children', 'one', 'end', 'rest')
 
-class EventBus:
-    """Framework-agnostischer Event-Bus für Publish/Subscribe Pattern"""
-    
     def __init__(self):
-        self._subs: Dict[str, List[Callable[..., None]]] = defaultdict(list)
+        self.children: Dict[str, '_TopicTrie'] = {}
+        self.one: Optional['_TopicTrie'] = None
+        self.end: Optional[str] = None      # Muster, das genau hier endet
+        self.rest: Optional[str] = None     # Muster "<präfix>:**"
+
+    def insert(self, pattern: str) -> None:
+        node = self
+        segments = pattern.split(SEPARATOR)
+        for index, segment in enumerate(segments):
+            if segment == REST and index == len(segments) - 1:
+                node.rest = pattern
+                return
+            if segment == ONE:
+                if node.one is None:
+                    node.one = _TopicTrie()
+                node = node.one
+            else:
+                node = node.children.setdefault(segment, _TopicTrie())
+        node.end = pattern
+
+    def remove(self, pattern: str) -> None:
+        self._remove(pattern.split(SEPARATOR), 0, pattern)
+
+    def _remove(self, segments: List[str], index: int, pattern: str) -> bool:
+        """-> True, wenn dieser Knoten danach leer ist"""
+        if index == len(segments):
+            self.end = None
+        elif segments[index] == REST and index == len(segments) - 1:
+            self.rest = None
+        elif segments[index] == ONE:
+            if self.one is not None and self.one._remove(segments, index + 1, pattern):
+                self.one = None
+        else:
+            child = self.children.get(segments[index])
+            if child is not None and child._remove(segments, index + 1, pattern):
+                del self.children[segments[index]]
+        return not (self.children or self.one or self.end or self.rest)
+
+    def match(self, topic: str) -> List[str]:
+        matches: List[str] = []
+        self._match(topic.split(SEPARATOR), 0, matches)
+        return matches
 
-    def subscribe(self, topic: str, fn: Callable[..., None]) -> None:
-        """Event-Handler für Topic registrieren"""
-        self._subs[topic].append(fn)
+    def _match(self, segments: List[str], index: int, matches: List[str]) -> None:
+        if self.rest is not None:
+            matches.append(self.rest)
+        if index == len(segments):
+            if self.end is not None:
+                matches.append(self.end)
+            return
+        child = self.children.get(segments[index])
+        if child is not None:
+            child._match(segments, index + 1, matches)
+        if self.one is not None:
+            self.one._match(segments, index + 1, matches)
+
+class EventBus:
+    """Framework-agnostischer Event-Bus für Publish/Subscribe Pattern
+
+    publish() ist aus jedem Thread erlaubt. Wo ein Handler läuft, legt er
+    beim Abonnieren fest:
+      "sync"    sofort im publizierenden Thread (Standard, bisheriges Verhalten)
+      "ui"      im UI-Thread. Aus anderen Threads wird das Event eingereiht,
+                der UI-Thread per Notifier geweckt und dispatch_pending()
+                stellt alles Wartende in einem Durchlauf zu. Im UI-Thread
+                selbst wird sofort zugestellt, solange nichts wartet (die
+                Reihenfolge bleibt erhalten). Ohne bind_ui() wie "sync".
+      "worker"  im Thread-Pool (max_workers Threads), Reihenfolge nicht garantiert
+    Tk-Anbindung im Tk-Thread (Bertrandt_GUI.py, core/tk_wakeup.bind_bus):
+        bus.bind_ui(TkWakeup(root, bus.dispatch_pending).notify)
+
+    Abonniert werden konkrete Topics oder Muster: "hardware:*" (ein
+    Segment), "hardware:**" (alles unter hardware:), "**" (alles). Die
+    Muster liegen in einem Präfixbaum; welche Handler ein konkretes Topic
+    bekommt (direkte und über Muster, in Abonnier-Reihenfolge), wird beim
+    ersten publish() einmal aufgelöst und als unveränderliches Tupel
+    zwischengespeichert. subscribe()/unsubscribe() (unter Lock) verwerfen
+    diesen Cache. publish() liest ihn ohne Lock und ohne Kopie - Muster
+    kosten pro publish nichts, ein Topic ohne Subscriber nur einen
+    Dictionary-Zugriff.
+
+    Abonnements halten ihren Handler stark, bis unsubscribe() bzw.
+    unsubscribe_owner() sie entfernt. Kurzlebige Komponenten (Tabs,
+    Seiten) melden sich beim Zerstören ab - release_on_destroy(widget)
+    erledigt das im <Destroy>-Binding - oder abonnieren mit weak=True:
+    dann hält das Abonnement sein Objekt nicht am Leben (wie WeakMethod,
+    aber ohne pro Aufruf eine gebundene Methode zu bauen), und ist das
+    Objekt weg, wird es entfernt statt aufgerufen. leak_report() listet
+    alle Abonnements mit Alter.
+
+    enable_stats() zählt publish-Aufrufe pro Topic und misst jeden Handler
+    (Summe, p99, Aufrufe über der Schwelle mit Namen im Log), get_stats()/
+    stats_report() geben das aus. Ausgeschaltet (Standard) kostet das
+    nichts: publish() und der Cache sind dann genau die ohne Messung.
+    """
+
+    def __init__(self, max_workers: int = 4):
+        # Abonnement (Topic oder Muster) -> (_Subscription, ...)
+        self._subs: Dict[str, Tuple[_Subscription, ...]] = {}
+        self._trie = _TopicTrie()
+        # Konkretes Topic -> ((target, func, zustellung), ...)
+        self._resolved: Dict[str, Tuple[Tuple[Any, Any, str], ...]] = {}
+        self._order = itertools.count()
+        self._lock = threading.Lock()
+        self._pending: Deque[Tuple[str, Any, Any, Dict[str, Any]]] = deque()
+        self._ui_thread: Optional[int] = None
+        self._ui_notifier: Optional[Callable[[], None]] = None
+        self._max_workers = max_workers
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._stats: Optional[BusStats] = None
+        self._stale = False     # Ein schwach referenziertes Objekt ist weg - beim nächsten Zugriff aufräumen
+        self.pruned = 0         # Automatisch entfernte Abonnements
+        self.batches = 0        # dispatch_pending-Durchläufe mit mindestens einem Event
+        self.max_batch = 0      # Größter Durchlauf (Events)
+
+    def subscribe(self, topic: str, fn: Callable[..., None], thread: str = SYNC,
+                  weak: bool = False) -> None:
+        """Event-Handler für Topic oder Muster registrieren (thread: "sync", "ui" oder "worker")
+
+        weak: False (Standard) = stark, das Abonnement hält den Handler am Leben;
+        True = schwach (gebundene Methoden und aufrufbare Objekte) - es endet mit
+        dem Objekt, z.B. für Seiten, die sich beim Verwerfen nicht abmelden.
+        """
+        if thread not in THREADS:
+            raise ValueError(f"Unbekannte Zustellung '{thread}' (erlaubt: {', '.join(THREADS)})")
+        thread = THREADS[THREADS.index(thread)]   # publish() vergleicht per Identität
+        target, func = fn, None
+        try:
+            if weak and inspect.ismethod(fn):
+                target, func = weakref.ref(fn.__self__, self._on_dead), fn.__func__
+            elif weak:
+                target, func = weakref.ref(fn, self._on_dead), type(fn).__call__
+        except TypeError:
+            pass    # Objekt ohne __weakref__ (z.B. __slots__) - stark referenzieren
+        with self._lock:
+            if self._stale:
+                self._prune_locked()
+            subs = self._subs.get(topic, ())
+            if not subs and is_pattern(topic):
+                self._trie.insert(topic)
+            self._subs[topic] = subs + (_Subscription(next(self._order), target, func, thread,
+                                                      handler_name(fn)),)
+            self._resolved = {}
 
     def unsubscribe(self, topic: str, fn: Callable[..., None]) -> None:
-        """Event-Handler entfernen"""
-        if topic in self._subs and fn in self._subs[topic]:
-            self._subs[topic].remove(fn)
+        """Event-Handler entfernen (auch noch eingereihte UI-Events an ihn verwerfen)"""
+        with self._lock:
+            subs = self._subs.get(topic, ())
+            for index, subscription in enumerate(subs):
+                if _matches(subscription.target, subscription.func, fn):
+                    break
+            else:
+                return
+            self._replace(topic, subs[:index] + subs[index + 1:])
+            if self._pending:
+                # Eingereihte Events tragen das konkrete Topic - bei Mustern alle dieses Handlers
+                pattern = is_pattern(topic)
+                self._pending = deque(
+                    item for item in self._pending
+                    if not _matches(item[1], item[2], fn) or (not pattern and item[0] != topic))
+
+    def unsubscribe_owner(self, owner: Any) -> int:
+        """Alle Abonnements mit Methoden von owner entfernen -> Anzahl
+
+        Für Widgets, die beim Zerstören sofort abmelden wollen, statt auf die
+        Garbage Collection zu warten (z.B. in einem <Destroy>-Binding).
+        """
+        removed = 0
+        with self._lock:
+            for topic, subs in list(self._subs.items()):
+                keep = tuple(subscription for subscription in subs
+                             if _owner(subscription.target, subscription.func) is not owner)
+                if len(keep) != len(subs):
+                    removed += len(subs) - len(keep)
+                    self._replace(topic, keep)
+            if removed and self._pending:
+                self._pending = deque(item for item in self._pending
+                                      if _owner(item[1], item[2]) is not owner)
+        return removed
+
+    def release_on_destroy(self, widget: Any, owner: Any = None) -> None:
+        """Tk-Widget: bei seinem <Destroy> unsubscribe_owner(owner) aufrufen (Standard: das Widget)"""
+        owner = widget if owner is None else owner
+
+        def on_destroy(event):
+            if event.widget is widget:      # <Destroy> kommt auch für jedes Kind-Widget
+                self.unsubscribe_owner(owner)
+
+        widget.bind("<Destroy>", on_destroy, add="+")
 
     def publish(self, topic: str, **payload: Any) -> None:
-        """Event mit Payload an alle Subscriber senden"""
-        for fn in list(self._subs.get(topic, [])):
-            try:
-                fn(**payload)
-            except Exception as e:
-                print(f"❌ Event-Handler Fehler für '{topic}': {e}")
+        """Event mit Payload an alle Subscriber senden (aus beliebigem Thread)"""
+        subs = self._resolved.get(topic)
+        if subs is None:
+            subs = self._resolve(topic)
+        if not subs:
+            return
+
+        wake = False
+        dead = False
+        for target, func, thread in subs:
+            if thread is SYNC:
+                # Häufigster Fall direkt, ohne zusätzlichen Funktionsaufruf
+                try:
+                    if func is None:
+                        target(**payload)
+                    else:
+                        owner = target()
+                        if owner is None:
+                            dead = True
+                        else:
+                            func(owner, **payload)
+                except Exception as e:
+                    logger.error("❌ Event-Handler Fehler für '%s': %s", topic, e)
+                continue
+            if thread is UI and self._ui_notifier is not None:
+                with self._lock:
+                    if self._pending or threading.get_ident() != self._ui_thread:
+                        self._pending.append((topic, target, func, payload))
+                        wake = True
+                        continue
+            fn = _handler(target, func)
+            if fn is None:
+                dead = True
+            elif thread is WORKER:
+                self._executor().submit(self._call, topic, fn, payload)
+            else:
+                self._call(topic, fn, payload)
+
+        if wake:
+            self._ui_notifier()
+        if dead:
+            self.prune()
+
+    def _resolve(self, topic: str) -> Tuple[Tuple[Any, Any, str], ...]:
+        """Handler für ein konkretes Topic bestimmen und zwischenspeichern"""
+        with self._lock:
+            entries = list(self._subs.get(topic, ()))
+            for pattern in self._trie.match(topic):
+                entries.extend(self._subs[pattern])
+            entries.sort(key=lambda subscription: subscription.order)
+            stats = self._stats
+            if stats is None:
+                subs = tuple((subscription.target, subscription.func, subscription.thread)
+                             for subscription in entries)
+            else:
+                subs = tuple((_TimedHandler(self, stats, topic, subscription), None, subscription.thread)
+                             for subscription in entries)
+            self._resolved[topic] = subs
+            return subs
+
+    def _replace(self, topic: str, subs: Tuple[_Subscription, ...]) -> None:
+        """Abonnements eines Topics ersetzen (unter Lock) und den Cache verwerfen"""
+        if subs:
+            self._subs[topic] = subs
+        else:
+            del self._subs[topic]
+            if is_pattern(topic):
+                self._trie.remove(topic)
+        self._resolved = {}
+
+    def _on_dead(self, ref) -> None:
+        """Weakref-Callback (beliebiger Thread, evtl. mitten in der GC) - nur vormerken"""
+        self._stale = True
+
+    def prune(self) -> int:
+        """Abonnements verschwundener Objekte entfernen -> Anzahl"""
+        with self._lock:
+            return self._prune_locked()
+
+    def _prune_locked(self) -> int:
+        self._stale = False
+        removed = 0
+        for topic, subs in list(self._subs.items()):
+            keep = tuple(subscription for subscription in subs if not subscription.dead)
+            if len(keep) != len(subs):
+                removed += len(subs) - len(keep)
+                self._replace(topic, keep)
+        if removed:
+            self.pruned += removed
+            logger.debug(f"Event-Bus: {removed} Abonnements verschwundener Objekte entfernt")
+        return removed
+
+    def get_subscriptions(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Abonnements pro Topic/Muster: [{'handler', 'thread', 'weak', 'age'}, ...]"""
+        now = time.monotonic()
+        with self._lock:
+            if self._stale:
+                self._prune_locked()
+            return {topic: [{'handler': subscription.name, 'thread': subscription.thread,
+                             'weak': subscription.weak, 'age': now - subscription.since}
+                            for subscription in subs]
+                    for topic, subs in self._subs.items()}
+
+    def leak_report(self, min_age: float = 0.0) -> str:
+        """Text: Abonnements pro Topic mit Alter, älteste zuerst
+
+        Markiert Handler, die dasselbe Topic mehrfach abonniert haben - bei
+        Komponenten, die immer wieder neu erzeugt werden, das typische
+        Zeichen für fehlendes unsubscribe().
+        """
+        subscriptions = self.get_subscriptions()
+        total = sum(len(subs) for subs in subscriptions.values())
+        lines = [f"Event-Bus: {total} Abonnements auf {len(subscriptions)} Topics "
+                 f"({self.pruned} automatisch entfernt)"]
+        for topic in sorted(subscriptions):
+            subs = [sub for sub in subscriptions[topic] if sub['age'] >= min_age]
+            if not subs:
+                continue
+            counts = Counter(sub['handler'] for sub in subs)
+            lines.append(f"{topic} ({len(subs)})")
+            for sub in sorted(subs, key=lambda sub: -sub['age']):
+                kind = "schwach" if sub['weak'] else "stark"
+                lines.append(f"  {sub['age']:>9.0f} s  {sub['handler']}  [{kind}, {sub['thread']}]")
+            for name, count in counts.items():
+                if count > 1:
+                    lines.append(f"  ⚠️ {name}: {count}x abonniert")
+        return "\n".join(lines)
+
+    def enable_stats(self, slow_ms: float = 16.0) -> None:
+        """Statistik pro Topic einschalten (slow_ms: Schwelle für langsame Handler)
+
+        Eingeschaltet überdeckt eine zählende Variante publish() als
+        Instanzattribut und der Cache enthält Messhüllen statt der Handler -
+        ausgeschaltet ist beides wieder weg, publish() fragt nichts ab.
+        Vorher gemerkte Referenzen auf bus.publish zählen nicht mit (ihre
+        Handler werden trotzdem gemessen).
+        """
+        with self._lock:
+            if self._stats is None:
+                self._stats = BusStats(slow_ms)
+            else:
+                self._stats.slow_ms = slow_ms
+            self._resolved = {}
+        self.publish = self._publish_counted
+        logger.info(f"Event-Bus: Statistik eingeschaltet (langsam ab {slow_ms:.0f} ms)")
+
+    def disable_stats(self) -> None:
+        """Statistik ausschalten und verwerfen"""
+        self.__dict__.pop('publish', None)
+        with self._lock:
+            self._stats = None
+            self._resolved = {}
+
+    @property
+    def stats_enabled(self) -> bool:
+        return self._stats is not None
+
+    def reset_stats(self) -> None:
+        """Gezählte Werte verwerfen, Statistik bleibt eingeschaltet"""
+        with self._lock:
+            if self._stats is not None:
+                self._stats = BusStats(self._stats.slow_ms)
+                self._resolved = {}
+
+    def _publish_counted(self, topic: str, **payload: Any) -> None:
+        """publish() bei eingeschalteter Statistik"""
+        stats = self._stats
+        if stats is not None:
+            stats.published(topic)
+        type(self).publish(self, topic, **payload)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Statistik pro Topic (leer, wenn ausgeschaltet)
+
+        {'published', 'rate' (publish/s), 'handlers' (aktuell), 'subscribers':
+        [{'handler', 'thread', 'calls', 'total_ms', 'mean_ms', 'p99_ms', 'max_ms', 'slow'}, ...]}
+        """
+        stats = self._stats
+        if stats is None:
+            return {}
+        topics = stats.summary()
+        for topic, info in topics.items():
+            subs = self._resolved.get(topic)
+            info['handlers'] = len(subs if subs is not None else self._resolve(topic))
+        return topics
+
+    def stats_report(self) -> str:
+        """Text: Topics nach Handler-Zeit, darunter die langsamen Handler mit Namen"""
+        stats = self._stats
+        if stats is None:
+            return "Event-Bus: Statistik ausgeschaltet (enable_stats())"
+        topics = self.get_stats()
+        lines = [f"Event-Bus: Statistik seit {time.monotonic() - stats.since:.0f} s, "
+                 f"{len(topics)} Topics (langsam ab {stats.slow_ms:.0f} ms)",
+                 f"{'Topic / Handler':<48}{'publish':>9}{'/s':>8}{'Handler':>9}{'Aufrufe':>9}"
+                 f"{'Summe ms':>10}{'p99 ms':>9}{'Max ms':>9}{'langsam':>9}"]
+        slow = []
+        for topic, info in sorted(topics.items(),
+                                  key=lambda item: -sum(sub['total_ms'] for sub in item[1]['subscribers'])):
+            total = sum(sub['total_ms'] for sub in info['subscribers'])
+            lines.append(f"{topic:<48}{info['published']:>9}{info['rate']:>8.1f}"
+                         f"{info['handlers']:>9}{'':>9}{total:>10.1f}")
+            for sub in sorted(info['subscribers'], key=lambda sub: -sub['total_ms']):
+                name = f"  {sub['handler']} [{sub['thread']}]"
+                lines.append(f"{name:<48}{'':>26}{sub['calls']:>9}{sub['total_ms']:>10.1f}"
+                             f"{sub['p99_ms']:>9.1f}{sub['max_ms']:>9.1f}{sub['slow']:>9}")
+                if sub['slow']:
+                    slow.append((sub['max_ms'], topic, sub))
+        for max_ms, topic, sub in sorted(slow, key=lambda item: -item[0]):
+            lines.append(f"⚠️ {sub['handler']} für '{topic}': {sub['slow']}x über "
+                         f"{stats.slow_ms:.0f} ms, max {max_ms:.1f} ms")
+        return "\n".join(lines)
+
+    def write_stats_report(self, target: Any) -> None:
+        """stats_report() ausgeben: target '-' -> stdout, sonst Dateipfad"""
+        text = self.stats_report()
+        if target == "-":
+            print(text)
+        else:
+            with open(target, "w", encoding="utf-8") as f:
+                f.write(text + "\n")
+
+    def bind_ui(self, notifier: Callable[[], None]) -> None:
+        """Im UI-Thread aufrufen: notifier weckt ihn thread-sicher (z.B. TkWakeup.notify)"""
+        self._ui_thread = threading.get_ident()
+        self._ui_notifier = notifier
+        if self._pending:
+            notifier()
+
+    def unbind_ui(self) -> None:
+        """UI-Anbindung lösen (z.B. beim Schließen des Fensters) - Wartendes wird verworfen"""
+        with self._lock:
+            self._ui_notifier = None
+            self._ui_thread = None
+            self._pending.clear()
+
+    def dispatch_pending(self) -> int:
+        """UI-Thread: alle eingereihten UI-Events zustellen -> Anzahl
+
+        Events, die Handler dabei neu einreihen, kommen im nächsten Durchlauf
+        (der Notifier wurde dafür schon ausgelöst). Ist das Objekt eines
+        schwach referenzierten Handlers inzwischen weg, entfällt das Event.
+        """
+        with self._lock:
+            batch, self._pending = self._pending, deque()
+        for topic, target, func, payload in batch:
+            fn = _handler(target, func)
+            if fn is not None:
+                self._call(topic, fn, payload)
+        if batch:
+            self.batches += 1
+            self.max_batch = max(self.max_batch, len(batch))
+        return len(batch)
+
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Thread-Pool der "worker"-Handler beenden"""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait)
+
+    def _executor(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(max_workers=self._max_workers,
+                                                    thread_name_prefix="BusWorker")
+        return self._pool
+
+    @staticmethod
+    def _call(topic: str, fn: Callable[..., None], payload: Dict[str, Any]) -> None:
+        try:
+            fn(**payload)
+        except Exception as e:
+            logger.error("❌ Event-Handler Fehler für '%s': %s", topic, e)
 
 # Globale Event-Bus Instanz
-bus = EventBus()
\ No newline at end of file
+bus = EventBus()
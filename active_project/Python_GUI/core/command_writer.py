@@ -0,0 +1,154 @@
+# core/command_writer.py
+"""
+Eigener Schreib-Thread pro Gerät: Befehle werden eingereiht statt im UI-Thread geschrieben
+"""
+
+import time
+import threading
+from collections import deque
+from concurrent.futures import Future
+from core.logger import logger
+
+class CommandQueueFull(Exception):
+    """Schreib-Queue eines Geräts ist voll - Befehl wurde nicht angenommen"""
+
+class WriterStopped(Exception):
+    """Schreib-Thread wurde beendet, bevor der Befehl gesendet war"""
+
+def command_merge_key(command):
+    """Schlüssel für Befehle, bei denen nur der neueste zählt (None = nie zusammenfassen)
+
+    SIGNAL:page_3:1 ersetzt ein noch wartendes SIGNAL, UDP_SEND an dieselbe
+    IP ersetzt ein wartendes UDP_SEND an diese IP.
+    """
+    if command.startswith("SIGNAL:"):
+        return "SIGNAL"
+    if command.startswith("UDP_SEND:"):
+        return "UDP_SEND:" + command.split(":", 2)[1]
+    return None
+
+class CommandWriter:
+    """Schreibt die Befehle eines Geräts nacheinander in einem eigenen Thread
+
+    submit() blockiert nie und liefert ein concurrent.futures.Future:
+      Ergebnis True     Befehl vollständig geschrieben
+      Exception         Schreibfehler, Timeout (write_timeout des Ports),
+                        CommandQueueFull, WriterStopped
+      cancelled()       durch einen neueren Befehl mit gleichem merge_key ersetzt
+    Callbacks (add_done_callback bzw. callback=) laufen im Schreib-Thread -
+    UI-Code muss sie selbst in den UI-Thread holen (z.B. TkWakeup).
+    """
+
+    def __init__(self, name, write, maxsize=64):
+        self.name = name
+        self.write = write
+        self.maxsize = maxsize
+        self.sent = 0
+        self.merged = 0
+        self.failed = 0
+        self.rejected = 0
+        self.last_write_ms = 0.0
+        self.running = False
+        self._pending = deque()     # [data, merge_key, future]
+        self._by_key = {}           # merge_key -> Eintrag in _pending
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._thread = None
+
+    def start(self):
+        """Startet den Schreib-Thread"""
+        if self.running:
+            return
+        self.running = True
+        self._thread = threading.Thread(target=self._run, name=f"Writer-{self.name}", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=2.0):
+        """Beendet den Thread; noch wartende Befehle scheitern mit WriterStopped"""
+        with self._lock:
+            if not self.running:
+                return
+            self.running = False
+            pending = list(self._pending)
+            self._pending.clear()
+            self._by_key.clear()
+            self._wakeup.notify()
+        for _, _, future in pending:
+            if future.set_running_or_notify_cancel():
+                future.set_exception(WriterStopped(f"{self.name}: Verbindung geschlossen"))
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+
+    def submit(self, data, merge_key=None, callback=None):
+        """Reiht data (bytes) ein -> Future"""
+        future = Future()
+        if callback:
+            future.add_done_callback(callback)
+
+        superseded = None
+        with self._lock:
+            if not self.running:
+                error = WriterStopped(f"{self.name}: nicht verbunden")
+            else:
+                error = None
+                entry = self._by_key.get(merge_key) if merge_key else None
+                if entry is not None:
+                    # Wartenden Befehl an seiner Position durch den neuen ersetzen
+                    superseded = entry[2]
+                    entry[0], entry[2] = data, future
+                    self.merged += 1
+                elif len(self._pending) >= self.maxsize:
+                    self.rejected += 1
+                    error = CommandQueueFull(f"{self.name}: {len(self._pending)} Befehle warten")
+                else:
+                    entry = [data, merge_key, future]
+                    self._pending.append(entry)
+                    if merge_key:
+                        self._by_key[merge_key] = entry
+                    self._wakeup.notify()
+
+        if superseded is not None:
+            superseded.cancel()
+        if error is not None:
+            future.set_running_or_notify_cancel()
+            future.set_exception(error)
+        return future
+
+    def pending_count(self):
+        return len(self._pending)
+
+    def get_stats(self):
+        return {
+            'pending': len(self._pending),
+            'sent': self.sent,
+            'merged': self.merged,
+            'failed': self.failed,
+            'rejected': self.rejected,
+            'last_write_ms': self.last_write_ms,
+        }
+
+    def _run(self):
+        while True:
+            with self._lock:
+                while self.running and not self._pending:
+                    self._wakeup.wait()
+                if not self.running:
+                    return
+                entry = self._pending.popleft()
+                data, merge_key, future = entry
+                if merge_key and self._by_key.get(merge_key) is entry:
+                    del self._by_key[merge_key]
+
+            if not future.set_running_or_notify_cancel():
+                continue
+            start = time.perf_counter()
+            try:
+                self.write(data)
+            except Exception as e:
+                self.failed += 1
+                logger.error(f"Fehler beim Senden an {self.name}: {e}")
+                future.set_exception(e)
+            else:
+                self.sent += 1
+                future.set_result(True)
+            self.last_write_ms = (time.perf_counter() - start) * 1000
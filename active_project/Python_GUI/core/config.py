@@ -4,7 +4,7 @@ Zentrale Konfiguration für Dynamic Messe Stand V3
 """
 import os
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 class Config:
     """Zentrale Konfigurationsklasse"""
@@ -21,11 +21,37 @@ class Config:
     LOGS_DIR = BASE_DIR / "logs"
     
     # Hardware-Konfiguration
-    ESP32_1_PORT = "/dev/ttyUSB0"  # Haupt-ESP32
-    ESP32_2_PORT = "/dev/ttyUSB1"  # ESP32.2 (Addon)
-    ESP32_3_PORT = "/dev/ttyUSB2"  # ESP32.3 (Addon)
-    GIGA_PORT = "/dev/ttyACM0"     # Arduino GIGA
+    # Ports: None = automatisch über den Geräte-Index (VID/PID/USB-Buchse)
+    ESP32_1_PORT: Optional[str] = None  # Haupt-ESP32
+    ESP32_2_PORT: Optional[str] = None  # ESP32.2 (Addon)
+    ESP32_3_PORT: Optional[str] = None  # ESP32.3 (Addon)
+    GIGA_PORT: Optional[str] = None     # Arduino GIGA
+    DEVICE_SERIALS: Dict[str, str] = {}  # Feste Zuordnung Rolle -> USB-Seriennummer
     BAUD_RATE = 115200
+    READY_TIMEOUT = 5.0            # Sekunden bis ein Gerät auf PING mit PONG antworten muss
+    READY_PING_INTERVAL = 0.5      # PING wiederholen, solange das Gerät noch bootet
+    DATA_QUEUE_SIZE = 256          # Empfangs-Queue pro Gerät (Ereignisse)
+    DATA_QUEUE_POLICY = "latest_signal"  # Bei vollem Puffer: drop_oldest, latest_signal, block
+    DATA_QUEUE_BLOCK_TIMEOUT = 1.0 # block: höchstens so lange auf Platz warten
+    COMMAND_QUEUE_SIZE = 64        # Wartende Befehle pro Gerät (Schreib-Thread)
+    WRITE_TIMEOUT = 1.0            # Sekunden bis ein hängender Schreibvorgang abbricht
+    HARDWARE_BACKEND = "threads"   # "threads" (Lese-/Schreib-Thread pro Gerät) oder "asyncio" (ein Loop)
+    LIVENESS_TIMEOUT = 5.0         # Sekunden ohne Zeile, bis ein Gerät per PING geprüft wird
+    LIVENESS_PROBE_TIMEOUT = 1.0   # Wartezeit auf die Antwort, danach hardware:device_stale
+    BUS_STATS_IN_DEV_MODE = True   # Im Dev Mode Bus-Statistik pro Topic (logs/bus_stats.txt beim Trennen)
+    BUS_SLOW_HANDLER_MS = 16.0     # Bus-Handler ab dieser Laufzeit als langsam melden (ein Frame bei 60 Hz)
+    
+    # Direkter UDP-Weg zu den ESP32s (Heartbeats, Acks, Umlaufzeit - core/udp_link.py)
+    UDP_LINK_ENABLED = False
+    UDP_PORT = 8889                # localPort im ESP32-Sketch
+    UDP_TARGETS: Dict[str, str] = {  # Rolle -> IP bzw. 'host:port' (esp32_ips im GIGA-Sketch)
+        'esp32_1': '192.168.1.100',
+        'esp32_2': '192.168.1.101',
+        'esp32_3': '192.168.1.102',
+    }
+    UDP_HEARTBEAT_INTERVAL = 2.0   # Sekunden zwischen Heartbeats des Hosts an jeden ESP32
+    UDP_ACK_TIMEOUT = 0.5          # Wiederholungs-Timeout, bis die Umlaufzeit gemessen ist
+    UDP_MAX_RETRIES = 4            # Wiederholungen eines unbestätigten Signals (Backoff x2)
     
     # GUI-Konfiguration
     WINDOW_TITLE = f"{PROJECT_NAME} - Bertrandt ESP32 Monitor"
@@ -0,0 +1,228 @@
+# core/device_index.py
+"""
+Geräte-Index:
+Ordnet logische Rollen (esp32_1, giga) über VID/PID/Seriennummer dem aktuellen Geräteknoten zu
+"""
+
+import os
+import re
+import sys
+import glob
+import argparse
+import threading
+from dataclasses import dataclass
+
+SYSFS_TTY = "/sys/class/tty"
+TTY_PATTERNS = ("ttyUSB*", "ttyACM*")
+
+# USB-Seriell-Chips der ESP32-Boards: CP210x, CH34x, FTDI, Espressif (nativ USB)
+ESP32_VIDS = {"10c4", "1a86", "0403", "303a"}
+# Arduino (GIGA R1: 2341:0266) und Arduino.org
+ARDUINO_VIDS = {"2341", "2a03"}
+
+ESP32_ROLES = ("esp32_1", "esp32_2", "esp32_3")
+GIGA_ROLE = "giga"
+
+@dataclass
+class UsbSerialDevice:
+    """Ein USB-Seriell-Gerät mit seiner Identität"""
+    node: str                 # /dev/ttyUSB0
+    vid: str                  # "10c4" (hex, klein)
+    pid: str                  # "ea60"
+    serial_number: str = ""
+    location: str = ""        # physische USB-Buchse, z.B. "1-1.2:1.0" - stabil über Reboots
+    manufacturer: str = ""
+    product: str = ""
+
+    @property
+    def usb_id(self):
+        return f"{self.vid}:{self.pid}"
+
+def _read_attribute(path):
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except OSError:
+        return ""
+
+def _location_key(location):
+    """'1-1.10:1.0' -> (1, 1, 10, 1, 0) - natürliche Sortierung nach Buchse"""
+    return tuple(int(part) for part in re.findall(r'\d+', location))
+
+def scan_sysfs(sysfs_root=SYSFS_TTY, dev_root="/dev"):
+    """Liest alle ttyUSB*/ttyACM* samt USB-Identität direkt aus sysfs"""
+    devices = []
+    for pattern in TTY_PATTERNS:
+        for entry in glob.glob(os.path.join(sysfs_root, pattern)):
+            device_link = os.path.join(entry, "device")
+            if not os.path.exists(device_link):
+                continue
+
+            # Vom Interface aufwärts bis zum USB-Gerät (dort liegen idVendor/idProduct)
+            path = os.path.realpath(device_link)
+            interface = ""
+            while path not in ("/", "") and not os.path.exists(os.path.join(path, "idVendor")):
+                if ":" in os.path.basename(path):
+                    interface = os.path.basename(path)
+                path = os.path.dirname(path)
+            if path in ("/", ""):
+                continue
+
+            devices.append(UsbSerialDevice(
+                node=os.path.join(dev_root, os.path.basename(entry)),
+                vid=_read_attribute(os.path.join(path, "idVendor")).lower(),
+                pid=_read_attribute(os.path.join(path, "idProduct")).lower(),
+                serial_number=_read_attribute(os.path.join(path, "serial")),
+                location=interface or os.path.basename(path),
+                manufacturer=_read_attribute(os.path.join(path, "manufacturer")),
+                product=_read_attribute(os.path.join(path, "product"))
+            ))
+    return devices
+
+def scan_pyserial():
+    """Fallback ohne sysfs (macOS/Windows): Identität über pyserial"""
+    try:
+        from serial.tools import list_ports
+    except ImportError:
+        return []
+
+    return [
+        UsbSerialDevice(
+            node=port.device,
+            vid=f"{port.vid:04x}",
+            pid=f"{port.pid:04x}",
+            serial_number=port.serial_number or "",
+            location=port.location or "",
+            manufacturer=port.manufacturer or "",
+            product=port.product or ""
+        )
+        for port in list_ports.comports()
+        if port.vid is not None
+    ]
+
+class DeviceIndex:
+    """Zwischengespeicherter Index Rolle -> Geräteknoten
+
+    Zuordnung: zuerst feste Seriennummern aus role_serials, dann GIGA über
+    die Arduino-VID und die ESP32s über ihre USB-Seriell-Chips in der
+    Reihenfolge der physischen USB-Buchsen (nicht der Enumerations-
+    Reihenfolge). Nach Hotplug-Ereignissen invalidate() aufrufen - der
+    nächste Zugriff liest sysfs neu ein.
+    """
+
+    def __init__(self, role_serials=None, sysfs_root=SYSFS_TTY):
+        self.role_serials = dict(role_serials or {})
+        self.sysfs_root = sysfs_root
+        self._lock = threading.Lock()
+        self._devices = None
+        self._roles = {}
+
+    def refresh(self):
+        """Liest die Geräte neu ein und berechnet die Rollen"""
+        if os.path.isdir(self.sysfs_root):
+            devices = scan_sysfs(self.sysfs_root)
+        else:
+            devices = scan_pyserial()
+        devices.sort(key=lambda device: _location_key(device.location))
+        roles = self._assign_roles(devices)
+
+        with self._lock:
+            self._devices = devices
+            self._roles = roles
+        return devices
+
+    def invalidate(self):
+        """Verwirft den Cache (z.B. nach Hotplug)"""
+        with self._lock:
+            self._devices = None
+
+    def devices(self):
+        """Alle bekannten USB-Seriell-Geräte"""
+        self._ensure()
+        return list(self._devices)
+
+    def resolve(self, role):
+        """Aktueller Geräteknoten einer Rolle oder None"""
+        self._ensure()
+        return self._roles.get(role)
+
+    def roles(self):
+        """Alle aufgelösten Rollen {rolle: knoten}"""
+        self._ensure()
+        return dict(self._roles)
+
+    def role_of(self, node):
+        """Rolle eines Geräteknotens oder None"""
+        for role, role_node in self.roles().items():
+            if role_node == node:
+                return role
+        return None
+
+    def find(self, node):
+        """Identität eines Geräteknotens oder None"""
+        for device in self.devices():
+            if device.node == node:
+                return device
+        return None
+
+    def _ensure(self):
+        if self._devices is None:
+            self.refresh()
+
+    def _assign_roles(self, devices):
+        roles = {}
+        taken = set()
+
+        for role, serial_number in self.role_serials.items():
+            for device in devices:
+                if serial_number and device.serial_number == serial_number and device.node not in taken:
+                    roles[role] = device.node
+                    taken.add(device.node)
+                    break
+
+        free = [device for device in devices if device.node not in taken]
+        if GIGA_ROLE not in roles:
+            for device in free:
+                if device.vid in ARDUINO_VIDS:
+                    roles[GIGA_ROLE] = device.node
+                    taken.add(device.node)
+                    break
+
+        esp32_candidates = (device for device in free
+                            if device.vid in ESP32_VIDS and device.node not in taken)
+        for role in ESP32_ROLES:
+            if role in roles:
+                continue
+            device = next(esp32_candidates, None)
+            if device is None:
+                break
+            roles[role] = device.node
+            taken.add(device.node)
+
+        return roles
+
+# Globale Geräte-Index Instanz
+device_index = DeviceIndex()
+
+def main():
+    parser = argparse.ArgumentParser(description='USB-Geräte-Index (Rolle -> Port)')
+    parser.add_argument('--shell', action='store_true',
+                        help='Ausgabe als ESP32_1_PORT=... für eval in Shell-Skripten')
+    args = parser.parse_args()
+
+    roles = device_index.roles()
+    if args.shell:
+        for role, node in sorted(roles.items()):
+            print(f"{role.upper()}_PORT={node}")
+        return 0
+
+    for device in device_index.devices():
+        role = device_index.role_of(device.node) or "-"
+        print(f"{device.node:<16}{role:<10}{device.usb_id:<11}{device.serial_number:<22}"
+              f"{device.location:<14}{device.product}")
+    if not roles:
+        print("Keine bekannten USB-Seriell-Geräte gefunden")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,219 @@
+# core/latency_trace.py
+"""
+Misst pro Signal die Zeit zwischen den Stationen der Verarbeitung (Seriell -> Queue -> Bus -> Bild)
+"""
+
+import time
+import threading
+
+# Stationen eines Signals in Pipeline-Reihenfolge. Nicht jeder Pfad durchläuft
+# alle (die Monolith-GUI hat z.B. keinen Bus); gemessen wird jeweils ab der
+# zuletzt erreichten Station.
+STAGES = ("read", "queued", "drained", "published", "page_load", "idle")
+STAGE_LABELS = {
+    "read": "Bytes gelesen",
+    "queued": "In data_queue",
+    "drained": "Aus Queue geholt",
+    "published": "Auf Bus veröffentlicht",
+    "page_load": "load_content_page",
+    "idle": "Erster Idle nach Layout",
+    "total": "Gesamt (gelesen -> Idle)",
+}
+FINAL_STAGE = "idle"
+
+class LatencyHistogram:
+    """Log-lineares Histogramm in Mikrosekunden (HDR-Prinzip)
+
+    Werte unter SUB_BUCKETS werden exakt gezählt, darüber teilt jede
+    Zweierpotenz in SUB_BUCKETS/2 gleich breite Fächer - der relative Fehler
+    bleibt unter 2 %, der Speicher wächst nur logarithmisch mit dem Wertebereich.
+    """
+
+    SUB_BITS = 7
+    SUB_BUCKETS = 1 << SUB_BITS
+    HALF = SUB_BUCKETS >> 1
+
+    def __init__(self):
+        self.counts = {}
+        self.count = 0
+        self.total_us = 0
+        self.min_us = None
+        self.max_us = 0
+
+    def record(self, value_us):
+        """Zählt einen Wert (Mikrosekunden, negative Werte zählen als 0)"""
+        value = max(0, int(value_us))
+        index = self._index(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total_us += value
+        self.max_us = max(self.max_us, value)
+        self.min_us = value if self.min_us is None else min(self.min_us, value)
+
+    def percentile(self, fraction):
+        """Wert, unter dem fraction (0..1) aller Messungen liegen - in Mikrosekunden"""
+        if not self.count:
+            return 0
+        rank = max(1, int(round(fraction * self.count)))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(self._upper(index), self.max_us)
+        return self.max_us
+
+    def mean(self):
+        return self.total_us / self.count if self.count else 0.0
+
+    def reset(self):
+        self.__init__()
+
+    @classmethod
+    def _index(cls, value):
+        if value < cls.SUB_BUCKETS:
+            return value
+        shift = value.bit_length() - cls.SUB_BITS
+        return shift * cls.HALF + (value >> shift)
+
+    @classmethod
+    def _upper(cls, index):
+        """Größter Wert im Fach index"""
+        if index < cls.SUB_BUCKETS:
+            return index
+        shift = index // cls.HALF - 1
+        mantissa = index % cls.HALF + cls.HALF
+        return ((mantissa + 1) << shift) - 1
+
+class SignalTrace:
+    """Zeitstempel eines einzelnen Signals"""
+
+    __slots__ = ("source", "value", "start", "last_stage", "last_time")
+
+    def __init__(self, source, value, at):
+        self.source = source
+        self.value = value
+        self.start = at
+        self.last_stage = "read"
+        self.last_time = at
+
+class LatencyTracer:
+    """Sammelt Stationszeiten aller Signale in Histogrammen pro Station
+
+    Lese-Threads rufen begin()/mark() mit dem Trace-Objekt auf, das mit dem
+    Signal durch die Queue wandert. Im UI-Thread macht active() das Signal
+    für die aufgerufenen Handler zum aktuellen Trace, sodass z.B.
+    load_content_page mark(None, ...) aufrufen kann, ohne die Signatur zu
+    ändern. Jede Station zählt die Zeit seit der vorherigen; mit FINAL_STAGE
+    wird zusätzlich die Gesamtzeit erfasst.
+    """
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.histograms = {stage: LatencyHistogram() for stage in STAGES[1:] + ("total",)}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def begin(self, source, value, at=None):
+        """Neues Signal, gelesen zum Zeitpunkt at (perf_counter, Standard jetzt) - None wenn deaktiviert"""
+        if not self.enabled:
+            return None
+        return SignalTrace(source, value, time.perf_counter() if at is None else at)
+
+    def mark(self, trace, stage, at=None):
+        """Signal hat stage erreicht (trace None -> aktueller Trace des Threads)"""
+        if trace is None:
+            trace = self.current()
+            if trace is None:
+                return
+        now = time.perf_counter() if at is None else at
+        with self._lock:
+            self.histograms[stage].record((now - trace.last_time) * 1_000_000)
+            if stage == FINAL_STAGE:
+                self.histograms["total"].record((now - trace.start) * 1_000_000)
+        trace.last_stage = stage
+        trace.last_time = now
+
+    def current(self):
+        """Trace des Signals, das dieser Thread gerade verarbeitet"""
+        return getattr(self._local, "trace", None)
+
+    def active(self, trace):
+        """Kontextmanager: trace ist während des Blocks der aktuelle Trace"""
+        return _ActiveTrace(self._local, trace)
+
+    def reset(self):
+        with self._lock:
+            for histogram in self.histograms.values():
+                histogram.reset()
+
+    def summary(self):
+        """{station: {'count', 'p50_ms', 'p95_ms', 'p99_ms', 'max_ms', 'mean_ms'}} für Stationen mit Messungen"""
+        result = {}
+        with self._lock:
+            for stage, histogram in self.histograms.items():
+                if not histogram.count:
+                    continue
+                result[stage] = {
+                    'count': histogram.count,
+                    'p50_ms': histogram.percentile(0.50) / 1000,
+                    'p95_ms': histogram.percentile(0.95) / 1000,
+                    'p99_ms': histogram.percentile(0.99) / 1000,
+                    'max_ms': histogram.max_us / 1000,
+                    'mean_ms': histogram.mean() / 1000,
+                }
+        return result
+
+    def status_text(self):
+        """Kurzform für Status-Anzeigen: Gesamtlatenz bzw. letzte gemessene Station"""
+        summary = self.summary()
+        for stage in ("total",) + tuple(reversed(STAGES[1:])):
+            if stage in summary:
+                info = summary[stage]
+                name = "Gesamt" if stage == "total" else STAGE_LABELS[stage]
+                return (f"{name}: p50 {info['p50_ms']:.1f} ms · p95 {info['p95_ms']:.1f} ms "
+                        f"(n={info['count']})")
+        return "Noch keine Signale"
+
+    def report(self):
+        """Tabelle aller Stationen (für --latency-report)"""
+        summary = self.summary()
+        lines = ["Signal-Latenz pro Station (Zeit seit der vorherigen Station, ms)",
+                 f"{'Station':<28}{'Anzahl':>8}{'p50':>9}{'p95':>9}{'p99':>9}{'Max':>9}{'Mittel':>9}"]
+        for stage in STAGES[1:] + ("total",):
+            info = summary.get(stage)
+            if not info:
+                continue
+            lines.append(f"{STAGE_LABELS[stage]:<28}{info['count']:>8}{info['p50_ms']:>9.2f}"
+                         f"{info['p95_ms']:>9.2f}{info['p99_ms']:>9.2f}{info['max_ms']:>9.2f}"
+                         f"{info['mean_ms']:>9.2f}")
+        if len(lines) == 2:
+            lines.append("Keine Signale gemessen")
+        return "\n".join(lines)
+
+    def write_report(self, target):
+        """Bericht ausgeben: target '-' -> stdout, sonst Dateipfad"""
+        text = self.report()
+        if target == "-":
+            print(text)
+        else:
+            with open(target, "w", encoding="utf-8") as f:
+                f.write(text + "\n")
+
+class _ActiveTrace:
+    __slots__ = ("_local", "_trace", "_previous")
+
+    def __init__(self, local, trace):
+        self._local = local
+        self._trace = trace
+
+    def __enter__(self):
+        self._previous = getattr(self._local, "trace", None)
+        self._local.trace = self._trace
+        return self._trace
+
+    def __exit__(self, *exc):
+        self._local.trace = self._previous
+        return False
+
+# Globale Tracer-Instanz
+latency_tracer = LatencyTracer()
@@ -0,0 +1,55 @@
+# core/line_framer.py
+"""
+Inkrementelles Zerlegen serieller Byte-Ströme in Textzeilen
+"""
+
+class LineFramer:
+    """Sammelt Bytes in einem Puffer und liefert nur vollständige Zeilen
+
+    Alles, was in in_waiting liegt, wird mit einem einzigen read() geholt.
+    Alle vollständigen Zeilen werden gemeinsam direkt aus dem Puffer
+    dekodiert (memoryview, keine Zwischenkopie pro Zeile); eine angefangene
+    Zeile bleibt für den nächsten Aufruf im Puffer.
+    """
+
+    def __init__(self, encoding='utf-8', max_line_length=4096):
+        self.encoding = encoding
+        self.max_line_length = max_line_length
+        self.buffer = bytearray()
+        self.overflow_count = 0
+
+    def feed(self, data):
+        """Hängt Bytes an und gibt alle nun vollständigen Zeilen zurück"""
+        buffer = self.buffer
+        buffer += data
+
+        lines = []
+        end = buffer.rfind(b'\n')
+        if end >= 0:
+            # Alle vollständigen Zeilen in einem Schritt direkt aus dem Puffer dekodieren
+            with memoryview(buffer) as view:
+                text = str(view[:end], self.encoding, 'replace')
+            del buffer[:end + 1]
+            lines = [line for line in map(str.strip, text.split('\n')) if line]
+
+        # Schutz vor endlosen Zeilen (z.B. Datenmüll ohne Zeilenende)
+        if len(buffer) > self.max_line_length:
+            buffer.clear()
+            self.overflow_count += 1
+
+        return lines
+
+    def read_from(self, connection):
+        """Liest alles Verfügbare in einem Aufruf von einer seriellen Verbindung
+
+        Liegt nichts an, blockiert read() bis zum ersten Byte bzw. bis zum
+        Timeout der Verbindung - eine zusätzliche Poll-Pause ist nicht nötig.
+        """
+        data = connection.read(connection.in_waiting or 1)
+        if not data:
+            return []
+        return self.feed(data)
+
+    def reset(self):
+        """Verwirft eine angefangene Zeile (z.B. nach Reconnect)"""
+        self.buffer.clear()
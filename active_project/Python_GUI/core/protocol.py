@@ -0,0 +1,447 @@
+# core/protocol.py
+"""
+Geräte-Protokoll:
+Wandelt Textzeilen von ESP32/GIGA über eine vorberechnete Präfix-Tabelle in typisierte Events
+"""
+
+from dataclasses import dataclass, field
+
+# ---------------------------------------------------------------------------
+# Events
+# ---------------------------------------------------------------------------
+
+@dataclass
+class DeviceEvent:
+    """Basis für alle Events aus einer Gerätezeile"""
+    __slots__ = ('line',)
+    line: str
+
+@dataclass
+class SignalEvent(DeviceEvent):
+    """SIGNAL:n - Seitenwechsel (für SIGNAL:0..255 eine gemeinsame Instanz - nicht verändern)"""
+    __slots__ = ('value',)
+    value: int
+
+@dataclass
+class ClientsEvent(DeviceEvent):
+    """Clients: n - verbundene WiFi-Clients"""
+    __slots__ = ('count',)
+    count: int
+
+@dataclass
+class PongEvent(DeviceEvent):
+    """PONG - Antwort auf PING"""
+    __slots__ = ()
+
+@dataclass
+class UdpReceivedEvent(DeviceEvent):
+    """UDP empfangen von <ip>: <nachricht>"""
+    __slots__ = ('sender', 'message')
+    sender: str
+    message: str
+
+@dataclass
+class UdpSentEvent(DeviceEvent):
+    """UDP gesendet an <ip>: <nachricht> (GIGA)"""
+    __slots__ = ('target', 'message')
+    target: str
+    message: str
+
+@dataclass
+class BroadcastEvent(DeviceEvent):
+    """Broadcasting Signal: <signal>:<wert> (GIGA)"""
+    __slots__ = ('signal', 'value')
+    signal: str
+    value: str
+
+@dataclass
+class HeartbeatTimeoutEvent(DeviceEvent):
+    """Heartbeat-Timeout - GIGA möglicherweise offline"""
+    __slots__ = ()
+
+@dataclass
+class PinEvent(DeviceEvent):
+    """Aktiviere Pin n für d ms / Pin n deaktiviert"""
+    pin: int
+    active: bool
+    duration_ms: int = 0
+
+@dataclass
+class WifiEvent(DeviceEvent):
+    """WiFi-Zustandsmeldungen"""
+    connected: bool
+    ip: str = ""
+
+@dataclass
+class CommandEchoEvent(DeviceEvent):
+    """Echo eines empfangenen seriellen Befehls"""
+    __slots__ = ('command',)
+    command: str
+
+@dataclass
+class UnknownCommandEvent(DeviceEvent):
+    """Gerät kennt den gesendeten Befehl nicht"""
+    __slots__ = ('command',)
+    command: str
+
+@dataclass
+class UnknownSignalEvent(DeviceEvent):
+    """ESP32 kennt das empfangene Signal nicht"""
+    __slots__ = ('signal',)
+    signal: str
+
+@dataclass
+class InfoEvent(DeviceEvent):
+    """Bekannte Informationszeile (Boot-Meldungen etc.)"""
+    __slots__ = ()
+
+@dataclass
+class StatusEvent(DeviceEvent):
+    """Kompletter STATUS-Block (=== ESP32 Status === ... ===) als ein Datensatz"""
+    device: str
+    wifi_connected: bool = False
+    ip: str = ""
+    rssi_dbm: int = None
+    udp_port: int = None
+    last_signal: str = ""
+    signal_count: int = None
+    last_heartbeat_ms: int = None
+    uptime_ms: int = None
+    free_heap: int = None
+    binary_mode: bool = None
+    frame_errors: int = None
+    broadcast: str = ""
+    signal_mapping: dict = field(default_factory=dict)
+    targets: dict = field(default_factory=dict)
+    fields: dict = field(default_factory=dict)
+    line_count: int = 0
+    complete: bool = True
+
+@dataclass
+class BinaryModeEvent(DeviceEvent):
+    """BINARY:OK / BINARY:AUS - Antwort auf das Binär-Angebot des Hosts"""
+    __slots__ = ('enabled',)
+    enabled: bool
+
+@dataclass
+class FrameErrorEvent(DeviceEvent):
+    """FRAME_ERR:<seq> - Binär-Frame mit falscher CRC verworfen"""
+    __slots__ = ('sequence',)
+    sequence: int
+
+@dataclass
+class MalformedLineEvent(DeviceEvent):
+    """Bekanntes Präfix, aber ungültiger Inhalt"""
+    __slots__ = ('reason',)
+    reason: str
+
+@dataclass
+class UnknownLineEvent(DeviceEvent):
+    """Nicht erkannte Zeile - wird weitergereicht statt verworfen"""
+    __slots__ = ()
+
+# ---------------------------------------------------------------------------
+# Einzelzeilen-Handler: (zeile, rest_nach_präfix) -> Event
+# ---------------------------------------------------------------------------
+
+def _parse_signal(line, rest):
+    try:
+        return SignalEvent(line, int(rest))
+    except ValueError:
+        return MalformedLineEvent(line, "SIGNAL ohne Ganzzahl")
+
+def _parse_clients(line, rest):
+    try:
+        return ClientsEvent(line, int(rest))
+    except ValueError:
+        return MalformedLineEvent(line, "Clients ohne Ganzzahl")
+
+def _split_address(line, rest, event_class):
+    address, sep, message = rest.partition(': ')
+    if not sep or not address:
+        return MalformedLineEvent(line, "Adresse ohne Nachricht")
+    return event_class(line, address, message)
+
+def _parse_udp_received(line, rest):
+    return _split_address(line, rest, UdpReceivedEvent)
+
+def _parse_udp_sent(line, rest):
+    return _split_address(line, rest, UdpSentEvent)
+
+def _parse_broadcast(line, rest):
+    signal, _, value = rest.partition(':')
+    if not signal:
+        return MalformedLineEvent(line, "Broadcast ohne Signal")
+    return BroadcastEvent(line, signal, value)
+
+def _parse_pin_on(line, rest):
+    # "12 für 1000 ms"
+    parts = rest.split()
+    try:
+        return PinEvent(line, int(parts[0]), True, int(parts[2]))
+    except (IndexError, ValueError):
+        return MalformedLineEvent(line, "Pin-Meldung ungültig")
+
+def _parse_pin_off(line, rest):
+    # "12 deaktiviert"
+    parts = rest.split()
+    if len(parts) != 2 or parts[1] != "deaktiviert":
+        return UnknownLineEvent(line)
+    try:
+        return PinEvent(line, int(parts[0]), False)
+    except ValueError:
+        return MalformedLineEvent(line, "Pin-Meldung ungültig")
+
+def _parse_wifi_connected(line, rest):
+    return WifiEvent(line, True, rest)
+
+def _parse_wifi_failed(line, rest):
+    return WifiEvent(line, False)
+
+def _parse_binary(line, rest):
+    if rest == "OK":
+        return BinaryModeEvent(line, True)
+    if rest == "AUS":
+        return BinaryModeEvent(line, False)
+    return MalformedLineEvent(line, "BINARY-Antwort unbekannt")
+
+def _parse_frame_error(line, rest):
+    try:
+        return FrameErrorEvent(line, int(rest))
+    except ValueError:
+        return MalformedLineEvent(line, "FRAME_ERR ohne Sequenznummer")
+
+def _event(event_class):
+    return lambda line, rest: event_class(line)
+
+def _with_rest(event_class):
+    return lambda line, rest: event_class(line, rest)
+
+STATUS_HEADERS = {
+    "=== ESP32 Status ===": "esp32",
+    "=== GIGA Status ===": "giga",
+}
+
+_PREFIX_HANDLERS = {
+    "SIGNAL:": _parse_signal,
+    "Clients:": _parse_clients,
+    "PONG": _event(PongEvent),
+    "UDP empfangen von ": _parse_udp_received,
+    "UDP gesendet an ": _parse_udp_sent,
+    "Broadcasting Signal: ": _parse_broadcast,
+    "Heartbeat-Timeout": _event(HeartbeatTimeoutEvent),
+    "Aktiviere Pin ": _parse_pin_on,
+    "Pin ": _parse_pin_off,
+    "WiFi verbunden! IP: ": _parse_wifi_connected,
+    "WiFi-Verbindung fehlgeschlagen": _parse_wifi_failed,
+    "WiFi-Verbindung verloren": _parse_wifi_failed,
+    "Serieller Befehl: ": _with_rest(CommandEchoEvent),
+    "Befehl empfangen: ": _with_rest(CommandEchoEvent),
+    "Unbekannter Befehl: ": _with_rest(UnknownCommandEvent),
+    "Unbekanntes Signal: ": _with_rest(UnknownSignalEvent),
+    "BINARY:": _parse_binary,
+    "FRAME_ERR:": _parse_frame_error,
+    "=== ESP32 UDP Receiver": _event(InfoEvent),
+    "=== Arduino GIGA UDP Sender": _event(InfoEvent),
+    "UDP Receiver gestartet": _event(InfoEvent),
+    "UDP Server gestartet": _event(InfoEvent),
+    "ESP32 bereit": _event(InfoEvent),
+    "GIGA bereit": _event(InfoEvent),
+    "Starte ESP32 Initialisierung": _event(InfoEvent),
+    "Teste Signal-Pins": _event(InfoEvent),
+    "Initialisierung abgeschlossen": _event(InfoEvent),
+    "Verbinde mit WiFi": _event(InfoEvent),
+}
+
+# Dispatch-Tabelle einmalig vorberechnen: die ersten Zeichen einer Zeile wählen
+# per Dictionary-Lookup die (meist einzige) passende Präfix-Regel aus, statt
+# für jede Zeile eine ganze startswith-Kette zu durchlaufen
+_KEY_LENGTH = min(len(prefix) for prefix in _PREFIX_HANDLERS)
+_DISPATCH = {}
+for _prefix, _handler in sorted(_PREFIX_HANDLERS.items(), key=lambda item: -len(item[0])):
+    _DISPATCH.setdefault(_prefix[:_KEY_LENGTH], []).append((_prefix, len(_prefix), _handler))
+_DISPATCH = {key: tuple(rules) for key, rules in _DISPATCH.items()}
+
+# Seitensignale sind im Betrieb der weit überwiegende Teil aller Zeilen und
+# wiederholen sich ständig: die üblichen Zeilen liefern per Dictionary-Lookup
+# ein vorab erzeugtes Event (kein int(), kein neues Objekt pro Zeile), alle
+# anderen umgehen die Tabelle über einen direkten startswith-Vergleich
+_SIGNAL_PREFIX = "SIGNAL:"
+_SIGNAL_LENGTH = len(_SIGNAL_PREFIX)
+_SIGNAL_EVENTS = {f"SIGNAL:{value}": SignalEvent(f"SIGNAL:{value}", value) for value in range(256)}
+
+def parse_line(line):
+    """Wandelt eine einzelne Zeile in ein Event (ohne STATUS-Block-Zustand)"""
+    event = _SIGNAL_EVENTS.get(line)
+    if event is not None:
+        return event
+    if line.startswith(_SIGNAL_PREFIX):
+        return _parse_signal(line, line[_SIGNAL_LENGTH:].strip())
+    rules = _DISPATCH.get(line[:_KEY_LENGTH])
+    if rules is not None:
+        for prefix, length, handler in rules:
+            if line.startswith(prefix):
+                return handler(line, line[length:].strip())
+    return UnknownLineEvent(line)
+
+# ---------------------------------------------------------------------------
+# STATUS-Block
+# ---------------------------------------------------------------------------
+
+def _leading_int(value):
+    """'-67 dBm' -> -67, '4711 ms ago' -> 4711; ungültig -> None"""
+    number = value.split(' ', 1)[0]
+    try:
+        return int(number)
+    except ValueError:
+        return None
+
+_STATUS_FIELDS = {
+    "WiFi": ('wifi_connected', lambda value: value == "Verbunden"),
+    "IP": ('ip', str),
+    "RSSI": ('rssi_dbm', _leading_int),
+    "UDP Port": ('udp_port', _leading_int),
+    "Letztes Signal": ('last_signal', str),
+    "Signal-Anzahl": ('signal_count', _leading_int),
+    "Letzter Heartbeat": ('last_heartbeat_ms', _leading_int),
+    "Uptime": ('uptime_ms', _leading_int),
+    "Freier Heap": ('free_heap', _leading_int),
+    "Binär-Modus": ('binary_mode', lambda value: value == "An"),
+    "Frame-Fehler": ('frame_errors', _leading_int),
+    "Broadcast": ('broadcast', str),
+}
+
+_STATUS_SECTIONS = {"Signal-Mapping:": 'signal_mapping', "ESP32 Ziele:": 'targets'}
+
+class _StatusBlock:
+    """Sammelt die Zeilen eines STATUS-Blocks"""
+
+    def __init__(self, header, device):
+        self.header = header
+        self.device = device
+        self.values = {}
+        self.fields = {}
+        self.signal_mapping = {}
+        self.targets = {}
+        self.section = None
+        self.line_count = 1
+
+    def add(self, line):
+        """Übernimmt eine Zeile; False wenn sie nicht zum Block gehört"""
+        if line in _STATUS_SECTIONS:
+            self.section = _STATUS_SECTIONS[line]
+        elif self.section == 'signal_mapping' and ' -> ' in line:
+            signal, _, target = line.partition(' -> ')
+            self.signal_mapping[signal] = _leading_int(target.replace('Pin ', '', 1))
+        elif self.section == 'targets' and ': ' in line:
+            name, _, address = line.partition(': ')
+            self.targets[name] = address
+        else:
+            key, sep, value = line.partition(': ')
+            if not sep or not key or key[0] == ' ':
+                return False
+            field_spec = _STATUS_FIELDS.get(key)
+            if field_spec is None:
+                # Neuere Firmware mit weiteren Feldern: nur in fields übernehmen,
+                # solange die Zeile keine bekannte Einzelzeile ist
+                if not isinstance(parse_line(line), UnknownLineEvent):
+                    return False
+            else:
+                attribute, convert = field_spec
+                self.values[attribute] = convert(value)
+            self.fields[key] = value
+        self.line_count += 1
+        return True
+
+    def to_event(self, complete):
+        """Erzeugt das StatusEvent"""
+        return StatusEvent(
+            self.header,
+            device=self.device,
+            signal_mapping=self.signal_mapping,
+            targets=self.targets,
+            fields=self.fields,
+            line_count=self.line_count + (1 if complete else 0),  # inkl. Endzeile
+            complete=complete,
+            **self.values
+        )
+
+def _is_block_end(line):
+    return line.startswith("===") and not line.strip('=')
+
+class ProtocolParser:
+    """Zustandsbehafteter Parser pro Gerät (fasst STATUS-Blöcke zusammen)"""
+
+    def __init__(self, max_block_lines=64):
+        self.max_block_lines = max_block_lines
+        self._block = None
+
+    def feed(self, lines):
+        """Parst mehrere Zeilen und gibt die daraus entstandenen Events zurück"""
+        events = []
+        append = events.append
+        dispatch = _DISPATCH
+        signal_events = _SIGNAL_EVENTS
+        for line in lines:
+            if self._block is None:
+                # Schneller Pfad (inline parse_line): SIGNAL direkt, sonst eine Tabellen-Suche
+                event = signal_events.get(line)
+                if event is not None:
+                    append(event)
+                    continue
+                if line.startswith("SIGNAL:"):
+                    try:
+                        append(SignalEvent(line, int(line[7:])))
+                    except ValueError:
+                        append(_parse_signal(line, line[7:].strip()))
+                    continue
+                if line not in STATUS_HEADERS:
+                    rules = dispatch.get(line[:_KEY_LENGTH])
+                    if rules is not None:
+                        for prefix, length, handler in rules:
+                            if line.startswith(prefix):
+                                append(handler(line, line[length:].strip()))
+                                break
+                        else:
+                            append(UnknownLineEvent(line))
+                    else:
+                        append(UnknownLineEvent(line))
+                    continue
+            self._parse_block_line(line, events)
+        return events
+
+    def _parse_block_line(self, line, events):
+        """Verarbeitet Zeilen rund um einen STATUS-Block"""
+        block = self._block
+        if block is not None:
+            if _is_block_end(line):
+                events.append(block.to_event(True))
+                self._block = None
+                return
+            if block.add(line):
+                if block.line_count >= self.max_block_lines:
+                    events.append(block.to_event(False))
+                    self._block = None
+                return
+            # Block wurde unterbrochen - unvollständig melden, Zeile normal verarbeiten
+            events.append(block.to_event(False))
+            self._block = None
+
+        device = STATUS_HEADERS.get(line)
+        if device is not None:
+            self._block = _StatusBlock(line, device)
+            return
+
+        events.append(parse_line(line))
+
+    def flush(self):
+        """Gibt einen angefangenen STATUS-Block als unvollständiges Event zurück"""
+        events = []
+        if self._block is not None:
+            events.append(self._block.to_event(False))
+            self._block = None
+        return events
+
+    def reset(self):
+        """Verwirft einen angefangenen STATUS-Block"""
+        self._block = None
@@ -0,0 +1,170 @@
+# core/ring_queue.py
+"""
+Begrenzte Empfangs-Queue mit Überlauf-Strategie und Zählern für Verluste und Höchststand
+"""
+
+import queue
+import threading
+from collections import deque
+
+POLICIES = ("drop_oldest", "latest_signal", "block")
+
+class RingQueue:
+    """Begrenzte FIFO zwischen Lese-Thread und UI mit der Schnittstelle von queue.Queue
+
+    Ist die Queue voll, entscheidet policy:
+      drop_oldest    ältesten Eintrag verwerfen (UI sieht nur die jüngsten maxsize)
+      latest_signal  ein neues Signal ersetzt das jüngste noch nicht abgeholte
+                     Signal mit gleichem Schlüssel (signal_key(item), None =
+                     kein Signal), statt den ältesten Eintrag zu verwerfen -
+                     nach einem UI-Hänger wird nur die aktuelle Seite
+                     nachgeholt. Ohne wartendes Signal wie drop_oldest.
+      block          put() wartet auf Platz, höchstens block_timeout Sekunden,
+                     danach wird der neue Eintrag verworfen. Bremst den
+                     Lese-Thread (beim Reactor: alle Geräte), der Rest staut
+                     sich im OS-Puffer.
+
+    Ein Lock ohne Benachrichtigung pro put(); drain() holt alles auf einmal.
+    """
+
+    def __init__(self, maxsize=256, policy="drop_oldest", signal_key=None, block_timeout=1.0):
+        if policy not in POLICIES:
+            raise ValueError(f"Unbekannte Queue-Strategie: {policy} (erlaubt: {', '.join(POLICIES)})")
+        self.maxsize = max(1, int(maxsize))
+        self.policy = policy
+        self.signal_key = signal_key
+        self.block_timeout = block_timeout
+        self.dropped = 0            # wegen Überlauf verworfen
+        self.superseded = 0         # durch ein neueres Signal ersetzt (latest_signal)
+        self.high_water = 0         # höchster Füllstand seit dem Start
+        self.total = 0              # insgesamt angenommene Einträge
+        self._items = deque()
+        self._pending_signals = {}  # Schlüssel -> noch nicht abgeholtes Signal
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._waiting_get = 0
+        self._waiting_put = 0
+
+    def put(self, item, block=True, timeout=None):
+        """Eintrag anhängen; verwirft nach policy statt unbegrenzt zu wachsen"""
+        key = self.signal_key(item) if self.signal_key and self.policy == "latest_signal" else None
+        with self._lock:
+            items = self._items
+            if key is not None and len(items) >= self.maxsize and key in self._pending_signals:
+                # Nur bei vollem Puffer - sonst sieht die UI jedes Signal
+                self._remove(self._pending_signals[key])
+                self.superseded += 1
+
+            if len(items) >= self.maxsize:
+                if self.policy == "block":
+                    if block:
+                        self._waiting_put += 1
+                        try:
+                            self._not_full.wait_for(lambda: len(items) < self.maxsize,
+                                                    self.block_timeout if timeout is None else timeout)
+                        finally:
+                            self._waiting_put -= 1
+                    if len(items) >= self.maxsize:
+                        self.dropped += 1
+                        return False
+                else:
+                    self._forget(items.popleft())
+                    self.dropped += 1
+
+            items.append(item)
+            if key is not None:
+                self._pending_signals[key] = item
+            self.total += 1
+            if len(items) > self.high_water:
+                self.high_water = len(items)
+            if self._waiting_get:
+                self._not_empty.notify()
+        return True
+
+    def put_nowait(self, item):
+        return self.put(item, block=False)
+
+    def get(self, block=True, timeout=None):
+        """Ältesten Eintrag holen (wie queue.Queue.get, leer -> queue.Empty)"""
+        with self._lock:
+            if not self._items:
+                if not block:
+                    raise queue.Empty
+                self._waiting_get += 1
+                try:
+                    self._not_empty.wait_for(lambda: self._items, timeout)
+                finally:
+                    self._waiting_get -= 1
+                if not self._items:
+                    raise queue.Empty
+            item = self._items.popleft()
+            self._forget(item)
+            if self._waiting_put:
+                self._not_full.notify()
+            return item
+
+    def get_nowait(self):
+        return self.get(block=False)
+
+    def drain(self):
+        """Alle Einträge auf einmal holen (ein Lock statt einem pro Eintrag)"""
+        with self._lock:
+            items = list(self._items)
+            self._items.clear()
+            self._pending_signals.clear()
+            if self._waiting_put:
+                self._not_full.notify_all()
+            return items
+
+    def empty(self):
+        return not self._items
+
+    def full(self):
+        return len(self._items) >= self.maxsize
+
+    def qsize(self):
+        return len(self._items)
+
+    def get_stats(self):
+        """Zähler für Status-Anzeigen"""
+        return {
+            'size': len(self._items),
+            'maxsize': self.maxsize,
+            'high_water': self.high_water,
+            'dropped': self.dropped,
+            'superseded': self.superseded,
+            'total': self.total,
+            'policy': self.policy,
+        }
+
+    def _remove(self, item):
+        """Bestimmten Eintrag (Identität, nicht Gleichheit) entfernen"""
+        for index, queued in enumerate(self._items):
+            if queued is item:
+                del self._items[index]
+                break
+
+    def _forget(self, item):
+        if self._pending_signals and self.signal_key:
+            key = self.signal_key(item)
+            if key is not None and self._pending_signals.get(key) is item:
+                del self._pending_signals[key]
+
+def queue_stats_text(stats):
+    """Kurzform der Zähler einer oder mehrerer Queues (Summe) für Status-Anzeigen"""
+    if isinstance(stats, dict):
+        stats = [stats]
+    stats = list(stats)
+    if not stats:
+        return "Queue: -"
+    high_water = max(s['high_water'] for s in stats)
+    maxsize = max(s['maxsize'] for s in stats)
+    dropped = sum(s['dropped'] for s in stats)
+    superseded = sum(s['superseded'] for s in stats)
+    text = f"Queue: max {high_water}/{maxsize}"
+    if dropped:
+        text += f" · {dropped} verworfen"
+    if superseded:
+        text += f" · {superseded} ersetzt"
+    return text
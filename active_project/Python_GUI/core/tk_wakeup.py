@@ -0,0 +1,101 @@
+# core/tk_wakeup.py
+"""
+Weckt den Tk-Mainloop aus Lese-Threads, statt die Daten-Queue per after() zu pollen
+"""
+
+import os
+import tkinter as tk
+
+WAKEUP_EVENT = "<<HardwareData>>"
+
+class TkWakeup:
+    """Brücke Thread -> Tk: notify() aus beliebigen Threads, callback() läuft im Tk-Thread
+
+    Unter Unix schreibt notify() ein Byte in eine Self-Pipe, die per
+    createfilehandler im Tk-Mainloop registriert ist. Ohne createfilehandler
+    (Windows) wird ein virtuelles Event per event_generate eingereiht.
+    Mehrere notify()-Aufrufe vor dem nächsten Durchlauf werden zu einem
+    einzigen callback()-Aufruf zusammengefasst - der Callback leert die
+    Queue daher immer komplett.
+    """
+
+    def __init__(self, root, callback):
+        self.root = root
+        self.callback = callback
+        self.mode = None
+        self._pending = False
+        self._read_fd = None
+        self._write_fd = None
+
+        try:
+            self._read_fd, self._write_fd = os.pipe()
+            os.set_blocking(self._read_fd, False)
+            os.set_blocking(self._write_fd, False)
+            root.tk.createfilehandler(self._read_fd, tk.READABLE, self._on_readable)
+            self.mode = "filehandler"
+        except (AttributeError, OSError, RuntimeError, tk.TclError):
+            self._close_pipe()
+            root.bind(WAKEUP_EVENT, self._on_event)
+            self.mode = "event"
+
+    def notify(self):
+        """Meldet neue Daten (thread-sicher, blockiert nie)"""
+        if self._pending:
+            return
+        self._pending = True
+
+        try:
+            if self.mode == "filehandler":
+                os.write(self._write_fd, b'\0')
+            elif self.mode == "event":
+                self.root.event_generate(WAKEUP_EVENT, when="tail")
+        except (BlockingIOError, OSError, RuntimeError, tk.TclError):
+            pass  # Pipe voll oder Fenster geschlossen - Wakeup steht ohnehin aus
+
+    def close(self):
+        """Meldet den Datei-Handler ab und schließt die Pipe"""
+        if self.mode == "filehandler":
+            try:
+                self.root.tk.deletefilehandler(self._read_fd)
+            except tk.TclError:
+                pass
+            self._close_pipe()
+        elif self.mode == "event":
+            try:
+                self.root.unbind(WAKEUP_EVENT)
+            except tk.TclError:
+                pass
+        self.mode = None
+
+    def _on_readable(self, fd, mask):
+        """Tk-Thread: Pipe leeren und Callback einmal ausführen"""
+        # Erst leeren, dann zurücksetzen: andersherum könnte das Leeren das
+        # Byte eines notify() schlucken, das _pending gerade wieder gesetzt
+        # hat - dann bliebe _pending ohne Byte in der Pipe hängen und jeder
+        # weitere notify() würde übergangen. So erzeugt ein notify() nach
+        # dem Zurücksetzen immer einen neuen Wakeup, einer davor wird vom
+        # folgenden callback() mit abgearbeitet.
+        try:
+            while os.read(fd, 512):
+                pass
+        except (BlockingIOError, OSError):
+            pass
+        self._pending = False
+        self.callback()
+
+    def _on_event(self, event=None):
+        """Tk-Thread: virtuelles Event empfangen"""
+        self._pending = False
+        self.callback()
+
+    def _close_pipe(self):
+        for fd in (self._read_fd, self._write_fd):
+            if fd is not None:
+                os.close(fd)
+        self._read_fd = self._write_fd = None
+
+def bind_bus(root, event_bus):
+    """Im Tk-Thread aufrufen: Handler mit thread="ui" laufen im Tk-Thread -> TkWakeup (zum Schließen)"""
+    wakeup = TkWakeup(root, event_bus.dispatch_pending)
+    event_bus.bind_ui(wakeup.notify)
+    return wakeup
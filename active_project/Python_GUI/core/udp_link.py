@@ -0,0 +1,434 @@
+# core/udp_link.py
+"""
+asyncio-Endpunkt für Signale mit Bestätigung: Umlaufzeit, Verlustrate und Uhrversatz pro ESP32
+"""
+
+import time
+import random
+import asyncio
+import threading
+from collections import deque
+from concurrent.futures import Future, InvalidStateError
+from core.logger import logger
+from core.udp_transport import ESP32_UDP_PORT, parse_address
+
+HEARTBEAT_SIGNAL = "heartbeat"
+ACK_PREFIX = "ack:"
+SEQUENCE_MODULO = 65536
+LOSS_WINDOW = 50        # Verlustrate über die letzten ... Pakete
+OFFSET_WINDOW = 8       # Uhrversatz aus der schnellsten der letzten ... Antworten
+MIN_RTO = 0.02          # Sekunden - Untergrenze für das Wiederholungs-Timeout
+MAX_RTO = 2.0           # Sekunden - Obergrenze, auch nach Verdopplung
+
+def link_packet(signal_id, value, sequence):
+    """Paket mit Sequenznummer als drittem Feld - ältere Firmware wertet nur signal:value aus"""
+    return f"{signal_id}:{value}:{sequence}".encode('utf-8')
+
+def parse_ack(data):
+    """b'ack:<seq>:<millis>' -> (seq, millis) oder None"""
+    try:
+        text = data.decode('utf-8').strip()
+    except UnicodeDecodeError:
+        return None
+    if not text.startswith(ACK_PREFIX):
+        return None
+    parts = text[len(ACK_PREFIX):].split(":")
+    if len(parts) != 2 or not parts[0].isdigit() or not parts[1].isdigit():
+        return None
+    return int(parts[0]), int(parts[1])
+
+def _resolve(future, error=None):
+    """Future erfüllen, falls es nicht inzwischen abgebrochen wurde"""
+    try:
+        if not future.set_running_or_notify_cancel():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(True)
+    except (InvalidStateError, RuntimeError):
+        pass
+
+def _in_loop(loop):
+    """Läuft der Aufrufer im Thread von loop? (dann nicht auf loop warten)"""
+    try:
+        return asyncio.get_running_loop() is loop
+    except RuntimeError:
+        return False
+
+class LinkStats:
+    """Verbindungsqualität eines Empfängers"""
+
+    def __init__(self):
+        self.sent = 0
+        self.acked = 0
+        self.lost = 0
+        self.rtt_ms = None          # letzte Umlaufzeit
+        self.srtt_ms = None         # geglättet (wie TCP, Faktor 1/8)
+        self.rttvar_ms = None       # Schwankung der Umlaufzeit (Faktor 1/4)
+        self.min_rtt_ms = None
+        self.clock_offset_ms = None # Geräte-millis() minus Host-Uhr (perf_counter in ms)
+        self.last_ack = None        # monotonic() der letzten Antwort
+        self.retransmits = 0
+        self.superseded = 0         # durch ein neueres Signal abgelöst, nicht wiederholt
+        self.failed = 0             # Signale ohne Bestätigung nach allen Wiederholungen
+        self.outcomes = deque(maxlen=LOSS_WINDOW)
+        self._offsets = deque(maxlen=OFFSET_WINDOW)
+
+    def record_ack(self, rtt_ms=None, offset_ms=None):
+        """Antwort zählen; ohne rtt_ms (Ack auf ein wiederholtes Paket) keine Messung"""
+        self.acked += 1
+        self.outcomes.append(True)
+        self.last_ack = time.monotonic()
+        if rtt_ms is None:
+            return
+        self.rtt_ms = rtt_ms
+        if self.srtt_ms is None:
+            self.srtt_ms, self.rttvar_ms = rtt_ms, rtt_ms / 2
+        else:
+            # RFC 6298: erst die Schwankung mit dem alten Mittelwert, dann den Mittelwert
+            self.rttvar_ms += (abs(self.srtt_ms - rtt_ms) - self.rttvar_ms) / 4
+            self.srtt_ms += (rtt_ms - self.srtt_ms) / 8
+        self.min_rtt_ms = rtt_ms if self.min_rtt_ms is None else min(self.min_rtt_ms, rtt_ms)
+        # Bei der schnellsten Antwort ist die Annahme "Hin- = Rückweg" am wenigsten falsch
+        self._offsets.append((rtt_ms, offset_ms))
+        self.clock_offset_ms = min(self._offsets)[1]
+
+    def record_loss(self):
+        self.lost += 1
+        self.outcomes.append(False)
+
+    def rto(self, initial):
+        """Wiederholungs-Timeout in Sekunden: srtt + 4 * rttvar, ohne Messung initial"""
+        if self.srtt_ms is None:
+            return initial
+        return min(MAX_RTO, max(MIN_RTO, (self.srtt_ms + 4 * self.rttvar_ms) / 1000))
+
+    def loss_rate(self):
+        """Anteil unbeantworteter Pakete im Fenster (None ohne Messung)"""
+        if not self.outcomes:
+            return None
+        return self.outcomes.count(False) / len(self.outcomes)
+
+    def as_dict(self):
+        return {
+            'sent': self.sent,
+            'acked': self.acked,
+            'lost': self.lost,
+            'rtt_ms': self.rtt_ms,
+            'srtt_ms': self.srtt_ms,
+            'min_rtt_ms': self.min_rtt_ms,
+            'rttvar_ms': self.rttvar_ms,
+            'loss_rate': self.loss_rate(),
+            'clock_offset_ms': self.clock_offset_ms,
+            'retransmits': self.retransmits,
+            'superseded': self.superseded,
+            'failed': self.failed,
+            'age': None if self.last_ack is None else time.monotonic() - self.last_ack,
+        }
+
+def link_quality_text(quality):
+    """Kurzform für Status-Anzeigen: '📶 4 ms · 2 % Verlust'"""
+    if not quality or quality['sent'] == 0:
+        return "📶 -"
+    if quality['srtt_ms'] is None:
+        return "📶 keine Antwort"
+    rtt = quality['srtt_ms']
+    text = f"📶 {rtt:.1f} ms" if rtt < 10 else f"📶 {rtt:.0f} ms"
+    if quality['loss_rate']:
+        text += f" · {quality['loss_rate']:.0%} Verlust"
+    return text
+
+class UdpLink:
+    """Direkter UDP-Weg zu den ESP32s mit Bestätigungen (asyncio im eigenen Thread)
+
+    Wie UdpTransport, aber jedes Paket trägt eine Sequenznummer
+    (signal:value:seq) und der ESP32 antwortet an den Absender mit
+    ack:seq:millis. Daraus ergeben sich pro Empfänger Umlaufzeit,
+    Verlustrate und der Versatz der Geräte-Uhr. Zusätzlich geht alle
+    heartbeat_interval Sekunden ein heartbeat an jeden ESP32 - so bleibt
+    die Messung aktuell, auch wenn gerade keine Seite wechselt.
+
+    send_signal() liefert pro Ziel ein Future: erfüllt mit der Bestätigung,
+    TimeoutError wenn auch nach max_retries Wiederholungen keine kommt.
+    Wiederholt wird dasselbe Paket (gleiche Sequenznummer, der ESP32
+    bestätigt es erneut, führt es aber nicht noch einmal aus) nach dem
+    Timeout aus gemessener Umlaufzeit (srtt + 4 * rttvar, vor der ersten
+    Messung ack_timeout), bei jeder Wiederholung verdoppelt. Ein neues
+    Signal an ein Ziel löst das dort noch unbestätigte ab: dessen Future
+    wird abgebrochen (cancelled) und nie wieder gesendet; kommt ein altes
+    Paket verspätet doch noch an, verwirft es der ESP32 anhand der
+    Sequenznummer. Heartbeats werden nicht
+    wiederholt. on_update(rolle, qualität) läuft im Loop-Thread nach jeder
+    Antwort bzw. jedem Verlust.
+    """
+
+    name = "UDP Link"
+    confirms = True     # Futures sind erst mit dem Ack des Empfängers fertig
+
+    def __init__(self, targets, port=ESP32_UDP_PORT, heartbeat_interval=2.0, ack_timeout=0.5,
+                 on_update=None, max_retries=4):
+        self.targets = {role: parse_address(address, port) for role, address in targets.items()}
+        self.heartbeat_interval = heartbeat_interval
+        self.ack_timeout = ack_timeout
+        self.max_retries = max_retries
+        self.on_update = on_update
+        self.stats = {role: LinkStats() for role in self.targets}
+        self.loop = None
+        self.transport = None
+        self._pending = {}          # seq -> _Pending
+        self._current = {}          # rolle -> seq des letzten noch unbestätigten Signals
+        # Zufälliger Start: nach einem Neustart des Hosts hält der ESP32 die neuen
+        # Pakete nicht für Wiederholungen der alten
+        self._sequence = random.randrange(SEQUENCE_MODULO)
+        self._thread = None         # eigener Loop-Thread (nicht bei geteiltem Loop)
+        self._heartbeat = None
+        self._ready = threading.Event()
+
+    # --- Lebenszyklus (aufrufender Thread) ---------------------------------
+
+    def open(self, loop=None):
+        """Öffnet den Socket -> True wenn bereit
+
+        Ohne loop startet ein eigener Loop-Thread. Mit loop (läuft bereits in
+        einem anderen Thread, z.B. im AsyncHardwareService) teilt sich der
+        Link dessen Thread.
+        """
+        if self._thread is not None or self.loop is not None:
+            return self.is_open()
+        if loop is not None:
+            self.loop = loop
+            try:
+                asyncio.run_coroutine_threadsafe(self._start(), loop).result(2.0)
+            except Exception as e:
+                logger.error(f"{self.name}: Socket konnte nicht geöffnet werden: {e}")
+                self.loop = None
+            return self.is_open()
+        self._ready.clear()
+        self._thread = threading.Thread(target=self._run, name="UdpLink", daemon=True)
+        self._thread.start()
+        self._ready.wait(2.0)
+        return self.is_open()
+
+    def close(self):
+        """Beendet den Link; offene Futures scheitern mit ConnectionError"""
+        loop, thread = self.loop, self._thread
+        if loop is None:
+            return
+        if thread is None:
+            # Geteilter Loop: nur Socket und Heartbeat beenden, der Loop läuft weiter
+            shutdown = asyncio.run_coroutine_threadsafe(self._shutdown(), loop)
+            if not _in_loop(loop):
+                try:
+                    shutdown.result(2.0)
+                except Exception:
+                    pass
+            self.loop = None
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not threading.current_thread():
+            thread.join(2.0)
+        self._thread = None
+
+    def is_open(self):
+        return self.transport is not None
+
+    def send_signal(self, signal_id, value=1, roles=None):
+        """Sendet signal_id:value an alle (bzw. die angegebenen) Ziele -> {rolle: Future}"""
+        futures = {role: Future() for role in self.targets if roles is None or role in roles}
+        loop = self.loop
+        if not self.is_open() or loop is None:
+            for future in futures.values():
+                _resolve(future, ConnectionError(f"{self.name}: nicht geöffnet"))
+            return futures
+        loop.call_soon_threadsafe(self._send_all, signal_id, value, futures)
+        return futures
+
+    def link_quality(self):
+        """{rolle: LinkStats.as_dict()}"""
+        return {role: stats.as_dict() for role, stats in self.stats.items()}
+
+    def get_stats(self):
+        return {
+            'targets': len(self.targets),
+            'sent': sum(stats.sent for stats in self.stats.values()),
+            'acked': sum(stats.acked for stats in self.stats.values()),
+            'lost': sum(stats.lost for stats in self.stats.values()),
+            'retransmits': sum(stats.retransmits for stats in self.stats.values()),
+            'superseded': sum(stats.superseded for stats in self.stats.values()),
+            'failed': sum(stats.failed for stats in self.stats.values()),
+            'pending': len(self._pending),
+        }
+
+    # --- Loop-Thread -------------------------------------------------------
+
+    def _run(self):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self.loop = loop
+        try:
+            loop.run_until_complete(self._start())
+            self._ready.set()
+            loop.run_forever()
+        except OSError as e:
+            logger.error(f"{self.name}: Socket konnte nicht geöffnet werden: {e}")
+        finally:
+            self._ready.set()
+            loop.run_until_complete(self._shutdown())
+            loop.close()
+            self.loop = None
+
+    async def _start(self):
+        loop = asyncio.get_running_loop()
+        self.transport, _ = await loop.create_datagram_endpoint(
+            lambda: _LinkProtocol(self), local_addr=("0.0.0.0", 0))
+        logger.info(f"📡 {self.name}: {len(self.targets)} Ziele, Antworten auf Port "
+                    f"{self.transport.get_extra_info('sockname')[1]}")
+        if self.heartbeat_interval:
+            self._heartbeat = loop.create_task(self._heartbeat_loop())
+
+    async def _shutdown(self):
+        heartbeat, self._heartbeat = self._heartbeat, None
+        if heartbeat is not None:
+            heartbeat.cancel()
+            try:
+                await heartbeat
+            except asyncio.CancelledError:
+                pass
+        if self.transport is not None:
+            self.transport.close()
+            self.transport = None
+        for pending in self._pending.values():
+            pending.timer.cancel()
+            if pending.future is not None:
+                _resolve(pending.future, ConnectionError(f"{self.name}: geschlossen"))
+        self._pending.clear()
+        self._current.clear()
+
+    async def _heartbeat_loop(self):
+        while True:
+            millis = int(time.perf_counter() * 1000) % 2 ** 32
+            for role in self.targets:
+                self._send(role, HEARTBEAT_SIGNAL, millis, None)
+            await asyncio.sleep(self.heartbeat_interval)
+
+    def _send_all(self, signal_id, value, futures):
+        for role, future in futures.items():
+            self._supersede(role)
+            self._current[role] = self._send(role, signal_id, value, future)
+
+    def _supersede(self, role):
+        """Noch unbestätigtes Signal an role verwerfen - es wird nicht mehr wiederholt"""
+        pending = self._pending.pop(self._current.pop(role, None), None)
+        if pending is None:
+            return
+        pending.timer.cancel()
+        pending.future.cancel()
+        self.stats[role].superseded += 1
+
+    def _send(self, role, signal_id, value, future):
+        if self.transport is None:
+            if future is not None:
+                _resolve(future, ConnectionError(f"{self.name}: nicht geöffnet"))
+            return None
+        self._sequence = (self._sequence + 1) % SEQUENCE_MODULO
+        sequence = self._sequence
+        stale = self._pending.pop(sequence, None)
+        if stale is not None:
+            # Sequenznummer wurde nach 65536 Paketen wieder vergeben
+            stale.timer.cancel()
+            self._give_up(sequence, stale)
+        pending = _Pending(role, link_packet(signal_id, value, sequence), future)
+        self._pending[sequence] = pending
+        self._transmit(sequence, pending)
+        return sequence
+
+    def _transmit(self, sequence, pending):
+        stats = self.stats[pending.role]
+        if pending.attempts:
+            stats.retransmits += 1
+        pending.attempts += 1
+        pending.sent = time.perf_counter()
+        self.transport.sendto(pending.packet, self.targets[pending.role])
+        stats.sent += 1
+        # Exponentielles Backoff ab dem zweiten Versuch
+        timeout = min(MAX_RTO, stats.rto(self.ack_timeout) * 2 ** (pending.attempts - 1))
+        pending.timer = asyncio.get_running_loop().call_later(timeout, self._expire, sequence)
+
+    def _expire(self, sequence):
+        pending = self._pending.get(sequence)
+        if pending is None:
+            return
+        self.stats[pending.role].record_loss()
+        future = pending.future
+        if future is not None and future.cancelled():
+            # Vom Aufrufer abgebrochen: nicht weiter wiederholen
+            self._pending.pop(sequence)
+        elif future is not None and pending.attempts <= self.max_retries and self.transport is not None:
+            self._transmit(sequence, pending)
+        else:
+            self._pending.pop(sequence)
+            self._give_up(sequence, pending)
+        self._notify(pending.role)
+
+    def _give_up(self, sequence, pending):
+        if self._current.get(pending.role) == sequence:
+            del self._current[pending.role]
+        if pending.future is not None:
+            self.stats[pending.role].failed += 1
+            _resolve(pending.future, TimeoutError(
+                f"{pending.role}: keine Bestätigung für Paket {sequence} nach "
+                f"{pending.attempts} Versuch{'en' if pending.attempts != 1 else ''}"))
+
+    def _datagram(self, data):
+        ack = parse_ack(data)
+        if ack is None:
+            return
+        sequence, device_millis = ack
+        pending = self._pending.pop(sequence, None)
+        if pending is None:
+            return  # Zu spät (abgelöst oder aufgegeben) oder doppelt
+        received = time.perf_counter()
+        pending.timer.cancel()
+        if self._current.get(pending.role) == sequence:
+            del self._current[pending.role]
+        if pending.attempts == 1:
+            rtt_ms = (received - pending.sent) * 1000
+            self.stats[pending.role].record_ack(rtt_ms, device_millis - (pending.sent * 1000 + rtt_ms / 2))
+        else:
+            # Karn: unklar, auf welchen Versuch der Ack antwortet - keine RTT-Messung
+            self.stats[pending.role].record_ack()
+        if pending.future is not None:
+            _resolve(pending.future)
+        self._notify(pending.role)
+
+    def _notify(self, role):
+        if self.on_update:
+            try:
+                self.on_update(role, self.stats[role].as_dict())
+            except Exception as e:
+                logger.error(f"{self.name}: Fehler in on_update: {e}")
+
+class _Pending:
+    """Gesendetes Paket, auf dessen Ack gewartet wird (nur im Loop-Thread)"""
+
+    __slots__ = ('role', 'packet', 'future', 'attempts', 'sent', 'timer')
+
+    def __init__(self, role, packet, future):
+        self.role = role
+        self.packet = packet
+        self.future = future        # None bei Heartbeats
+        self.attempts = 0
+        self.sent = 0.0             # perf_counter() des letzten Versuchs
+        self.timer = None
+
+class _LinkProtocol(asyncio.DatagramProtocol):
+    def __init__(self, link):
+        self.link = link
+
+    def datagram_received(self, data, addr):
+        self.link._datagram(data)
+
+    def error_received(self, exc):
+        # z.B. ICMP "Port unreachable" - der Verlust zählt über den Ack-Timeout
+        logger.debug(f"{self.link.name}: {exc}")
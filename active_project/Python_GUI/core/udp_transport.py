@@ -0,0 +1,103 @@
+# core/udp_transport.py
+"""
+Sendet Seitensignale direkt vom Host an die ESP32s - ohne den Umweg über den GIGA
+"""
+
+import time
+import socket
+from concurrent.futures import Future
+from core.logger import logger
+
+ESP32_UDP_PORT = 8889   # localPort im ESP32-Sketch
+
+def parse_address(target, default_port=ESP32_UDP_PORT):
+    """'192.168.1.100' oder 'host:port' -> (host, port)"""
+    if isinstance(target, (tuple, list)):
+        return target[0], int(target[1])
+    host, _, port = str(target).rpartition(":")
+    if host and port.isdigit():
+        return host, int(port)
+    return str(target), default_port
+
+def _finished(result=True, error=None):
+    """Bereits erfülltes Future (sendto blockiert nicht - es gibt nichts zu warten)"""
+    future = Future()
+    future.set_running_or_notify_cancel()
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+    return future
+
+class UdpTransport:
+    """Direkter Signalweg Host -> ESP32 per UDP
+
+    Pakete haben dasselbe Format wie vom GIGA-Sketch ("signal:value"),
+    processUDPPacket() im ESP32 unterscheidet die Absender nicht. Ein
+    Paket kostet nur den sendto()-Aufruf; der GIGA blockiert dagegen nach
+    jedem Paket 50 ms für seine LED. UDP bestätigt nichts - das Future
+    eines Ziels meldet nur, dass das Paket den Host verlassen hat.
+    Ziele: {rolle: adresse} (adresse wie bei parse_address).
+    """
+
+    name = "UDP direkt"
+    confirms = False    # Futures sind fertig, sobald das Paket gesendet ist
+
+    def __init__(self, targets, port=ESP32_UDP_PORT):
+        self.targets = {role: parse_address(address, port) for role, address in targets.items()}
+        self.socket = None
+        self.sent = 0
+        self.failed = 0
+        self.last_send_us = 0.0
+
+    def open(self):
+        """Öffnet den (nicht blockierenden) Sende-Socket"""
+        if self.socket is None:
+            self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            self.socket.setblocking(False)
+            logger.info(f"📡 {self.name}: {len(self.targets)} Ziele "
+                        f"({', '.join(f'{host}:{port}' for host, port in self.targets.values())})")
+        return True
+
+    def close(self):
+        if self.socket is not None:
+            self.socket.close()
+            self.socket = None
+
+    def is_open(self):
+        return self.socket is not None
+
+    def send_signal(self, signal_id, value=1, roles=None):
+        """Sendet signal_id:value an alle (bzw. die angegebenen) Ziele -> {rolle: Future}"""
+        if self.socket is None:
+            return {}
+        packet = f"{signal_id}:{value}".encode('utf-8')
+        futures = {}
+        start = time.perf_counter()
+        for role, address in self.targets.items():
+            if roles is not None and role not in roles:
+                continue
+            try:
+                self.socket.sendto(packet, address)
+            except OSError as e:
+                # z.B. Netz nicht erreichbar oder Sendepuffer voll
+                self.failed += 1
+                logger.warning(f"{self.name}: Senden an {role} ({address[0]}) fehlgeschlagen: {e}")
+                futures[role] = _finished(error=e)
+            else:
+                self.sent += 1
+                futures[role] = _finished()
+        self.last_send_us = (time.perf_counter() - start) * 1_000_000
+        return futures
+
+    def link_quality(self):
+        """Ohne Bestätigungen keine Messung - siehe UdpLink"""
+        return {}
+
+    def get_stats(self):
+        return {
+            'targets': len(self.targets),
+            'sent': self.sent,
+            'failed': self.failed,
+            'last_send_us': self.last_send_us,
+        }
@@ -30,10 +30,21 @@ class HardwareDevice:
     last_signal: Optional[int] = None
     client_count: int = 0
     error_message: str = ""
+    ready: bool = False                  # Hat auf PING mit PONG geantwortet
+    ready_time: Optional[float] = None   # Sekunden vom Öffnen des Ports bis PONG
+    rtt_ms: Optional[float] = None       # Geglättete UDP-Umlaufzeit (UdpLink)
+    loss_rate: Optional[float] = None    # Anteil unbestätigter UDP-Pakete (letzte 50)
+    clock_offset_ms: Optional[float] = None  # Geräte-millis() minus Host-Uhr
+    link_age: Optional[float] = None     # Sekunden seit dem letzten Ack
+    name: str = ""                       # Eigener Anzeigename (Geräte über ESP32.1-3 hinaus)
+    last_seen: Optional[float] = None    # time.time() der letzten empfangenen Zeile
+    alive: bool = False                  # Sendet (oder antwortet auf PING) - LivenessTracker
     
     @property
     def display_name(self) -> str:
         """Anzeigename für das Gerät"""
+        if self.name:
+            return self.name
         names = {
             DeviceType.ESP32_1: "ESP32.1 (Haupt)",
             DeviceType.ESP32_2: "ESP32.2 (Addon)",
@@ -56,5 +67,14 @@ class HardwareDevice:
             "status": self.status.value,
             "last_signal": self.last_signal,
             "client_count": self.client_count,
-            "error_message": self.error_message
+            "error_message": self.error_message,
+            "ready": self.ready,
+            "ready_time": self.ready_time,
+            "rtt_ms": self.rtt_ms,
+            "loss_rate": self.loss_rate,
+            "clock_offset_ms": self.clock_offset_ms,
+            "link_age": self.link_age,
+            "name": self.name,
+            "last_seen": self.last_seen,
+            "alive": self.alive
         }
\ No newline at end of file
@@ -2,30 +2,63 @@
 """
 Hardware-Kommunikation Service
 """
+import os
 import serial
+import asyncio
 import threading
 import time
-import queue
-from typing import Dict, Optional, Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from collections import deque
+from typing import Any, Dict, Optional, Callable
 from models.hardware import HardwareDevice, DeviceType, ConnectionStatus
 from core.config import config
 from core.logger import logger
 from core.bus import bus
+from core.line_framer import LineFramer
+from core.device_index import device_index
+from core.latency_trace import latency_tracer
+from core.ring_queue import RingQueue
+from core.signal_coalescer import SignalCoalescer
+from core.command_writer import CommandWriter, CommandQueueFull, WriterStopped, command_merge_key
+from core.udp_link import UdpLink
+from core.liveness import LivenessTracker, DEVICE_ALIVE
+from core.protocol import (ProtocolParser, SignalEvent, ClientsEvent, StatusEvent,
+                           HeartbeatTimeoutEvent, MalformedLineEvent, UnknownLineEvent,
+                           PongEvent, UnknownCommandEvent, parse_line)
+
+# Import-Zeitpunkt dieses Moduls ≈ Programmstart (für die Boot-Zeit im Log)
+_LAUNCH_TIME = time.monotonic()
 
 class HardwareService:
-    """Service für Hardware-Kommunikation mit mehreren ESP32/GIGA Geräten"""
+    """Service für Hardware-Kommunikation mit mehreren ESP32/GIGA Geräten
+    
+    Thread-Betrieb: je Gerät ein Lese- und ein Schreib-Thread, Verbinden im
+    Thread-Pool. AsyncHardwareService bietet dieselbe API auf einem
+    einzigen asyncio-Loop (Auswahl: config.HARDWARE_BACKEND).
+    """
     
-    def __init__(self):
+    def __init__(self, configured_devices: bool = True):
         self.devices: Dict[str, HardwareDevice] = {}
         self.connections: Dict[str, serial.Serial] = {}
         self.threads: Dict[str, threading.Thread] = {}
-        self.data_queue = queue.Queue()
+        self.framers: Dict[str, LineFramer] = {}
+        self.writers: Dict[str, CommandWriter] = {}
+        self.data_queues: Dict[str, RingQueue] = {}   # Pro Gerät, begrenzt
+        self.signal_coalescers: Dict[str, SignalCoalescer] = {}
+        self.data_notifier: Optional[Callable[[], None]] = None
+        self.udp_link: Optional[UdpLink] = None      # Direkter UDP-Weg mit Acks (UDP_LINK_ENABLED)
+        self.liveness = LivenessTracker(config.LIVENESS_TIMEOUT, self._liveness_changed,
+                                        probe=self._probe, probe_timeout=config.LIVENESS_PROBE_TIMEOUT)
+        self.auto_ports: set = set()    # Geräte ohne festen Port -> Geräte-Index
         self.running = False
         
-        self._setup_devices()
+        device_index.role_serials.update(config.DEVICE_SERIALS)
+        
+        if configured_devices:
+            self._setup_devices()
     
     def _setup_devices(self):
-        """Initialisiere Hardware-Geräte"""
+        """Initialisiere die konfigurierten Hardware-Geräte (ESP32.1-3 und GIGA)"""
         device_configs = [
             (DeviceType.ESP32_1, config.ESP32_1_PORT),
             (DeviceType.ESP32_2, config.ESP32_2_PORT),
@@ -34,21 +67,56 @@ class HardwareService:
         ]
         
         for device_type, port in device_configs:
-            device = HardwareDevice(
-                device_type=device_type,
-                port=port,
-                baud_rate=config.BAUD_RATE
-            )
-            self.devices[device_type.value] = device
+            self.add_device(device_type.value, port, device_type)
+    
+    def add_device(self, device_name: str, port: Optional[str],
+                   device_type: DeviceType = DeviceType.ESP32_1) -> HardwareDevice:
+        """Gerät hinzufügen (vor connect_all); ohne Port über den Geräte-Index
+        
+        Weitere Geräte über die konfigurierten hinaus (z.B. zusätzliche ESP32s)
+        bekommen ihren Namen als Anzeigenamen.
+        """
+        if port is None:
+            self.auto_ports.add(device_name)
+        device = HardwareDevice(
+            device_type=device_type,
+            port=port or device_index.resolve(device_name) or "",
+            baud_rate=config.BAUD_RATE,
+            name="" if device_name == device_type.value else device_name
+        )
+        self.devices[device_name] = device
+        self.data_queues[device_name] = RingQueue(
+            config.DATA_QUEUE_SIZE, config.DATA_QUEUE_POLICY,
+            signal_key=lambda item: "signal" if item[0] == 'signal' else None,
+            block_timeout=config.DATA_QUEUE_BLOCK_TIMEOUT)
+        self.signal_coalescers[device_name] = SignalCoalescer(
+            self._publish_signal, self._publish_skipped_signal)
+        return device
     
     def connect_all(self) -> int:
-        """Verbinde alle verfügbaren Geräte"""
-        connected_count = 0
+        """Verbinde alle Geräte parallel und warte auf deren PING/PONG-Bereitschaft"""
+        start = time.monotonic()
+        self.liveness.start()
+        if self.auto_ports:
+            device_index.refresh()   # einmal vorab statt parallel in jedem Connect-Thread
+        
+        results = self._open_all()
         
-        for device_name, device in self.devices.items():
-            if self.connect_device(device_name):
+        # Bus-Events erst nach dem Öffnen im aufrufenden Thread veröffentlichen
+        connected_count = 0
+        for device_name, error in results.items():
+            self._publish_connect_result(device_name, error)
+            if error is None:
                 connected_count += 1
         
+        if config.UDP_LINK_ENABLED:
+            self.start_udp_link()
+        
+        ready_count = sum(1 for device in self.devices.values() if device.ready)
+        logger.info(f"⏱️ Hardware: {ready_count}/{len(self.devices)} Geräte bereit, "
+                   f"{connected_count} verbunden nach {time.monotonic() - start:.2f} s "
+                   f"(seit Programmstart {time.monotonic() - _LAUNCH_TIME:.2f} s)")
+        
         if connected_count > 0:
             self.start_reading()
             bus.publish("hardware:status_changed", 
@@ -56,54 +124,168 @@ class HardwareService:
                        dev_mode=False)
         else:
             logger.warning("Keine Hardware gefunden - Dev Mode aktiviert")
+            if config.BUS_STATS_IN_DEV_MODE:
+                bus.enable_stats(config.BUS_SLOW_HANDLER_MS)
             bus.publish("hardware:dev_mode_activated")
         
         return connected_count
     
+    def _open_all(self) -> Dict[str, Optional[str]]:
+        """Alle Geräte parallel im Thread-Pool öffnen -> {gerät: None oder Fehlertext}"""
+        if not self.devices:
+            return {}
+        with ThreadPoolExecutor(max_workers=len(self.devices),
+                                thread_name_prefix="HardwareConnect") as pool:
+            return dict(zip(self.devices, pool.map(self._open_device, self.devices)))
+    
     def connect_device(self, device_name: str) -> bool:
         """Verbinde einzelnes Gerät"""
         if device_name not in self.devices:
             return False
         
+        self.liveness.start()
+        error = self._open_device(device_name)
+        self._publish_connect_result(device_name, error)
+        return error is None
+    
+    def _open_device(self, device_name: str) -> Optional[str]:
+        """Port öffnen und auf PONG warten (läuft im Connect-Pool) - None oder Fehlertext"""
         device = self.devices[device_name]
-        device.status = ConnectionStatus.CONNECTING
+        error = self._prepare_port(device_name)
+        if error:
+            return error
         
         try:
-            connection = serial.Serial(device.port, device.baud_rate, timeout=1)
-            time.sleep(2)  # Warten auf Initialisierung
-            
-            self.connections[device_name] = connection
-            device.status = ConnectionStatus.CONNECTED
-            device.error_message = ""
-            
-            logger.info(f"✅ {device.display_name} verbunden auf {device.port}")
-            bus.publish("hardware:device_connected", device_name=device_name, device=device)
-            return True
-            
+            connection = serial.Serial(device.port, device.baud_rate,
+                                       timeout=config.READY_PING_INTERVAL,
+                                       write_timeout=config.WRITE_TIMEOUT)
         except Exception as e:
             device.status = ConnectionStatus.ERROR
             device.error_message = str(e)
             logger.error(f"❌ {device.display_name} Verbindung fehlgeschlagen: {e}")
-            bus.publish("hardware:device_error", device_name=device_name, error=str(e))
-            return False
+            return str(e)
+        
+        opened = time.monotonic()
+        framer = LineFramer()
+        try:
+            device.ready = self._wait_ready(connection, framer)
+            connection.timeout = 1
+        except Exception as e:
+            connection.close()
+            device.status = ConnectionStatus.ERROR
+            device.error_message = str(e)
+            logger.error(f"❌ {device.display_name} Handshake fehlgeschlagen: {e}")
+            return str(e)
+        
+        self.connections[device_name] = connection
+        self.framers[device_name] = framer
+        # Ab hier schreibt nur noch der Schreib-Thread (PING oben noch direkt im Connect-Pool)
+        writer = CommandWriter(device.display_name, connection.write, config.COMMAND_QUEUE_SIZE)
+        writer.start()
+        self.writers[device_name] = writer
+        self._mark_connected(device_name, opened)
+        return None
+    
+    def _prepare_port(self, device_name: str, resolved: Optional[str] = None) -> Optional[str]:
+        """Gerät auf CONNECTING setzen und Port bestimmen - None oder Fehlertext
+        
+        resolved: bereits aufgelöster Knoten (sonst löst device_index hier auf)
+        """
+        device = self.devices[device_name]
+        device.status = ConnectionStatus.CONNECTING
+        device.ready = False
+        device.ready_time = None
+        
+        if device_name in self.auto_ports:
+            # Knoten kann sich seit dem Start geändert haben (Replug, andere Buchse)
+            if resolved is None:
+                resolved = device_index.resolve(device_name)
+            device.port = resolved or ""
+        if not device.port:
+            device.status = ConnectionStatus.ERROR
+            device.error_message = "Kein passendes USB-Gerät gefunden"
+            logger.error(f"❌ {device.display_name}: kein passendes USB-Gerät gefunden")
+            return device.error_message
+        return None
+    
+    def _mark_connected(self, device_name: str, opened: float):
+        """Status nach erfolgreichem Öffnen setzen, Liveness starten und Bereitschaft loggen"""
+        device = self.devices[device_name]
+        device.status = ConnectionStatus.CONNECTED
+        device.error_message = ""
+        device.last_seen = time.time()
+        device.alive = True
+        self.liveness.watch(device_name)
+        
+        if device.ready:
+            device.ready_time = time.monotonic() - opened
+            logger.info(f"✅ {device.display_name} bereit auf {device.port} "
+                       f"(PONG nach {device.ready_time:.2f} s)")
+        else:
+            logger.warning(f"⚠️ {device.display_name} verbunden auf {device.port}, "
+                          f"aber kein PONG nach {config.READY_TIMEOUT:.1f} s")
+    
+    def _wait_ready(self, connection: serial.Serial, framer: LineFramer) -> bool:
+        """PING senden bis PONG kommt oder READY_TIMEOUT abläuft
+        
+        Ältere Firmware ohne PING antwortet mit "Unbekannter Befehl" - sie
+        lebt also und gilt ebenfalls als bereit.
+        """
+        deadline = time.monotonic() + config.READY_TIMEOUT
+        next_ping = 0.0
+        
+        while True:
+            now = time.monotonic()
+            if now >= deadline:
+                return False
+            if now >= next_ping:
+                connection.write(b"PING\n")
+                next_ping = now + config.READY_PING_INTERVAL
+            
+            for line in framer.read_from(connection):
+                event = parse_line(line)
+                if isinstance(event, PongEvent):
+                    return True
+                if isinstance(event, UnknownCommandEvent) and "PING" in line:
+                    return True
+    
+    def _publish_connect_result(self, device_name: str, error: Optional[str]):
+        """Verbindungsergebnis auf dem Bus melden"""
+        if error is None:
+            bus.publish("hardware:device_connected", device_name=device_name,
+                       device=self.devices[device_name])
+        else:
+            bus.publish("hardware:device_error", device_name=device_name, error=error)
     
     def disconnect_device(self, device_name: str):
         """Trenne einzelnes Gerät"""
+        writer = self.writers.pop(device_name, None)
+        if writer:
+            writer.stop()
+        
         if device_name in self.connections:
             try:
                 self.connections[device_name].close()
                 del self.connections[device_name]
+                self.framers.pop(device_name, None)
                 logger.info(f"🔌 {device_name} getrennt")
             except Exception as e:
                 logger.error(f"Fehler beim Trennen von {device_name}: {e}")
         
+        self.liveness.forget(device_name)
         if device_name in self.devices:
             self.devices[device_name].status = ConnectionStatus.DISCONNECTED
+            self.devices[device_name].ready = False
+            self.devices[device_name].alive = False
             bus.publish("hardware:device_disconnected", device_name=device_name)
     
     def disconnect_all(self):
         """Trenne alle Geräte"""
         self.running = False
+        self.liveness.stop()
+        if self.udp_link:
+            self.udp_link.close()
+            self.udp_link = None
         
         for device_name in list(self.connections.keys()):
             self.disconnect_device(device_name)
@@ -114,6 +296,48 @@ class HardwareService:
                 thread.join(timeout=1)
         
         self.threads.clear()
+        
+        if bus.stats_enabled:
+            report = config.LOGS_DIR / "bus_stats.txt"
+            bus.write_stats_report(report)
+            logger.info(f"Event-Bus-Statistik geschrieben: {report}")
+    
+    def start_udp_link(self) -> bool:
+        """Öffnet den direkten UDP-Weg zu den ESP32s (Heartbeats und Acks -> Verbindungsqualität)"""
+        if self.udp_link is None:
+            targets = {role: address for role, address in config.UDP_TARGETS.items()
+                       if role in self.devices}
+            self.udp_link = UdpLink(targets, config.UDP_PORT, config.UDP_HEARTBEAT_INTERVAL,
+                                    config.UDP_ACK_TIMEOUT, on_update=self._link_updated,
+                                    max_retries=config.UDP_MAX_RETRIES)
+        return self.udp_link.open(self._event_loop())
+    
+    def _event_loop(self) -> Optional[asyncio.AbstractEventLoop]:
+        """Loop, den sich der UdpLink teilt - im Thread-Betrieb keiner (eigener Loop-Thread)"""
+        return None
+    
+    def _link_updated(self, device_name: str, quality: Dict[str, Any]):
+        """Loop-Thread des UdpLink: Messwerte ins Gerät übernehmen, UI benachrichtigen"""
+        device = self.devices[device_name]
+        device.rtt_ms = quality['srtt_ms']
+        device.loss_rate = quality['loss_rate']
+        device.clock_offset_ms = quality['clock_offset_ms']
+        device.link_age = quality['age']
+        self.data_queues[device_name].put(('link', device_name, quality, None))
+        self._notify_data()
+    
+    def _liveness_changed(self, topic: str, device_name: str, last_seen: float):
+        """Liveness-Thread: Übergang alive <-> stale ins Gerät übernehmen, UI benachrichtigen"""
+        device = self.devices.get(device_name)
+        if device is None:
+            return
+        device.alive = topic == DEVICE_ALIVE
+        self.data_queues[device_name].put(('liveness', device_name, topic, None))
+        self._notify_data()
+    
+    def _probe(self, device_name: str):
+        """Liveness-Probe: ein stilles Gerät per PING zu einer Antwort (PONG) bewegen"""
+        self.send_command(device_name, "PING")
     
     def start_reading(self):
         """Starte Daten-Lese-Threads für alle verbundenen Geräte"""
@@ -122,7 +346,7 @@ class HardwareService:
         for device_name, connection in self.connections.items():
             thread = threading.Thread(
                 target=self._read_device_data,
-                args=(device_name, connection),
+                args=(device_name, connection, self.framers.get(device_name)),
                 daemon=True
             )
             thread.start()
@@ -131,73 +355,187 @@ class HardwareService:
         # Starte Datenverarbeitung
         self._start_data_processing()
     
-    def _read_device_data(self, device_name: str, connection: serial.Serial):
+    def _read_device_data(self, device_name: str, connection: serial.Serial,
+                          framer: Optional[LineFramer] = None):
         """Lese Daten von einem Gerät in separatem Thread"""
         device = self.devices[device_name]
+        framer = framer or LineFramer()  # Puffer aus dem Handshake weiterverwenden
+        parser = ProtocolParser()
         
         while self.running and connection.is_open:
             try:
-                if connection.in_waiting > 0:
-                    line = connection.readline().decode('utf-8').strip()
-                    
-                    if line.startswith("SIGNAL:"):
-                        signal_value = int(line.split(":")[1])
-                        self.data_queue.put(('signal', device_name, signal_value))
-                        device.last_signal = signal_value
-                        
-                    elif line.startswith("Clients:"):
-                        client_count = int(line.split(":")[1].strip())
-                        self.data_queue.put(('clients', device_name, client_count))
-                        device.client_count = client_count
+                queued = False
+                lines = framer.read_from(connection)
+                read_at = time.perf_counter()
+                if lines:
+                    device.last_seen = time.time()
+                    self.liveness.seen(device_name)
+                for event in parser.feed(lines):
+                    queued |= self._handle_event(device_name, device, event, read_at)
+                if queued:
+                    self._notify_data()
                         
             except Exception as e:
-                if self.running:  # Nur loggen wenn nicht beim Shutdown
-                    logger.error(f"Fehler beim Lesen von {device_name}: {e}")
-                    device.status = ConnectionStatus.ERROR
-                    device.error_message = str(e)
+                if self.running:  # Nur melden wenn nicht beim Shutdown
+                    self._report_read_error(device_name, device, str(e))
                 break
+    
+    def _report_read_error(self, device_name: str, device: HardwareDevice, error: str):
+        """Lese-Thread/Loop: Gerät auf ERROR setzen, hardware:device_error über die Daten-Queue melden"""
+        logger.error(f"Fehler beim Lesen von {device_name}: {error}")
+        device.status = ConnectionStatus.ERROR
+        device.error_message = error
+        self.data_queues[device_name].put(('error', device_name, error, None))
+        self._notify_data()
+    
+    def _handle_event(self, device_name: str, device: HardwareDevice, event,
+                      read_at: Optional[float] = None) -> bool:
+        """Protokoll-Event eines Geräts in die Daten-Queue übernehmen (True wenn eingereiht)
+        
+        Signale bekommen einen Latenz-Trace ab read_at (perf_counter beim Lesen).
+        """
+        data_queue = self.data_queues[device_name]
+        if isinstance(event, SignalEvent):
+            trace = latency_tracer.begin(device_name, event.value, read_at)
+            latency_tracer.mark(trace, "queued")
+            data_queue.put(('signal', device_name, event.value, trace))
+            device.last_signal = event.value
+            
+        elif isinstance(event, ClientsEvent):
+            data_queue.put(('clients', device_name, event.count, None))
+            device.client_count = event.count
+            
+        elif isinstance(event, StatusEvent):
+            data_queue.put(('status', device_name, event, None))
+            
+        elif isinstance(event, HeartbeatTimeoutEvent):
+            data_queue.put(('heartbeat_timeout', device_name, event, None))
+            
+        elif isinstance(event, MalformedLineEvent):
+            logger.warning(f"Ungültige Zeile von {device_name} ({event.reason}): {event.line}")
+            return False
+            
+        elif isinstance(event, UnknownLineEvent):
+            logger.debug(f"Unbekannte Zeile von {device_name}: {event.line}")
+            return False
             
-            time.sleep(0.01)  # Kurze Pause
+        else:
+            return False
+        
+        return True
+    
+    def set_data_notifier(self, notifier: Optional[Callable[[], None]]) -> None:
+        """Thread-sicheren Wakeup des UI-Threads setzen (z.B. TkWakeup.notify)"""
+        self.data_notifier = notifier
+        if notifier and any(not data_queue.empty() for data_queue in self.data_queues.values()):
+            notifier()
+    
+    def get_queue_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Füllstand, Höchststand und Verluste der Empfangs-Queue pro Gerät"""
+        return {name: data_queue.get_stats() for name, data_queue in self.data_queues.items()}
+    
+    def _notify_data(self):
+        """Lese-Thread: UI-Thread über neue Daten informieren"""
+        notifier = self.data_notifier
+        if notifier:
+            notifier()
     
     def _start_data_processing(self):
-        """Starte Datenverarbeitung im Hauptthread"""
+        """Übergibt die Datenverarbeitung an das UI-Framework
+        
+        Der Subscriber von hardware:start_data_processing führt processor im
+        UI-Thread aus, sobald der über set_data_notifier gesetzte Wakeup
+        auslöst (Tk: TkWakeup(root, processor).notify) - ohne Polling-Schleife.
+        Mehrere Signale eines Geräts in einem Durchlauf werden zusammengefasst:
+        nur das letzte kommt als hardware:signal_received, die übrigen als
+        hardware:signal_skipped (für die Historie). Während
+        hardware:signal_received ist der Latenz-Trace des Signals aktiv
+        (latency_tracer.current()), Subscriber können weitere Stationen
+        markieren.
+        """
         def process_data():
-            try:
-                while not self.data_queue.empty():
-                    data_type, device_name, value = self.data_queue.get_nowait()
+            for data_queue in self.data_queues.values():
+                for data_type, device_name, value, trace in data_queue.drain():
                     
                     if data_type == 'signal':
-                        bus.publish("hardware:signal_received", 
-                                   device_name=device_name, 
-                                   signal_id=value)
+                        latency_tracer.mark(trace, "drained")
+                        self.signal_coalescers[device_name].add((device_name, value), trace)
                         
                     elif data_type == 'clients':
                         bus.publish("hardware:clients_updated", 
                                    device_name=device_name, 
                                    client_count=value)
                         
-            except queue.Empty:
-                pass
+                    elif data_type == 'status':
+                        bus.publish("hardware:status_received", 
+                                   device_name=device_name, 
+                                   status=value)
+                        
+                    elif data_type == 'heartbeat_timeout':
+                        bus.publish("hardware:heartbeat_timeout", 
+                                   device_name=device_name)
+                        
+                    elif data_type == 'error':
+                        bus.publish("hardware:device_error",
+                                   device_name=device_name,
+                                   error=value)
+                        
+                    elif data_type == 'link':
+                        bus.publish("hardware:link_updated",
+                                   device_name=device_name,
+                                   device=self.devices[device_name])
+                        
+                    elif data_type == 'liveness':
+                        # hardware:device_stale bzw. hardware:device_alive
+                        bus.publish(value,
+                                   device_name=device_name,
+                                   device=self.devices[device_name])
             
-            # Nächste Verarbeitung planen (wird vom UI-Framework aufgerufen)
-            if self.running:
-                bus.publish("hardware:schedule_data_processing")
+            for coalescer in self.signal_coalescers.values():
+                coalescer.end_cycle()
         
         bus.publish("hardware:start_data_processing", processor=process_data)
     
-    def send_command(self, device_name: str, command: str) -> bool:
-        """Sende Kommando an Gerät"""
-        if device_name not in self.connections:
-            return False
+    def _publish_signal(self, signal: tuple, trace=None):
+        """Letztes Signal eines Durchlaufs veröffentlichen (SignalCoalescer)"""
+        device_name, value = signal
+        with latency_tracer.active(trace):
+            latency_tracer.mark(trace, "published")
+            bus.publish("hardware:signal_received", 
+                       device_name=device_name, 
+                       signal_id=value)
+    
+    def _publish_skipped_signal(self, signal: tuple):
+        """Zwischenseite eines Bursts nur melden (Historie), nicht anzeigen"""
+        device_name, value = signal
+        bus.publish("hardware:signal_skipped", 
+                   device_name=device_name, 
+                   signal_id=value)
+    
+    def send_command(self, device_name: str, command: str,
+                     callback: Optional[Callable[[Future], None]] = None) -> Optional[Future]:
+        """Sende Kommando an Gerät (blockiert nie)
         
-        try:
-            connection = self.connections[device_name]
-            connection.write(f"{command}\n".encode('utf-8'))
-            logger.debug(f"Kommando an {device_name}: {command}")
-            return True
-        except Exception as e:
-            logger.error(f"Fehler beim Senden an {device_name}: {e}")
-            return False
+        Geschrieben wird im Schreib-Thread des Geräts; zurück kommt ein Future
+        (True = geschrieben, cancelled = durch neueres SIGNAL/UDP_SEND ersetzt,
+        Exception = Fehler/Timeout) oder None ohne Verbindung. callback läuft
+        im Schreib-Thread.
+        """
+        writer = self.writers.get(device_name)
+        if writer is None:
+            return None
+        
+        logger.debug(f"Kommando an {device_name}: {command}")
+        return writer.submit(f"{command}\n".encode('utf-8'), command_merge_key(command), callback)
+    
+    def send_udp_signal(self, signal_id: str, value: int = 1) -> Dict[str, Future]:
+        """Signal direkt per UDP an alle ESP32s -> {gerät: Future}, erfüllt mit deren Ack
+        
+        Ohne UdpLink leer - dann bleibt nur der Weg über send_command.
+        """
+        if self.udp_link is None:
+            return {}
+        return self.udp_link.send_signal(signal_id, value)
     
     def get_device_status(self, device_name: str) -> Optional[HardwareDevice]:
         """Status eines Geräts abrufen"""
@@ -211,5 +549,351 @@ class HardwareService:
         """Alle Verbindungen neu starten"""
         logger.info("🔄 Starte Hardware-Verbindungen neu...")
         self.disconnect_all()
-        time.sleep(1)
-        return self.connect_all()
\ No newline at end of file
+        return self.connect_all()
+
+
+class _LoopWriter:
+    """Gegenstück zu CommandWriter ohne eigenen Thread (AsyncHardwareService)
+    
+    Gleiche API und Future-Semantik (merge_key, Queue-Grenze, WriterStopped),
+    geschrieben wird aber im Loop-Thread: os.write auf den nicht
+    blockierenden Port, ein Rest per add_writer, sobald wieder Platz ist.
+    WRITE_TIMEOUT ist ein Loop-Timer.
+    """
+    
+    def __init__(self, name: str, loop: asyncio.AbstractEventLoop, fd: int, maxsize: int = 64):
+        self.name = name
+        self.loop = loop
+        self.fd = fd
+        self.maxsize = maxsize
+        self.sent = 0
+        self.merged = 0
+        self.failed = 0
+        self.rejected = 0
+        self.last_write_ms = 0.0
+        self.running = False
+        self._pending: deque = deque()      # [data, merge_key, future]
+        self._by_key: Dict[str, list] = {}
+        self._current: Optional[list] = None  # [Rest (memoryview), future, Start, Timer]
+    
+    def start(self):
+        self.running = True
+    
+    def stop(self, timeout: float = 2.0):
+        """Noch wartende Befehle scheitern mit WriterStopped"""
+        if not self.running:
+            return
+        self.running = False
+        self.loop.call_soon_threadsafe(self._shutdown)
+    
+    def submit(self, data: bytes, merge_key: Optional[str] = None,
+               callback: Optional[Callable[[Future], None]] = None) -> Future:
+        """Reiht data ein (aus beliebigem Thread) -> Future"""
+        future = Future()
+        if callback:
+            future.add_done_callback(callback)
+        if not self.running:
+            self._fail(future, WriterStopped(f"{self.name}: nicht verbunden"))
+        else:
+            self.loop.call_soon_threadsafe(self._enqueue, data, merge_key, future)
+        return future
+    
+    def pending_count(self) -> int:
+        return len(self._pending)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'pending': len(self._pending),
+            'sent': self.sent,
+            'merged': self.merged,
+            'failed': self.failed,
+            'rejected': self.rejected,
+            'last_write_ms': self.last_write_ms,
+        }
+    
+    @staticmethod
+    def _fail(future: Future, error: Exception):
+        if future.set_running_or_notify_cancel():
+            future.set_exception(error)
+    
+    # --- Loop-Thread ---
+    
+    def _enqueue(self, data: bytes, merge_key: Optional[str], future: Future):
+        if not self.running:
+            self._fail(future, WriterStopped(f"{self.name}: Verbindung geschlossen"))
+            return
+        entry = self._by_key.get(merge_key) if merge_key else None
+        if entry is not None:
+            # Wartenden Befehl an seiner Position durch den neuen ersetzen
+            superseded = entry[2]
+            entry[0], entry[2] = data, future
+            self.merged += 1
+            superseded.cancel()
+            return
+        if len(self._pending) >= self.maxsize:
+            self.rejected += 1
+            self._fail(future, CommandQueueFull(f"{self.name}: {len(self._pending)} Befehle warten"))
+            return
+        entry = [data, merge_key, future]
+        self._pending.append(entry)
+        if merge_key:
+            self._by_key[merge_key] = entry
+        self._next()
+    
+    def _next(self):
+        while self._current is None and self._pending and self.running:
+            entry = self._pending.popleft()
+            data, merge_key, future = entry
+            if merge_key and self._by_key.get(merge_key) is entry:
+                del self._by_key[merge_key]
+            if not future.set_running_or_notify_cancel():
+                continue
+            self._current = [memoryview(data), future, time.perf_counter(), None]
+            self._flush()
+    
+    def _flush(self):
+        current = self._current
+        try:
+            written = os.write(self.fd, current[0])
+        except BlockingIOError:
+            written = 0
+        except OSError as e:
+            self._finish(e)
+            return
+        current[0] = current[0][written:]
+        if not current[0]:
+            self._finish()
+        elif current[3] is None:
+            # Port-Puffer voll: Rest schreiben, sobald der Treiber wieder Platz hat
+            self.loop.add_writer(self.fd, self._flush)
+            current[3] = self.loop.call_later(
+                config.WRITE_TIMEOUT, self._finish,
+                serial.SerialTimeoutException(f"Write timeout nach {config.WRITE_TIMEOUT:.1f} s"))
+    
+    def _finish(self, error: Optional[Exception] = None):
+        _, future, start, timer = self._current
+        self._current = None
+        if timer is not None:
+            timer.cancel()
+            self.loop.remove_writer(self.fd)
+        if error is not None:
+            self.failed += 1
+            logger.error(f"Fehler beim Senden an {self.name}: {error}")
+            future.set_exception(error)
+        else:
+            self.sent += 1
+            future.set_result(True)
+        self.last_write_ms = (time.perf_counter() - start) * 1000
+        # Nächsten Befehl im nächsten Durchlauf - keine Rekursion über _flush
+        self.loop.call_soon(self._next)
+    
+    def _shutdown(self):
+        self.running = False
+        if self._current is not None:
+            self._finish(WriterStopped(f"{self.name}: Verbindung geschlossen"))
+        pending = list(self._pending)
+        self._pending.clear()
+        self._by_key.clear()
+        for _, _, future in pending:
+            self._fail(future, WriterStopped(f"{self.name}: Verbindung geschlossen"))
+
+
+class AsyncHardwareService(HardwareService):
+    """HardwareService auf einem einzigen asyncio-Loop-Thread
+    
+    Statt Lese-, Schreib- und Connect-Threads pro Gerät laufen alle Ports
+    nicht blockierend im selben Event-Loop: Lesen per add_reader auf dem
+    Dateideskriptor, Schreiben über _LoopWriter, connect_all öffnet alle
+    Geräte mit gather, PING-Wiederholung und Timeouts sind Loop-Timer. Der
+    UdpLink teilt sich den Loop. Zur UI geht es wie im Thread-Betrieb über
+    die Daten-Queues und set_data_notifier (TkWakeup); Bus-Events entstehen
+    weiterhin nur im aufrufenden bzw. UI-Thread. add_reader auf seriellen
+    Ports gibt es nur unter POSIX (siehe create_hardware_service).
+    
+    Die öffentlichen Methoden blockieren bis der Loop fertig ist und dürfen
+    nicht aus dem Loop-Thread selbst aufgerufen werden.
+    """
+    
+    def __init__(self, configured_devices: bool = True):
+        super().__init__(configured_devices)
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._parsers: Dict[str, ProtocolParser] = {}
+        self._ready_waiters: Dict[str, asyncio.Future] = {}
+    
+    def _event_loop(self) -> Optional[asyncio.AbstractEventLoop]:
+        """Laufenden Loop liefern, bei Bedarf (auch nach disconnect_all) neu starten"""
+        if self.loop is None:
+            loop = asyncio.new_event_loop()
+            started = threading.Event()
+            
+            def run():
+                asyncio.set_event_loop(loop)
+                loop.call_soon(started.set)
+                loop.run_forever()
+                loop.close()
+            
+            self._loop_thread = threading.Thread(target=run, name="HardwareLoop", daemon=True)
+            self._loop_thread.start()
+            started.wait()
+            self.loop = loop
+        return self.loop
+    
+    def _call(self, coroutine, timeout: Optional[float] = None):
+        """Coroutine im Loop-Thread ausführen und auf ihr Ergebnis warten"""
+        return asyncio.run_coroutine_threadsafe(coroutine, self._event_loop()).result(timeout)
+    
+    def _open_all(self) -> Dict[str, Optional[str]]:
+        """Alle Geräte gleichzeitig im Loop öffnen (gather statt Thread-Pool)"""
+        async def open_all():
+            names = list(self.devices)
+            errors = await asyncio.gather(*(self._open_device_async(name) for name in names))
+            return dict(zip(names, errors))
+        return self._call(open_all())
+    
+    def _open_device(self, device_name: str) -> Optional[str]:
+        return self._call(self._open_device_async(device_name))
+    
+    async def _open_device_async(self, device_name: str) -> Optional[str]:
+        """Port öffnen, Leser anmelden und auf PONG warten - None oder Fehlertext"""
+        device = self.devices[device_name]
+        loop = asyncio.get_running_loop()
+        resolved = None
+        if device_name in self.auto_ports:
+            # resolve() liest bei leerem Cache sysfs bzw. pyserial ein - nicht im Loop-Thread
+            resolved = await loop.run_in_executor(None, device_index.resolve, device_name) or ""
+        error = self._prepare_port(device_name, resolved)
+        if error:
+            return error
+        
+        try:
+            connection = serial.Serial(device.port, device.baud_rate, timeout=0, write_timeout=0)
+            fd = connection.fileno()
+            os.set_blocking(fd, False)
+        except Exception as e:
+            device.status = ConnectionStatus.ERROR
+            device.error_message = str(e)
+            logger.error(f"❌ {device.display_name} Verbindung fehlgeschlagen: {e}")
+            return str(e)
+        
+        opened = time.monotonic()
+        self.framers[device_name] = LineFramer()
+        self._parsers[device_name] = ProtocolParser()
+        writer = _LoopWriter(device.display_name, loop, fd, config.COMMAND_QUEUE_SIZE)
+        writer.start()
+        waiter = self._ready_waiters[device_name] = loop.create_future()
+        try:
+            loop.add_reader(fd, self._on_readable, device_name, connection)
+            device.ready = await self._wait_ready_async(writer, waiter)
+        except Exception as e:
+            loop.remove_reader(fd)
+            writer._shutdown()
+            connection.close()
+            device.status = ConnectionStatus.ERROR
+            device.error_message = str(e)
+            logger.error(f"❌ {device.display_name} Handshake fehlgeschlagen: {e}")
+            return str(e)
+        finally:
+            self._ready_waiters.pop(device_name, None)
+        
+        self.connections[device_name] = connection
+        self.writers[device_name] = writer
+        self._mark_connected(device_name, opened)
+        return None
+    
+    async def _wait_ready_async(self, writer: _LoopWriter, waiter: asyncio.Future) -> bool:
+        """PING alle READY_PING_INTERVAL Sekunden, bis _on_readable PONG meldet"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + config.READY_TIMEOUT
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return False
+            writer.submit(b"PING\n")
+            try:
+                await asyncio.wait_for(asyncio.shield(waiter), min(config.READY_PING_INTERVAL, remaining))
+                return True
+            except asyncio.TimeoutError:
+                continue
+    
+    def _on_readable(self, device_name: str, connection: serial.Serial):
+        """Loop-Thread: Port lesbar - Zeilen parsen und in die Daten-Queue übernehmen"""
+        device = self.devices[device_name]
+        try:
+            data = os.read(connection.fileno(), 4096)
+        except BlockingIOError:
+            return
+        except OSError as e:
+            data, error = b"", str(e)
+        else:
+            error = "Gerät getrennt"
+        if not data:
+            # EOF/EIO: Gerät abgezogen - Leser abmelden, sonst meldet der Loop den Port endlos
+            self.loop.remove_reader(connection.fileno())
+            self._report_read_error(device_name, device, error)
+            return
+        
+        read_at = time.perf_counter()
+        lines = self.framers[device_name].feed(data)
+        if lines:
+            device.last_seen = time.time()
+            self.liveness.seen(device_name)
+        waiter = self._ready_waiters.get(device_name)
+        if waiter is not None and not waiter.done():
+            # Handshake: Zeilen vor dem PONG verwirft auch der Thread-Betrieb
+            for line in lines:
+                event = parse_line(line)
+                if isinstance(event, PongEvent) or (
+                        isinstance(event, UnknownCommandEvent) and "PING" in line):
+                    waiter.set_result(True)
+                    break
+            return
+        
+        queued = False
+        for event in self._parsers[device_name].feed(lines):
+            queued |= self._handle_event(device_name, device, event, read_at)
+        if queued:
+            self._notify_data()
+    
+    def start_reading(self):
+        """Gelesen wird schon ab dem Öffnen im Loop - hier nur die UI-Verarbeitung starten"""
+        self.running = True
+        self._start_data_processing()
+    
+    def disconnect_device(self, device_name: str):
+        """Trenne einzelnes Gerät (Leser und Schreiber vorher im Loop abmelden)"""
+        connection = self.connections.get(device_name)
+        writer = self.writers.get(device_name)
+        if connection is not None and self.loop is not None:
+            async def detach():
+                self.loop.remove_reader(connection.fileno())
+                if writer is not None:
+                    writer.running = False
+                    writer._shutdown()
+            self._call(detach(), 2.0)
+        super().disconnect_device(device_name)
+    
+    def disconnect_all(self):
+        """Trenne alle Geräte und beende den Loop-Thread"""
+        super().disconnect_all()
+        loop, thread = self.loop, self._loop_thread
+        if loop is not None:
+            self.loop = None
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(2.0)
+            self._loop_thread = None
+
+
+def create_hardware_service(backend: Optional[str] = None, **kwargs) -> HardwareService:
+    """HardwareService nach config.HARDWARE_BACKEND ("threads" oder "asyncio")
+    
+    asyncio braucht add_reader auf seriellen Ports - unter Windows bleibt es
+    beim Thread-Betrieb.
+    """
+    backend = backend or config.HARDWARE_BACKEND
+    if backend == "asyncio":
+        if os.name == "nt":
+            logger.warning("asyncio-Hardware-Service braucht POSIX - verwende Threads")
+        else:
+            return AsyncHardwareService(**kwargs)
+    return HardwareService(**kwargs)
@@ -0,0 +1,130 @@
+# tools/bench_bus.py
+"""
+Benchmark: EventBus-Durchsatz mit gleichzeitigen Publishern je Zustellung
+
+P Threads publizieren je N Events auf ein Topic mit einem Handler der
+Zustellung "sync", "ui" oder "worker". Der UI-Thread ist ein Tcl-Interpreter
+mit TkWakeup (gleicher Weg wie im Tk-Mainloop, ohne Fenster). Gemessen wird
+  Events/s     vom Start der Publisher bis zur letzten Zustellung
+  Durchläufe   dispatch_pending-Aufrufe mit Events ("ui") und deren Größe
+  Falscher Thread  "ui"-Handler außerhalb des UI-Threads (muss 0 sein)
+
+Aufruf (aus active_project/Python_GUI/):
+    python tools/bench_bus.py
+    python tools/bench_bus.py --publishers 1,4,16 --events 20000 --work-us 50
+"""
+import os
+import sys
+import time
+import argparse
+import threading
+import tkinter as tk
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.bus import EventBus, THREADS
+from core.tk_wakeup import TkWakeup
+
+
+class Counter:
+    """Handler: zählt Zustellungen und prüft den Thread"""
+
+    def __init__(self, expected: int, work_s: float, ui_thread: int):
+        self.expected = expected
+        self.work_s = work_s
+        self.ui_thread = ui_thread
+        self.count = 0
+        self.wrong_thread = 0
+        self.finished_at = None
+        self.done = threading.Event()
+        self._lock = threading.Lock()
+
+    def __call__(self, value: int, check_ui: bool):
+        if self.work_s:
+            end = time.perf_counter() + self.work_s
+            while time.perf_counter() < end:
+                pass
+        with self._lock:
+            self.count += 1
+            if check_ui and threading.get_ident() != self.ui_thread:
+                self.wrong_thread += 1
+            if self.count == self.expected:
+                self.finished_at = time.perf_counter()
+                self.done.set()
+
+
+def run(mode: str, publishers: int, events: int, work_s: float, workers: int) -> dict:
+    root = tk.Tcl()
+    bus = EventBus(max_workers=workers)
+    wakeup = TkWakeup(root, bus.dispatch_pending)
+    bus.bind_ui(wakeup.notify)
+    counter = Counter(publishers * events, work_s, threading.get_ident())
+    bus.subscribe("bench:event", counter, thread=mode)
+    check_ui = mode == "ui"
+    barrier = threading.Barrier(publishers + 1)
+
+    def publish():
+        barrier.wait()
+        for value in range(events):
+            bus.publish("bench:event", value=value, check_ui=check_ui)
+
+    threads = [threading.Thread(target=publish, name=f"Publisher-{n}", daemon=True)
+               for n in range(publishers)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    deadline = time.monotonic() + 60.0
+    try:
+        # UI-Thread: Tcl-Ereignisschleife, bis alles zugestellt ist (der Timer
+        # weckt sie auch ohne UI-Events, um das Ende zu bemerken)
+        def tick():
+            root.after(20, tick)
+        tick()
+        while not counter.done.is_set() and time.monotonic() < deadline:
+            root.dooneevent()
+        for thread in threads:
+            thread.join()
+    finally:
+        bus.unbind_ui()
+        bus.shutdown()
+        wakeup.close()
+
+    elapsed = (counter.finished_at or time.perf_counter()) - start
+    return {
+        'delivered': counter.count,
+        'missing': publishers * events - counter.count,
+        'rate': counter.count / elapsed if elapsed > 0 else 0.0,
+        'batches': bus.batches,
+        'avg_batch': counter.count / bus.batches if bus.batches else 0.0,
+        'max_batch': bus.max_batch,
+        'wrong_thread': counter.wrong_thread,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='EventBus: Events/s mit gleichzeitigen Publishern')
+    parser.add_argument('--publishers', default='1,4,8', help='Anzahl Publisher-Threads, kommagetrennt')
+    parser.add_argument('--events', type=int, default=20000, help='Events pro Publisher')
+    parser.add_argument('--work-us', type=float, default=0.0, help='Arbeit pro Handler-Aufruf (µs)')
+    parser.add_argument('--workers', type=int, default=4, help='Threads im Worker-Pool')
+    args = parser.parse_args()
+
+    print(f"{args.events} Events pro Publisher, Handler-Arbeit {args.work_us:.0f} µs, "
+          f"{args.workers} Worker")
+    print(f"{'Publisher':>9}  {'Zustellung':<10}{'Events/s':>11}{'Durchläufe':>11}"
+          f"{'Ø/Durchlauf':>12}{'max':>7}{'Fehlend':>8}{'Falscher Thread':>16}")
+    failures = 0
+    for publishers in [int(value) for value in args.publishers.split(',')]:
+        for mode in THREADS:
+            result = run(mode, publishers, args.events, args.work_us / 1e6, args.workers)
+            failures += result['missing'] + result['wrong_thread']
+            batches = f"{result['batches']:>11}{result['avg_batch']:>12.1f}{result['max_batch']:>7}" \
+                if mode == "ui" else f"{'-':>11}{'-':>12}{'-':>7}"
+            print(f"{publishers:>9}  {mode:<10}{result['rate']:>11.0f}{batches}"
+                  f"{result['missing']:>8}{result['wrong_thread']:>16}")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,90 @@
+# tools/bench_bus_publish.py
+"""
+Benchmark: Kosten eines EventBus.publish mit 0, 1 und 10 Subscribern
+
+Misst ns pro publish() im aufrufenden Thread ("sync"-Handler, die nichts
+tun) und vergleicht mit dem vorherigen Verfahren (Subscriber-Liste unter
+Lock bei jedem publish kopieren). Die Zahlen sind der Referenzwert für
+Änderungen am Bus: steigt "jetzt" deutlich, ist der Hot Path teurer
+geworden. Mit --max-ns bricht das Skript mit Exit-Code 1 ab, wenn ein Fall
+über der Schranke liegt (z.B. in einem CI-Schritt).
+
+Aufruf (aus active_project/Python_GUI/):
+    python tools/bench_bus_publish.py
+    python tools/bench_bus_publish.py --subscribers 0,1,10,50 --number 200000 --max-ns 2000
+"""
+import os
+import sys
+import timeit
+import argparse
+import threading
+from collections import defaultdict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.bus import EventBus
+
+
+class ListCopyBus:
+    """Vorheriges Verfahren: Liste pro publish unter Lock kopieren"""
+
+    def __init__(self):
+        self._subs = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def subscribe(self, topic, fn):
+        with self._lock:
+            self._subs[topic].append(fn)
+
+    def publish(self, topic, **payload):
+        with self._lock:
+            subs = list(self._subs.get(topic, []))
+        if not subs:
+            return
+        for fn in subs:
+            try:
+                fn(**payload)
+            except Exception as e:
+                print(f"❌ Event-Handler Fehler für '{topic}': {e}")
+
+
+def handler(device_name, signal_id):
+    pass
+
+
+def measure(bus, subscribers: int, number: int, repeat: int) -> float:
+    """Bester Wert aus repeat Läufen in ns pro publish"""
+    for _ in range(subscribers):
+        bus.subscribe("hardware:signal_received", handler)
+    publish = bus.publish
+    timer = timeit.Timer(lambda: publish("hardware:signal_received", device_name="esp32_1", signal_id=3))
+    return min(timer.repeat(repeat, number)) / number * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description='EventBus.publish: ns pro Aufruf')
+    parser.add_argument('--subscribers', default='0,1,10', help='Anzahl Subscriber, kommagetrennt')
+    parser.add_argument('--number', type=int, default=100000, help='publish-Aufrufe pro Lauf')
+    parser.add_argument('--repeat', type=int, default=5, help='Läufe (gezählt wird der beste)')
+    parser.add_argument('--max-ns', type=float, default=None, help='Schranke für "jetzt" (Exit-Code 1)')
+    args = parser.parse_args()
+
+    # Leerer Aufruf (Lambda + Keyword-Argumente) als Untergrenze
+    baseline = min(timeit.Timer(lambda: handler(device_name="esp32_1", signal_id=3))
+                   .repeat(args.repeat, args.number)) / args.number * 1e9
+    print(f"{args.number} publish-Aufrufe, bester von {args.repeat} Läufen "
+          f"(Handler direkt aufgerufen: {baseline:.0f} ns)")
+    print(f"{'Subscriber':>10}{'vorher ns':>11}{'jetzt ns':>10}{'Faktor':>8}")
+    failed = False
+    for subscribers in [int(value) for value in args.subscribers.split(',')]:
+        before = measure(ListCopyBus(), subscribers, args.number, args.repeat)
+        now = measure(EventBus(), subscribers, args.number, args.repeat)
+        print(f"{subscribers:>10}{before:>11.0f}{now:>10.0f}{before / now:>7.1f}x")
+        if args.max_ns is not None and now > args.max_ns:
+            print(f"❌ {subscribers} Subscriber: {now:.0f} ns > {args.max_ns:.0f} ns")
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,120 @@
+# tools/bench_bus_topics.py
+"""
+Benchmark: Wildcard-Routing des EventBus mit einigen hundert Topics
+
+N Namensräume mit je M Topics (ns07:event12), jedes Topic mit einem
+direkten Subscriber. Verglichen wird ns pro publish (reihum über alle
+Topics) für
+  ohne Muster   nur direkte Abonnements
+  Muster        zusätzlich "nsXX:*" für jeden zweiten Namensraum und "**"
+                (aufgelöst über den Präfixbaum, pro Topic zwischengespeichert)
+  ohne Cache    wie "Muster", aber der Cache wird vor jedem publish verworfen
+                (Kosten der Auflösung im Präfixbaum)
+  linear        alle Muster per fnmatch gegen das Topic (naiver Ansatz)
+Das Ergebnis der Auflösung wird gegen fnmatch geprüft.
+
+Aufruf (aus active_project/Python_GUI/):
+    python tools/bench_bus_topics.py
+    python tools/bench_bus_topics.py --namespaces 40 --topics 20 --number 200000
+"""
+import os
+import sys
+import time
+import argparse
+import fnmatch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.bus import EventBus
+
+
+def handler(**payload):
+    pass
+
+
+class LinearBus:
+    """Vergleich: Muster bei jedem publish per fnmatch durchsuchen"""
+
+    def __init__(self):
+        self.exact = {}
+        self.patterns = []
+
+    def subscribe(self, topic, fn):
+        if "*" in topic:
+            self.patterns.append((topic.replace("**", "*"), fn))
+        else:
+            self.exact.setdefault(topic, []).append(fn)
+
+    def publish(self, topic, **payload):
+        for fn in self.exact.get(topic, ()):
+            fn(**payload)
+        for pattern, fn in self.patterns:
+            if fnmatch.fnmatchcase(topic, pattern):
+                fn(**payload)
+
+
+def build(bus, topics, patterns):
+    for topic in topics:
+        bus.subscribe(topic, handler)
+    for pattern in patterns:
+        bus.subscribe(pattern, handler)
+    return bus
+
+
+def measure(bus, topics, number, invalidate=False) -> float:
+    """ns pro publish, reihum über alle Topics"""
+    publish = bus.publish
+    count = len(topics)
+    start = time.perf_counter()
+    if invalidate:
+        for index in range(number):
+            bus._resolved = {}
+            publish(topics[index % count], value=index)
+    else:
+        for index in range(number):
+            publish(topics[index % count], value=index)
+    return (time.perf_counter() - start) / number * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description='EventBus: Wildcard-Routing mit vielen Topics')
+    parser.add_argument('--namespaces', type=int, default=20, help='Anzahl Namensräume')
+    parser.add_argument('--topics', type=int, default=15, help='Topics pro Namensraum')
+    parser.add_argument('--number', type=int, default=100000, help='publish-Aufrufe pro Variante')
+    args = parser.parse_args()
+
+    topics = [f"ns{n:02d}:event{t:02d}" for n in range(args.namespaces) for t in range(args.topics)]
+    patterns = [f"ns{n:02d}:*" for n in range(0, args.namespaces, 2)] + ["**"]
+
+    # Auflösung gegen fnmatch prüfen
+    bus = build(EventBus(), topics, patterns)
+    wrong = 0
+    for topic in topics + ["ns00", "ns00:a:b", "other:x"]:
+        expected = (topic in topics) + sum(
+            fnmatch.fnmatchcase(topic, pattern.replace("**", "*")) if pattern == "**"
+            else fnmatch.fnmatchcase(topic, pattern) and topic.count(":") == 1
+            for pattern in patterns)
+        resolved = bus._resolve(topic)
+        wrong += len(resolved) != expected
+
+    print(f"{len(topics)} Topics, {len(patterns)} Muster, {args.number} publish-Aufrufe pro Variante")
+    # Handler-Aufrufe pro publish: Muster bringen zusätzliche Handler mit, nicht nur Routing
+    handlers = sum(len(bus._resolve(topic)) for topic in topics) / len(topics)
+    print(f"{'Variante':<14}{'ns/publish':>11}{'Handler':>9}")
+    results = [
+        ("ohne Muster", measure(build(EventBus(), topics, []), topics, args.number), 1.0),
+        ("Muster", measure(build(EventBus(), topics, patterns), topics, args.number), handlers),
+        ("ohne Cache", measure(build(EventBus(), topics, patterns), topics, args.number, invalidate=True),
+         handlers),
+        ("linear", measure(build(LinearBus(), topics, patterns), topics, args.number), handlers),
+    ]
+    for name, ns, calls in results:
+        print(f"{name:<14}{ns:>11.0f}{calls:>9.1f}")
+    if wrong:
+        print(f"❌ {wrong} Topics falsch aufgelöst")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
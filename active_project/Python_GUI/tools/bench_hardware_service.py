@@ -0,0 +1,177 @@
+# tools/bench_hardware_service.py
+"""
+Benchmark: HardwareService mit Threads gegen AsyncHardwareService (ein asyncio-Loop)
+
+Simuliert N Geräte an Pseudo-Terminals (PONG auf PING, SIGNAL-Zeilen auf
+Abruf) und misst pro Variante:
+  Threads      zusätzliche Threads nach connect_all + start_reading
+  Verbinden    Dauer von connect_all (PING/PONG aller Geräte)
+  Leerlauf     CPU-Zeit des Prozesses ohne Verkehr (in % eines Kerns)
+  Latenz       SIGNAL-Zeile geschrieben -> hardware:signal_received im
+               "UI-Thread" (hier der Hauptthread statt Tk, gleicher Wakeup-Weg)
+
+Aufruf (aus active_project/Python_GUI/, nur POSIX):
+    python tools/bench_hardware_service.py
+    python tools/bench_hardware_service.py --devices 4,32,64 --rounds 100
+"""
+import os
+import sys
+import pty
+import time
+import argparse
+import selectors
+import threading
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.bus import bus
+from services.hardware import create_hardware_service
+
+
+class PtyDevices:
+    """N simulierte Geräte: je ein Pseudo-Terminal, ein gemeinsamer Antwort-Thread"""
+
+    def __init__(self, count: int):
+        self.masters = []
+        self.slaves = []
+        self.ports = []
+        for _ in range(count):
+            master, slave = pty.openpty()
+            os.set_blocking(master, False)
+            self.masters.append(master)
+            self.slaves.append(slave)    # offen halten, sonst EIO beim Lesen des Masters
+            self.ports.append(os.ttyname(slave))
+        self.running = True
+        self.selector = selectors.DefaultSelector()
+        for master in self.masters:
+            self.selector.register(master, selectors.EVENT_READ)
+        self.thread = threading.Thread(target=self._run, name="PtyDevices", daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        while self.running:
+            for key, _ in self.selector.select(0.2):
+                try:
+                    data = os.read(key.fd, 4096)
+                except OSError:
+                    continue
+                if b"PING" in data:
+                    os.write(key.fd, b"PONG\n")
+
+    def send_signal(self, index: int, value: int):
+        os.write(self.masters[index], f"SIGNAL:{value}\n".encode())
+
+    def close(self):
+        self.running = False
+        self.thread.join(1.0)
+        self.selector.close()
+        for fd in self.masters + self.slaves:
+            os.close(fd)
+
+
+class UiPump:
+    """Ersetzt den Tk-Mainloop: wartet auf den Wakeup und ruft den Prozessor auf"""
+
+    def __init__(self):
+        self.wakeup = threading.Event()
+        self.processor = None
+        self.sent = {}              # (gerät, wert) -> perf_counter beim Schreiben
+        self.latencies = []
+        bus.subscribe("hardware:start_data_processing", self._set_processor)
+        bus.subscribe("hardware:signal_received", self._received)
+        bus.subscribe("hardware:signal_skipped", self._received)
+
+    def close(self):
+        bus.unsubscribe("hardware:start_data_processing", self._set_processor)
+        bus.unsubscribe("hardware:signal_received", self._received)
+        bus.unsubscribe("hardware:signal_skipped", self._received)
+
+    def _set_processor(self, processor):
+        self.processor = processor
+
+    def _received(self, device_name, signal_id):
+        sent = self.sent.pop((device_name, signal_id), None)
+        if sent is not None:
+            self.latencies.append((time.perf_counter() - sent) * 1000)
+
+    def run(self, seconds: float, until=None):
+        """UI-Schleife für höchstens seconds Sekunden (oder bis until() wahr ist)"""
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline and not (until and until()):
+            if self.wakeup.wait(min(0.1, max(0.0, deadline - time.monotonic()))):
+                self.wakeup.clear()
+                if self.processor:
+                    self.processor()
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def run(backend: str, count: int, rounds: int, gap: float, idle: float) -> dict:
+    devices = PtyDevices(count)
+    pump = UiPump()
+    baseline = threading.active_count()
+    service = create_hardware_service(backend, configured_devices=False)
+    for index, port in enumerate(devices.ports):
+        service.add_device(f"esp32_{index + 1}", port)
+    service.set_data_notifier(pump.wakeup.set)
+    try:
+        start = time.perf_counter()
+        connected = service.connect_all()
+        connect_s = time.perf_counter() - start
+        threads = threading.active_count() - baseline
+
+        pump.run(0.5)   # Nachlauf des Handshakes abwarten
+        cpu = time.process_time()
+        wall = time.perf_counter()
+        pump.run(idle)
+        idle_cpu = (time.process_time() - cpu) / (time.perf_counter() - wall) * 100
+
+        for value in range(1, rounds + 1):
+            for index in range(count):
+                pump.sent[(f"esp32_{index + 1}", value)] = time.perf_counter()
+                devices.send_signal(index, value)
+            pump.run(1.0, until=lambda: not pump.sent)
+            pump.sent.clear()   # Nicht angekommene zählen nicht zur Latenz
+            pump.run(gap)
+
+        latencies = pump.latencies or [0.0]
+        return {
+            'connected': connected,
+            'threads': threads,
+            'connect_s': connect_s,
+            'idle_cpu': idle_cpu,
+            'p50': statistics.median(latencies),
+            'p95': percentile(latencies, 0.95),
+            'max': max(latencies),
+            'missing': rounds * count - len(pump.latencies),
+        }
+    finally:
+        service.disconnect_all()
+        pump.close()
+        devices.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='HardwareService: Threads gegen asyncio')
+    parser.add_argument('--devices', default='4,32', help='Anzahl simulierter Geräte, kommagetrennt')
+    parser.add_argument('--rounds', type=int, default=50, help='Signale pro Gerät')
+    parser.add_argument('--gap-ms', type=float, default=20.0, help='Pause zwischen zwei Runden')
+    parser.add_argument('--idle', type=float, default=3.0, help='Sekunden Leerlauf-Messung')
+    args = parser.parse_args()
+
+    print(f"{'Geräte':>7}  {'Backend':<8}{'verb.':>6}{'Threads':>8}{'Verbinden s':>12}"
+          f"{'Leerlauf %':>11}{'p50 ms':>8}{'p95 ms':>8}{'max ms':>8}{'Fehlend':>8}")
+    for count in [int(value) for value in args.devices.split(',')]:
+        for backend in ("threads", "asyncio"):
+            result = run(backend, count, args.rounds, args.gap_ms / 1000.0, args.idle)
+            print(f"{count:>7}  {backend:<8}{result['connected']:>6}{result['threads']:>8}"
+                  f"{result['connect_s']:>12.2f}{result['idle_cpu']:>11.1f}{result['p50']:>8.2f}"
+                  f"{result['p95']:>8.2f}{result['max']:>8.2f}{result['missing']:>8}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,194 @@
+# tools/check_bus_leaks.py
+"""
+Prüfung: schwache Abonnements des EventBus gegen zerstörte Komponenten
+
+Simuliert load_content_page: N-mal wird eine Seite erzeugt, die drei Topics
+mit gebundenen Methoden abonniert, und wieder verworfen, ohne unsubscribe().
+Dazwischen wird publiziert. Verglichen werden schwache Abonnements
+(weak=True) und starke (Standard).
+
+Geprüft wird mit schwachen Abonnements, dass
+  - am Ende nur die Abonnements der letzten, noch lebenden Seite übrig sind,
+  - keine verworfene Seite mehr aufgerufen wurde,
+  - unsubscribe_owner() die lebende Seite sofort abmeldet,
+und mit starken Abonnements, dass release_on_destroy() eine Seite beim
+<Destroy> ihres Widgets abmeldet (Kind-Widgets lösen nichts aus).
+Zusätzlich: ns pro publish mit 10 schwachen bzw. starken Abonnements und
+ein Auszug aus leak_report().
+
+Aufruf (aus active_project/Python_GUI/):
+    python tools/check_bus_leaks.py
+    python tools/check_bus_leaks.py --pages 1000
+"""
+import os
+import gc
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.bus import EventBus
+
+TOPICS = ("hardware:signal_received", "demo:started", "slide:change")
+
+
+class ContentPage:
+    """Steht für einen Tab/eine Seite mit Bus-Abonnements"""
+
+    calls_after_destroy = 0
+    alive = 0
+
+    def __init__(self, bus: EventBus, weak: bool):
+        self.destroyed = False
+        self.payload = bytearray(64 * 1024)     # Widgets, Bilder, ...
+        ContentPage.alive += 1
+        for topic in TOPICS:
+            bus.subscribe(topic, self.on_event, weak=weak)
+
+    def on_event(self, **payload):
+        if self.destroyed:
+            ContentPage.calls_after_destroy += 1
+
+    def destroy(self):
+        self.destroyed = True
+
+    def __del__(self):
+        ContentPage.alive -= 1
+
+
+def run(pages: int, weak: bool) -> dict:
+    bus = EventBus()
+    ContentPage.calls_after_destroy = 0
+    page = None
+    for number in range(pages):
+        if page is not None:
+            page.destroy()          # Widgets zerstört, aber kein unsubscribe()
+        page = ContentPage(bus, weak)
+        bus.publish("hardware:signal_received", device_name="esp32_1", signal_id=number % 10 + 1)
+    gc.collect()
+    bus.publish("demo:started")
+    subscriptions = sum(len(subs) for subs in bus.get_subscriptions().values())
+    result = {
+        'subscriptions': subscriptions,
+        'alive': ContentPage.alive,
+        'calls_after_destroy': ContentPage.calls_after_destroy,
+        'pruned': bus.pruned,
+        'report': bus.leak_report(),
+        'owner_removed': bus.unsubscribe_owner(page),
+        'after_owner': sum(len(subs) for subs in bus.get_subscriptions().values()),
+    }
+    page.destroy()
+    del page
+    bus.unsubscribe_owner(None)
+    return result
+
+
+class FakeWidget:
+    """Tk-Widget-Ersatz: bind("<Destroy>") und destroy() mit Kind-Widgets"""
+
+    def __init__(self, parent=None):
+        self.parent = parent
+        self.children = []
+        self.bindings = []
+        if parent is not None:
+            parent.children.append(self)
+
+    def bind(self, sequence, fn, add=None):
+        self.bindings.append(fn)
+
+    def destroy(self):
+        for child in list(self.children):
+            child.destroy()
+        # Tk meldet <Destroy> eines Kinds auch an die Bindings der Eltern-Widgets
+        event = type("Event", (), {"widget": self})()
+        widget = self
+        while widget is not None:
+            for fn in widget.bindings:
+                fn(event)
+            widget = widget.parent
+
+
+def run_released(pages: int) -> dict:
+    """Starke Abonnements, Abmeldung über release_on_destroy()"""
+    bus = EventBus()
+    ContentPage.calls_after_destroy = 0
+    before_destroy = 0
+    for number in range(pages):
+        frame = FakeWidget()
+        FakeWidget(frame)
+        page = ContentPage(bus, False)
+        bus.release_on_destroy(frame, page)
+        bus.publish("hardware:signal_received", device_name="esp32_1", signal_id=number % 10 + 1)
+        frame.children[0].destroy()     # Kind-Widget: Seite bleibt abonniert
+        before_destroy = sum(len(subs) for subs in bus.get_subscriptions().values())
+        page.destroy()
+        frame.destroy()
+        bus.publish("demo:started")
+    return {
+        'before_destroy': before_destroy,
+        'subscriptions': sum(len(subs) for subs in bus.get_subscriptions().values()),
+        'calls_after_destroy': ContentPage.calls_after_destroy,
+    }
+
+
+def publish_ns(weak: bool, number: int = 100000) -> float:
+    bus = EventBus()
+    pages = [ContentPage(bus, weak) for _ in range(10)]
+    start = time.perf_counter()
+    for _ in range(number):
+        bus.publish("slide:change", slide_id=1)
+    elapsed = (time.perf_counter() - start) / number * 1e9
+    del pages
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='EventBus: schwache Abonnements gegen Leaks prüfen')
+    parser.add_argument('--pages', type=int, default=300, help='Erzeugte und verworfene Seiten')
+    args = parser.parse_args()
+
+    print(f"{args.pages} Seiten erzeugt und verworfen, je {len(TOPICS)} Abonnements")
+    print(f"{'Abonnements':<12}{'übrig':>8}{'Seiten lebend':>15}{'Aufrufe tot':>13}{'entfernt':>10}")
+    results = {}
+    for weak in (False, True):
+        result = results[weak] = run(args.pages, weak)
+        gc.collect()
+        print(f"{'schwach' if weak else 'stark':<12}{result['subscriptions']:>8}{result['alive']:>15}"
+              f"{result['calls_after_destroy']:>13}{result['pruned']:>10}")
+
+    released = run_released(args.pages)
+    print(f"{'stark+Destroy':<12}{released['subscriptions']:>8}{'-':>15}"
+          f"{released['calls_after_destroy']:>13}{'-':>10}")
+
+    weak_ns, strong_ns = publish_ns(True), publish_ns(False)
+    print(f"publish mit 10 Abonnements: schwach {weak_ns:.0f} ns, stark {strong_ns:.0f} ns")
+    print("leak_report() schwach:")
+    print("\n".join("  " + line for line in results[True]['report'].splitlines()[:6]))
+
+    failures = []
+    weak_result = results[True]
+    if weak_result['subscriptions'] != len(TOPICS):
+        failures.append(f"{weak_result['subscriptions']} Abonnements übrig, erwartet {len(TOPICS)}")
+    if weak_result['alive'] != 1:
+        failures.append(f"{weak_result['alive']} Seiten noch am Leben, erwartet 1")
+    if weak_result['calls_after_destroy']:
+        failures.append(f"{weak_result['calls_after_destroy']} Aufrufe verworfener Seiten")
+    if weak_result['owner_removed'] != len(TOPICS) or weak_result['after_owner']:
+        failures.append("unsubscribe_owner() hat die lebende Seite nicht abgemeldet")
+    if released['before_destroy'] != len(TOPICS):
+        failures.append("release_on_destroy(): Kind-Widget hat die Seite abgemeldet")
+    if released['subscriptions'] or released['calls_after_destroy']:
+        failures.append(f"release_on_destroy(): {released['subscriptions']} Abonnements übrig, "
+                        f"{released['calls_after_destroy']} Aufrufe verworfener Seiten")
+    if failures:
+        for failure in failures:
+            print(f"❌ {failure}")
+        return 1
+    print("✅ Schwache Abonnements und release_on_destroy(): verworfene Seiten werden weder "
+          "gehalten noch aufgerufen")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,126 @@
+# tools/check_bus_stats.py
+"""
+Prüfung: Bus-Statistik pro Topic und Erkennung langsamer Handler
+
+Eine Seite abonniert hardware:signal_received mit einem schnellen und einem
+langsamen Handler (jedes zehnte Signal länger als die Schwelle), dazu ein
+Worker-Handler und ein Muster "hardware:**". Nach N Signalen wird
+stats_report() ausgegeben und geprüft, dass
+  - publish-Anzahl und Handler-Anzahl pro Topic stimmen,
+  - nur der langsame Handler mit seinem qualifizierten Namen gemeldet wird,
+  - unsubscribe() bei eingeschalteter Statistik weiter greift,
+  - nach disable_stats() publish() und der Cache wieder ohne Messung sind.
+Zusätzlich: ns pro publish ohne, mit und nach der Statistik.
+
+Aufruf (aus active_project/Python_GUI/):
+    python tools/check_bus_stats.py
+    python tools/check_bus_stats.py --signals 500 --slow-ms 16
+"""
+import os
+import sys
+import time
+import timeit
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.bus import EventBus, WORKER
+
+
+class SignalPage:
+    """Steht für die Seite, die auf Signale reagiert"""
+
+    def __init__(self, bus: EventBus, slow_s: float):
+        self.slow_s = slow_s
+        self.signals = 0
+        self.removed_calls = 0
+        bus.subscribe("hardware:signal_received", self.on_signal)
+        bus.subscribe("hardware:signal_received", self.render)
+        bus.subscribe("hardware:signal_received", self.log_signal, thread=WORKER)
+
+    def on_signal(self, device_name, signal_id):
+        self.signals += 1
+
+    def render(self, device_name, signal_id):
+        if signal_id % 10 == 0:
+            time.sleep(self.slow_s)     # z.B. Bild laden im Handler
+
+    def log_signal(self, device_name, signal_id):
+        pass
+
+    def removed(self, device_name, signal_id):
+        self.removed_calls += 1
+
+
+def trace(**payload):
+    pass
+
+
+def publish_ns(bus: EventBus, number: int = 100000) -> float:
+    publish = bus.publish
+    timer = timeit.Timer(lambda: publish("hardware:status", device_name="esp32_1", signal_id=3))
+    return min(timer.repeat(3, number)) / number * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description='EventBus: Statistik pro Topic und langsame Handler')
+    parser.add_argument('--signals', type=int, default=200, help='Veröffentlichte Signale')
+    parser.add_argument('--slow-ms', type=float, default=16.0, help='Schwelle für langsame Handler')
+    args = parser.parse_args()
+
+    bus = EventBus()
+    bus.enable_stats(args.slow_ms)
+    page = SignalPage(bus, args.slow_ms * 1.5 / 1000)
+    bus.subscribe("hardware:**", trace)
+    bus.subscribe("hardware:signal_received", page.removed)
+    bus.unsubscribe("hardware:signal_received", page.removed)
+    for number in range(1, args.signals + 1):
+        bus.publish("hardware:signal_received", device_name="esp32_1", signal_id=number)
+        if number % 50 == 0:
+            bus.publish("hardware:status_changed", connected_count=1, dev_mode=True)
+    bus.shutdown()
+
+    print(bus.stats_report())
+    stats = bus.get_stats()
+    signal = stats.get("hardware:signal_received", {'published': 0, 'handlers': 0, 'subscribers': []})
+    slow = {sub['handler'] for info in stats.values() for sub in info['subscribers'] if sub['slow']}
+    expected_slow = f"{__name__}.SignalPage.render"
+
+    failures = []
+    if signal['published'] != args.signals or signal['handlers'] != 4:
+        failures.append(f"hardware:signal_received: {signal['published']} publish, "
+                        f"{signal['handlers']} Handler (erwartet {args.signals}, 4)")
+    if stats.get("hardware:status_changed", {}).get('published') != args.signals // 50:
+        failures.append("hardware:status_changed falsch gezählt")
+    if slow != {expected_slow}:
+        failures.append(f"Langsam gemeldet: {sorted(slow)}, erwartet {expected_slow}")
+    calls = {sub['handler']: sub['calls'] for sub in signal['subscribers']}
+    if calls.get(f"{__name__}.SignalPage.log_signal") != args.signals:
+        failures.append("Worker-Handler nicht bei jedem Signal gemessen")
+    if page.removed_calls:
+        failures.append(f"Abgemeldeter Handler {page.removed_calls}x aufgerufen")
+
+    # Kosten: gleicher Bus ohne, mit und nach der Statistik (1 Handler über Muster)
+    plain = EventBus()
+    plain.subscribe("hardware:**", trace)
+    before = publish_ns(plain)
+    plain.enable_stats(args.slow_ms)
+    enabled = publish_ns(plain)
+    plain.disable_stats()
+    after = publish_ns(plain)
+    print(f"publish mit 1 Handler: ohne Statistik {before:.0f} ns, eingeschaltet {enabled:.0f} ns, "
+          f"wieder ausgeschaltet {after:.0f} ns")
+    if 'publish' in vars(plain) or any(func is None and target is not trace
+                                       for target, func, thread in plain._resolve("hardware:status")):
+        failures.append("Nach disable_stats() ist publish() noch instrumentiert")
+
+    if failures:
+        for failure in failures:
+            print(f"❌ {failure}")
+        return 1
+    print(f"✅ Statistik pro Topic stimmt, langsamer Handler erkannt: {expected_slow}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,122 @@
+# tools/check_bus_ui_thread.py
+"""
+Prüfung: Bus-Handler mit thread="ui" laufen im Tk-Thread
+
+Wie in Bertrandt_GUI.py wird der Bus per bind_bus(root, bus) an den
+Tk-Thread gebunden (hier ein Tcl-Interpreter ohne Fenster, gleicher
+Wakeup-Weg). Ein Worker-Thread publiziert Events; geprüft wird, dass
+  - jeder "ui"-Handler im Tk-Thread läuft und kein Event verloren geht,
+  - ein "sync"-Handler weiterhin im publizierenden Thread läuft.
+Zum Vergleich: ohne bind_bus läuft der "ui"-Handler im Worker-Thread.
+
+Aufruf (aus active_project/Python_GUI/):
+    python tools/check_bus_ui_thread.py
+    python tools/check_bus_ui_thread.py --events 1000
+"""
+import os
+import sys
+import time
+import argparse
+import threading
+import tkinter as tk
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.bus import EventBus
+from core.tk_wakeup import bind_bus
+
+
+class Recorder:
+    """Merkt sich pro Zustellung den Thread, in dem der Handler lief"""
+
+    def __init__(self):
+        self.threads = {"ui": [], "sync": []}
+
+    def on_ui(self, value):
+        self.threads["ui"].append(threading.get_ident())
+
+    def on_sync(self, value):
+        self.threads["sync"].append(threading.get_ident())
+
+
+def publish_from_worker(bus: EventBus, events: int) -> int:
+    """Publiziert events Events aus einem eigenen Thread -> dessen Thread-ID"""
+    worker_ident = []
+
+    def publish():
+        worker_ident.append(threading.get_ident())
+        for value in range(events):
+            bus.publish("check:ui", value=value)
+
+    worker = threading.Thread(target=publish, name="SerialWorker", daemon=True)
+    worker.start()
+    worker.join()
+    return worker_ident[0]
+
+
+def pump(root, until, timeout: float = 5.0):
+    """Tcl-Ereignisschleife laufen lassen, bis until() wahr ist"""
+    def tick():
+        root.after(20, tick)
+    tick()
+    deadline = time.monotonic() + timeout
+    while not until() and time.monotonic() < deadline:
+        root.dooneevent()
+
+
+def run(events: int, bound: bool) -> dict:
+    root = tk.Tcl()
+    bus = EventBus()
+    recorder = Recorder()
+    bus.subscribe("check:ui", recorder.on_ui, thread="ui")
+    bus.subscribe("check:ui", recorder.on_sync)
+    wakeup = bind_bus(root, bus) if bound else None
+    try:
+        worker = publish_from_worker(bus, events)
+        pump(root, lambda: len(recorder.threads["ui"]) >= events)
+    finally:
+        bus.unbind_ui()
+        bus.shutdown()
+        if wakeup is not None:
+            wakeup.close()
+    tk_thread = threading.get_ident()
+    ui, sync = recorder.threads["ui"], recorder.threads["sync"]
+    return {
+        'delivered': min(len(ui), events),
+        'on_tk': sum(1 for ident in ui[:events] if ident == tk_thread),
+        'on_worker': sum(1 for ident in ui[:events] if ident == worker),
+        'sync_on_worker': sum(1 for ident in sync[:events] if ident == worker),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='EventBus: "ui"-Handler im Tk-Thread prüfen')
+    parser.add_argument('--events', type=int, default=200, help='Events aus dem Worker-Thread')
+    args = parser.parse_args()
+
+    print(f"{args.events} Events aus einem Worker-Thread")
+    print(f"{'Anbindung':<12}{'zugestellt':>11}{'im Tk-Thread':>14}{'im Worker':>11}{'sync im Worker':>16}")
+    results = {}
+    for bound in (False, True):
+        result = results[bound] = run(args.events, bound)
+        print(f"{'bind_bus' if bound else 'ohne':<12}{result['delivered']:>11}{result['on_tk']:>14}"
+              f"{result['on_worker']:>11}{result['sync_on_worker']:>16}")
+
+    failures = []
+    bound = results[True]
+    if bound['delivered'] != args.events:
+        failures.append(f"{args.events - bound['delivered']} UI-Events nicht zugestellt")
+    if bound['on_tk'] != args.events:
+        failures.append(f"{args.events - bound['on_tk']} UI-Handler außerhalb des Tk-Threads")
+    if bound['sync_on_worker'] != args.events:
+        failures.append("sync-Handler lief nicht im publizierenden Thread")
+    if failures:
+        for failure in failures:
+            print(f"❌ {failure}")
+        return 1
+    print("✅ UI-Handler laufen mit bind_bus im Tk-Thread, auch wenn ein Worker publiziert")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -8,9 +8,16 @@ import serial
 import time
 import subprocess
 import sys
+import os
 import threading
 import queue
 
+# Gemeinsame Protokoll-Module aus active_project/Python_GUI/core
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "Python_GUI"))
+
+from core.line_framer import LineFramer
+from core.protocol import ProtocolParser, SignalEvent
+
 class ESP32SerialReader:
     def __init__(self, port='/dev/ttyUSB0', baudrate=115200):
         self.port = port
@@ -60,14 +67,16 @@ class ESP32SerialReader:
     
     def _read_serial_data(self):
         """Thread-Funktion zum Lesen der seriellen Daten"""
+        framer = LineFramer()
+        parser = ProtocolParser()
         while self.running:
             try:
-                if self.serial_connection.in_waiting > 0:
-                    line = self.serial_connection.readline().decode('utf-8').strip()
-                    if line.startswith("SIGNAL:"):
-                        signal_value = int(line.split(":")[1])
-                        self.data_queue.put(signal_value)
-                        print(f"📡 Signal empfangen: {signal_value}")
+                for event in parser.feed(framer.read_from(self.serial_connection)):
+                    if isinstance(event, SignalEvent):
+                        self.data_queue.put(event.value)
+                        print(f"📡 Signal empfangen: {event.value}")
+                    else:
+                        print(f"📝 ESP32: {event.line}")
             except Exception as e:
                 print(f"❌ Fehler beim Lesen: {e}")
                 time.sleep(0.1)
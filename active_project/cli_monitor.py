@@ -8,10 +8,19 @@ import serial
 import time
 import subprocess
 import sys
+import os
 import argparse
 import threading
 from datetime import datetime
 
+# Gemeinsame Protokoll-Module aus Python_GUI/core
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "Python_GUI"))
+
+from core.line_framer import LineFramer
+from core.protocol import (ProtocolParser, SignalEvent, StatusEvent, HeartbeatTimeoutEvent,
+                           MalformedLineEvent)
+from core.device_index import device_index
+
 class BertrandtCLI:
     def __init__(self, esp32_port="/dev/ttyUSB0"):
         self.esp32_port = esp32_port
@@ -85,16 +94,15 @@ class BertrandtCLI:
             return False
     
     def scan_ports(self):
-        """Scannt verfügbare Ports"""
-        import glob
-        ports = []
-        
-        # Linux/Mac Ports
-        for pattern in ["/dev/ttyUSB*", "/dev/ttyACM*", "/dev/cu.usbserial*", "/dev/cu.usbmodem*"]:
-            ports.extend(glob.glob(pattern))
+        """Scannt verfügbare Ports samt USB-Identität und Rolle"""
+        devices = device_index.refresh()
+        ports = [device.node for device in devices]
         
         if ports:
             self.log(f"Gefundene Ports: {', '.join(ports)}", "SUCCESS")
+            for device in devices:
+                role = device_index.role_of(device.node) or "-"
+                self.log(f"  {device.node:<16}{role:<10}{device.usb_id}  {device.product}", "INFO")
         else:
             self.log("Keine Ports gefunden", "WARNING")
         
@@ -191,6 +199,27 @@ class BertrandtCLI:
             self.log(f"Serial-Verbindung fehlgeschlagen: {e}", "ERROR")
             return False
     
+    def log_event(self, event):
+        """Gibt ein Protokoll-Event formatiert aus"""
+        if isinstance(event, SignalEvent):
+            if 1 <= event.value <= 10:
+                self.signal_count += 1
+                signal_name = self.signal_names.get(event.value, f"Signal {event.value}")
+                self.log(f"📡 Signal {event.value}: {signal_name} (#{self.signal_count})", "SUCCESS")
+            else:
+                self.log(f"⚠️  Unbekanntes Signal: {event.value}", "WARNING")
+        elif isinstance(event, StatusEvent):
+            state = "" if event.complete else " (unvollständig)"
+            self.log(f"📊 {event.device.upper()} Status{state}: RSSI {event.rssi_dbm} dBm, "
+                     f"Heap {event.free_heap} bytes, Uptime {event.uptime_ms} ms, "
+                     f"Signale {event.signal_count}", "INFO")
+        elif isinstance(event, HeartbeatTimeoutEvent):
+            self.log(f"💔 {event.line}", "WARNING")
+        elif isinstance(event, MalformedLineEvent):
+            self.log(f"⚠️  Ungültiges Format ({event.reason}): {event.line}", "WARNING")
+        else:
+            self.log(f"📝 ESP32: {event.line}", "INFO")
+    
     def monitor_signals(self):
         """Überwacht eingehende Signale"""
         self.log("🔍 Starte Signal-Monitoring...", "INFO")
@@ -200,27 +229,13 @@ class BertrandtCLI:
             return
         
         self.running = True
+        framer = LineFramer()
+        parser = ProtocolParser()
         
         try:
             while self.running:
-                if self.serial_connection.in_waiting > 0:
-                    line = self.serial_connection.readline().decode('utf-8').strip()
-                    
-                    if line.startswith("SIGNAL:"):
-                        try:
-                            signal_num = int(line.split(":")[1])
-                            if 1 <= signal_num <= 10:
-                                self.signal_count += 1
-                                signal_name = self.signal_names.get(signal_num, f"Signal {signal_num}")
-                                self.log(f"📡 Signal {signal_num}: {signal_name} (#{self.signal_count})", "SUCCESS")
-                            else:
-                                self.log(f"⚠️  Unbekanntes Signal: {signal_num}", "WARNING")
-                        except ValueError:
-                            self.log(f"⚠️  Ungültiges Signal-Format: {line}", "WARNING")
-                    else:
-                        self.log(f"📝 ESP32: {line}", "INFO")
-                
-                time.sleep(0.1)
+                for event in parser.feed(framer.read_from(self.serial_connection)):
+                    self.log_event(event)
                 
         except KeyboardInterrupt:
             self.log("Monitoring beendet", "INFO")
@@ -231,12 +246,14 @@ class BertrandtCLI:
 
 def main():
     parser = argparse.ArgumentParser(description="Bertrandt ESP32 CLI Tool")
-    parser.add_argument("--esp32-port", default="/dev/ttyUSB0", help="ESP32 Serial Port")
-    parser.add_argument("--giga-port", default="/dev/ttyACM0", help="Arduino GIGA Port")
+    parser.add_argument("--esp32-port", default=None, help="ESP32 Serial Port (Standard: automatisch)")
+    parser.add_argument("--giga-port", default=None, help="Arduino GIGA Port (Standard: automatisch)")
     parser.add_argument("--action", choices=["monitor", "flash-esp32", "flash-giga", "flash-both", "scan"], 
                        default="monitor", help="Aktion ausführen")
     
     args = parser.parse_args()
+    args.esp32_port = args.esp32_port or device_index.resolve("esp32_1") or "/dev/ttyUSB0"
+    args.giga_port = args.giga_port or device_index.resolve("giga") or "/dev/ttyACM0"
     
     cli = BertrandtCLI(args.esp32_port)
     
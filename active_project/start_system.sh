@@ -62,36 +62,17 @@ fi
 
 # Verfügbare Ports anzeigen
 log_info "Suche verfügbare Geräte..."
-FOUND_PORTS=()
 
-# Linux/Mac Ports prüfen
-for port in /dev/ttyUSB* /dev/ttyACM* /dev/cu.usbserial* /dev/cu.usbmodem*; do
-    if [ -e "$port" ]; then
-        FOUND_PORTS+=("$port")
-    fi
-done
+# Rollen über USB-Identität (VID/PID/Buchse) statt Namensmuster
+eval "$(python3 core/device_index.py --shell)"
 
-if [ ${#FOUND_PORTS[@]} -eq 0 ]; then
+if [ -z "$ESP32_1_PORT" ] && [ -z "$GIGA_PORT" ]; then
     log_warning "Keine Arduino-Geräte gefunden!"
     log_info "Das ist OK - Sie können Geräte später in der GUI flashen"
     ESP32_PORT="/dev/ttyUSB0"  # Default
 else
-    log_success "Gefundene Ports: ${FOUND_PORTS[*]}"
-    
-    # Versuche ESP32 zu identifizieren (meist USB)
-    ESP32_PORT=""
-    for port in "${FOUND_PORTS[@]}"; do
-        if [[ "$port" == *"ttyUSB"* ]] || [[ "$port" == *"usbserial"* ]]; then
-            ESP32_PORT="$port"
-            break
-        fi
-    done
-    
-    # Falls kein USB-Port, nimm den ersten verfügbaren
-    if [ -z "$ESP32_PORT" ]; then
-        ESP32_PORT="${FOUND_PORTS[0]}"
-    fi
-    
+    [ -n "$GIGA_PORT" ] && log_success "Arduino GIGA gefunden: $GIGA_PORT"
+    ESP32_PORT="${ESP32_1_PORT:-/dev/ttyUSB0}"
     log_success "ESP32 Port gesetzt auf: $ESP32_PORT"
 fi
 
@@ -23,22 +23,18 @@ fi
 
 # Hardware-Ports prüfen
 echo "🔌 Prüfe Hardware-Verbindungen..."
-if [ -e "/dev/ttyUSB0" ]; then
-    echo "✅ ESP32 gefunden: /dev/ttyUSB0"
-    ESP32_PORT="/dev/ttyUSB0"
+# Rollen über USB-Identität (VID/PID/Buchse) statt fester ttyUSB-Nummern
+eval "$(python3 core/device_index.py --shell)"
+if [ -n "$ESP32_1_PORT" ]; then
+    echo "✅ ESP32 gefunden: $ESP32_1_PORT"
+    ESP32_PORT="$ESP32_1_PORT"
 else
-    echo "⚠️ ESP32 nicht gefunden - suche alternative Ports..."
-    ESP32_PORT=$(ls /dev/ttyUSB* 2>/dev/null | head -1)
-    if [ -z "$ESP32_PORT" ]; then
-        echo "❌ Kein ESP32 gefunden - starte ohne Hardware"
-        NO_HARDWARE="--no-hardware"
-    else
-        echo "✅ ESP32 gefunden: $ESP32_PORT"
-    fi
+    echo "❌ Kein ESP32 gefunden - starte ohne Hardware"
+    NO_HARDWARE="--no-hardware"
 fi
 
-if [ -e "/dev/ttyACM0" ]; then
-    echo "✅ Arduino GIGA gefunden: /dev/ttyACM0"
+if [ -n "$GIGA_PORT" ]; then
+    echo "✅ Arduino GIGA gefunden: $GIGA_PORT"
 else
     echo "⚠️ Arduino GIGA nicht gefunden"
 fi